@@ -65,6 +65,24 @@ if TYPE_CHECKING:
     from usethis._tool.all_ import SupportedToolType
 
 
+ALL_TOOLS: list[SupportedToolType] = [
+    # Alphabetical order, matching TOOL_REGISTRY in usethis._tool.registry
+    CodespellTool(),
+    CoveragePyTool(),
+    DeptryTool(),
+    ImportLinterTool(),
+    MkDocsTool(),
+    PreCommitTool(),
+    PyprojectFmtTool(),
+    PyprojectTOMLTool(),
+    PytestTool(),
+    RequirementsTxtTool(),
+    RuffTool(),
+    TachTool(),
+    TyTool(),
+]
+
+
 @contextmanager
 def change_cwd(new_dir: Path) -> Generator[None, None, None]:
     """Change the working directory temporarily.
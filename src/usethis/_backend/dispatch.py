@@ -13,6 +13,7 @@ from usethis._backend.uv.available import is_uv_available
 from usethis._backend.uv.call import call_uv_subprocess
 from usethis._backend.uv.detect import is_uv_used
 from usethis._config import usethis_config
+from usethis._file import fs
 from usethis._types.backend import BackendEnum
 
 
@@ -28,7 +29,7 @@ def get_backend() -> Literal[BackendEnum.uv, BackendEnum.poetry, BackendEnum.non
         usethis_config.inferred_backend = BackendEnum.poetry
     elif is_uv_used():
         usethis_config.inferred_backend = BackendEnum.uv
-    elif not (usethis_config.cpd() / "pyproject.toml").exists():
+    elif not fs.exists(usethis_config.cpd() / "pyproject.toml"):
         # If there's not likely to be a backend in use yet...
         if is_uv_available():
             # Use uv with preference if it's available
@@ -57,16 +57,23 @@ def call_poetry_subprocess(args: list[str], *, change_toml: bool) -> str:
     lock_path = usethis_config.cpd() / "poetry.lock"
     with _frozen_poetry_lock(lock_path) if frozen_applicable else _noop_context():
         try:
-            result = call_subprocess(new_args, cwd=usethis_config.cpd())
+            result = call_subprocess(
+                new_args,
+                cwd=usethis_config.cpd(),
+                on_stderr_line=_surface_stderr_warning,
+            )
         except SubprocessFailedError as err:
             raise PoetrySubprocessFailedError(err) from None
         except FileNotFoundError:
             msg = "Poetry is not installed or not found on PATH."
             raise PoetrySubprocessFailedError(msg) from None
 
-    _surface_stderr_warnings(result.stderr)
-
-    if change_toml and PyprojectTOMLManager().is_locked():
+    if (
+        change_toml
+        and PyprojectTOMLManager().is_locked()
+        # In dry-run mode, the subprocess didn't run so there's nothing new to read.
+        and not usethis_config.dry_run
+    ):
         PyprojectTOMLManager().read_file()
 
     return result.stdout
@@ -100,9 +107,8 @@ def _noop_context() -> Generator[None, None, None]:
     yield
 
 
-def _surface_stderr_warnings(stderr: str) -> None:
-    """Surface any warning lines from Poetry's stderr output."""
-    for line in stderr.splitlines():
-        stripped = line.strip()
-        if stripped.lower().startswith("warning:"):
-            warn_print(stripped.split(":", 1)[1].strip())
+def _surface_stderr_warning(line: str) -> None:
+    """Surface a line of Poetry's stderr output if it is a warning."""
+    stripped = line.strip()
+    if stripped.lower().startswith("warning:"):
+        warn_print(stripped.split(":", 1)[1].strip())
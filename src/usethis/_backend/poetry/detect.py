@@ -1,18 +1,19 @@
 """Detection of Poetry usage in a project."""
 
-from usethis._config import usethis_config
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+from usethis._file.snapshot import get_project_snapshot
 
 
 def is_poetry_used() -> bool:
     """Check if Poetry is being used in the project."""
     pyproject_toml_manager = PyprojectTOMLManager()
+    snapshot = get_project_snapshot()
 
     return (
-        (usethis_config.cpd() / "poetry.lock").exists()
-        or (usethis_config.cpd() / "poetry.toml").exists()
+        snapshot.exists("poetry.lock")
+        or snapshot.exists("poetry.toml")
         or (
-            pyproject_toml_manager.path.exists()
+            snapshot.exists(pyproject_toml_manager.relative_path)
             and ["tool", "poetry"] in pyproject_toml_manager
         )
     )
@@ -7,6 +7,7 @@ from usethis._backend.uv.link_mode import ensure_symlink_mode
 from usethis._backend.uv.toml import UVTOMLManager
 from usethis._config import usethis_config
 from usethis._console import warn_print
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import (
     PyprojectTOMLManager,
 )
@@ -67,30 +68,34 @@ def call_uv_subprocess(args: list[str], change_toml: bool) -> str:
 
     try:
         result = call_subprocess(
-            new_args, cwd=usethis_config.cpd() if args[0] != "init" else None
+            new_args,
+            cwd=usethis_config.cpd() if args[0] != "init" else None,
+            on_stderr_line=_surface_stderr_warning,
         )
     except SubprocessFailedError as err:
         raise UVSubprocessFailedError(err) from None
 
-    _surface_stderr_warnings(result.stderr)
-
-    if change_toml and PyprojectTOMLManager().is_locked():
+    if (
+        change_toml
+        and PyprojectTOMLManager().is_locked()
+        # In dry-run mode, the subprocess didn't run so there's nothing new to read.
+        and not usethis_config.dry_run
+    ):
         PyprojectTOMLManager().read_file()
 
     return result.stdout
 
 
-def _surface_stderr_warnings(stderr: str) -> None:
-    """Surface any warning lines from subprocess stderr output."""
-    for line in stderr.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("warning:"):
-            warn_print(stripped.removeprefix("warning:").strip())
+def _surface_stderr_warning(line: str) -> None:
+    """Surface a line of subprocess stderr output if it is a warning."""
+    stripped = line.strip()
+    if stripped.startswith("warning:"):
+        warn_print(stripped.removeprefix("warning:").strip())
 
 
 def add_default_groups_via_uv(groups: list[str]) -> None:
     """Add default groups using the uv command-line tool."""
-    if UVTOMLManager().path.exists():
+    if fs.exists(UVTOMLManager().path):
         UVTOMLManager().extend_list(keys=["default-groups"], values=groups)
     else:
         PyprojectTOMLManager().extend_list(
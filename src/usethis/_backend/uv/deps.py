@@ -12,6 +12,7 @@ from usethis._backend.uv.errors import (
     UVSubprocessFailedError,
 )
 from usethis._backend.uv.toml import UVTOMLManager
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 
 if TYPE_CHECKING:
@@ -42,7 +43,7 @@ def remove_dep_from_group_via_uv(dep: Dependency, group: str):
 def get_default_groups_via_uv() -> list[str]:
     """Get the default dependency groups from the uv configuration."""
     try:
-        if UVTOMLManager().path.exists():
+        if fs.exists(UVTOMLManager().path):
             default_groups = TypeAdapter(list[str]).validate_python(
                 UVTOMLManager()[["default-groups"]]
             )
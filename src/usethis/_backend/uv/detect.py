@@ -1,18 +1,19 @@
 """Detection of uv usage in a project."""
 
-from usethis._config import usethis_config
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+from usethis._file.snapshot import get_project_snapshot
 
 
 def is_uv_used() -> bool:
     """Check if uv is being used in the project."""
     pyproject_toml_manager = PyprojectTOMLManager()
+    snapshot = get_project_snapshot()
 
     return (
-        (usethis_config.cpd() / "uv.lock").exists()
-        or (usethis_config.cpd() / "uv.toml").exists()
+        snapshot.exists("uv.lock")
+        or snapshot.exists("uv.toml")
         or (
-            pyproject_toml_manager.path.exists()
+            snapshot.exists(pyproject_toml_manager.relative_path)
             and ["tool", "uv"] in pyproject_toml_manager
         )
     )
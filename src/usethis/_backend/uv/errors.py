@@ -25,3 +25,7 @@ class UVSubprocessFailedError(UVError, _BackendSubprocessFailedError):
 
 class UVInitError(UVSubprocessFailedError):
     """Raised when the uv init command fails to create a pyproject.toml file."""
+
+
+class UVWorkspaceError(UVError):
+    """Raised when the uv workspace configuration is missing or invalid."""
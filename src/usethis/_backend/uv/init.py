@@ -6,6 +6,7 @@ from usethis._backend.uv import (  # Use this style to allow test mocking
     call,
 )
 from usethis._backend.uv.errors import UVInitError, UVSubprocessFailedError
+from usethis._backend.uv.template import init_from_template
 from usethis._config import usethis_config
 from usethis._file.dir import get_project_name_from_dir
 from usethis._file.pyproject_toml.errors import PyprojectTOMLInitError
@@ -14,8 +15,13 @@ from usethis._file.pyproject_toml.errors import PyprojectTOMLInitError
 def opinionated_uv_init() -> None:
     """Subprocess `uv init` with opinionated arguments.
 
-    It is assumed that the pyproject.toml file doesn't already exist.
+    It is assumed that the pyproject.toml file doesn't already exist. If a template
+    cache directory is configured, the project skeleton is created from the cache where
+    possible, rather than running `uv init` each time.
     """
+    if init_from_template():
+        return
+
     try:
         call.call_uv_subprocess(
             [
@@ -3,6 +3,7 @@
 import contextlib
 
 from usethis._backend.uv.toml import UVTOMLManager
+from usethis._file import fs
 from usethis._file.pyproject_toml.errors import (
     PyprojectTOMLValueAlreadySetError,
 )
@@ -19,13 +20,13 @@ def ensure_symlink_mode() -> None:
     """
     # The reason we don't do this for just Windows is because repo configuration should
     # ideally be valid cross-platform.
-    if UVTOMLManager().path.exists():
+    if fs.exists(UVTOMLManager().path):
         with contextlib.suppress(PyprojectTOMLValueAlreadySetError):
             UVTOMLManager().set_value(
                 keys=["link-mode"], value="symlink", exists_ok=False
             )
     else:
-        PyprojectTOMLManager().path.touch()
+        fs.touch(PyprojectTOMLManager().path)
         with contextlib.suppress(PyprojectTOMLValueAlreadySetError):
             PyprojectTOMLManager().set_value(
                 keys=["tool", "uv", "link-mode"], value="symlink", exists_ok=False
@@ -3,10 +3,28 @@
 from usethis._backend.uv.call import call_uv_subprocess
 from usethis._config import usethis_config
 from usethis._console import tick_print
+from usethis._file import fs
+from usethis._file.pyproject_toml.fingerprint import (
+    is_fingerprint_stale,
+    record_fingerprint,
+)
 
 
-def ensure_uv_lock() -> None:
-    """Ensure a uv.lock file exists, creating it if necessary."""
-    if not (usethis_config.cpd() / "uv.lock").exists():
+def ensure_uv_lock(*, force: bool = False) -> None:
+    """Ensure a uv.lock file exists, creating it if necessary.
+
+    An existing uv.lock file is updated if it was written by usethis from different
+    dependency declarations than those currently in pyproject.toml.
+
+    Args:
+        force: Whether to update an existing uv.lock file regardless.
+    """
+    if not fs.exists(usethis_config.cpd() / "uv.lock"):
         tick_print("Writing 'uv.lock'.")
-        call_uv_subprocess(["lock"], change_toml=False)
+    elif force or is_fingerprint_stale("uv.lock"):
+        tick_print("Updating 'uv.lock'.")
+    else:
+        return
+
+    call_uv_subprocess(["lock"], change_toml=False)
+    record_fingerprint("uv.lock")
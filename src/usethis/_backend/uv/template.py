@@ -0,0 +1,219 @@
+"""A cache of project skeletons generated by `uv init`.
+
+Creating many projects with the same options would otherwise run `uv init` for each of
+them, even though the generated skeleton only differs in the project name. Instead, the
+skeleton is generated once for a placeholder project name and stored in a cache
+directory, keyed by the options and the uv version. New projects are then created by
+copying the skeleton and substituting the project name.
+
+The skeleton is only reused in the simple cases where it is known to be equivalent to
+running `uv init`; otherwise, `uv init` is run as usual. Note that details which `uv
+init` takes from the environment, such as the author (from the git configuration) and
+the Python version, are those from when the skeleton was generated; the cache directory
+should be cleared if they change.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from usethis._backend.uv import (  # Use this style to allow test mocking
+    call,
+)
+from usethis._backend.uv.errors import UVInitError, UVSubprocessFailedError
+from usethis._config import usethis_config
+from usethis._file.dir import get_project_name_from_dir
+from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+from usethis._file.pyproject_toml.write import prepare_pyproject_write
+from usethis._subprocess import SubprocessFailedError, call_subprocess
+
+_TEMPLATE_FORMAT_VERSION = 1
+_PLACEHOLDER_PROJECT_NAME = "usethis-template-project"
+_PLACEHOLDER_PACKAGE_NAME = "usethis_template_project"
+_FILES_DIR_NAME = "files"
+_METADATA_FILE_NAME = "template.json"
+
+# Files in parent directories which `uv init` takes into account, and which would make
+# the skeleton depend on where the project is created.
+_CONTEXT_FILE_NAMES = ("pyproject.toml", "uv.toml", ".python-version")
+
+# Names for which the package name is simply the project name with underscores, both
+# for uv and for the placeholder substitution.
+_SIMPLE_NAME_REGEX = re.compile(r"[a-z][a-z0-9]*(?:-[a-z0-9]+)*")
+
+
+def init_from_template() -> bool:
+    """Create the project skeleton from the template cache, if possible.
+
+    On a cache miss, the skeleton is generated with `uv init` and stored in the cache
+    directory first. The project name is taken from the project directory.
+
+    Returns:
+        Whether the skeleton was created. If not, `uv init` should be run as usual, e.g.
+        because the cache is disabled, or because the project's name or location means
+        the skeleton could differ from that generated by `uv init`, or because the uv
+        version can't be determined.
+
+    Raises:
+        UVInitError: If generating the skeleton with `uv init` fails.
+    """
+    cache_dir = usethis_config.template_cache_dir
+    if cache_dir is None or usethis_config.dry_run:
+        return False
+
+    project_dir = usethis_config.cpd()
+    project_name = get_project_name_from_dir()
+    if not _SIMPLE_NAME_REGEX.fullmatch(project_name) or _has_context_file(project_dir):
+        return False
+
+    uv_version = _get_uv_version()
+    if uv_version is None:
+        return False
+
+    entry_dir = cache_dir / _get_template_key(uv_version=uv_version)
+    if not (entry_dir / _METADATA_FILE_NAME).exists() and not _generate_template(
+        entry_dir
+    ):
+        return False
+
+    vcs = json.loads((entry_dir / _METADATA_FILE_NAME).read_text(encoding="utf-8"))[
+        "vcs"
+    ]
+    in_repo = _is_in_git_repo(project_dir)
+
+    prepare_pyproject_write()
+    project_dir.mkdir(parents=True, exist_ok=True)
+    _copy_template(
+        entry_dir / _FILES_DIR_NAME,
+        project_dir,
+        project_name=project_name,
+        # As for `uv init`, we don't touch the VCS when already in a repository.
+        skip={".gitignore"} if in_repo else set(),
+    )
+    try:
+        if vcs and not in_repo:
+            call_subprocess(["git", "init"], cwd=project_dir)
+    except SubprocessFailedError as err:
+        msg = f"Failed to initialize a git repository for the project:\n{err}"
+        raise UVInitError(msg) from None
+
+    if PyprojectTOMLManager().is_locked():
+        PyprojectTOMLManager().read_file()
+
+    return True
+
+
+@functools.cache
+def _get_uv_version() -> str | None:
+    # The uv executable doesn't change while usethis is running, so only ask it once.
+    try:
+        return call.call_uv_subprocess(["--version"], change_toml=False).strip()
+    except UVSubprocessFailedError:
+        return None
+
+
+def _get_template_key(*, uv_version: str) -> str:
+    content = json.dumps(
+        {
+            "version": _TEMPLATE_FORMAT_VERSION,
+            "backend": "uv",
+            "build_backend": usethis_config.build_backend.value,
+            "uv_version": uv_version,
+            "options": ["--lib"],
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _generate_template(entry_dir: Path) -> bool:
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp) / _PLACEHOLDER_PROJECT_NAME
+        if _has_context_file(work_dir) or _is_in_git_repo(work_dir):
+            return False
+
+        try:
+            call.call_uv_subprocess(
+                [
+                    "init",
+                    "--lib",
+                    "--name",
+                    _PLACEHOLDER_PROJECT_NAME,
+                    "--build-backend",
+                    usethis_config.build_backend.value,
+                    work_dir.as_posix(),
+                ],
+                change_toml=False,
+            )
+        except UVSubprocessFailedError as err:
+            msg = (
+                f"Failed to create a pyproject.toml file and initialize project:\n{err}"
+            )
+            raise UVInitError(msg) from None
+
+        vcs = (work_dir / ".git").exists()
+        shutil.rmtree(work_dir / ".git", ignore_errors=True)
+
+        # Stage the entry alongside its final location, so it can be moved into place
+        # atomically; a partially-written entry is never visible to other processes.
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(dir=entry_dir.parent))
+        try:
+            shutil.copytree(work_dir, staging_dir / _FILES_DIR_NAME)
+            (staging_dir / _METADATA_FILE_NAME).write_text(
+                json.dumps({"vcs": vcs}) + "\n", encoding="utf-8"
+            )
+            os.replace(staging_dir, entry_dir)
+        except OSError:
+            # e.g. another process stored the same entry in the meantime.
+            if not (entry_dir / _METADATA_FILE_NAME).exists():
+                raise
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    return True
+
+
+def _copy_template(
+    src_dir: Path, dest_dir: Path, *, project_name: str, skip: set[str]
+) -> None:
+    package_name = project_name.replace("-", "_")
+    for src in sorted(src_dir.rglob("*")):
+        relative = src.relative_to(src_dir)
+        if relative.as_posix() in skip:
+            continue
+
+        dest = dest_dir / Path(
+            *(
+                part.replace(_PLACEHOLDER_PACKAGE_NAME, package_name)
+                for part in relative.parts
+            )
+        )
+        if src.is_dir():
+            dest.mkdir(exist_ok=True)
+        elif not dest.exists():
+            content = src.read_text(encoding="utf-8")
+            content = content.replace(_PLACEHOLDER_PROJECT_NAME, project_name)
+            content = content.replace(_PLACEHOLDER_PACKAGE_NAME, package_name)
+            dest.write_text(content, encoding="utf-8")
+
+
+def _has_context_file(path: Path) -> bool:
+    path = path.resolve()
+    return any(
+        (parent / name).exists()
+        for parent in (path, *path.parents)
+        for name in _CONTEXT_FILE_NAMES
+    )
+
+
+def _is_in_git_repo(path: Path) -> bool:
+    path = path.resolve()
+    return any((parent / ".git").exists() for parent in (path, *path.parents))
@@ -0,0 +1,69 @@
+"""Discovery of uv workspace members."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pydantic import TypeAdapter, ValidationError
+
+from usethis._backend.uv.errors import UVWorkspaceError
+from usethis._config import usethis_config
+from usethis._file import fs
+from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def get_workspace_members() -> list[Path]:
+    """Get the directories of the members of the uv workspace at the project directory.
+
+    As for uv, the members are the directories matching the `members` globs in the
+    `[tool.uv.workspace]` table, less those matching the `exclude` globs, which contain
+    a `pyproject.toml` file. The workspace root is itself a member if it declares a
+    `[project]` table, in which case it comes first; the others are sorted by path.
+
+    Raises:
+        UVWorkspaceError: If there is no valid workspace configuration.
+    """
+    root = usethis_config.cpd()
+    if not fs.exists(root / "pyproject.toml"):
+        msg = "No 'pyproject.toml' file found, so there is no uv workspace."
+        raise UVWorkspaceError(msg)
+
+    manager = PyprojectTOMLManager()
+    if ["tool", "uv", "workspace"] not in manager:
+        msg = "No uv workspace is configured in the 'tool.uv.workspace' section of 'pyproject.toml'."
+        raise UVWorkspaceError(msg)
+
+    members = _get_workspace_globs("members")
+    excludes = _get_workspace_globs("exclude")
+
+    excluded = {path for pattern in excludes for path in root.glob(pattern)}
+    member_dirs = sorted(
+        {
+            path
+            for pattern in members
+            for path in root.glob(pattern)
+            if path not in excluded
+            and path != root
+            and (path / "pyproject.toml").is_file()
+        }
+    )
+
+    if ["project"] in manager:
+        return [root, *member_dirs]
+    return member_dirs
+
+
+def _get_workspace_globs(key: str) -> list[str]:
+    try:
+        value = PyprojectTOMLManager()[["tool", "uv", "workspace", key]]
+    except KeyError:
+        return []
+
+    try:
+        return TypeAdapter(list[str]).validate_python(value)
+    except ValidationError as err:
+        msg = f"Invalid 'tool.uv.workspace.{key}' value in 'pyproject.toml':\n{err}"
+        raise UVWorkspaceError(msg) from None
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Literal
 
 from usethis._types.backend import BackendEnum
 from usethis._types.build_backend import BuildBackendEnum
+from usethis._types.output_mode import OutputModeEnum
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -19,8 +20,10 @@ REMOVE_DEFAULT = False
 FROZEN_DEFAULT = False
 OFFLINE_DEFAULT = False
 QUIET_DEFAULT = False
+DRY_RUN_DEFAULT = False
 BACKEND_DEFAULT = "auto"
 BUILD_BACKEND_DEFAULT = "hatch"
+OUTPUT_MODE_DEFAULT = "auto"
 
 
 @dataclass
@@ -31,15 +34,28 @@ class UsethisConfig:
         offline: Disable network access.
         quiet: Suppress all output, regardless of any other options.
         frozen: Do not install dependencies, nor update lockfiles.
+        dry_run: Do not run subprocesses; record them in the current plan instead.
         alert_only: Suppress all output except for warnings and errors.
         instruct_only: Suppress all success and info output; do not suppress
                        instructions, warnings, or errors.
+        output_mode: How to write messages to the console, e.g. as plain text or as
+                     JSON lines.
         backend: The package manager backend to use. Attempted subprocesses to other
                  backends will raise an error.
         disable_pre_commit: Disable pre-commit integrations. Assume that pre-commit is
                             never used (unless explicitly requested via a function whose
                             purpose is to modify pre-commit configuration).
         subprocess_verbose: Verbose output for subprocesses.
+        subprocess_timeout: The maximum time in seconds to wait for each subprocess
+                            before terminating it. If None, there is no limit. A
+                            timeout given for a specific subprocess takes precedence.
+        lock_timeout: The maximum time in seconds to wait for other usethis processes
+                      to release their lock on the project directory. If None, there is
+                      no limit.
+        template_cache_dir: Directory in which to cache project skeletons generated
+                            when initializing projects, to reuse them for new
+                            projects with the same options. If None, skeletons are
+                            not cached.
         force_project_dir: Directory for the project. If None, defaults to the current
                            working directory dynamically determined at runtime.
     """
@@ -47,8 +63,10 @@ class UsethisConfig:
     offline: bool = OFFLINE_DEFAULT
     quiet: bool = QUIET_DEFAULT
     frozen: bool = FROZEN_DEFAULT
+    dry_run: bool = DRY_RUN_DEFAULT
     alert_only: bool = False
     instruct_only: bool = False
+    output_mode: OutputModeEnum = OutputModeEnum(OUTPUT_MODE_DEFAULT)  # noqa: RUF009
     backend: BackendEnum = BackendEnum(BACKEND_DEFAULT)  # noqa: RUF009
     inferred_backend: (
         Literal[BackendEnum.uv, BackendEnum.poetry, BackendEnum.none] | None
@@ -56,6 +74,9 @@ class UsethisConfig:
     build_backend: BuildBackendEnum = BuildBackendEnum(BUILD_BACKEND_DEFAULT)  # noqa: RUF009
     disable_pre_commit: bool = False
     subprocess_verbose: bool = False
+    subprocess_timeout: float | None = None
+    lock_timeout: float | None = None
+    template_cache_dir: Path | None = None
     project_dir: Path | None = None
 
     def copy(self) -> UsethisConfig:
@@ -63,18 +84,23 @@ class UsethisConfig:
         return replace(self)
 
     @contextmanager
-    def set(  # noqa: PLR0912, PLR0913
+    def set(  # noqa: PLR0912, PLR0913, PLR0915
         self,
         *,
         offline: bool | None = None,
         quiet: bool | None = None,
         frozen: bool | None = None,
+        dry_run: bool | None = None,
         alert_only: bool | None = None,
         instruct_only: bool | None = None,
+        output_mode: OutputModeEnum | None = None,
         backend: BackendEnum | None = None,
         build_backend: BuildBackendEnum | None = None,
         disable_pre_commit: bool | None = None,
         subprocess_verbose: bool | None = None,
+        subprocess_timeout: float | None = None,
+        lock_timeout: float | None = None,
+        template_cache_dir: Path | str | None = None,
         project_dir: Path | str | None = None,
     ) -> Generator[None, None, None]:
         """Temporarily change command options."""
@@ -86,10 +112,14 @@ class UsethisConfig:
             quiet = self.quiet
         if frozen is None:
             frozen = self.frozen
+        if dry_run is None:
+            dry_run = self.dry_run
         if alert_only is None:
             alert_only = self.alert_only
         if instruct_only is None:
             instruct_only = self.instruct_only
+        if output_mode is None:
+            output_mode = self.output_mode
         if backend is None:
             backend = self.backend
         if build_backend is None:
@@ -98,22 +128,38 @@ class UsethisConfig:
             disable_pre_commit = self.disable_pre_commit
         if subprocess_verbose is None:
             subprocess_verbose = self.subprocess_verbose
+        if subprocess_timeout is None:
+            subprocess_timeout = self.subprocess_timeout
+        if lock_timeout is None:
+            lock_timeout = self.lock_timeout
+        if template_cache_dir is None:
+            template_cache_dir = self.template_cache_dir
+        if isinstance(template_cache_dir, str):
+            template_cache_dir = Path(template_cache_dir)
         if project_dir is None:
             project_dir = self.project_dir
+        if isinstance(project_dir, str):
+            project_dir = Path(project_dir)
 
         self.offline = offline
         self.quiet = quiet
         self.frozen = frozen
+        self.dry_run = dry_run
         self.alert_only = alert_only
         self.instruct_only = instruct_only
+        self.output_mode = output_mode
         self.backend = backend
         if backend is not BackendEnum.auto:
             self.inferred_backend = backend
+        elif project_dir != self.project_dir:
+            # The inferred backend is specific to the project.
+            self.inferred_backend = None
         self.build_backend = build_backend
         self.disable_pre_commit = disable_pre_commit
         self.subprocess_verbose = subprocess_verbose
-        if isinstance(project_dir, str):
-            project_dir = Path(project_dir)
+        self.subprocess_timeout = subprocess_timeout
+        self.lock_timeout = lock_timeout
+        self.template_cache_dir = template_cache_dir
         self.project_dir = project_dir
         try:
             yield
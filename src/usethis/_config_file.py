@@ -10,11 +10,14 @@ from typing_extensions import override
 
 from usethis._backend.uv.toml import UVTOMLManager
 from usethis._file.ini.io_ import INIFileManager
+from usethis._file.lock import project_lock
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._file.setup_cfg.io_ import SetupCFGManager
+from usethis._file.snapshot import project_snapshot
 from usethis._file.toml.io_ import TOMLFileManager
 from usethis._file.yaml.io_ import YAMLFileManager
 from usethis._integrations.pre_commit.yaml import PreCommitConfigYAMLManager
+from usethis._integrations.readme.markdown import READMEMarkdownManager
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -39,8 +42,16 @@ def files_manager() -> Iterator[None]:
     the files have been flushed. If you need to run a subprocess that depends on
     configuration written by functions inside this context, exit the context first and
     then run the subprocess.
+
+    An advisory lock is held on the project directory for the duration of the context,
+    so that other usethis processes working on the same project wait until the files
+    have been flushed. Within this context, a snapshot of the project directory's
+    structure is also shared between the heuristics which check for the existence of
+    files.
     """
     with (
+        project_lock(),
+        project_snapshot(),
         PyprojectTOMLManager(),
         SetupCFGManager(),
         DotCodespellRCManager(),
@@ -54,6 +65,7 @@ def files_manager() -> Iterator[None]:
         MkDocsYMLManager(),
         PreCommitConfigYAMLManager(),
         PytestINIManager(),
+        READMEMarkdownManager(),
         RuffTOMLManager(),
         ToxINIManager(),
         TyTOMLManager(),
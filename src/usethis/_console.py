@@ -4,14 +4,19 @@ from __future__ import annotations
 
 import codecs
 import functools
+import io
+import json
 import sys
-from typing import TYPE_CHECKING, Literal
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, Protocol
 
-from rich.console import Console
+from typing_extensions import assert_never
 
 from usethis._config import usethis_config
+from usethis._types.output_mode import OutputModeEnum
 
 if TYPE_CHECKING:
+    from rich.console import Console
     from rich.table import Table
 
 # Unicode support - but we need to be able to write bytes
@@ -22,8 +27,204 @@ except AttributeError:
     # e.g. in Jupyter
     pass
 
-console = Console()
-err_console = Console(stderr=True)
+EventType = Literal[
+    "plain", "table", "tick", "instruct", "how", "info", "error", "warning"
+]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OutputEvent:
+    """A message to write to the console.
+
+    Attributes:
+        type: The kind of message, e.g. "tick" for a success message.
+        message: The message, as Rich markup.
+        file: The (relative) path of the file the message is about, if any.
+        tool: The name of the tool the message is about, if any.
+        temporary: Whether the message is only shown until the next one, e.g. while
+                   waiting for a slow operation.
+    """
+
+    type: EventType
+    message: str
+    file: str | None = None
+    tool: str | None = None
+    temporary: bool = False
+
+
+class OutputSink(Protocol):
+    """A destination for console output."""
+
+    def write(self, event: OutputEvent) -> None:
+        """Write a message."""
+        ...
+
+    def write_table(self, table: Table) -> None:
+        """Write a Rich table."""
+        ...
+
+
+class RichOutputSink:
+    """Styled output rendered by Rich, for interactive terminals."""
+
+    def __init__(self) -> None:
+        self._consoles: dict[Literal["stdout", "stderr", "plain"], Console] = {}
+
+    def write(self, event: OutputEvent) -> None:
+        end = "\r" if event.temporary else "\n"
+        if event.type == "plain":
+            self._get_console("plain").print(event.message, end=end)
+        elif event.type == "table":
+            msg = "Tables must be written with `write_table`."
+            raise ValueError(msg)
+        else:
+            console = self._get_console("stderr" if event.type == "error" else "stdout")
+            console.print(
+                f"{_get_icon(event.type)} {event.message}",
+                style=_STYLE_BY_ICON_TYPE[event.type],
+                end=end,
+                soft_wrap=True,
+            )
+
+    def write_table(self, table: Table) -> None:
+        self._get_console("stdout").print(
+            table, justify="left", overflow="fold", soft_wrap=True
+        )
+
+    def _get_console(self, kind: Literal["stdout", "stderr", "plain"]) -> Console:
+        # Rich is slow to import, and it's only needed for interactive terminals.
+        from rich.console import Console  # noqa: PLC0415
+
+        console = self._consoles.get(kind)
+        if console is None:
+            if kind == "stdout":
+                console = Console()
+            elif kind == "stderr":
+                console = Console(stderr=True)
+            else:
+                console = Console(force_terminal=False, soft_wrap=True)
+            self._consoles[kind] = console
+        return console
+
+
+class PlainOutputSink:
+    """Plain text output, e.g. for CI logs.
+
+    Messages are written straight to the standard streams, without styling, so standard
+    output is left to the stream's own buffering.
+    """
+
+    def write(self, event: OutputEvent) -> None:
+        end = "\r" if event.temporary else "\n"
+        if event.type == "plain":
+            text = _render_markup(event.message)
+        elif event.type == "table":
+            msg = "Tables must be written with `write_table`."
+            raise ValueError(msg)
+        else:
+            text = _render_markup(f"{_get_icon(event.type)} {event.message}")
+
+        if event.type == "error":
+            # Keep the order of messages when both streams are written to the same place.
+            sys.stdout.flush()
+            sys.stderr.write(text + end)
+            sys.stderr.flush()
+        else:
+            sys.stdout.write(text + end)
+            if event.temporary:
+                sys.stdout.flush()
+
+    def write_table(self, table: Table) -> None:
+        sys.stdout.write(_render_table(table))
+
+
+class NDJSONOutputSink:
+    """Machine-readable output, as a JSON object per message on standard output.
+
+    Each object has the event type, the message as plain text, and the file and tool the
+    message is about (or null).
+    """
+
+    def write(self, event: OutputEvent) -> None:
+        if event.type == "table":
+            msg = "Tables must be written with `write_table`."
+            raise ValueError(msg)
+
+        self._write_object(
+            type_=event.type,
+            message=_render_markup(event.message),
+            file=event.file,
+            tool=event.tool,
+        )
+
+    def write_table(self, table: Table) -> None:
+        self._write_object(
+            type_="table",
+            message=_render_table(table).removesuffix("\n"),
+            file=None,
+            tool=None,
+        )
+
+    @staticmethod
+    def _write_object(
+        *, type_: EventType, message: str, file: str | None, tool: str | None
+    ) -> None:
+        obj = {"type": type_, "message": message, "file": file, "tool": tool}
+        sys.stdout.write(json.dumps(obj) + "\n")
+
+
+def _render_markup(text: str) -> str:
+    """Render Rich markup (including emoji codes) as plain text."""
+    if "[" not in text and ":" not in text:
+        # Nothing to render, so skip importing and running the markup parser.
+        return text
+
+    from rich.markup import render  # noqa: PLC0415
+
+    return render(text).plain
+
+
+def _render_table(table: Table) -> str:
+    """Render a Rich table as plain text."""
+    from rich.console import Console  # noqa: PLC0415
+
+    file = io.StringIO()
+    Console(file=file, force_terminal=False).print(
+        table, justify="left", overflow="fold", soft_wrap=True
+    )
+    return file.getvalue()
+
+
+def _is_stdout_interactive() -> bool:
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        # e.g. a stream without a file descriptor, or a closed one.
+        return False
+
+
+_RICH_SINK = RichOutputSink()
+_PLAIN_SINK = PlainOutputSink()
+_NDJSON_SINK = NDJSONOutputSink()
+
+
+def get_output_sink() -> OutputSink:
+    """Get the sink for console output, based on the output mode.
+
+    In the automatic mode, Rich is only used when standard output is an interactive
+    terminal; otherwise, plain text is written.
+    """
+    mode = usethis_config.output_mode
+    if mode is OutputModeEnum.auto:
+        return _RICH_SINK if _is_stdout_interactive() else _PLAIN_SINK
+    elif mode is OutputModeEnum.rich:
+        return _RICH_SINK
+    elif mode is OutputModeEnum.plain:
+        return _PLAIN_SINK
+    elif mode is OutputModeEnum.ndjson:
+        return _NDJSON_SINK
+    else:
+        assert_never(mode)
 
 
 def plain_print(msg: str | Exception) -> None:
@@ -35,7 +236,7 @@ def plain_print(msg: str | Exception) -> None:
         or usethis_config.alert_only
         or usethis_config.instruct_only
     ):
-        Console(force_terminal=False, soft_wrap=True).print(msg)
+        get_output_sink().write(OutputEvent(type="plain", message=msg))
 
 
 def table_print(table: Table) -> None:
@@ -45,10 +246,12 @@ def table_print(table: Table) -> None:
         or usethis_config.alert_only
         or usethis_config.instruct_only
     ):
-        console.print(table, justify="left", overflow="fold", soft_wrap=True)
+        get_output_sink().write_table(table)
 
 
-def tick_print(msg: str | Exception) -> None:
+def tick_print(
+    msg: str | Exception, *, file: str | None = None, tool: str | None = None
+) -> None:
     """Print a ✔ success/completion message (green)."""
     msg = str(msg)
 
@@ -57,20 +260,26 @@ def tick_print(msg: str | Exception) -> None:
         or usethis_config.alert_only
         or usethis_config.instruct_only
     ):
-        icon = _get_icon("tick")
-        console.print(f"{icon} {msg}", style="green", soft_wrap=True)
+        get_output_sink().write(
+            OutputEvent(type="tick", message=msg, file=file, tool=tool)
+        )
 
 
-def instruct_print(msg: str | Exception) -> None:
+def instruct_print(
+    msg: str | Exception, *, file: str | None = None, tool: str | None = None
+) -> None:
     """Print a ☐ instruction the user must perform manually (red)."""
     msg = str(msg)
 
     if not (usethis_config.quiet or usethis_config.alert_only):
-        icon = _get_icon("instruct")
-        console.print(f"{icon} {msg}", style="red", soft_wrap=True)
+        get_output_sink().write(
+            OutputEvent(type="instruct", message=msg, file=file, tool=tool)
+        )
 
 
-def how_print(msg: str | Exception) -> None:
+def how_print(
+    msg: str | Exception, *, file: str | None = None, tool: str | None = None
+) -> None:
     """Print a ☐ guidance message explaining how to do something (red)."""
     msg = str(msg)
 
@@ -79,11 +288,18 @@ def how_print(msg: str | Exception) -> None:
         or usethis_config.alert_only
         or usethis_config.instruct_only
     ):
-        icon = _get_icon("how")
-        console.print(f"{icon} {msg}", style="red", soft_wrap=True)
-
-
-def info_print(msg: str | Exception, temporary: bool = False) -> None:
+        get_output_sink().write(
+            OutputEvent(type="how", message=msg, file=file, tool=tool)
+        )
+
+
+def info_print(
+    msg: str | Exception,
+    temporary: bool = False,
+    *,
+    file: str | None = None,
+    tool: str | None = None,
+) -> None:
     """Print an informational message (blue)."""
     msg = str(msg)
 
@@ -92,35 +308,40 @@ def info_print(msg: str | Exception, temporary: bool = False) -> None:
         or usethis_config.alert_only
         or usethis_config.instruct_only
     ):
-        icon = _get_icon("info")
-        if temporary:
-            end = "\r"
-        else:
-            end = "\n"
-        console.print(f"{icon} {msg}", style="blue", end=end, soft_wrap=True)
+        get_output_sink().write(
+            OutputEvent(
+                type="info", message=msg, file=file, tool=tool, temporary=temporary
+            )
+        )
 
 
-def err_print(msg: str | Exception) -> None:
+def err_print(
+    msg: str | Exception, *, file: str | None = None, tool: str | None = None
+) -> None:
     """Print a ✗ error message to stderr (red)."""
     msg = str(msg)
 
     if not usethis_config.quiet:
-        icon = _get_icon("error")
-        err_console.print(f"{icon} {msg}", style="red", soft_wrap=True)
+        get_output_sink().write(
+            OutputEvent(type="error", message=msg, file=file, tool=tool)
+        )
 
 
-def warn_print(msg: str | Exception) -> None:
+def warn_print(
+    msg: str | Exception, *, file: str | None = None, tool: str | None = None
+) -> None:
     """Print a ⚠ warning message (yellow; deduplicated)."""
     msg = str(msg)
 
-    _cached_warn_print(msg)
+    _cached_warn_print(msg, file=file, tool=tool)
 
 
 @functools.cache
-def _cached_warn_print(msg: str) -> None:
+def _cached_warn_print(msg: str, *, file: str | None, tool: str | None) -> None:
     if not usethis_config.quiet:
-        icon = _get_icon("warning")
-        console.print(f"{icon} {msg}", style="yellow", soft_wrap=True)
+        get_output_sink().write(
+            OutputEvent(type="warning", message=msg, file=file, tool=tool)
+        )
 
 
 # Icon fallback system for terminals with varying Unicode support
@@ -137,6 +358,15 @@ _ICON_FALLBACKS: dict[IconType, tuple[str, str, str]] = {
     "warning": ("⚠", "!", "\\[warning]"),
 }
 
+_STYLE_BY_ICON_TYPE: dict[IconType, str] = {
+    "tick": "green",
+    "instruct": "red",
+    "how": "red",
+    "info": "blue",
+    "error": "red",
+    "warning": "yellow",
+}
+
 
 @functools.cache
 def get_icon_mode() -> Literal["unicode", "universal", "text"]:
@@ -3,36 +3,37 @@
 from __future__ import annotations
 
 import re
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel
-
-from usethis._config import usethis_config
 from usethis._console import plain_print, tick_print, warn_print
 from usethis._core.readme import add_readme
 from usethis._integrations.project.name import get_project_name
+from usethis._integrations.readme.markdown import (
+    READMELine,
+    READMEMarkdownManager,
+    get_badge_name,
+    is_badge_line,
+)
 from usethis._integrations.readme.path import (
     NonMarkdownREADMEError,
     get_markdown_readme_path,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from typing_extensions import Self
 
 
-class Badge(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Badge:
     markdown: str
 
     @property
     def name(self) -> str | None:
-        match = re.match(r"^\s*\[!\[(.*)\]\(.*\)\]\(.*\)\s*$", self.markdown)
-        if match:
-            return match.group(1)
-        match = re.match(r"^\s*\!\[(.*)\]\(.*\)\s*$", self.markdown)
-        if match:
-            return match.group(1)
-        return None
+        return get_badge_name(self.markdown)
 
     def equivalent_to(self, other: Self) -> bool:
         return self.name == other.name
@@ -145,107 +146,114 @@ class MarkdownH1Status:
 
 def add_badge(badge: Badge) -> None:
     """Add a badge to the README.md file in the correct position."""
+    add_badges([badge])
+
+
+def add_badges(badges: Sequence[Badge]) -> None:
+    """Add badges to the README.md file in the correct positions.
+
+    The README is scanned once, and the changes are written when the README manager is
+    closed, e.g. on exiting `files_manager()`.
+    """
     add_readme()
 
     try:
-        path = get_markdown_readme_path()
+        get_markdown_readme_path()
     except NonMarkdownREADMEError:
         warn_print(
             "No Markdown-based README file found, printing badge markdown instead..."
         )
-        plain_print(badge.markdown)
+        for badge in badges:
+            plain_print(badge.markdown)
         return
 
-    try:
-        content = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        warn_print(
-            "README file uses an unsupported encoding, printing badge markdown instead..."
-        )
-        plain_print(badge.markdown)
-        return
+    with _opened(READMEMarkdownManager()) as manager:
+        try:
+            lines = manager.get_lines()
+        except UnicodeDecodeError:
+            warn_print(
+                "README file uses an unsupported encoding, printing badge markdown instead..."
+            )
+            for badge in badges:
+                plain_print(badge.markdown)
+            return
+
+        badge_order = get_badge_order()
+        have_added = False
+        for badge in badges:
+            if _add_badge_to_lines(
+                lines, badge, prerequisites=_get_prerequisites(badge, badge_order)
+            ):
+                tick_print(f"Adding {badge.name} badge to 'README.md'.")
+                have_added = True
+
+        if have_added:
+            manager.commit_lines(lines)
 
-    original_lines = content.splitlines()
 
-    prerequisites = _get_prerequisites(badge)
+def _add_badge_to_lines(
+    lines: list[READMELine], badge: Badge, *, prerequisites: Sequence[Badge]
+) -> bool:
+    """Insert a badge into the lines of the README in the correct position.
+
+    Returns:
+        Whether the badge was added, i.e. it wasn't already present.
+    """
+    if any(line.badge_name == badge.name for line in lines):
+        # If the badge is already there, we don't need to do anything
+        return False
+
+    prerequisite_names = {prerequisite.name for prerequisite in prerequisites}
+    badge_line = READMELine.from_text(badge.markdown)
 
-    have_added = False
     have_encountered_badge = False
     h1_status = MarkdownH1Status()
-    lines: list[str] = []
-    for original_line in original_lines:
-        if is_badge(original_line):
+    for idx, line in enumerate(lines):
+        if line.is_badge:
             have_encountered_badge = True
 
-        h1_status.update_from_line(original_line)
+        h1_status.update_from_line(line.text)
 
-        original_badge = Badge(markdown=original_line)
-
-        if original_badge.equivalent_to(badge):
-            # If the badge is already there, we don't need to do anything
-            return
-
-        original_line_is_prerequisite = any(
-            original_badge.equivalent_to(prerequisite) for prerequisite in prerequisites
-        )
-        if not have_added and (
-            not original_line_is_prerequisite
-            and (not is_blank(original_line) or have_encountered_badge)
-            and not is_header(original_line)
+        if (
+            line.badge_name not in prerequisite_names
+            and (not is_blank(line.text) or have_encountered_badge)
+            and not is_header(line.text)
             and not h1_status.in_block
         ):
-            lines.append(badge.markdown)
-            have_added = True
+            lines.insert(idx, badge_line)
 
             # Protect the badge we've just added
-            if not is_blank(original_line) and not is_badge(original_line):
-                lines.append("")
-
-        lines.append(original_line)
-
-    # In case the badge needs to go at the bottom of the file
-    if not have_added:
+            if not is_blank(line.text) and not line.is_badge:
+                lines.insert(idx + 1, READMELine.from_text(""))
+            break
+    else:
+        # In case the badge needs to go at the bottom of the file
         # Add a blank line between headers and the badge
-        if original_lines and is_header(original_lines[-1]):
-            lines.append("")
-        lines.append(badge.markdown)
-        have_added = True
-
-    tick_print(f"Adding {badge.name} badge to 'README.md'.")
+        if lines and is_header(lines[-1].text):
+            lines.append(READMELine.from_text(""))
+        lines.append(badge_line)
 
     # If the first line is blank, we basically just want to replace it.
-    if is_blank(lines[0]):
+    if is_blank(lines[0].text):
         del lines[0]
 
-    output = "\n".join(lines)
+    return True
 
-    # Ensure final newline
-    if have_added:
-        output = _ensure_final_newline(output)
 
-    path.write_text(output, encoding="utf-8")
-
-
-def _get_prerequisites(badge: Badge) -> list[Badge]:
+def _get_prerequisites(badge: Badge, badge_order: Sequence[Badge]) -> list[Badge]:
     """Get the prerequisites for a badge.
 
     We want to place the badges in a specific order, so we need to check if we've
     passed those prerequisites.
     """
     prerequisites: list[Badge] = []
-    for _b in get_badge_order():
+    for _b in badge_order:
         if badge.equivalent_to(_b):
             break
         prerequisites.append(_b)
     return prerequisites
 
 
-def _ensure_final_newline(content: str) -> str:
-    if not content or content[-1] != "\n":
-        content += "\n"
-    return content
-
-
 def is_blank(line: str) -> bool:
     """Return True if the line is empty or contains only whitespace."""
     return line.isspace() or not line
@@ -258,35 +266,63 @@ def is_header(line: str) -> bool:
 
 def is_badge(line: str) -> bool:
     """Return True if the line looks like a Markdown badge (heuristic)."""
-    return (
-        re.match(r"^\[!\[.*\]\(.*\)\]\(.*\)$", line) is not None
-        or re.match(r"^\!\[.*\]\(.*\)$", line) is not None
-    )
+    return is_badge_line(line)
 
 
 def remove_badge(badge: Badge) -> None:
     """Remove a badge from the README.md file."""
-    path = usethis_config.cpd() / "README.md"
+    remove_badges([badge])
+
 
+def remove_badges(badges: Sequence[Badge]) -> None:
+    """Remove badges from the README.md file.
+
+    The README is scanned once, and the changes are written when the README manager is
+    closed, e.g. on exiting `files_manager()`.
+    """
     try:
-        path = get_markdown_readme_path()
+        get_markdown_readme_path()
     except FileNotFoundError:
         # If there's no README.md, there's nothing to remove
         return
 
-    content = path.read_text(encoding="utf-8")
+    with _opened(READMEMarkdownManager()) as manager:
+        lines = manager.get_lines()
+        has_final_newline = manager.get().endswith("\n")
 
-    original_lines = content.splitlines()
-    if content.endswith("\n"):
-        original_lines.append("")
+        have_removed = False
+        for badge in badges:
+            new_lines = _remove_badge_from_lines(
+                lines, badge, has_final_newline=has_final_newline
+            )
+            if new_lines is not None:
+                tick_print(f"Removing {badge.name} badge from 'README.md'.")
+                lines = new_lines
+                has_final_newline = True
+                have_removed = True
+
+        if have_removed:
+            manager.commit_lines(lines)
 
-    lines: list[str] = []
+
+def _remove_badge_from_lines(
+    lines: list[READMELine], badge: Badge, *, has_final_newline: bool
+) -> list[READMELine] | None:
+    """Remove a badge from the lines of the README.
+
+    Returns:
+        The new lines, or None if the badge wasn't present.
+    """
+    original_lines = list(lines)
+    if has_final_newline:
+        original_lines.append(READMELine.from_text(""))
+
+    new_lines: list[READMELine] = []
     have_removed = False
     skip_blank = False
     for idx, original_line in enumerate(original_lines):
         if not skip_blank:
-            if Badge(markdown=original_line).equivalent_to(badge):
-                tick_print(f"Removing {badge.name} badge from 'README.md'.")
+            if original_line.badge_name == badge.name:
                 have_removed = True
 
                 # Merge consecutive blank lines around the badges,
@@ -294,21 +330,32 @@ def remove_badge(badge: Badge) -> None:
                 if (
                     idx - 1 >= 0
                     and idx + 1 < len(original_lines)
-                    and is_blank(original_lines[idx - 1])
-                    and is_blank(original_lines[idx + 1])
+                    and is_blank(original_lines[idx - 1].text)
+                    and is_blank(original_lines[idx + 1].text)
                 ):
                     skip_blank = True  # i.e. next iteration once we hit a blank
 
                 continue
 
-            lines.append(original_line)
+            new_lines.append(original_line)
         else:
             skip_blank = False
 
-    output = "\n".join(lines)
+    if not have_removed:
+        return None
+
+    # The final line ending is restored when the lines are committed.
+    if len(new_lines) > 1 and not new_lines[-1].text:
+        del new_lines[-1]
+
+    return new_lines
 
-    # Ensure final newline
-    if have_removed:
-        output = _ensure_final_newline(output)
 
-    path.write_text(output, encoding="utf-8")
+@contextmanager
+def _opened(manager: READMEMarkdownManager) -> Iterator[READMEMarkdownManager]:
+    """Use the README manager, opening it for the duration if it isn't already open."""
+    if manager.is_locked():
+        yield manager
+    else:
+        with manager:
+            yield manager
@@ -0,0 +1,68 @@
+"""Dry runs of commands, which report the changes they would make."""
+
+from __future__ import annotations
+
+import os
+import shlex
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from rich.markup import escape
+
+from usethis._config import usethis_config
+from usethis._console import info_print, plain_print
+from usethis._file import fs
+from usethis._plan import get_planned_file_change, record_plan
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from usethis._plan import ChangePlan
+
+
+@contextmanager
+def dry_run(*, plan_file: Path | None = None) -> Iterator[ChangePlan]:
+    """Context manager which runs commands without modifying the project.
+
+    Changes to files are held in memory rather than written to disk (see
+    `usethis._file.fs`), and subprocesses are skipped. On exit, a unified diff of the
+    changes is displayed, followed by the subprocesses which would have been run.
+
+    Args:
+        plan_file: If given, a machine-readable JSON plan is also written to this file.
+    """
+    project_dir = os.path.realpath(usethis_config.cpd())
+    with (
+        usethis_config.set(dry_run=True),
+        fs.hold_changes() as held,
+        record_plan() as plan,
+    ):
+        yield plan
+
+    plan.file_changes = [
+        get_planned_file_change(
+            # Files outside the project, e.g. a workspace root, are relative to it too.
+            os.path.relpath(file_change.path, project_dir).replace(os.sep, "/"),
+            before=file_change.before,
+            after=file_change.after,
+        )
+        for file_change in held.get_file_changes()
+    ]
+
+    _output_plan(plan, plan_file=plan_file)
+
+
+def _output_plan(plan: ChangePlan, *, plan_file: Path | None) -> None:
+    if plan_file is not None:
+        plan_file.write_text(plan.to_json() + "\n", encoding="utf-8")
+
+    if plan.is_empty():
+        info_print("Dry run: no changes would be made.")
+        return
+
+    diff = plan.get_unified_diff()
+    if diff:
+        plain_print(escape(diff.removesuffix("\n")))
+    for subprocess in plan.subprocesses:
+        info_print(escape(f"Dry run: would run '{shlex.join(subprocess.args)}'."))
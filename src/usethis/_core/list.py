@@ -1,5 +1,6 @@
 """List tools and their usage status."""
 
+from dataclasses import dataclass
 from typing import Literal
 
 from pydantic import BaseModel
@@ -8,11 +9,12 @@ from typing_extensions import assert_never
 
 from usethis._console import table_print
 from usethis._detect.readme import is_readme_used
-from usethis._tool.all_ import ALL_TOOLS
 from usethis._tool.impl.base.ruff import RuffTool
+from usethis._tool.registry import TOOL_REGISTRY
 
 
-class UsageRow(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UsageRow:
     category: Literal["tool", "config", ""]
     name: str
     status: Literal["used", "unused"] | Literal["numpy", "google", "pep257"]
@@ -90,8 +92,10 @@ def get_usage_table() -> UsageTable:
     """Get the usage table."""
     table = UsageTable(rows=[])
 
-    # Add rows for each tool
-    for tool in ALL_TOOLS:
+    # Add rows for each tool. Each needs a full check, since whether a tool is used can
+    # depend on its configuration sections, which aren't known statically.
+    for registration in TOOL_REGISTRY.values():
+        tool = registration.load()
         if tool.is_used():
             table.rows.append(UsageRow(category="tool", name=tool.name, status="used"))
         else:
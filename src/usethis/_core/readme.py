@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from usethis._config import usethis_config
 from usethis._console import how_print, tick_print
+from usethis._file import fs
 from usethis._file.pyproject_toml.errors import PyprojectTOMLError
 from usethis._file.pyproject_toml.name import get_description
 from usethis._integrations.project.name import get_project_name
+from usethis._integrations.readme.markdown import READMEMarkdownManager
 from usethis._integrations.readme.path import get_readme_path
 
 
@@ -21,7 +23,7 @@ def add_readme() -> None:
     else:
         # Check if the file is non-empty; if so, we will exit early
         try:
-            existing_content = path.read_text(encoding="utf-8")
+            existing_content = fs.read_text(path)
         except UnicodeDecodeError:
             return
         if existing_content.strip():
@@ -46,5 +48,9 @@ def add_readme() -> None:
 """
 
     tick_print("Writing 'README.md'.")
-    (usethis_config.cpd() / "README.md").write_text(content, encoding="utf-8")
+    fs.write_text(usethis_config.cpd() / "README.md", content)
+    manager = READMEMarkdownManager()
+    if manager.is_locked():
+        # Any previously-read content is stale.
+        manager.revert()
     how_print("Populate 'README.md' to help users understand the project.")
@@ -1,13 +1,14 @@
 """Linter rule selection and configuration."""
 
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 from usethis._core.tool import use_deptry, use_ruff
 from usethis._tool.impl.base.deptry import DeptryTool
 from usethis._tool.impl.base.ruff import RuffTool
 
 
-class RulesMapping(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RulesMapping:
     ruff_rules: list[str]
     deptry_rules: list[str]
 
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
+from rich.markup import escape
+from typing_extensions import assert_never
+
 from usethis._backend.dispatch import get_backend
+from usethis._config import usethis_config
+from usethis._config_file import files_manager
 from usethis._console import plain_print
+from usethis._core.list import get_usage_table
 from usethis._integrations.project.license import get_license_id
 from usethis._integrations.project.name import get_project_name
 from usethis._integrations.sonarqube.config import get_sonar_project_properties
+from usethis._types.output_format import OutputFormatEnum
+from usethis.errors import UsethisError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
     from pathlib import Path
 
 
@@ -38,10 +48,80 @@ def show_sonarqube_config(
     )
 
 
+def show_all(
+    *,
+    project_dirs: Sequence[Path] = (),
+    output_format: OutputFormatEnum = OutputFormatEnum.json,
+    output_file: Path | None = None,
+) -> None:
+    """Display every project fact at once, as JSON.
+
+    The facts are the project name, backend, license, SonarQube configuration and the
+    usage status of each tool. Each configuration file is only parsed once per project.
+    A fact which can't be determined is null, with the reason given under "errors".
+
+    Args:
+        project_dirs: The project directories to describe. Defaults to the current
+                      project.
+        output_format: With JSON, a single JSON document is displayed: an object
+                       for a single project, or an array of objects for several. With
+                       NDJSON, each project's object is displayed on its own line as
+                       soon as it has been computed.
+        output_file: A file to write the output to instead of displaying it.
+    """
+    if not project_dirs:
+        project_dirs = [usethis_config.cpd()]
+
+    if output_format is OutputFormatEnum.json:
+        facts = [_get_facts_for_project(project_dir) for project_dir in project_dirs]
+        content = json.dumps(facts[0] if len(facts) == 1 else facts, indent=2)
+        _output(content, output_file=output_file)
+    elif output_format is OutputFormatEnum.ndjson:
+        if output_file is not None:
+            with output_file.open("w", encoding="utf-8") as f:
+                for project_dir in project_dirs:
+                    f.write(json.dumps(_get_facts_for_project(project_dir)) + "\n")
+                    f.flush()
+        else:
+            for project_dir in project_dirs:
+                plain_print(escape(json.dumps(_get_facts_for_project(project_dir))))
+    else:
+        assert_never(output_format)
+
+
+def _get_facts_for_project(project_dir: Path) -> dict[str, object]:
+    # Any warnings would corrupt the JSON output; problems are reported in it instead.
+    with usethis_config.set(project_dir=project_dir, quiet=True), files_manager():
+        return _get_facts()
+
+
+def _get_facts() -> dict[str, object]:
+    errors: dict[str, str] = {}
+
+    def _get(fact: str, getter: Callable[[], object]) -> object:
+        try:
+            return getter()
+        except UsethisError as err:
+            errors[fact] = str(err)
+            return None
+
+    return {
+        "project_dir": usethis_config.cpd().as_posix(),
+        "name": _get("name", get_project_name),
+        "backend": _get("backend", lambda: get_backend().value),
+        "license": _get("license", get_license_id),
+        "sonarqube": _get("sonarqube", get_sonar_project_properties),
+        "usage": _get(
+            "usage", lambda: get_usage_table().model_dump(mode="json")["rows"]
+        ),
+        "errors": errors,
+    }
+
+
 def _output(content: str, *, output_file: Path | None = None) -> None:
     if output_file is not None:
         if not content.endswith("\n"):
             content += "\n"
         output_file.write_text(content, encoding="utf-8")
     else:
-        plain_print(content)
+        plain_print(escape(content))
@@ -12,6 +12,11 @@ from usethis._backend.uv.lockfile import ensure_uv_lock
 from usethis._config import usethis_config
 from usethis._console import info_print, instruct_print, tick_print
 from usethis._deps import add_deps_to_group, remove_deps_from_group
+from usethis._file import fs
+from usethis._file.pyproject_toml.fingerprint import (
+    is_fingerprint_stale,
+    record_fingerprint,
+)
 from usethis._file.pyproject_toml.valid import ensure_pyproject_validity
 from usethis._init import ensure_dep_declaration_file, write_simple_requirements_txt
 from usethis._integrations.mkdocs.core import add_docs_dir
@@ -27,7 +32,6 @@ from usethis._integrations.pytest.core import (
     add_pytest_dir,
     remove_pytest_dir,
 )
-from usethis._tool.all_ import ALL_TOOLS
 from usethis._tool.impl.base.codespell import CodespellTool
 from usethis._tool.impl.base.coverage_py import CoveragePyTool
 from usethis._tool.impl.base.deptry import DeptryTool
@@ -41,6 +45,7 @@ from usethis._tool.impl.base.requirements_txt import RequirementsTxtTool
 from usethis._tool.impl.base.ruff import RuffTool
 from usethis._tool.impl.base.tach import TachTool
 from usethis._tool.impl.base.ty import TyTool
+from usethis._tool.registry import TOOL_REGISTRY
 from usethis._tool.rule import RuleConfig
 from usethis._types.backend import BackendEnum
 from usethis._types.deps import Dependency
@@ -162,7 +167,7 @@ def use_mkdocs(*, remove: bool = False, how: bool = False) -> None:
 
     if not remove:
         ensure_dep_declaration_file()
-        (usethis_config.cpd() / "mkdocs.yml").touch()
+        fs.touch(usethis_config.cpd() / "mkdocs.yml")
 
         add_docs_dir()
 
@@ -191,8 +196,10 @@ def use_pre_commit(*, remove: bool = False, how: bool = False) -> None:
         tool.add_dev_deps()
         _add_all_tools_pre_commit_configs()
 
-        for _tool in ALL_TOOLS:
-            _tool.migrate_config_to_pre_commit()
+        # Only tools with pre-commit hooks have any configuration to migrate.
+        for registration in TOOL_REGISTRY.values():
+            if registration.hook_ids:
+                registration.load().migrate_config_to_pre_commit()
 
         if not get_hook_ids():
             add_placeholder_hook()
@@ -216,17 +223,20 @@ def use_pre_commit(*, remove: bool = False, how: bool = False) -> None:
         remove_pre_commit_config()
         tool.remove_dev_deps()
 
-        for _tool in ALL_TOOLS:
-            _tool.migrate_config_from_pre_commit()
+        for registration in TOOL_REGISTRY.values():
+            if registration.hook_ids:
+                registration.load().migrate_config_from_pre_commit()
 
         tool.remove_managed_files()
 
 
 def _add_all_tools_pre_commit_configs():
-    PreCommitTool().add_pre_commit_config()
-    for _tool in ALL_TOOLS:
-        if isinstance(_tool, PreCommitTool):
+    tool = PreCommitTool()
+    tool.add_pre_commit_config()
+    for registration in TOOL_REGISTRY.values():
+        if registration.name == tool.name or not registration.hook_ids:
             continue
+        _tool = registration.load()
         if _tool.is_used():
             _tool.add_pre_commit_config()
 
@@ -305,11 +315,15 @@ def use_pytest(
 
         rule_config = tool.rule_config
 
-        for _tool in ALL_TOOLS:
-            if isinstance(_tool, PytestTool):
+        for registration in TOOL_REGISTRY.values():
+            if (
+                registration.name == tool.name
+                or not registration.rule_config.is_related_to_tests
+            ):
                 continue
 
-            if _tool.rule_config.is_related_to_tests and _tool.is_used():
+            _tool = registration.load()
+            if _tool.is_used():
                 rule_config |= _tool.rule_config.subset_related_to_tests()
 
         if RuffTool().is_used():
@@ -332,9 +346,18 @@ def use_pytest(
 
 
 def use_requirements_txt(
-    *, remove: bool = False, how: bool = False, output_file: str = "requirements.txt"
+    *,
+    remove: bool = False,
+    how: bool = False,
+    output_file: str = "requirements.txt",
+    force: bool = False,
 ) -> None:
-    """Add and configure a requirements.txt file exported from the uv lockfile."""
+    """Add and configure a requirements.txt file exported from the uv lockfile.
+
+    An existing requirements file is only regenerated if it was written by usethis from
+    different dependency declarations than those currently in pyproject.toml, unless
+    `force` is set.
+    """
     tool = RequirementsTxtTool(output_file=output_file)
 
     if how:
@@ -355,13 +378,13 @@ def use_requirements_txt(
                 with usethis_config.set(quiet=True):
                     add_deps_to_group([Dependency(name="uv")], "uv", default=False)
 
-        if path.exists():
-            # requirements file already exists - short circuit; only need to explain how
-            # how to re-generate it.
+        if fs.exists(path) and not force and not is_fingerprint_stale(output_file):
+            # requirements file already exists and is up-to-date - short circuit; only
+            # need to explain how to re-generate it.
             tool.print_how_to_use()
             return
 
-        _generate_requirements_txt(output_file=output_file)
+        generate_requirements_txt(output_file=output_file, force=force)
 
         tool.print_how_to_use()
     else:
@@ -372,13 +395,23 @@ def use_requirements_txt(
         tool.remove_managed_files()
 
 
-def _generate_requirements_txt(*, output_file: str = "requirements.txt") -> None:
+def generate_requirements_txt(
+    *, output_file: str = "requirements.txt", force: bool = False
+) -> None:
+    """Write a requirements file for the project, and record its fingerprint.
+
+    With uv, the requirements are exported from the lockfile; otherwise, the abstract
+    dependencies declared in pyproject.toml are listed.
+    """
     backend = get_backend()
     if backend is BackendEnum.uv:
-        if not (usethis_config.cpd() / "pyproject.toml").exists():
+        if not fs.exists(usethis_config.cpd() / "pyproject.toml"):
             write_simple_requirements_txt(output_file=output_file)
-        elif not usethis_config.frozen:
-            ensure_uv_lock()
+        elif usethis_config.frozen:
+            # Exporting requires an up-to-date lockfile, which we can't ensure.
+            return
+        else:
+            ensure_uv_lock(force=force)
             tick_print(f"Writing '{output_file}'.")
             call_uv_subprocess(
                 [
@@ -405,6 +438,8 @@ def _generate_requirements_txt(*, output_file: str = "requirements.txt") -> None
     else:
         assert_never(backend)
 
+    record_fingerprint(output_file)
+
 
 def use_ruff(  # noqa: PLR0913
     *,
@@ -456,8 +491,12 @@ def use_ruff(  # noqa: PLR0913
         or not tool.selected_rules()
     ):
         rule_config = _get_basic_rule_config()
-        for _tool in ALL_TOOLS:
-            if not _tool.rule_config.empty and _tool.is_used():
+        for registration in TOOL_REGISTRY.values():
+            if registration.rule_config.empty:
+                continue
+
+            _tool = registration.load()
+            if _tool.is_used():
                 rule_config |= _tool.rule_config
     else:
         rule_config = RuleConfig()
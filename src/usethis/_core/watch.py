@@ -0,0 +1,363 @@
+"""Keep derived configuration in sync with the project as it changes."""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import PurePath
+from typing import TYPE_CHECKING
+
+from usethis._config import usethis_config
+from usethis._config_file import files_manager
+from usethis._console import err_print, info_print, tick_print
+from usethis._core.tool import generate_requirements_txt
+from usethis._deps import add_deps_to_group, get_dep_index, remove_deps_from_group
+from usethis._file import fs
+from usethis._file.manager import document_cache
+from usethis._file.pyproject_toml.fingerprint import (
+    has_fingerprint,
+    is_fingerprint_stale,
+)
+from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+from usethis._file.snapshot import project_snapshot
+from usethis._integrations.project.imports import (
+    import_graph_cache,
+    invalidate_import_graph_cache,
+)
+from usethis._integrations.sonarqube.config import build_sonar_project_properties
+from usethis._tool.impl.base.codespell import CodespellTool
+from usethis._tool.impl.base.import_linter import ImportLinterTool
+from usethis._tool.impl.base.tach import TachTool
+from usethis._types.deps import Dependency
+from usethis.errors import UsethisError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+    from pathlib import Path
+
+# Directories which never contain files that derived artifacts depend on.
+_IGNORED_DIR_NAMES = frozenset(
+    {"__pycache__", "build", "dist", "node_modules", "site", "venv"}
+)
+
+_REQUIREMENTS_TXT = "requirements.txt"
+_SONAR_PROJECT_PROPERTIES = "sonar-project.properties"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DerivedArtifact:
+    """Configuration or a file which is derived from other files in the project.
+
+    Attributes:
+        name: The name of the artifact, for display purposes.
+        inputs: Whether a change to the file or directory at the given (relative) path
+                might affect the artifact.
+        outputs: The (relative) paths of the files which syncing the artifact might
+                 modify. Artifacts later in the sync order which depend on these are
+                 also synced.
+        sync: Bring the artifact up to date with the project, if the project has it.
+              Returns whether anything was modified.
+    """
+
+    name: str
+    inputs: Callable[[PurePath], bool]
+    outputs: tuple[PurePath, ...]
+    sync: Callable[[], bool]
+
+
+def _sync_codespell_deps() -> bool:
+    # tomli is only needed for Python < 3.11, so it follows requires-python.
+    if not get_dep_index().is_dep_satisfied_in_group(
+        Dependency(name="codespell"), group="dev"
+    ):
+        return False
+
+    tomli = Dependency(name="tomli")
+    needs_tomli = tomli in CodespellTool().dev_deps()
+    has_tomli = get_dep_index().is_dep_satisfied_in_group(tomli, group="dev")
+    if needs_tomli and not has_tomli:
+        add_deps_to_group([tomli], "dev")
+    elif has_tomli and not needs_tomli:
+        remove_deps_from_group([tomli], "dev")
+    else:
+        return False
+    return True
+
+
+def _sync_requirements_txt() -> bool:
+    # Only regenerate the file if usethis generated it, so it isn't maintained by hand.
+    path = usethis_config.cpd() / _REQUIREMENTS_TXT
+    if not (path.is_file() and has_fingerprint(_REQUIREMENTS_TXT)):
+        return False
+
+    lock_path = usethis_config.cpd() / "uv.lock"
+    is_lock_newer = (
+        lock_path.is_file() and lock_path.stat().st_mtime_ns > path.stat().st_mtime_ns
+    )
+    if not (is_lock_newer or is_fingerprint_stale(_REQUIREMENTS_TXT)):
+        return False
+
+    generate_requirements_txt(output_file=_REQUIREMENTS_TXT)
+    return True
+
+
+def _sync_import_linter_contracts() -> bool:
+    tool = ImportLinterTool()
+    return tool.is_used() and tool.sync_derived_configs()
+
+
+def _sync_tach_modules() -> bool:
+    tool = TachTool()
+    return tool.is_used() and tool.sync_derived_configs()
+
+
+def _sync_sonar_project_properties() -> bool:
+    # The file is only managed when there is SonarQube configuration for usethis, since
+    # otherwise it is the source of truth for `usethis show sonarqube`.
+    if not (
+        (usethis_config.cpd() / "pyproject.toml").is_file()
+        and ["tool", "usethis", "sonarqube"] in PyprojectTOMLManager()
+    ):
+        return False
+
+    content = build_sonar_project_properties()
+    path = usethis_config.cpd() / _SONAR_PROJECT_PROPERTIES
+    if fs.is_file(path) and fs.read_text(path) == content:
+        return False
+
+    tick_print(
+        f"Writing '{_SONAR_PROJECT_PROPERTIES}'.", file=_SONAR_PROJECT_PROPERTIES
+    )
+    fs.write_text(path, content)
+    return True
+
+
+def _is_module(path: PurePath) -> bool:
+    return path.suffix == ".py"
+
+
+def _is_layout(path: PurePath) -> bool:
+    return path in {PurePath("src"), PurePath("tests"), PurePath("test")}
+
+
+DERIVED_ARTIFACTS: list[DerivedArtifact] = [
+    # In order, so that each artifact is synced after those it depends on.
+    DerivedArtifact(
+        name="Codespell dependencies",
+        inputs=lambda path: path == PurePath("pyproject.toml"),
+        outputs=(PurePath("pyproject.toml"), PurePath("uv.lock")),
+        sync=_sync_codespell_deps,
+    ),
+    DerivedArtifact(
+        name=_REQUIREMENTS_TXT,
+        inputs=lambda path: path in {PurePath("pyproject.toml"), PurePath("uv.lock")},
+        outputs=(PurePath(_REQUIREMENTS_TXT), PurePath("uv.lock")),
+        sync=_sync_requirements_txt,
+    ),
+    DerivedArtifact(
+        name="Import Linter contracts",
+        inputs=lambda path: (
+            _is_module(path)
+            or _is_layout(path)
+            or path
+            in {
+                PurePath("pyproject.toml"),
+                PurePath("setup.cfg"),
+                PurePath(".importlinter"),
+            }
+        ),
+        outputs=(
+            PurePath("pyproject.toml"),
+            PurePath("setup.cfg"),
+            PurePath(".importlinter"),
+        ),
+        sync=_sync_import_linter_contracts,
+    ),
+    DerivedArtifact(
+        name="Tach modules",
+        inputs=lambda path: (
+            _is_module(path) or _is_layout(path) or path == PurePath("tach.toml")
+        ),
+        outputs=(PurePath("tach.toml"),),
+        sync=_sync_tach_modules,
+    ),
+    DerivedArtifact(
+        name=_SONAR_PROJECT_PROPERTIES,
+        inputs=lambda path: (
+            _is_layout(path)
+            or path in {PurePath("pyproject.toml"), PurePath(".python-version")}
+        ),
+        outputs=(PurePath(_SONAR_PROJECT_PROPERTIES),),
+        sync=_sync_sonar_project_properties,
+    ),
+]
+
+
+def watch(
+    *,
+    interval: float,
+    debounce: float,
+    max_cycles: int | None = None,
+) -> None:
+    """Watch the project for changes, and keep derived artifacts in sync with it.
+
+    The project is polled for changes every `interval` seconds. Once a change is found,
+    we wait until there have been no more changes for `debounce` seconds, e.g. while
+    switching git branches, and then sync the artifacts affected by the changes. Parsed
+    configuration files, the import graph, and the project's layout are kept in memory
+    between cycles, and only refreshed when the relevant files change.
+
+    Args:
+        interval: The time in seconds between polls for changes.
+        debounce: The time in seconds without changes to wait for before syncing.
+        max_cycles: The number of sync cycles after which to stop. By default, this
+                    watches until interrupted.
+    """
+    info_print("Watching for changes. Press Ctrl+C to stop.")
+
+    with document_cache(), import_graph_cache(), project_snapshot():
+        stamps = _scan_project()
+        cycles = 0
+        while max_cycles is None or cycles < max_cycles:
+            time.sleep(interval)
+            latest = _scan_project()
+            changed = _get_changed_paths(stamps, latest)
+            if not changed:
+                continue
+
+            while True:
+                time.sleep(debounce)
+                previous, latest = latest, _scan_project()
+                more_changed = _get_changed_paths(previous, latest)
+                if not more_changed:
+                    break
+                changed |= more_changed
+
+            updated = sync_derived_artifacts(changed)
+            cycles += 1
+
+            # Ignore the changes made by the sync itself, but not any other changes made
+            # while it ran, so they are synced in the next cycle.
+            stamps = latest
+            _restamp(
+                stamps,
+                paths={
+                    path
+                    for artifact in DERIVED_ARTIFACTS
+                    if artifact.name in updated
+                    for path in artifact.outputs
+                },
+            )
+
+
+def sync_derived_artifacts(changed: Collection[PurePath]) -> list[str]:
+    """Sync the derived artifacts affected by changes to the given paths.
+
+    Any import graphs cached in the `import_graph_cache` context are discarded if
+    modules have changed.
+
+    Args:
+        changed: The (relative) paths of the files and directories which have changed.
+
+    Returns:
+        The names of the artifacts which were modified.
+    """
+    start = time.perf_counter()
+
+    change_count = len(changed)
+    changed = set(changed)
+    if any(_is_module(path) for path in changed):
+        invalidate_import_graph_cache()
+
+    updated: list[str] = []
+    for artifact in DERIVED_ARTIFACTS:
+        if not any(artifact.inputs(path) for path in changed):
+            continue
+
+        try:
+            with files_manager():
+                is_modified = artifact.sync()
+        except UsethisError as err:
+            err_print(err)
+            continue
+
+        if is_modified:
+            updated.append(artifact.name)
+            changed.update(artifact.outputs)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    s = "" if change_count == 1 else "s"
+    if updated:
+        names = ", ".join(f"'{name}'" for name in updated)
+        info_print(
+            f"Synced {names} after {change_count} change{s} ({elapsed_ms:.0f}ms)."
+        )
+    else:
+        info_print(
+            f"Nothing to sync after {change_count} change{s} ({elapsed_ms:.0f}ms)."
+        )
+    return updated
+
+
+def _scan_project() -> dict[PurePath, tuple[int, int] | None]:
+    """Get the modification time and size of each file in the project, by path.
+
+    Directories are included (with None), so that creating or removing them counts as a
+    change, but hidden directories (e.g. '.git' and '.venv') are skipped.
+    """
+    root = usethis_config.cpd()
+    stamps: dict[PurePath, tuple[int, int] | None] = {}
+    _scan_dir(root, relative_dir=PurePath(), stamps=stamps)
+    return stamps
+
+
+def _scan_dir(
+    path: Path,
+    *,
+    relative_dir: PurePath,
+    stamps: dict[PurePath, tuple[int, int] | None],
+) -> None:
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        # e.g. the directory was removed while scanning.
+        return
+
+    for entry in entries:
+        relative_path = relative_dir / entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.startswith(".") or entry.name in _IGNORED_DIR_NAMES:
+                    continue
+                stamps[relative_path] = None
+                _scan_dir(path / entry.name, relative_dir=relative_path, stamps=stamps)
+            elif entry.is_file():
+                stat = entry.stat()
+                stamps[relative_path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            continue
+
+
+def _restamp(
+    stamps: dict[PurePath, tuple[int, int] | None], *, paths: Collection[PurePath]
+) -> None:
+    """Update the modification time and size of the given files in a scan."""
+    root = usethis_config.cpd()
+    for path in paths:
+        try:
+            stat = os.stat(root / path)
+        except OSError:
+            stamps.pop(path, None)
+            continue
+        stamps[path] = (stat.st_mtime_ns, stat.st_size)
+
+
+def _get_changed_paths(
+    old: dict[PurePath, tuple[int, int] | None],
+    new: dict[PurePath, tuple[int, int] | None],
+) -> set[PurePath]:
+    """Get the paths which were created, removed, or modified between two scans."""
+    changed = set(old.keys() ^ new.keys())
+    changed.update(path for path, stamp in new.items() if old.get(path, stamp) != stamp)
+    return changed
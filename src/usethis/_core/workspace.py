@@ -0,0 +1,75 @@
+"""Running usethis commands across the members of a uv workspace."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from usethis._backend.dispatch import get_backend
+from usethis._backend.uv.lockfile import ensure_uv_lock
+from usethis._backend.uv.workspace import get_workspace_members
+from usethis._config import usethis_config
+from usethis._config_file import files_manager
+from usethis._console import info_print
+from usethis._file.pyproject_toml.fingerprint import get_deps_fingerprint
+from usethis._types.backend import BackendEnum
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def use_in_workspace(func: Callable[[], None]) -> None:
+    """Run a function for each member of the uv workspace at the project directory.
+
+    This should be called within the `files_manager` context for the workspace root.
+    The root's configuration files stay open throughout, and each other member's are
+    opened in turn, with the member as the project directory. The backend is inferred
+    once, for the root.
+
+    Rather than locking the workspace after each change to a member's dependencies, the
+    function runs in frozen mode, and the workspace is locked once at the end if any
+    dependencies changed (unless frozen mode was already requested).
+
+    Args:
+        func: The function to run for each member, e.g. a partial application of
+              `use_ruff`.
+
+    Raises:
+        UVWorkspaceError: If there is no valid workspace configuration.
+    """
+    root = usethis_config.cpd()
+    members = get_workspace_members()
+    backend = get_backend()
+    frozen = usethis_config.frozen
+
+    deps_changed = False
+    with usethis_config.set(frozen=True):
+        for member in members:
+            info_print(
+                f"Configuring workspace member '{_get_member_str(member, root)}'."
+            )
+            if member == root:
+                deps_changed |= _run_tracking_deps(func)
+                continue
+
+            with (
+                usethis_config.set(project_dir=member, backend=backend),
+                files_manager(),
+            ):
+                deps_changed |= _run_tracking_deps(func)
+
+    if backend is BackendEnum.uv and not frozen:
+        ensure_uv_lock(force=deps_changed)
+
+
+def _run_tracking_deps(func: Callable[[], None]) -> bool:
+    """Run a function, returning whether it changed the dependency declarations."""
+    before = get_deps_fingerprint()
+    func()
+    return get_deps_fingerprint() != before
+
+
+def _get_member_str(member: Path, root: Path) -> str:
+    if member == root:
+        return "."
+    return member.relative_to(root).as_posix()
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+import tomlkit
+from packaging.utils import canonicalize_name
+from pydantic import TypeAdapter
+from tomlkit.items import Table
 from typing_extensions import assert_never
 
 from usethis._backend.dispatch import get_backend
@@ -32,12 +37,17 @@ from usethis._file.pyproject_toml.deps import (
 from usethis._file.pyproject_toml.deps import (
     get_project_deps as _get_project_deps,
 )
+from usethis._file.pyproject_toml.deps import parse_requirement
 from usethis._file.pyproject_toml.errors import PyprojectTOMLDepsError
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._types.backend import BackendEnum
 from usethis.errors import DepGroupError
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tomlkit.container import Container
+
     from usethis._types.deps import Dependency
 
 
@@ -90,13 +100,71 @@ def _merge_deps(base: list[Dependency], extra: list[Dependency]) -> list[Depende
     return base + [dep for dep in extra if dep.name not in existing_names]
 
 
-def get_deps_from_group(group: str) -> list[Dependency]:
-    """Get the list of dependencies in a named dependency group."""
-    dep_groups = get_dep_groups()
-    try:
-        return dep_groups[group]
-    except KeyError:
-        return []
+@dataclass
+class DepIndex:
+    """An index of the dependencies declared in each dependency group.
+
+    Dependencies are indexed by their normalized name (per PEP 503), so checking whether
+    a dependency is declared doesn't require a scan over the declarations.
+
+    Attributes:
+        extras_by_name_by_group: For each group, the extras of each declaration of each
+                                 dependency, by normalized name.
+    """
+
+    extras_by_name_by_group: dict[str, dict[str, list[frozenset[str]]]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def from_dep_groups(cls, dep_groups: dict[str, list[Dependency]]) -> DepIndex:
+        """Build an index of the given dependency groups."""
+        index = cls()
+        for group, deps in dep_groups.items():
+            extras_by_name = index.extras_by_name_by_group.setdefault(group, {})
+            for dep in deps:
+                extras_by_name.setdefault(canonicalize_name(dep.name), []).append(
+                    dep.extras
+                )
+        return index
+
+    def is_dep_satisfied_in_group(self, dep: Dependency, *, group: str) -> bool:
+        """Check if a dependency is satisfied by a declaration in the named group."""
+        extras_by_name = self.extras_by_name_by_group.get(group, {})
+        return any(
+            dep.extras <= extras
+            for extras in extras_by_name.get(canonicalize_name(dep.name), [])
+        )
+
+    def is_dep_satisfied_in_any_group(self, dep: Dependency) -> bool:
+        """Check if a dependency is satisfied by a declaration in any group."""
+        return any(
+            self.is_dep_satisfied_in_group(dep, group=group)
+            for group in self.extras_by_name_by_group
+        )
+
+
+_DEP_INDEX_BY_KEY: dict[tuple[Path, int, BackendEnum], DepIndex] = {}
+
+
+def get_dep_index() -> DepIndex:
+    """Get an index of the dependencies declared in each dependency group.
+
+    The index is built once for each revision of `pyproject.toml`, and is only valid
+    until the next change to the file.
+    """
+    manager = PyprojectTOMLManager()
+    if not manager.is_locked():
+        return DepIndex.from_dep_groups(get_dep_groups())
+
+    key = (manager.path, manager.revision, get_backend())
+    index = _DEP_INDEX_BY_KEY.get(key)
+    if index is None:
+        index = DepIndex.from_dep_groups(get_dep_groups())
+        # Only the latest revision is ever looked up again.
+        _DEP_INDEX_BY_KEY.clear()
+        _DEP_INDEX_BY_KEY[key] = index
+    return index
 
 
 def register_default_group(group: str) -> None:
@@ -160,21 +228,11 @@ def ensure_dev_group_is_defined() -> None:
     PyprojectTOMLManager().extend_list(keys=["dependency-groups", "dev"], values=[])
 
 
-def is_dep_satisfied_in(dep: Dependency, *, in_: list[Dependency]) -> bool:
-    """Check if a dependency is satisfied by any dependency in the given list."""
-    return any(_is_dep_satisfied_by(dep, by=by) for by in in_)
-
-
-def _is_dep_satisfied_by(dep: Dependency, *, by: Dependency) -> bool:
-    # Name is the same and extras are a subset of the extras of the dependency
-    return dep.name == by.name and (dep.extras or set()) <= (by.extras or set())
-
-
 def remove_deps_from_group(deps: list[Dependency], group: str) -> None:
     """Remove dependencies from the named group if present."""
-    existing_group = get_deps_from_group(group)
+    index = get_dep_index()
 
-    _deps = [dep for dep in deps if is_dep_satisfied_in(dep, in_=existing_group)]
+    _deps = [dep for dep in deps if index.is_dep_satisfied_in_group(dep, group=group)]
 
     if not _deps:
         return
@@ -195,6 +253,9 @@ def remove_deps_from_group(deps: list[Dependency], group: str) -> None:
                 remove_dep_from_group_via_poetry(dep, group)
         else:
             assert_never(backend)
+
+        if usethis_config.dry_run:
+            _undeclare_deps_in_group(_deps, group, backend=backend)
     elif backend is BackendEnum.none:
         instruct_print(f"Remove the {group} dependenc{ies} {deps_str}.")
     else:
@@ -203,9 +264,7 @@ def remove_deps_from_group(deps: list[Dependency], group: str) -> None:
 
 def is_dep_in_any_group(dep: Dependency) -> bool:
     """Check if a dependency exists in any dependency group."""
-    return is_dep_satisfied_in(
-        dep, in_=[dep for group in get_dep_groups().values() for dep in group]
-    )
+    return get_dep_index().is_dep_satisfied_in_any_group(dep)
 
 
 def add_deps_to_group(
@@ -219,10 +278,10 @@ def add_deps_to_group(
         default: Whether to register the group as a default group. Set to False
                  for groups that should be declared but not installed by default.
     """
-    existing_group = get_deps_from_group(group)
+    index = get_dep_index()
 
     to_add_deps = [
-        dep for dep in deps if not is_dep_satisfied_in(dep, in_=existing_group)
+        dep for dep in deps if not index.is_dep_satisfied_in_group(dep, group=group)
     ]
 
     if not to_add_deps:
@@ -278,12 +337,90 @@ def _install_deps_to_group(
     elif backend is BackendEnum.poetry:
         for dep in deps:
             add_dep_to_group_via_poetry(dep, group)
+    elif backend is BackendEnum.none:
+        return
+    else:
+        assert_never(backend)
+
+    if usethis_config.dry_run:
+        _declare_deps_in_group(deps, group, backend=backend)
+
+
+def _declare_deps_in_group(
+    deps: list[Dependency], group: str, *, backend: BackendEnum
+) -> None:
+    """Declare dependencies in pyproject.toml as the skipped backend subprocess would.
+
+    Poetry would also choose a version constraint for each dependency, which isn't known
+    without resolving it, so any version is allowed instead.
+    """
+    if backend is BackendEnum.uv:
+        PyprojectTOMLManager().extend_list(
+            keys=["dependency-groups", group],
+            values=[dep.to_requirement_string() for dep in deps],
+        )
+    elif backend is BackendEnum.poetry:
+        toml_document = PyprojectTOMLManager().get()
+        keys = ["tool", "poetry", "group", group, "dependencies"]
+        table: Container | Table = toml_document
+        for idx, key in enumerate(keys):
+            if key not in table:
+                table[key] = tomlkit.table(is_super_table=idx < len(keys) - 1)
+            item = table[key]
+            if not isinstance(item, Table):
+                msg = f"Expected '{'.'.join(keys[: idx + 1])}' to be a table in 'pyproject.toml'."
+                raise PyprojectTOMLDepsError(msg)
+            table = item
+
+        for dep in deps:
+            if dep.extras:
+                value = tomlkit.inline_table()
+                value.update({"version": "*", "extras": sorted(dep.extras)})
+                table[dep.name] = value
+            else:
+                table[dep.name] = "*"
+        PyprojectTOMLManager().commit(toml_document)
     elif backend is BackendEnum.none:
         pass
     else:
         assert_never(backend)
 
 
+def _undeclare_deps_in_group(
+    deps: list[Dependency], group: str, *, backend: BackendEnum
+) -> None:
+    """Remove dependencies from pyproject.toml as the skipped backend subprocess would.
+
+    Poetry removes dependencies from its own group tables as well as from PEP 735
+    dependency groups.
+    """
+    names = {canonicalize_name(dep.name) for dep in deps}
+
+    poetry_keys = ["tool", "poetry", "group", group, "dependencies"]
+    if backend is BackendEnum.poetry and poetry_keys in PyprojectTOMLManager():
+        poetry_deps = TypeAdapter(dict[str, object]).validate_python(
+            PyprojectTOMLManager()[poetry_keys]
+        )
+        for name in poetry_deps:
+            if canonicalize_name(name) in names:
+                del PyprojectTOMLManager()[[*poetry_keys, name]]
+
+    if ["dependency-groups", group] not in PyprojectTOMLManager():
+        return
+
+    req_strs = TypeAdapter(list[str]).validate_python(
+        PyprojectTOMLManager()[["dependency-groups", group]]
+    )
+    PyprojectTOMLManager().remove_from_list(
+        keys=["dependency-groups", group],
+        values=[
+            req_str
+            for req_str in req_strs
+            if canonicalize_name(parse_requirement(req_str).name) in names
+        ],
+    )
+
+
 def _register_poetry_default_group(group: str) -> None:
     """Ensure a poetry dependency group is installed by default (non-optional)."""
     try:
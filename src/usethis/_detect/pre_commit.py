@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from usethis._config import usethis_config
 from usethis._deps import is_dep_in_any_group
+from usethis._file import fs
 from usethis._types.deps import Dependency
 
 
@@ -17,7 +18,7 @@ def is_pre_commit_used() -> bool:
     if usethis_config.disable_pre_commit:
         return False
 
-    if (usethis_config.cpd() / ".pre-commit-config.yaml").exists():
+    if fs.exists(usethis_config.cpd() / ".pre-commit-config.yaml"):
         return True
 
     return is_dep_in_any_group(Dependency(name="pre-commit"))
@@ -0,0 +1,325 @@
+"""Filesystem operations on the project, which can be held in memory for dry runs.
+
+Usually, these are equivalent to the `pathlib` and `shutil` operations of the same name.
+Within the `hold_changes` context, changes are held in memory instead, and queries made
+through this module see the held changes as if they had been made on disk. This lets a
+command run as usual, without modifying the project, and then report the changes it
+would have made.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Literal
+
+    _HeldKind = Literal["dir", "file"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HeldFileChange:
+    """A change to a file which is held in memory.
+
+    Attributes:
+        path: The absolute path of the file.
+        before: The content of the file on disk, or None if it doesn't exist there.
+        after: The held content of the file, or None if it has been removed.
+    """
+
+    path: Path
+    before: bytes | None
+    after: bytes | None
+
+
+@dataclass
+class HeldChanges:
+    """Changes to the filesystem which are held in memory rather than made on disk.
+
+    Paths which have been created or removed are recorded with their kind (or None if
+    removed). Nothing on disk beneath a recorded path is visible: a directory is only
+    recorded when it is created where nothing existed (or after being removed), and a
+    file or a removed path can't have anything beneath it.
+    """
+
+    kind_by_path: dict[Path, _HeldKind | None] = field(default_factory=dict)
+    content_by_path: dict[Path, bytes] = field(default_factory=dict)
+    names_by_dir: dict[Path, set[str]] = field(default_factory=dict)
+
+    def get_file_changes(self) -> list[HeldFileChange]:
+        """Get the changes which would be made to files on disk, ordered by path.
+
+        Directories are only represented by the files within them, so creating an empty
+        directory is not a change.
+        """
+        paths: set[Path] = set()
+        for path, kind in self.kind_by_path.items():
+            if kind == "file":
+                paths.add(path)
+            elif path.is_dir():
+                # Everything on disk beneath the directory has been removed, unless it
+                # has since been created again.
+                paths.update(_walk_files(path))
+            elif kind is None and path.exists():
+                paths.add(path)
+
+        file_changes: list[HeldFileChange] = []
+        for path in sorted(paths):
+            before = path.read_bytes() if path.is_file() else None
+            after = (
+                self.content_by_path[path] if self._get_kind(path) == "file" else None
+            )
+            if before != after:
+                file_changes.append(
+                    HeldFileChange(path=path, before=before, after=after)
+                )
+        return file_changes
+
+    def _get_kind(self, path: Path) -> _HeldKind | Literal["other"] | None:
+        """Get the kind of a path, taking the held changes into account."""
+        if path in self.kind_by_path:
+            return self.kind_by_path[path]
+        if any(parent in self.kind_by_path for parent in path.parents):
+            return None
+
+        if path.is_dir():
+            return "dir"
+        elif path.is_file():
+            return "file"
+        elif path.exists():
+            return "other"
+        return None
+
+    def _set_kind(self, path: Path, kind: _HeldKind | None) -> None:
+        # Anything held beneath the path is replaced.
+        for recorded in [p for p in self.kind_by_path if path in p.parents]:
+            del self.kind_by_path[recorded]
+            self.content_by_path.pop(recorded, None)
+        for dir_path in [
+            p for p in self.names_by_dir if p == path or path in p.parents
+        ]:
+            del self.names_by_dir[dir_path]
+
+        self.kind_by_path[path] = kind
+        if kind != "file":
+            self.content_by_path.pop(path, None)
+        self.names_by_dir.setdefault(path.parent, set()).add(path.name)
+
+
+@dataclass
+class _HeldChangesState:
+    held: HeldChanges | None = None
+
+
+_state = _HeldChangesState()
+
+
+@contextmanager
+def hold_changes() -> Iterator[HeldChanges]:
+    """Context manager to hold changes to the filesystem in memory.
+
+    Only changes made through this module are held; anything else, e.g. a subprocess,
+    modifies the filesystem as usual.
+    """
+    if _state.held is not None:
+        msg = "Changes are already being held."
+        raise RuntimeError(msg)
+
+    held = HeldChanges()
+    _state.held = held
+    try:
+        yield held
+    finally:
+        _state.held = None
+
+
+def is_holding_changes() -> bool:
+    """Whether changes to the filesystem are currently held in memory."""
+    return _state.held is not None
+
+
+def exists(path: Path) -> bool:
+    """Whether a path exists."""
+    held = _state.held
+    if held is None:
+        return path.exists()
+    return held._get_kind(_normalize(path)) is not None
+
+
+def is_file(path: Path) -> bool:
+    """Whether a path is a file (or a symlink to one)."""
+    held = _state.held
+    if held is None:
+        return path.is_file()
+    return held._get_kind(_normalize(path)) == "file"
+
+
+def is_dir(path: Path) -> bool:
+    """Whether a path is a directory (or a symlink to one)."""
+    held = _state.held
+    if held is None:
+        return path.is_dir()
+    return held._get_kind(_normalize(path)) == "dir"
+
+
+def iterdir(path: Path) -> list[Path]:
+    """List the paths of the entries in a directory, in arbitrary order."""
+    held = _state.held
+    if held is None:
+        return list(path.iterdir())
+
+    path = _normalize(path)
+    kind = held._get_kind(path)
+    if kind is None:
+        msg = f"No such directory: '{path}'"
+        raise FileNotFoundError(msg)
+    elif kind != "dir":
+        msg = f"Not a directory: '{path}'"
+        raise NotADirectoryError(msg)
+
+    names = set() if path in held.kind_by_path else {p.name for p in path.iterdir()}
+    for name in held.names_by_dir.get(path, set()):
+        if held.kind_by_path[path / name] is None:
+            names.discard(name)
+        else:
+            names.add(name)
+    return [path / name for name in names]
+
+
+def read_bytes(path: Path) -> bytes:
+    """Read the content of a file."""
+    held = _state.held
+    if held is None:
+        return path.read_bytes()
+
+    path = _normalize(path)
+    kind = held._get_kind(path)
+    if kind is None:
+        msg = f"No such file: '{path}'"
+        raise FileNotFoundError(msg)
+    elif kind == "dir":
+        msg = f"Is a directory: '{path}'"
+        raise IsADirectoryError(msg)
+    elif path in held.content_by_path:
+        return held.content_by_path[path]
+    return path.read_bytes()
+
+
+def read_text(path: Path) -> str:
+    """Read the content of a UTF-8 text file, with universal newlines."""
+    if _state.held is None:
+        return path.read_text(encoding="utf-8")
+
+    content = read_bytes(path).decode("utf-8")
+    return content.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def write_text(path: Path, content: str) -> None:
+    """Write content to a UTF-8 text file, creating it if necessary."""
+    held = _state.held
+    if held is None:
+        path.write_text(content, encoding="utf-8")
+        return
+
+    path = _normalize(path)
+    _check_parent_dir(held, path)
+    if held._get_kind(path) == "dir":
+        msg = f"Is a directory: '{path}'"
+        raise IsADirectoryError(msg)
+    held._set_kind(path, "file")
+    held.content_by_path[path] = content.encode("utf-8")
+
+
+def touch(path: Path, *, exist_ok: bool = True) -> None:
+    """Create an empty file, if it doesn't already exist."""
+    held = _state.held
+    if held is None:
+        path.touch(exist_ok=exist_ok)
+        return
+
+    if exists(path):
+        if not exist_ok:
+            msg = f"File exists: '{path}'"
+            raise FileExistsError(msg)
+        return
+    write_text(path, "")
+
+
+def mkdir(path: Path, *, parents: bool = False, exist_ok: bool = False) -> None:
+    """Create a directory."""
+    held = _state.held
+    if held is None:
+        path.mkdir(parents=parents, exist_ok=exist_ok)
+        return
+
+    path = _normalize(path)
+    kind = held._get_kind(path)
+    if kind is not None:
+        if exist_ok and kind == "dir":
+            return
+        msg = f"File exists: '{path}'"
+        raise FileExistsError(msg)
+
+    if parents and held._get_kind(path.parent) is None:
+        mkdir(path.parent, parents=True, exist_ok=True)
+    _check_parent_dir(held, path)
+    held._set_kind(path, "dir")
+
+
+def unlink(path: Path) -> None:
+    """Remove a file."""
+    held = _state.held
+    if held is None:
+        path.unlink()
+        return
+
+    path = _normalize(path)
+    kind = held._get_kind(path)
+    if kind is None:
+        msg = f"No such file: '{path}'"
+        raise FileNotFoundError(msg)
+    elif kind == "dir":
+        msg = f"Is a directory: '{path}'"
+        raise IsADirectoryError(msg)
+    held._set_kind(path, None)
+
+
+def rmtree(path: Path) -> None:
+    """Remove a directory and everything beneath it."""
+    held = _state.held
+    if held is None:
+        shutil.rmtree(path)
+        return
+
+    path = _normalize(path)
+    kind = held._get_kind(path)
+    if kind is None:
+        msg = f"No such directory: '{path}'"
+        raise FileNotFoundError(msg)
+    elif kind != "dir":
+        msg = f"Not a directory: '{path}'"
+        raise NotADirectoryError(msg)
+    held._set_kind(path, None)
+
+
+def _normalize(path: Path) -> Path:
+    # Symlinks are resolved so that each file has a single key, however it is reached.
+    return Path(os.path.realpath(path))
+
+
+def _check_parent_dir(held: HeldChanges, path: Path) -> None:
+    if held._get_kind(path.parent) != "dir":
+        msg = f"No such directory: '{path.parent}'"
+        raise FileNotFoundError(msg)
+
+
+def _walk_files(path: Path) -> Iterator[Path]:
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            yield Path(dirpath) / filename
@@ -5,13 +5,13 @@ from __future__ import annotations
 import configparser
 import re
 from abc import ABCMeta
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TypeAlias
 
-from configupdater import ConfigUpdater as INIDocument
-from configupdater import Option, Section
 from pydantic import TypeAdapter
 from typing_extensions import assert_never, override
 
+from usethis._file import fs
 from usethis._file.ini.errors import (
     INIDecodeError,
     ININestingError,
@@ -27,6 +27,7 @@ from usethis._file.manager import (
     UnexpectedFileIOError,
     UnexpectedFileOpenError,
 )
+from usethis._file.patch import DeleteValue, ExtendList, RemoveFromList, SetValue
 from usethis._file.print_ import print_keys
 
 if TYPE_CHECKING:
@@ -34,13 +35,35 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import Any, ClassVar
 
+    from configupdater import ConfigUpdater as INIDocument
+    from configupdater import Section
     from typing_extensions import Self
 
+    from usethis._file.patch import PatchOp
     from usethis._file.types_ import Key
 
+_ReadonlyINIDocument: TypeAlias = "dict[str, dict[str, str]]"
+"""A read-only INI document, as a mapping of section names to option values."""
+
+# Indented comment lines inside multi-line values are kept as part of the value by
+# ConfigUpdater but not by configparser, so such files can't use the read-only parse.
+_INDENTED_COMMENT_REGEX = re.compile(r"^[ \t]+[#;]", flags=re.MULTILINE)
+
+
+class INIFileManager(KeyValueFileManager["INIDocument"], metaclass=ABCMeta):
+    """An abstract class for managing INI files.
+
+    Lookups via `in` and `[]` use a read-only copy of the document parsed with the
+    standard library `configparser`, which is much cheaper than a full `ConfigUpdater`
+    parse. The `ConfigUpdater` document is only parsed when it is needed, i.e. via
+    `get()` or when the file is modified, after which lookups use it instead. Section
+    name matches are indexed, so repeated lookups (e.g. by regex) don't rescan the
+    sections.
+    """
 
-class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
     _content_by_path: ClassVar[dict[Path, INIDocument | None]] = {}
+    _readonly_content_by_path: ClassVar[dict[Path, _ReadonlyINIDocument]] = {}
+    _section_index_by_path: ClassVar[dict[Path, _SectionIndex]] = {}
 
     @override
     def __enter__(self) -> Self:
@@ -71,7 +94,10 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
 
     @override
     def _parse_content(self, content: str) -> INIDocument:
-        updater = INIDocument()
+        # configupdater is slow to import, and it's only needed when modifying a file.
+        from configupdater import ConfigUpdater  # noqa: PLC0415
+
+        updater = ConfigUpdater()
         updater.read_string(content)
         return updater
 
@@ -91,6 +117,71 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
     @_content.setter
     def _content(self, value: INIDocument | None) -> None:
         self._content_by_path[self.path] = value
+        # The read-only copy and index are superseded by (or stale relative to) the
+        # new content.
+        self._readonly_content_by_path.pop(self.path, None)
+        self._section_index_by_path.pop(self.path, None)
+
+    @override
+    def unlock(self) -> None:
+        super().unlock()
+        self._readonly_content_by_path.pop(self.path, None)
+        self._section_index_by_path.pop(self.path, None)
+
+    def _get_readonly(self) -> INIDocument | _ReadonlyINIDocument:
+        """Retrieve the document for lookups, without necessarily parsing it fully.
+
+        If the document has already been read via `get()`, it is returned as-is.
+        Otherwise, a read-only copy parsed with `configparser` is returned. In any case
+        where the fast parse isn't possible (e.g. the file doesn't exist or is invalid),
+        this falls back to `get()`, which raises the usual errors.
+        """
+        self._validate_lock()
+
+        if self._content is not None:
+            return self.get()
+
+        readonly = self._readonly_content_by_path.get(self.path)
+        if readonly is not None:
+            return readonly
+
+        try:
+            content = fs.read_text(self.path)
+        except FileNotFoundError:
+            return self.get()
+        if _INDENTED_COMMENT_REGEX.search(content):
+            return self.get()
+
+        parser = configparser.RawConfigParser(
+            # ConfigUpdater doesn't treat the DEFAULT section specially.
+            default_section="\0",
+            interpolation=None,
+        )
+        try:
+            parser.read_string(content)
+        except configparser.Error:
+            return self.get()
+
+        readonly = {
+            section: dict(parser.items(section, raw=True))
+            for section in parser.sections()
+        }
+        self._readonly_content_by_path[self.path] = readonly
+        return readonly
+
+    def _get_section_index(
+        self, root: INIDocument | _ReadonlyINIDocument
+    ) -> _SectionIndex:
+        """Get the index of section names for the current document."""
+        index = self._section_index_by_path.get(self.path)
+        if index is None:
+            if isinstance(root, dict):
+                names = list(root)
+            else:
+                names = root.sections()
+            index = _SectionIndex(names=names)
+            self._section_index_by_path[self.path] = index
+        return index
 
     @override
     def _validate_lock(self) -> None:
@@ -106,7 +197,7 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
         A non-existent file will return False.
         """
         try:
-            root = self.get()
+            root = self._get_readonly()
         except FileNotFoundError:
             return False
 
@@ -114,12 +205,13 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
             return True
         elif len(keys) == 1:
             (section_key,) = keys
-            for _ in _itermatches(root.sections(), key=section_key):
-                return True
+            return bool(self._get_section_index(root).match(section_key))
         elif len(keys) == 2:
             (section_key, option_key) = keys
-            for section_strkey in _itermatches(root.sections(), key=section_key):
-                for _ in _itermatches(root[section_strkey].options(), key=option_key):
+            for section_strkey in self._get_section_index(root).match(section_key):
+                for _ in _itermatches(
+                    _get_option_keys(root, section_strkey), key=option_key
+                ):
                     return True
         return False
 
@@ -127,7 +219,7 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
     def __getitem__(self, item: Sequence[Key]) -> object:
         keys = item
 
-        root = self.get()
+        root = self._get_readonly()
 
         if len(keys) == 0:
             return _as_dict(root)
@@ -148,6 +240,8 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
                     f"accessing values, but a {type(section_key)} was provided."
                 )
                 raise NotImplementedError(msg)
+            if isinstance(root, dict):
+                return root[section_key][option_key]
             return root[section_key][option_key].value
         else:
             msg = (
@@ -169,7 +263,12 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
         An empty list of keys corresponds to the root of the document.
         """
         root = self.get()
+        self._set_value(root=root, keys=keys, value=value, exists_ok=exists_ok)
+        self.commit(root)
 
+    def _set_value(
+        self, *, root: INIDocument, keys: Sequence[Key], value: object, exists_ok: bool
+    ) -> None:
         if len(keys) == 0:
             value = TypeAdapter(dict[str, dict[str, str | list[str]]]).validate_python(
                 value
@@ -198,8 +297,6 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
             )
             raise ININestingError(msg)
 
-        self.commit(root)
-
     @staticmethod
     def _set_value_in_root(
         root: INIDocument, value: dict[str, dict[str, str | list[str]]], exists_ok: bool
@@ -344,6 +441,8 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
             root.add_section(section_key)
 
         if option_key not in root[section_key]:
+            from configupdater import Option  # noqa: PLC0415
+
             option = Option(key=option_key, value=value)
             root[section_key].add_option(option)
         else:
@@ -355,6 +454,11 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
 
         An empty list of keys corresponds to the root of the document.
         """
+        root = self.get()
+        self._delete_value(root=root, keys=keys)
+        self.commit(root)
+
+    def _delete_value(self, *, root: INIDocument, keys: Sequence[Key]) -> None:
         # We will iterate through keys and find all matches in the document
         seqs: list[list[str]] = []
 
@@ -363,18 +467,18 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
         elif len(keys) == 1:
             (section_key,) = keys
 
-            for seq in _itermatches(self.get().sections(), key=section_key):
+            for seq in _itermatches(root.sections(), key=section_key):
                 seqs.append([seq])
         elif len(keys) == 2:
             (section_key, option_key) = keys
 
             section_strkeys: list[str] = []
-            for section_strkey in _itermatches(self.get().sections(), key=section_key):
+            for section_strkey in _itermatches(root.sections(), key=section_key):
                 section_strkeys.append(section_strkey)
 
             for section_strkey in section_strkeys:
                 for option_strkey in _itermatches(
-                    self.get()[section_strkey].options(), key=option_key
+                    root[section_strkey].options(), key=option_key
                 ):
                     seqs.append([section_strkey, option_strkey])
         else:
@@ -389,17 +493,15 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
             raise INIValueMissingError(msg)
 
         for seq in seqs:
-            self._delete_strkeys(seq)
+            self._delete_strkeys(root=root, strkeys=seq)
 
-    def _delete_strkeys(self, strkeys: Sequence[str]) -> None:
-        """Delete a specific value in the INI file.
+    def _delete_strkeys(self, *, root: INIDocument, strkeys: Sequence[str]) -> None:
+        """Delete a specific value in the INI document.
 
         An empty list of strkeys corresponds to the root of the document.
 
         Assumes that the keys exist in the file.
         """
-        root = self.get()
-
         if len(strkeys) == 0:
             removed = False
             for section_key in root.sections():
@@ -427,8 +529,6 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
             msg = f"INI file '{self.name}' does not contain the keys '{print_keys(strkeys)}'."
             raise INIValueMissingError(msg)
 
-        self.commit(root)
-
     @override
     def extend_list(self, *, keys: Sequence[Key], values: Sequence[object]) -> None:
         """Extend a list in the INI file.
@@ -436,7 +536,12 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
         An empty list of keys corresponds to the root of the document.
         """
         root = self.get()
+        self._extend_list(root=root, keys=keys, values=values)
+        self.commit(root)
 
+    def _extend_list(
+        self, *, root: INIDocument, keys: Sequence[Key], values: Sequence[object]
+    ) -> None:
         if len(keys) == 0:
             msg = (
                 f"INI files do not support lists at the root level, whereas access to "
@@ -462,8 +567,6 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
             )
             raise ININestingError(msg)
 
-        self.commit(root)
-
     @staticmethod
     def _extend_list_in_option(
         *, root: INIDocument, section_key: Key, option_key: Key, values: Sequence[str]
@@ -517,7 +620,12 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
         An empty list of keys corresponds to the root of the document.
         """
         root = self.get()
+        self._remove_from_list(root=root, keys=keys, values=values)
+        self.commit(root)
 
+    def _remove_from_list(
+        self, *, root: INIDocument, keys: Sequence[Key], values: Sequence[object]
+    ) -> None:
         if len(keys) == 0:
             msg = (
                 f"INI files do not support lists at the root level, whereas access to "
@@ -543,13 +651,72 @@ class INIFileManager(KeyValueFileManager[INIDocument], metaclass=ABCMeta):
             )
             raise ININestingError(msg)
 
+    @override
+    def _patch(self, ops: Sequence[PatchOp]) -> None:
+        """Apply validated operations to the document, then commit once."""
+        root = self.get()
+        for op in ops:
+            if isinstance(op, SetValue):
+                self._set_value(
+                    root=root, keys=op.keys, value=op.value, exists_ok=op.exists_ok
+                )
+            elif isinstance(op, ExtendList):
+                self._extend_list(root=root, keys=op.keys, values=op.values)
+            elif isinstance(op, RemoveFromList):
+                self._remove_from_list(root=root, keys=op.keys, values=op.values)
+            elif isinstance(op, DeleteValue):
+                try:
+                    self._delete_value(root=root, keys=op.keys)
+                except INIValueMissingError:
+                    if not op.missing_ok:
+                        raise
+            else:
+                assert_never(op)
         self.commit(root)
 
 
+@dataclass
+class _SectionIndex:
+    """An index of the section names in an INI document.
+
+    Attributes:
+        names: The section names, in order.
+        matches_by_key: The cached section names matching each key looked up so far.
+    """
+
+    names: list[str]
+    matches_by_key: dict[Key, list[str]] = field(default_factory=dict)
+
+    def match(self, key: Key) -> list[str]:
+        """Get the section names matching a key, in order."""
+        try:
+            return self.matches_by_key[key]
+        except KeyError:
+            pass
+
+        matches = list(_itermatches(self.names, key=key))
+        self.matches_by_key[key] = matches
+        return matches
+
+
+def _get_option_keys(
+    root: INIDocument | _ReadonlyINIDocument, section_key: str
+) -> list[str]:
+    if isinstance(root, dict):
+        return list(root[section_key])
+    return root[section_key].options()
+
+
 def _as_dict(
-    value: INIDocument | Section,
+    value: INIDocument | Section | _ReadonlyINIDocument | dict[str, str],
 ) -> dict[str, dict[str, Any]] | dict[str, Any]:
-    if isinstance(value, INIDocument):
+    if isinstance(value, dict):
+        # A read-only document or section; copy it to keep the original read-only.
+        return {k: dict(v) if isinstance(v, dict) else v for k, v in value.items()}
+
+    from configupdater import ConfigUpdater, Section  # noqa: PLC0415
+
+    if isinstance(value, ConfigUpdater):
         return {k: _as_dict(v) for k, v in value.items()}
     elif isinstance(value, Section):
         return {option.key: option.value for option in value.iter_options()}
@@ -0,0 +1,132 @@
+"""Cross-process locking of the project directory.
+
+Within a process, file managers coordinate access to configuration files, but separate
+usethis processes working on the same project could otherwise interleave their reads
+and writes. To prevent this, an advisory lock is held on the project directory while its
+files are in use. The directory itself is locked (with `fcntl.flock`) so that no lock
+file needs to be created in the project.
+
+Locking is not supported on Windows, where it is skipped.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from usethis._config import usethis_config
+from usethis._console import info_print
+from usethis.errors import UsethisError
+
+if sys.platform != "win32":
+    import fcntl
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+_INITIAL_POLL_INTERVAL = 0.01
+_MAX_POLL_INTERVAL = 0.25
+
+
+class ProjectLockTimeoutError(UsethisError):
+    """Raised when the project lock cannot be acquired before the timeout."""
+
+
+_HOLD_COUNT_BY_DIR: dict[Path, int] = {}
+
+
+@contextmanager
+def project_lock() -> Iterator[None]:
+    """Context manager to hold an exclusive lock on the project directory.
+
+    If another process holds the lock, this waits for up to the configured
+    `lock_timeout` before raising an error; by default, it waits indefinitely. The lock
+    is re-entrant within a process.
+
+    Raises:
+        ProjectLockTimeoutError: If the lock cannot be acquired before the timeout.
+    """
+    project_dir = usethis_config.cpd().resolve()
+    if sys.platform == "win32" or _HOLD_COUNT_BY_DIR.get(project_dir, 0) > 0:
+        with _held(project_dir):
+            yield
+        return
+
+    try:
+        fd = os.open(project_dir, os.O_RDONLY)
+    except OSError:
+        # e.g. the directory doesn't exist yet, so there is nothing to protect.
+        with _held(project_dir):
+            yield
+        return
+
+    try:
+        _acquire(fd, project_dir=project_dir)
+        try:
+            with _held(project_dir):
+                yield
+        finally:
+            _release(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _held(project_dir: Path) -> Iterator[None]:
+    _HOLD_COUNT_BY_DIR[project_dir] = _HOLD_COUNT_BY_DIR.get(project_dir, 0) + 1
+    try:
+        yield
+    finally:
+        _HOLD_COUNT_BY_DIR[project_dir] -= 1
+        if not _HOLD_COUNT_BY_DIR[project_dir]:
+            del _HOLD_COUNT_BY_DIR[project_dir]
+
+
+def _acquire(fd: int, *, project_dir: Path) -> None:
+    if sys.platform == "win32":
+        return
+
+    if _try_flock(fd):
+        return
+
+    info_print(f"Waiting for another usethis process to finish in '{project_dir}'.")
+    timeout = usethis_config.lock_timeout
+    start = time.perf_counter()
+    interval = _INITIAL_POLL_INTERVAL
+    while True:
+        waited = time.perf_counter() - start
+        if timeout is not None and waited >= timeout:
+            msg = (
+                f"Timed out after {timeout} seconds waiting for another usethis "
+                f"process to finish in '{project_dir}'."
+            )
+            raise ProjectLockTimeoutError(msg)
+
+        sleep = interval if timeout is None else min(interval, timeout - waited)
+        time.sleep(sleep)
+        interval = min(interval * 2, _MAX_POLL_INTERVAL)
+
+        if _try_flock(fd):
+            waited = time.perf_counter() - start
+            info_print(f"Continuing after waiting {waited:.1f} seconds.")
+            return
+
+
+def _try_flock(fd: int) -> bool:
+    if sys.platform == "win32":
+        return True
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _release(fd: int) -> None:
+    if sys.platform != "win32":
+        fcntl.flock(fd, fcntl.LOCK_UN)
@@ -2,22 +2,34 @@
 
 from __future__ import annotations
 
+import hashlib
+import itertools
 from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, cast
 
-from typing_extensions import override
+from typing_extensions import assert_never, override
 
 from usethis._config import usethis_config
+from usethis._file import fs
+from usethis._file.patch import (
+    DeleteValue,
+    ExtendList,
+    RemoveFromList,
+    SetValue,
+    validate_patch_ops,
+)
 from usethis.errors import UsethisError
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
     from pathlib import Path
     from types import TracebackType
     from typing import ClassVar
 
     from typing_extensions import Self
 
+    from usethis._file.patch import PatchOp
     from usethis._file.types_ import Key
 
 
@@ -64,6 +76,12 @@ class FileManager(Generic[DocumentT], metaclass=ABCMeta):
     # The Any in this expression should be identified with DocumentT
     _content_by_path: ClassVar[dict[Path, Any | None]] = {}
     _dirty_by_path: ClassVar[dict[Path, bool]] = {}
+    _revision_by_path: ClassVar[dict[Path, int]] = {}
+    _revisions: ClassVar[Iterator[int]] = itertools.count()
+    # Within the `document_cache` context, the documents of closed file managers, and
+    # a digest of the file content on disk which they correspond to.
+    _cached_document_by_path: ClassVar[dict[Path, tuple[str, Any]] | None] = None
+    _read_digest_by_path: ClassVar[dict[Path, str | None]] = {}
     path: Path
 
     @property
@@ -111,12 +129,14 @@ class FileManager(Generic[DocumentT], metaclass=ABCMeta):
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
-        del exc_type, exc_value, traceback
+        del exc_value, traceback
         if not self.is_locked():
             # This could happen if we decide to delete the file.
             return
 
         self.write_file()
+        if exc_type is None:
+            self._cache_document()
         self.unlock()
 
     def get(self) -> DocumentT:
@@ -133,11 +153,26 @@ class FileManager(Generic[DocumentT], metaclass=ABCMeta):
         self._validate_lock()
         self._content = document
         self._dirty_by_path[self.path] = True
+        self._bump_revision()
 
     def revert(self) -> None:
         """Clear the stored document without writing to disk."""
         self._content = None
         self._dirty_by_path[self.path] = False
+        self._bump_revision()
+
+    @property
+    def revision(self) -> int:
+        """An identifier for the current revision of the document.
+
+        The revision changes whenever the document might have changed, i.e. when the
+        file is opened, when changes are committed, and when the stored document is
+        reverted (e.g. because the file was modified by a subprocess). It can be used to
+        key caches of values derived from the document. Revisions are never reused,
+        even across different openings of the file.
+        """
+        self._validate_lock()
+        return self._revision_by_path[self.path]
 
     def write_file(self) -> None:
         """Write the stored document to disk if there are changes."""
@@ -152,10 +187,10 @@ class FileManager(Generic[DocumentT], metaclass=ABCMeta):
             return
 
         # Also, if the file has since been deleted, we should not write it.
-        if not self.path.exists():
+        if not fs.exists(self.path):
             return
 
-        self.path.write_text(self._dump_content(), encoding="utf-8")
+        fs.write_text(self.path, self._dump_content())
 
     def read_file(self) -> DocumentT:
         """Read the document from disk and store it in memory.
@@ -170,16 +205,56 @@ class FileManager(Generic[DocumentT], metaclass=ABCMeta):
                 f"access the content."
             )
             raise UnexpectedFileIOError(msg)
+
         try:
-            document = self._parse_content(self.path.read_text(encoding="utf-8"))
+            content = fs.read_text(self.path)
         except FileNotFoundError:
+            self._pop_cached_document(None)
             msg = f"'{self.name}' not found in the current directory at '{self.path}'."
             raise FileNotFoundError(msg) from None
 
+        cached = self._pop_cached_document(content)
+        if cached is not None:
+            self._content = cached
+            return cached
+
+        document = self._parse_content(content)
         self._content = document
 
         return document
 
+    def _pop_cached_document(self, content: str | None) -> DocumentT | None:
+        """Take the cached document for the file, if the file is unchanged on disk."""
+        cache = FileManager._cached_document_by_path
+        if cache is None:
+            return None
+
+        digest = None if content is None else _get_digest(content)
+        self._read_digest_by_path[self.path] = digest
+        # The document is owned by this file manager until it is closed.
+        cached = cache.pop(self.path, None)
+        if cached is None or digest is None or cached[0] != digest:
+            return None
+        return cast("DocumentT", cached[1])
+
+    def _cache_document(self) -> None:
+        """Keep the document after closing the file manager, if it matches the file."""
+        cache = FileManager._cached_document_by_path
+        if cache is None or self._content is None or fs.is_holding_changes():
+            return
+
+        try:
+            digest = _get_digest(fs.read_text(self.path))
+        except OSError:
+            return
+        if not self._dirty_by_path.get(self.path, False) and digest != (
+            self._read_digest_by_path.get(self.path)
+        ):
+            # The file was modified on disk since it was read, e.g. by a subprocess.
+            return
+
+        cache[self.path] = (digest, self._content)
+
     @abstractmethod
     def _dump_content(self) -> str:
         """Return the content of the document as a string."""
@@ -212,10 +287,16 @@ class FileManager(Generic[DocumentT], metaclass=ABCMeta):
     def lock(self) -> None:
         self._content = None
         self._dirty_by_path[self.path] = False
+        self._bump_revision()
 
     def unlock(self) -> None:
         self._content_by_path.pop(self.path, None)
         self._dirty_by_path.pop(self.path, None)
+        self._revision_by_path.pop(self.path, None)
+        self._read_digest_by_path.pop(self.path, None)
+
+    def _bump_revision(self) -> None:
+        self._revision_by_path[self.path] = next(FileManager._revisions)
 
 
 class KeyValueFileManager(
@@ -261,3 +342,65 @@ class KeyValueFileManager(
     ) -> None:
         """Remove values from a list in the configuration file."""
         raise NotImplementedError
+
+    def patch(self, ops: Sequence[PatchOp]) -> None:
+        """Apply a batch of changes to the configuration file.
+
+        Each operation has the same effect as the corresponding method, e.g. a
+        `SetValue` operation is equivalent to calling `set_value`, and they are applied
+        in order. All the operations are validated before any are applied.
+        """
+        validate_patch_ops(ops)
+        if not ops:
+            return
+
+        self._patch(ops)
+
+    def _patch(self, ops: Sequence[PatchOp]) -> None:
+        """Apply validated operations to the configuration file.
+
+        By default, the operations are applied one at a time. Subclasses may override
+        this to apply them all to a single working copy of the document, committing once.
+        """
+        for op in ops:
+            if isinstance(op, SetValue):
+                self.set_value(keys=op.keys, value=op.value, exists_ok=op.exists_ok)
+            elif isinstance(op, ExtendList):
+                self.extend_list(keys=op.keys, values=op.values)
+            elif isinstance(op, RemoveFromList):
+                self.remove_from_list(keys=op.keys, values=op.values)
+            elif isinstance(op, DeleteValue):
+                try:
+                    del self[op.keys]
+                except KeyError:
+                    if not op.missing_ok:
+                        raise
+            else:
+                assert_never(op)
+
+
+@contextmanager
+def document_cache() -> Iterator[None]:
+    """Keep documents in memory between file manager contexts, to avoid re-parsing them.
+
+    Within this context, the document of each file manager is kept when it is closed, and
+    reused the next time the file is read, as long as the file's content on disk hasn't
+    changed. This is useful for long-running processes which open the same files
+    repeatedly, such as `usethis watch`.
+    """
+    if FileManager._cached_document_by_path is not None:
+        # Already caching in an outer context
+        yield
+        return
+
+    FileManager._cached_document_by_path = {}
+    try:
+        yield
+    finally:
+        FileManager._cached_document_by_path = None
+
+
+def _get_digest(content: str) -> str:
+    # Modification times aren't enough, since the file could be rewritten with content
+    # of the same size within the filesystem's timestamp resolution.
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
@@ -0,0 +1,86 @@
+"""Operations for changing many values in a key-value file at once."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeAlias
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from usethis._file.types_ import Key
+
+
+@dataclass(frozen=True)
+class SetValue:
+    """Set a value, like `KeyValueFileManager.set_value`.
+
+    Attributes:
+        keys: The keys to the value. An empty list corresponds to the root.
+        value: The value to set.
+        exists_ok: Whether to overwrite an existing value, rather than raising an error.
+    """
+
+    keys: Sequence[Key]
+    value: object
+    exists_ok: bool = False
+
+
+@dataclass(frozen=True)
+class ExtendList:
+    """Extend a list, like `KeyValueFileManager.extend_list`.
+
+    Attributes:
+        keys: The keys to the list.
+        values: The values to append to the list.
+    """
+
+    keys: Sequence[Key]
+    values: Sequence[object]
+
+
+@dataclass(frozen=True)
+class RemoveFromList:
+    """Remove values from a list, like `KeyValueFileManager.remove_from_list`.
+
+    Attributes:
+        keys: The keys to the list.
+        values: The values to remove from the list.
+    """
+
+    keys: Sequence[Key]
+    values: Sequence[object]
+
+
+@dataclass(frozen=True)
+class DeleteValue:
+    """Delete a value, like `del` on a `KeyValueFileManager`.
+
+    Attributes:
+        keys: The keys to the value. An empty list corresponds to the root.
+        missing_ok: Whether to pass silently if the value is missing, rather than
+                    raising an error.
+    """
+
+    keys: Sequence[Key]
+    missing_ok: bool = False
+
+
+PatchOp: TypeAlias = SetValue | ExtendList | RemoveFromList | DeleteValue
+
+
+def validate_patch_ops(ops: Sequence[PatchOp]) -> None:
+    """Check that a sequence of operations is well-formed before any are applied.
+
+    Raises:
+        TypeError: If any of the operations is not a recognized operation.
+        ValueError: If a list operation is not given any keys.
+    """
+    for op in ops:
+        if not isinstance(op, SetValue | ExtendList | RemoveFromList | DeleteValue):
+            msg = f"Unrecognized operation of type '{type(op).__name__}'."
+            raise TypeError(msg)
+
+        if isinstance(op, ExtendList | RemoveFromList) and not op.keys:
+            msg = "At least one ID key must be provided."
+            raise ValueError(msg)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 import pydantic
@@ -20,21 +21,8 @@ def get_project_deps() -> list[Dependency]:
     dependency-groups section, not extras/optional dependencies, not build dependencies.
     """
     try:
-        pyproject = PyprojectTOMLManager().get()
-    except FileNotFoundError:
-        return []
-
-    try:
-        project_section = pyproject["project"]
-    except KeyError:
-        return []
-
-    if not isinstance(project_section, dict):
-        return []
-
-    try:
-        dep_section = project_section["dependencies"]
-    except KeyError:
+        dep_section = PyprojectTOMLManager()[["project", "dependencies"]]
+    except (FileNotFoundError, KeyError):
         return []
 
     try:
@@ -47,20 +35,15 @@ def get_project_deps() -> list[Dependency]:
         )
         raise PyprojectTOMLDepsError(msg) from None
 
-    reqs = [Requirement(req_str) for req_str in req_strs]
+    reqs = [parse_requirement(req_str) for req_str in req_strs]
     return [Dependency(name=req.name, extras=frozenset(req.extras)) for req in reqs]
 
 
 def get_dep_groups() -> dict[str, list[Dependency]]:
     """Get all dependency groups from [dependency-groups]."""
     try:
-        pyproject = PyprojectTOMLManager().get()
-    except FileNotFoundError:
-        return {}
-
-    try:
-        dep_groups_section = pyproject["dependency-groups"]
-    except KeyError:
+        dep_groups_section = PyprojectTOMLManager()[["dependency-groups"]]
+    except (FileNotFoundError, KeyError):
         return {}
 
     try:
@@ -76,7 +59,7 @@ def get_dep_groups() -> dict[str, list[Dependency]]:
         raise PyprojectTOMLDepsError(msg) from None
 
     reqs_by_group = {
-        group: [Requirement(req_str) for req_str in req_strs]
+        group: [parse_requirement(req_str) for req_str in req_strs]
         for group, req_strs in req_strs_by_group.items()
     }
     return {
@@ -85,6 +68,20 @@ def get_dep_groups() -> dict[str, list[Dependency]]:
     }
 
 
+@functools.lru_cache(maxsize=1024)
+def parse_requirement(req_str: str) -> Requirement:
+    """Parse a PEP 508 requirement string, reusing the result for repeated strings.
+
+    The same requirement strings are parsed many times over, e.g. each time a tool
+    checks whether its dependencies are declared, so the parsed requirements are
+    memoized. The returned requirement is shared, so it should not be modified.
+
+    Raises:
+        InvalidRequirement: If the string is not a valid requirement.
+    """
+    return Requirement(req_str)
+
+
 def get_poetry_project_deps() -> list[Dependency]:
     """Get project dependencies from [tool.poetry.dependencies].
 
@@ -94,12 +91,10 @@ def get_poetry_project_deps() -> list[Dependency]:
     constraint, not a package dependency.
     """
     try:
-        pyproject = PyprojectTOMLManager().get()
-    except FileNotFoundError:
+        poetry_deps = PyprojectTOMLManager()[["tool", "poetry", "dependencies"]]
+    except (FileNotFoundError, KeyError):
         return []
 
-    poetry_deps = pyproject.get("tool", {}).get("poetry", {}).get("dependencies", {})
-
     if not isinstance(poetry_deps, dict):
         return []
 
@@ -114,12 +109,10 @@ def get_poetry_dep_groups() -> dict[str, list[Dependency]]:
     section containing key-value pairs.
     """
     try:
-        pyproject = PyprojectTOMLManager().get()
-    except FileNotFoundError:
+        poetry_groups = PyprojectTOMLManager()[["tool", "poetry", "group"]]
+    except (FileNotFoundError, KeyError):
         return {}
 
-    poetry_groups = pyproject.get("tool", {}).get("poetry", {}).get("group", {})
-
     if not isinstance(poetry_groups, dict):
         return {}
 
@@ -0,0 +1,168 @@
+"""Fingerprints of the dependency declarations in pyproject.toml.
+
+Artifacts generated from the dependency declarations, such as `uv.lock` and exported
+requirements files, have the fingerprint they were generated from recorded in the user's
+cache directory, rather than in the project. This lets us tell whether they need to be
+regenerated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from usethis._config import usethis_config
+from usethis._file import fs
+from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+
+CACHE_DIR_ENV_VAR = "USETHIS_CACHE_DIR"
+"""The environment variable which, if set, overrides the user cache directory."""
+
+_FINGERPRINT_VERSION = 1
+
+_DEPENDENCY_KEYS: tuple[tuple[str, ...], ...] = (
+    ("project", "requires-python"),
+    ("project", "dependencies"),
+    ("project", "optional-dependencies"),
+    ("dependency-groups",),
+    ("tool", "uv", "sources"),
+    ("tool", "uv", "index"),
+    ("tool", "uv", "dev-dependencies"),
+    ("tool", "uv", "constraint-dependencies"),
+    ("tool", "uv", "override-dependencies"),
+)
+
+
+def get_deps_fingerprint() -> str:
+    """Get a fingerprint of the dependency-relevant parts of pyproject.toml.
+
+    The fingerprint covers the project dependencies (including optional
+    dependencies), the dependency groups, the requires-python constraint, and the
+    uv sources, indexes, and constraints. Any other change to pyproject.toml leaves it
+    unchanged.
+    """
+    if not fs.exists(usethis_config.cpd() / "pyproject.toml"):
+        values = {}
+    elif PyprojectTOMLManager().is_locked():
+        values = _get_dependency_values()
+    else:
+        with PyprojectTOMLManager():
+            values = _get_dependency_values()
+
+    content = json.dumps(
+        {"version": _FINGERPRINT_VERSION, "values": values}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def is_fingerprint_stale(artifact: str) -> bool:
+    """Whether an artifact was generated from different dependency declarations.
+
+    Artifacts without a recorded fingerprint are never considered stale, since they
+    might not have been generated by usethis.
+
+    Args:
+        artifact: The path of the artifact relative to the project directory.
+    """
+    recorded = _read_fingerprints().get(artifact)
+    if recorded is None:
+        return False
+
+    return recorded != get_deps_fingerprint()
+
+
+def has_fingerprint(artifact: str) -> bool:
+    """Whether a fingerprint has been recorded for an artifact.
+
+    This is the case for artifacts which were generated by usethis.
+
+    Args:
+        artifact: The path of the artifact relative to the project directory.
+    """
+    return artifact in _read_fingerprints()
+
+
+def record_fingerprint(artifact: str) -> None:
+    """Record that an artifact was generated from the current dependency declarations.
+
+    Nothing is recorded in a dry run, since the artifact isn't actually generated.
+
+    Args:
+        artifact: The path of the artifact relative to the project directory.
+    """
+    if usethis_config.dry_run:
+        return
+
+    fingerprints = _read_fingerprints()
+    fingerprint = get_deps_fingerprint()
+    if fingerprints.get(artifact) == fingerprint:
+        return
+
+    fingerprints[artifact] = fingerprint
+    path = _get_fingerprints_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(fingerprints, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def _get_dependency_values() -> dict[str, object]:
+    values: dict[str, object] = {}
+    for keys in _DEPENDENCY_KEYS:
+        try:
+            value = PyprojectTOMLManager()[list(keys)]
+        except KeyError:
+            continue
+        values[".".join(keys)] = _to_plain(value)
+    return values
+
+
+def _read_fingerprints() -> dict[str, str]:
+    try:
+        content = json.loads(_get_fingerprints_path().read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+    if not isinstance(content, dict):
+        return {}
+
+    return {
+        artifact: fingerprint
+        for artifact, fingerprint in content.items()
+        if isinstance(fingerprint, str)
+    }
+
+
+def _get_fingerprints_path() -> Path:
+    # Each project has its own file, named by a hash of the project directory's path.
+    project_dir = os.path.realpath(usethis_config.cpd())
+    project_hash = hashlib.sha256(project_dir.encode("utf-8")).hexdigest()[:16]
+    return _get_user_cache_dir() / "fingerprints" / f"{project_hash}.json"
+
+
+def _get_user_cache_dir() -> Path:
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dir:
+        return Path(cache_dir)
+
+    if sys.platform == "win32":
+        local_app_data = os.environ.get("LOCALAPPDATA")
+        base = Path(local_app_data) if local_app_data else Path.home() / "AppData/Local"
+        return base / "usethis" / "Cache"
+    elif sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "usethis"
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base / "usethis"
+
+
+def _to_plain(value: object) -> object:
+    # tomlkit items need unwrapping to plain Python objects to serialize them.
+    unwrap = getattr(value, "unwrap", None)
+    if callable(unwrap):
+        return unwrap()
+    return value
@@ -32,6 +32,7 @@ if TYPE_CHECKING:
     from tomlkit import TOMLDocument
     from typing_extensions import Self
 
+    from usethis._file.patch import PatchOp
     from usethis._file.types_ import Key
 
 
@@ -85,3 +86,12 @@ class PyprojectTOMLManager(TOMLFileManager):
             super().__delitem__(keys)
         except TOMLValueMissingError as err:
             raise PyprojectTOMLValueMissingError(err) from None
+
+    @override
+    def _patch(self, ops: Sequence[PatchOp]) -> None:
+        try:
+            super()._patch(ops)
+        except TOMLValueAlreadySetError as err:
+            raise PyprojectTOMLValueAlreadySetError(err) from None
+        except TOMLValueMissingError as err:
+            raise PyprojectTOMLValueMissingError(err) from None
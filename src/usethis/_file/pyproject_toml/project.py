@@ -17,10 +17,8 @@ if TYPE_CHECKING:
 
 def get_project_dict() -> dict[str, Any]:
     """Get the contents of the [project] section from pyproject.toml."""
-    pyproject = PyprojectTOMLManager().get().value
-
     try:
-        project = TypeAdapter(dict).validate_python(pyproject["project"])
+        project = TypeAdapter(dict).validate_python(PyprojectTOMLManager()[["project"]])
     except KeyError:
         msg = "The 'project' section is missing from 'pyproject.toml'."
         raise PyprojectTOMLProjectSectionError(msg) from None
@@ -15,11 +15,9 @@ class MissingRequiresPythonError(Exception):
 
 def get_requires_python() -> SpecifierSet:
     """Get the requires-python constraint from pyproject.toml."""
-    pyproject = PyprojectTOMLManager().get()
-
     try:
         requires_python = TypeAdapter(str).validate_python(
-            TypeAdapter(dict).validate_python(pyproject["project"])["requires-python"]
+            PyprojectTOMLManager()[["project", "requires-python"]]
         )
     except KeyError:
         msg = "The 'project.requires-python' value is missing from 'pyproject.toml'."
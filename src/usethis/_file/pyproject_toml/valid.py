@@ -9,6 +9,7 @@ from tomlkit.items import Array, Table
 
 from usethis._config import usethis_config
 from usethis._console import tick_print
+from usethis._file import fs
 from usethis._file.dir import get_project_name_from_dir
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
 
 def ensure_pyproject_validity():
     """Ensure pyproject.toml has a valid structure, adding missing required fields."""
-    if not (usethis_config.cpd() / "pyproject.toml").exists():
+    if not fs.exists(usethis_config.cpd() / "pyproject.toml"):
         return
 
     toml_document = PyprojectTOMLManager().get()
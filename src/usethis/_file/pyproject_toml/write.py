@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from usethis._config import usethis_config
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._file.pyproject_toml.valid import ensure_pyproject_validity
 
@@ -15,7 +16,7 @@ def prepare_pyproject_write() -> None:
     the subprocess runs, the caller should re-read the file to pick up any
     external modifications.
     """
-    is_pyproject_toml = (usethis_config.cpd() / "pyproject.toml").exists()
+    is_pyproject_toml = fs.exists(usethis_config.cpd() / "pyproject.toml")
     is_locked = PyprojectTOMLManager().is_locked()
 
     if is_pyproject_toml and is_locked:
@@ -32,6 +32,7 @@ if TYPE_CHECKING:
     from configupdater import ConfigUpdater as INIDocument
     from typing_extensions import Self
 
+    from usethis._file.patch import PatchOp
     from usethis._file.types_ import Key
 
 
@@ -85,3 +86,12 @@ class SetupCFGManager(INIFileManager):
             super().__delitem__(keys)
         except INIValueMissingError as err:
             raise SetupCFGValueMissingError(err) from None
+
+    @override
+    def _patch(self, ops: Sequence[PatchOp]) -> None:
+        try:
+            super()._patch(ops)
+        except INIValueAlreadySetError as err:
+            raise SetupCFGValueAlreadySetError(err) from None
+        except INIValueMissingError as err:
+            raise SetupCFGValueMissingError(err) from None
@@ -0,0 +1,243 @@
+"""Snapshot of the project directory's structure.
+
+Many heuristics check whether particular files or directories exist in the project.
+Rather than each of these making its own filesystem calls, they can query a shared
+snapshot, which lists each directory (with `os.scandir`) and then only checks the
+directory's modification time on later queries. This matters most on network and
+overlay filesystems, where each `stat` call can be slow, and for heuristics which check
+for many names in the same directory.
+
+The snapshot only records which entries exist and what kind they are, so it is
+unaffected by changes to the content of files. Creating or removing an entry changes
+the modification time of its directory, so the snapshot stays up to date however the
+project is modified. It is shared only within the `project_snapshot` context. While
+changes are held in memory (see `usethis._file.fs`), the disk doesn't reflect them, so
+directories are listed afresh on every query instead.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import PurePath
+from typing import TYPE_CHECKING
+
+from usethis._config import usethis_config
+from usethis._file import fs
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from typing import ClassVar, Literal
+
+    _EntryKind = Literal["dir", "file", "other"]
+
+# A listing taken this soon after its directory was last modified might miss entries
+# created afterwards within the same tick of the filesystem's (possibly coarse) clock,
+# so it isn't trusted until it has been taken again.
+_RACY_WINDOW_NS = 20_000_000
+_COARSE_RACY_WINDOW_NS = 2_000_000_000
+
+
+class ProjectSnapshot:
+    """The structure of a project directory, listed lazily one directory at a time.
+
+    The project root is listed when the snapshot is created, and subdirectories are
+    listed the first time they are queried. A directory is listed again if its
+    modification time has changed since it was last listed. Paths are relative to the
+    project root, and names are matched exactly, i.e. case-sensitively.
+    """
+
+    # The snapshots shared within the `project_snapshot` context, if it is active.
+    _shared_by_root: ClassVar[dict[Path, ProjectSnapshot] | None] = None
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._listing_by_dir: dict[tuple[str, ...], _Listing] = {}
+        self._get_entries(())
+
+    def exists(self, relative_path: PurePath | str) -> bool:
+        """Whether the path exists in the project."""
+        return self._get_kind(relative_path) is not None
+
+    def is_file(self, relative_path: PurePath | str) -> bool:
+        """Whether the path is a file (or a symlink to one) in the project."""
+        return self._get_kind(relative_path) == "file"
+
+    def is_dir(self, relative_path: PurePath | str) -> bool:
+        """Whether the path is a directory (or a symlink to one) in the project."""
+        return self._get_kind(relative_path) == "dir"
+
+    def iterdir(self, relative_dir: PurePath | str = ".") -> list[Path]:
+        """List the paths of the entries in a directory, sorted by name.
+
+        If the directory doesn't exist, the list is empty.
+        """
+        parts = _get_parts(relative_dir, root=self.root)
+        entries = self._get_entries(parts) if parts is not None else None
+        if entries is None:
+            return []
+
+        return [self.root.joinpath(*parts, name) for name in sorted(entries)]
+
+    def glob(self, pattern: str, relative_dir: PurePath | str = ".") -> list[Path]:
+        """List the paths of the entries in a directory with names matching a pattern.
+
+        Only the directory itself is searched, i.e. the pattern cannot contain path
+        separators or recursive wildcards. The list is sorted by name.
+        """
+        return [
+            path
+            for path in self.iterdir(relative_dir)
+            if fnmatch.fnmatchcase(path.name, pattern)
+        ]
+
+    def _get_kind(self, relative_path: PurePath | str) -> _EntryKind | None:
+        parts = _get_parts(relative_path, root=self.root)
+        if parts is None:
+            # Outside the project, so not covered by the snapshot.
+            return _get_path_kind(self.root / relative_path)
+
+        if not parts:
+            return "dir"
+
+        parent_entries = self._get_entries(parts[:-1])
+        if parent_entries is None:
+            return None
+        return parent_entries.get(parts[-1])
+
+    def _get_entries(self, parts: tuple[str, ...]) -> dict[str, _EntryKind] | None:
+        path = self.root.joinpath(*parts)
+        if fs.is_holding_changes():
+            self._listing_by_dir.clear()
+            return _list_held_dir(path)
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            self._listing_by_dir.pop(parts, None)
+            return None
+
+        listing = self._listing_by_dir.get(parts)
+        if listing is not None and listing.mtime_ns == mtime_ns and not listing.is_racy:
+            return listing.entries
+
+        scanned_ns = time.time_ns()
+        entries = _scan_dir(path)
+        if entries is None:
+            return None
+
+        self._listing_by_dir[parts] = _Listing(
+            entries=entries,
+            mtime_ns=mtime_ns,
+            is_racy=_is_racy(mtime_ns, scanned_ns=scanned_ns),
+        )
+        return entries
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _Listing:
+    entries: dict[str, _EntryKind]
+    mtime_ns: int
+    is_racy: bool
+
+
+def _is_racy(mtime_ns: int, *, scanned_ns: int) -> bool:
+    if mtime_ns % 1_000_000_000 == 0:
+        # The filesystem probably only records whole seconds (or coarser).
+        window_ns = _COARSE_RACY_WINDOW_NS
+    else:
+        window_ns = _RACY_WINDOW_NS
+    return scanned_ns - mtime_ns < window_ns
+
+
+@contextmanager
+def project_snapshot() -> Iterator[None]:
+    """Context manager to share project snapshots between all queries in the context.
+
+    Outside this context, each call to `get_project_snapshot` gives a fresh snapshot.
+    """
+    if ProjectSnapshot._shared_by_root is not None:
+        # Already shared by an enclosing context.
+        yield
+        return
+
+    ProjectSnapshot._shared_by_root = {}
+    try:
+        yield
+    finally:
+        ProjectSnapshot._shared_by_root = None
+
+
+def get_project_snapshot() -> ProjectSnapshot:
+    """Get the snapshot of the current project directory."""
+    root = usethis_config.cpd()
+    shared_by_root = ProjectSnapshot._shared_by_root
+    if shared_by_root is None:
+        return ProjectSnapshot(root)
+
+    snapshot = shared_by_root.get(root)
+    if snapshot is None:
+        snapshot = ProjectSnapshot(root)
+        shared_by_root[root] = snapshot
+    return snapshot
+
+
+def _get_parts(relative_path: PurePath | str, *, root: Path) -> tuple[str, ...] | None:
+    """Get the normalized parts of a relative path, or None if it leaves the project."""
+    path = PurePath(relative_path)
+    if path.is_absolute():
+        try:
+            path = path.relative_to(root)
+        except ValueError:
+            return None
+
+    parts = tuple(part for part in path.parts if part != ".")
+    if ".." in parts:
+        return None
+    return parts
+
+
+def _scan_dir(path: Path) -> dict[str, _EntryKind] | None:
+    try:
+        with os.scandir(path) as it:
+            return {
+                entry.name: kind
+                for entry in it
+                if (kind := _get_entry_kind(entry)) is not None
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _list_held_dir(path: Path) -> dict[str, _EntryKind] | None:
+    try:
+        paths = fs.iterdir(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return {p.name: kind for p in paths if (kind := _get_path_kind(p)) is not None}
+
+
+def _get_path_kind(path: Path) -> _EntryKind | None:
+    if fs.is_dir(path):
+        return "dir"
+    elif fs.is_file(path):
+        return "file"
+    elif fs.exists(path):
+        return "other"
+    return None
+
+
+def _get_entry_kind(entry: os.DirEntry[str]) -> _EntryKind | None:
+    # These checks only need a system call for symlinks, on most platforms.
+    if entry.is_dir():
+        return "dir"
+    elif entry.is_file():
+        return "file"
+    elif entry.is_symlink() and not os.path.exists(entry.path):
+        # A broken symlink doesn't exist, as far as `Path.exists` is concerned.
+        return None
+    return "other"
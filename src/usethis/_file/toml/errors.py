@@ -35,3 +35,7 @@ class UnexpectedTOMLOpenError(TOMLError):
 
 class UnexpectedTOMLIOError(TOMLError):
     """Raised when an unexpected attempt is made to read or write the TOML file."""
+
+
+class TOMLIncrementalDumpError(TOMLError):
+    """Raised when an incremental render of a TOML file differs from a full render."""
@@ -0,0 +1,231 @@
+"""Incremental serialization of TOML documents.
+
+Rendering a `tomlkit` document re-serializes every table in it, even though usually only
+a few tables have been modified since it was parsed. Instead, the source text of each
+top-level table is recorded when parsing, and when dumping, only the modified top-level
+tables are rendered; the source text of the others is reused as-is.
+
+This relies on private `tomlkit` APIs. If they aren't available, e.g. in a future
+version of `tomlkit`, documents are parsed without recording their source, and so are
+always dumped in full.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import tomlkit.api
+from tomlkit import TOMLDocument
+from tomlkit.items import AoT, Table
+from tomlkit.parser import Parser
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+
+    from tomlkit.items import Item, Key
+
+# Whether the private `tomlkit` APIs which this relies on are available.
+_IS_SUPPORTED = all(
+    hasattr(Parser, name) for name in ("_idx", "_parse_table", "_parse_aot")
+) and all(
+    hasattr(TOMLDocument, name)
+    for name in ("_render_simple_item", "_render_table", "_render_aot")
+)
+
+
+@dataclass(frozen=True)
+class TOMLSource:
+    """The source text of a parsed TOML document.
+
+    Attributes:
+        text: The source text.
+        spans: For each top-level table (or array of tables) in the document's body, in
+               order, the start and end indices of its source text.
+        body: The items in the document's body, as parsed.
+    """
+
+    text: str
+    spans: tuple[tuple[int, int], ...]
+    body: tuple[tuple[Key | None, Item], ...]
+
+
+def parse_with_source(content: str) -> tuple[TOMLDocument, TOMLSource | None]:
+    """Parse a TOML document, recording the source text of its top-level tables.
+
+    Returns:
+        The document, and its source. The source is None if the top-level tables can't
+        be matched up with their source text, or if the private `tomlkit` APIs this
+        relies on aren't available, in which case the document can only be dumped in
+        full.
+    """
+    if not _IS_SUPPORTED:
+        return tomlkit.api.parse(content), None
+
+    parser = _SpanRecordingParser(content)
+    document = parser.parse()
+
+    tables = [
+        (key, item)
+        for key, item in document.body
+        if key is not None and isinstance(item, Table | AoT)
+    ]
+
+    # Each table's source text runs from the end of the previous one (or the end of the
+    # top-level key-value pairs), including any indentation before its header.
+    start = 0
+    for key, item in document.body:
+        if key is not None and isinstance(item, Table | AoT):
+            break
+        start += len(document._render_simple_item(key, item))
+
+    # Consecutive headers for the same top-level key are merged into a single table.
+    merged: list[tuple[str, int, int]] = []
+    for key, end in parser.ends:
+        if merged and merged[-1][0] == key:
+            merged[-1] = (key, merged[-1][1], end)
+        else:
+            merged.append((key, start, end))
+        start = end
+
+    # Any indentation before a header belongs to its table, not the previous one.
+    for idx in range(1, len(merged)):
+        (prev_key, prev_start, end), (key, _, next_end) = merged[idx - 1], merged[idx]
+        boundary = end
+        while boundary > prev_start and content[boundary - 1] in " \t":
+            boundary -= 1
+        if boundary > prev_start and content[boundary - 1] == "\n":
+            merged[idx - 1] = (prev_key, prev_start, boundary)
+            merged[idx] = (key, boundary, next_end)
+
+    if (
+        len(tables) != len(merged)
+        or any(
+            key.key != span_key
+            for (key, _), (span_key, _, _) in zip(tables, merged, strict=False)
+        )
+        or (merged and merged[-1][2] != len(content))
+    ):
+        # e.g. dotted keys at the top level, which define tables without headers.
+        return document, None
+
+    return document, TOMLSource(
+        text=content,
+        spans=tuple((start, end) for _, start, end in merged),
+        body=tuple(document.body),
+    )
+
+
+def dumps_incremental(
+    document: TOMLDocument,
+    *,
+    source: TOMLSource,
+    modified_keys: Collection[str],
+) -> str:
+    """Render a TOML document, reusing the source text of unmodified top-level tables.
+
+    This mirrors `tomlkit`'s rendering of the document's body.
+
+    Args:
+        document: The document to render.
+        source: The source of the original document, from `parse_with_source`.
+        modified_keys: The top-level keys which have been modified since parsing.
+    """
+    text_by_item_id = {
+        id(item): source.text[start:end]
+        for (key, item), (start, end) in zip(
+            (
+                (key, item)
+                for key, item in source.body
+                if key is not None and isinstance(item, Table | AoT)
+            ),
+            source.spans,
+            strict=True,
+        )
+        if key.key not in modified_keys
+    }
+
+    # Inserting, removing or replacing an item in the document's body can adjust the
+    # whitespace of its neighbours in place, so the source text is only reused for
+    # tables whose neighbours are the same items as before. Modifying a table in place
+    # only affects that table.
+    neighbours_by_item_id = _get_neighbours_by_item_id(source.body)
+    for item_id, neighbours in _get_neighbours_by_item_id(document.body).items():
+        if neighbours != neighbours_by_item_id.get(item_id):
+            text_by_item_id.pop(item_id, None)
+
+    s = ""
+    for key, item in document.body:
+        if key is None or not isinstance(item, Table | AoT):
+            s += document._render_simple_item(key, item)
+            continue
+
+        if (
+            s.strip(" ")
+            and not s.strip(" ").endswith("\n")
+            and "\n" not in item.trivia.indent
+        ):
+            s += "\n"
+
+        text = text_by_item_id.get(id(item))
+        if text is not None:
+            s += text
+        elif isinstance(item, Table):
+            s += document._render_table(key, item)
+        else:
+            s += document._render_aot(key, item)
+
+    return s
+
+
+def _get_neighbours_by_item_id(
+    body: Sequence[tuple[Key | None, Item]],
+) -> dict[int, tuple[int | None, int | None]]:
+    """Get the IDs of the items either side of each item in a document's body."""
+    neighbours_by_item_id: dict[int, tuple[int | None, int | None]] = {}
+    for idx, (_, item) in enumerate(body):
+        prev = body[idx - 1][1] if idx > 0 else None
+        next_ = body[idx + 1][1] if idx + 1 < len(body) else None
+        neighbours_by_item_id[id(item)] = (
+            None if prev is None else id(prev),
+            None if next_ is None else id(next_),
+        )
+    return neighbours_by_item_id
+
+
+class _SpanRecordingParser(Parser):
+    """A parser which records where the source text of each top-level table ends."""
+
+    def __init__(self, string: str) -> None:
+        super().__init__(string)
+        self.ends: list[tuple[str, int]] = []
+        self._depth = 0
+
+    @override
+    def _parse_table(
+        self, parent_name: Key | None = None, parent: Table | None = None
+    ) -> tuple[Key, Table | AoT]:
+        self._depth += 1
+        try:
+            key, value = super()._parse_table(parent_name, parent)
+        finally:
+            self._depth -= 1
+
+        if not self._depth:
+            self.ends.append((key.key, self._idx))
+        return key, value
+
+    @override
+    def _parse_aot(self, first: Table, name_first: Key) -> AoT:
+        self._depth += 1
+        try:
+            aot = super()._parse_aot(first, name_first)
+        finally:
+            self._depth -= 1
+
+        if not self._depth and self.ends:
+            # The rest of the array follows its first table.
+            key, _ = self.ends[-1]
+            self.ends[-1] = (key, self._idx)
+        return aot
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import copy
 import re
+import sys
 from abc import ABCMeta
 from typing import TYPE_CHECKING, Any
 
@@ -15,15 +16,18 @@ from tomlkit.container import OutOfOrderTableProxy
 from tomlkit.exceptions import TOMLKitError
 from typing_extensions import assert_never, override
 
+from usethis._file import fs
 from usethis._file.manager import (
     KeyValueFileManager,
     UnexpectedFileIOError,
     UnexpectedFileOpenError,
 )
 from usethis._file.merge import deep_merge
+from usethis._file.patch import DeleteValue, ExtendList, RemoveFromList, SetValue
 from usethis._file.print_ import print_keys
 from usethis._file.toml.errors import (
     TOMLDecodeError,
+    TOMLIncrementalDumpError,
     TOMLNotFoundError,
     TOMLValueAlreadySetError,
     TOMLValueInvalidError,
@@ -31,8 +35,12 @@ from usethis._file.toml.errors import (
     UnexpectedTOMLIOError,
     UnexpectedTOMLOpenError,
 )
+from usethis._file.toml.incremental import dumps_incremental, parse_with_source
 from usethis._file.types_ import Key
 
+if sys.version_info >= (3, 11):
+    import tomllib
+
 if TYPE_CHECKING:
     from collections.abc import Collection, Sequence
     from pathlib import Path
@@ -42,13 +50,32 @@ if TYPE_CHECKING:
     from tomlkit.items import Item
     from typing_extensions import Never, Self
 
+    from usethis._file.patch import PatchOp
+    from usethis._file.toml.incremental import TOMLSource
     from usethis._file.types_ import Key
 
 
 class TOMLFileManager(KeyValueFileManager[TOMLDocument], metaclass=ABCMeta):
-    """An abstract class for managing TOML files."""
+    """An abstract class for managing TOML files.
+
+    Lookups via `in` and `[]` use a read-only copy of the document parsed with the
+    (much faster) standard library `tomllib`, consisting of plain Python values. The
+    full `tomlkit` document is only parsed when it is needed, i.e. via `get()` or when
+    the file is modified, after which lookups use it instead.
 
+    The top-level tables modified since the document was parsed are tracked, so that
+    when the file is written, only those tables are re-rendered; the source text of the
+    others is reused as-is. Set `verify_incremental_dumps` to check this against a full
+    render of the document each time.
+    """
+
+    verify_incremental_dumps: ClassVar[bool] = False
     _content_by_path: ClassVar[dict[Path, TOMLDocument | None]] = {}
+    _readonly_content_by_path: ClassVar[dict[Path, dict[str, Any]]] = {}
+    _source_by_path: ClassVar[dict[Path, TOMLSource]] = {}
+    # None means the modified tables are unknown, so the document is rendered in full.
+    _modified_keys_by_path: ClassVar[dict[Path, set[str] | None]] = {}
+    _committing_keys_by_path: ClassVar[dict[Path, set[str]]] = {}
 
     @override
     def __enter__(self) -> Self:
@@ -75,11 +102,31 @@ class TOMLFileManager(KeyValueFileManager[TOMLDocument], metaclass=ABCMeta):
             msg = "Content is None, cannot dump."
             raise ValueError(msg)
 
-        return tomlkit.api.dumps(self._content)
+        source = self._source_by_path.get(self.path)
+        modified_keys = self._modified_keys_by_path.get(self.path)
+        if source is None or modified_keys is None:
+            return tomlkit.api.dumps(self._content)
+
+        content = dumps_incremental(
+            self._content, source=source, modified_keys=modified_keys
+        )
+        if self.verify_incremental_dumps and content != tomlkit.api.dumps(
+            self._content
+        ):
+            msg = (
+                f"The incremental render of '{self.name}' differs from the full render "
+                f"after modifying the top-level keys {sorted(modified_keys)}."
+            )
+            raise TOMLIncrementalDumpError(msg)
+        return content
 
     @override
     def _parse_content(self, content: str) -> TOMLDocument:
-        return tomlkit.api.parse(content)
+        document, source = parse_with_source(content)
+        if source is not None:
+            self._source_by_path[self.path] = source
+            self._modified_keys_by_path[self.path] = set()
+        return document
 
     @override
     def get(self) -> TOMLDocument:
@@ -87,7 +134,25 @@ class TOMLFileManager(KeyValueFileManager[TOMLDocument], metaclass=ABCMeta):
 
     @override
     def commit(self, document: TOMLDocument) -> None:
-        return super().commit(document)
+        modified_keys = self._modified_keys_by_path.get(self.path)
+        committing_keys = self._committing_keys_by_path.pop(self.path, None)
+        super().commit(document)
+        if modified_keys is None or committing_keys is None:
+            # We don't know which tables were modified.
+            self._modified_keys_by_path[self.path] = None
+        else:
+            modified_keys.update(committing_keys)
+
+    def _commit_modified(
+        self, document: TOMLDocument, *, keys_list: Sequence[Sequence[str]]
+    ) -> None:
+        """Commit a document in which only the values at the given keys were modified."""
+        if all(keys_list):
+            self._committing_keys_by_path[self.path] = {keys[0] for keys in keys_list}
+        try:
+            self.commit(document)
+        finally:
+            self._committing_keys_by_path.pop(self.path, None)
 
     @property
     @override
@@ -97,6 +162,43 @@ class TOMLFileManager(KeyValueFileManager[TOMLDocument], metaclass=ABCMeta):
     @_content.setter
     def _content(self, value: TOMLDocument | None) -> None:
         self._content_by_path[self.path] = value
+        # The read-only copy is superseded by (or stale relative to) the new content.
+        self._readonly_content_by_path.pop(self.path, None)
+        if value is None:
+            self._source_by_path.pop(self.path, None)
+            self._modified_keys_by_path.pop(self.path, None)
+
+    @override
+    def unlock(self) -> None:
+        super().unlock()
+        self._readonly_content_by_path.pop(self.path, None)
+        self._source_by_path.pop(self.path, None)
+        self._modified_keys_by_path.pop(self.path, None)
+
+    def _get_readonly(self) -> TOMLDocument | dict[str, Any]:
+        """Retrieve the document for lookups, without necessarily parsing it fully.
+
+        If the document has already been read via `get()`, it is returned as-is.
+        Otherwise, a read-only copy parsed with `tomllib` is returned. In any case where
+        the fast parse isn't possible (e.g. the file doesn't exist or is invalid), this
+        falls back to `get()`, which raises the usual errors.
+        """
+        self._validate_lock()
+
+        if self._content is not None or sys.version_info < (3, 11):
+            return self.get()
+
+        readonly = self._readonly_content_by_path.get(self.path)
+        if readonly is not None:
+            return readonly
+
+        try:
+            readonly = tomllib.loads(fs.read_text(self.path))
+        except (FileNotFoundError, tomllib.TOMLDecodeError):
+            return self.get()
+
+        self._readonly_content_by_path[self.path] = readonly
+        return readonly
 
     @override
     def _validate_lock(self) -> None:
@@ -114,7 +216,7 @@ class TOMLFileManager(KeyValueFileManager[TOMLDocument], metaclass=ABCMeta):
         keys = _validate_keys(keys)
         try:
             try:
-                container = self.get()
+                container = self._get_readonly()
             except FileNotFoundError:
                 return False
             for key in keys:
@@ -131,7 +233,7 @@ class TOMLFileManager(KeyValueFileManager[TOMLDocument], metaclass=ABCMeta):
         keys = item
         keys = _validate_keys(keys)
 
-        d = self.get()
+        d = self._get_readonly()
         for key in keys:
             try:
                 TypeAdapter(dict).validate_python(d)
@@ -155,65 +257,8 @@ class TOMLFileManager(KeyValueFileManager[TOMLDocument], metaclass=ABCMeta):
         An empty list of keys corresponds to the root of the document.
         """
         toml_document = copy.copy(self.get())
-        keys = _validate_keys(keys)
-
-        # If value is a dict and keys are provided, recurse over each item. This
-        # avoids a tomlkit bug where setting a dict to a dotted key raises an error.
-        if keys and isinstance(value, dict):
-            for k, v in value.items():
-                self.set_value(keys=[*keys, k], value=v, exists_ok=exists_ok)
-            return
-
-        if not keys:
-            # Root level config - value must be a mapping.
-            TypeAdapter(dict).validate_python(toml_document)
-            assert isinstance(toml_document, dict)
-            TypeAdapter(dict).validate_python(value)
-            assert isinstance(value, dict)
-            if not toml_document or exists_ok:
-                toml_document.update(value)
-                self.commit(toml_document)
-                return
-
-        d, parent = toml_document, {}
-        shared_keys: list[str] = []
-        try:
-            # Index our way into each ID key.
-            # Eventually, we should land at a final dict, which is the one we are setting.
-            for key in keys:
-                TypeAdapter(dict).validate_python(d)
-                assert isinstance(d, dict)
-                d, parent = d[key], d
-                shared_keys.append(key)
-        except KeyError:
-            _set_value_in_existing(
-                toml_document=toml_document,
-                shared_container=d,
-                shared_keys=shared_keys,
-                keys=keys,
-                value=value,
-            )
-        except ValidationError:
-            if not exists_ok:
-                # The configuration is already present, which is not allowed.
-                _raise_already_set(shared_keys)
-            else:
-                _set_value_in_existing(
-                    toml_document=toml_document,
-                    shared_keys=shared_keys,
-                    shared_container=d,
-                    keys=keys,
-                    value=value,
-                )
-        else:
-            if not exists_ok:
-                # The configuration is already present, which is not allowed.
-                _raise_already_set(keys)
-            else:
-                # The configuration is already present, but we're allowed to overwrite it.
-                parent[keys[-1]] = value
-
-        self.commit(toml_document)
+        _set_value(toml_document, keys=keys, value=value, exists_ok=exists_ok)
+        self._commit_modified(toml_document, keys_list=[_validate_keys(keys)])
 
     @override
     def __delitem__(self, keys: Sequence[Key]) -> None:
@@ -227,116 +272,18 @@ class TOMLFileManager(KeyValueFileManager[TOMLDocument], metaclass=ABCMeta):
             toml_document = copy.copy(self.get())
         except FileNotFoundError:
             return
-        keys = _validate_keys(keys)
-
-        # Exit early if the configuration is not present.
-        try:
-            d = toml_document
-            for key in keys:
-                TypeAdapter(dict).validate_python(d)
-                assert isinstance(d, dict)
-                d = d[key]
-        except (KeyError, ValidationError):
-            # N.B. by convention a del call should raise an error if the key is not found.
-            msg = f"Configuration value '{print_keys(keys)}' is missing."
-            raise TOMLValueMissingError(msg) from None
-
-        # Remove the configuration.
-        d = toml_document
-        for key in keys[:-1]:
-            TypeAdapter(dict).validate_python(d)
-            assert isinstance(d, dict)
-            d = d[key]
-        assert isinstance(d, dict)
-        if not keys:
-            # i.e. the case where we're deleting the root of the document.
-            for key in list(d.keys()):
-                del d[key]
-        else:
-            # N.B. There was a strange behaviour (bug?) in tomlkit where deleting a
-            # key has two separate lines:
-            # self._value.remove(key)  # noqa: ERA001
-            # dict.__delitem__(self, key)  # noqa: ERA001
-            # but it's not clear why there's this duplicate and it causes a KeyError
-            # in some cases.
-            if isinstance(d, OutOfOrderTableProxy):
-                # N.B. this case isn't expected based on the type annotations but
-                # it is possible in practice.
-                d.__delitem__(keys[-1])
-            else:
-                d.remove(keys[-1])
-
-            # Cleanup: any empty sections should be removed.
-            for idx in reversed(range(1, len(keys))):
-                # Navigate to the parent of the section we want to check
-                parent = toml_document
-                for key in keys[: idx - 1]:
-                    TypeAdapter(dict).validate_python(parent)
-                    assert isinstance(parent, dict)
-                    parent = parent[key]
-
-                # If the section is empty, remove it
-                TypeAdapter(dict).validate_python(parent)
-                assert isinstance(parent, dict)
-                if not parent[keys[idx - 1]]:
-                    del parent[keys[idx - 1]]
-
-        self.commit(toml_document)
+        _delete_value(toml_document, keys=keys)
+        self._commit_modified(toml_document, keys_list=[_validate_keys(keys)])
 
     @override
     def extend_list(self, *, keys: Sequence[Key], values: Sequence[Any]) -> None:
         if not keys:
             msg = "At least one ID key must be provided."
             raise ValueError(msg)
-        keys = _validate_keys(keys)
 
         toml_document = copy.copy(self.get())
-
-        shared_keys: list[str] = []
-        d = toml_document
-        try:
-            for key in keys[:-1]:
-                TypeAdapter(dict).validate_python(d)
-                assert isinstance(d, dict)
-                d = d[key]
-                shared_keys.append(key)
-            p_parent = d
-            TypeAdapter(dict).validate_python(p_parent)
-            assert isinstance(p_parent, dict)
-            d = p_parent[keys[-1]]
-        except KeyError:
-            contents = values
-            for key in reversed(keys):
-                contents = {key: contents}
-            assert isinstance(contents, dict)
-            _set_value_in_existing(
-                toml_document=toml_document,
-                shared_keys=shared_keys,
-                shared_container=d,
-                keys=keys,
-                value=values,
-            )
-            assert isinstance(toml_document, TOMLDocument)
-        except ValidationError:
-            msg = (
-                f"Configuration value '{print_keys(keys[:-1])}' is not a valid mapping in "
-                f"the TOML file '{self.name}', and does not contain the key '{keys[-1]}'."
-            )
-            raise TOMLValueMissingError(msg) from None
-        else:
-            try:
-                TypeAdapter(list).validate_python(d)
-            except ValidationError:
-                msg = (
-                    f"Configuration value '{print_keys(keys)}' is not a valid list in "
-                    f"the TOML file '{self.name}'."
-                )
-                raise TOMLValueInvalidError(msg) from None
-            assert isinstance(d, list)
-            for value in values:
-                d.insert(len(d), value)
-
-        self.commit(toml_document)
+        _extend_list(toml_document, keys=keys, values=values, name=self.name)
+        self._commit_modified(toml_document, keys_list=[_validate_keys(keys)])
 
     @override
     def remove_from_list(self, *, keys: Sequence[Key], values: Collection[Any]) -> None:
@@ -348,36 +295,252 @@ class TOMLFileManager(KeyValueFileManager[TOMLDocument], metaclass=ABCMeta):
         if not keys:
             msg = "At least one ID key must be provided."
             raise ValueError(msg)
-        keys = _validate_keys(keys)
 
         toml_document = copy.copy(self.get())
+        if _remove_from_list(toml_document, keys=keys, values=values):
+            self._commit_modified(toml_document, keys_list=[_validate_keys(keys)])
 
-        try:
-            p = toml_document
-            for key in keys[:-1]:
-                TypeAdapter(dict).validate_python(p)
-                assert isinstance(p, dict)
-                p = p[key]
-
-            p_parent = p
-            TypeAdapter(dict).validate_python(p_parent)
-            assert isinstance(p_parent, dict)
-            p = p_parent[keys[-1]]
-        except (KeyError, ValidationError):
-            # The configuration is not present - do not modify
+    @override
+    def _patch(self, ops: Sequence[PatchOp]) -> None:
+        """Apply validated operations to a single copy of the document, then commit."""
+        for op in ops:
+            _validate_keys(op.keys)
+
+        toml_document = copy.copy(self.get())
+        for op in ops:
+            if isinstance(op, SetValue):
+                _set_value(
+                    toml_document, keys=op.keys, value=op.value, exists_ok=op.exists_ok
+                )
+            elif isinstance(op, ExtendList):
+                _extend_list(
+                    toml_document, keys=op.keys, values=op.values, name=self.name
+                )
+            elif isinstance(op, RemoveFromList):
+                _remove_from_list(toml_document, keys=op.keys, values=op.values)
+            elif isinstance(op, DeleteValue):
+                try:
+                    _delete_value(toml_document, keys=op.keys)
+                except TOMLValueMissingError:
+                    if not op.missing_ok:
+                        raise
+            else:
+                assert_never(op)
+        self._commit_modified(
+            toml_document, keys_list=[_validate_keys(op.keys) for op in ops]
+        )
+
+
+def _set_value(
+    toml_document: TOMLDocument, *, keys: Sequence[Key], value: Any, exists_ok: bool
+) -> None:
+    """Set a value in a TOML document in place."""
+    keys = _validate_keys(keys)
+
+    # If value is a dict and keys are provided, recurse over each item. This
+    # avoids a tomlkit bug where setting a dict to a dotted key raises an error.
+    if keys and isinstance(value, dict):
+        for k, v in value.items():
+            _set_value(toml_document, keys=[*keys, k], value=v, exists_ok=exists_ok)
+        return
+
+    if not keys:
+        # Root level config - value must be a mapping.
+        TypeAdapter(dict).validate_python(toml_document)
+        assert isinstance(toml_document, dict)
+        TypeAdapter(dict).validate_python(value)
+        assert isinstance(value, dict)
+        if not toml_document or exists_ok:
+            toml_document.update(value)
             return
 
+    d, parent = toml_document, {}
+    shared_keys: list[str] = []
+    try:
+        # Index our way into each ID key.
+        # Eventually, we should land at a final dict, which is the one we are setting.
+        for key in keys:
+            TypeAdapter(dict).validate_python(d)
+            assert isinstance(d, dict)
+            d, parent = d[key], d
+            shared_keys.append(key)
+    except KeyError:
+        _set_value_in_existing(
+            toml_document=toml_document,
+            shared_container=d,
+            shared_keys=shared_keys,
+            keys=keys,
+            value=value,
+        )
+    except ValidationError:
+        if not exists_ok:
+            # The configuration is already present, which is not allowed.
+            _raise_already_set(shared_keys)
+        else:
+            _set_value_in_existing(
+                toml_document=toml_document,
+                shared_keys=shared_keys,
+                shared_container=d,
+                keys=keys,
+                value=value,
+            )
+    else:
+        if not exists_ok:
+            # The configuration is already present, which is not allowed.
+            _raise_already_set(keys)
+        else:
+            # The configuration is already present, but we're allowed to overwrite it.
+            parent[keys[-1]] = value
+
+
+def _delete_value(toml_document: TOMLDocument, *, keys: Sequence[Key]) -> None:
+    """Delete a value in a TOML document in place."""
+    keys = _validate_keys(keys)
+
+    # Exit early if the configuration is not present.
+    try:
+        d = toml_document
+        for key in keys:
+            TypeAdapter(dict).validate_python(d)
+            assert isinstance(d, dict)
+            d = d[key]
+    except (KeyError, ValidationError):
+        # N.B. by convention a del call should raise an error if the key is not found.
+        msg = f"Configuration value '{print_keys(keys)}' is missing."
+        raise TOMLValueMissingError(msg) from None
+
+    # Remove the configuration.
+    d = toml_document
+    for key in keys[:-1]:
+        TypeAdapter(dict).validate_python(d)
+        assert isinstance(d, dict)
+        d = d[key]
+    assert isinstance(d, dict)
+    if not keys:
+        # i.e. the case where we're deleting the root of the document.
+        for key in list(d.keys()):
+            del d[key]
+    else:
+        # N.B. There was a strange behaviour (bug?) in tomlkit where deleting a
+        # key has two separate lines:
+        # self._value.remove(key)  # noqa: ERA001
+        # dict.__delitem__(self, key)  # noqa: ERA001
+        # but it's not clear why there's this duplicate and it causes a KeyError
+        # in some cases.
+        if isinstance(d, OutOfOrderTableProxy):
+            # N.B. this case isn't expected based on the type annotations but
+            # it is possible in practice.
+            d.__delitem__(keys[-1])
+        else:
+            d.remove(keys[-1])
+
+        # Cleanup: any empty sections should be removed.
+        for idx in reversed(range(1, len(keys))):
+            # Navigate to the parent of the section we want to check
+            parent = toml_document
+            for key in keys[: idx - 1]:
+                TypeAdapter(dict).validate_python(parent)
+                assert isinstance(parent, dict)
+                parent = parent[key]
+
+            # If the section is empty, remove it
+            TypeAdapter(dict).validate_python(parent)
+            assert isinstance(parent, dict)
+            if not parent[keys[idx - 1]]:
+                del parent[keys[idx - 1]]
+
+
+def _extend_list(
+    toml_document: TOMLDocument,
+    *,
+    keys: Sequence[Key],
+    values: Sequence[Any],
+    name: str,
+) -> None:
+    """Extend a list in a TOML document in place, creating it if necessary."""
+    keys = _validate_keys(keys)
+
+    shared_keys: list[str] = []
+    d = toml_document
+    try:
+        for key in keys[:-1]:
+            TypeAdapter(dict).validate_python(d)
+            assert isinstance(d, dict)
+            d = d[key]
+            shared_keys.append(key)
+        p_parent = d
+        TypeAdapter(dict).validate_python(p_parent)
+        assert isinstance(p_parent, dict)
+        d = p_parent[keys[-1]]
+    except KeyError:
+        contents = values
+        for key in reversed(keys):
+            contents = {key: contents}
+        assert isinstance(contents, dict)
+        _set_value_in_existing(
+            toml_document=toml_document,
+            shared_keys=shared_keys,
+            shared_container=d,
+            keys=keys,
+            value=values,
+        )
+        assert isinstance(toml_document, TOMLDocument)
+    except ValidationError:
+        msg = (
+            f"Configuration value '{print_keys(keys[:-1])}' is not a valid mapping in "
+            f"the TOML file '{name}', and does not contain the key '{keys[-1]}'."
+        )
+        raise TOMLValueMissingError(msg) from None
+    else:
         try:
-            TypeAdapter(list).validate_python(p)
+            TypeAdapter(list).validate_python(d)
         except ValidationError:
-            return
-        assert isinstance(p, list)
+            msg = (
+                f"Configuration value '{print_keys(keys)}' is not a valid list in "
+                f"the TOML file '{name}'."
+            )
+            raise TOMLValueInvalidError(msg) from None
+        assert isinstance(d, list)
+        for value in values:
+            d.insert(len(d), value)
+
 
-        for value in list(values):
-            while value in p:
-                p.remove(value)
+def _remove_from_list(
+    toml_document: TOMLDocument, *, keys: Sequence[Key], values: Collection[Any]
+) -> bool:
+    """Remove values from a list in a TOML document in place.
 
-        self.commit(toml_document)
+    Returns:
+        Whether the list was found, in which case the document may have been modified.
+    """
+    keys = _validate_keys(keys)
+
+    try:
+        p = toml_document
+        for key in keys[:-1]:
+            TypeAdapter(dict).validate_python(p)
+            assert isinstance(p, dict)
+            p = p[key]
+
+        p_parent = p
+        TypeAdapter(dict).validate_python(p_parent)
+        assert isinstance(p_parent, dict)
+        p = p_parent[keys[-1]]
+    except (KeyError, ValidationError):
+        # The configuration is not present - do not modify
+        return False
+
+    try:
+        TypeAdapter(list).validate_python(p)
+    except ValidationError:
+        return False
+    assert isinstance(p, list)
+
+    for value in list(values):
+        while value in p:
+            p.remove(value)
+
+    return True
 
 
 def _set_value_in_existing(
@@ -9,11 +9,7 @@ from dataclasses import dataclass
 from io import StringIO
 from typing import TYPE_CHECKING, Any, ClassVar
 
-import ruamel.yaml
 from pydantic import TypeAdapter, ValidationError
-from ruamel.yaml.comments import CommentedMap
-from ruamel.yaml.error import YAMLError
-from ruamel.yaml.util import load_yaml_guess_indent
 from typing_extensions import assert_never, override
 
 from usethis._console import info_print
@@ -23,6 +19,7 @@ from usethis._file.manager import (
     UnexpectedFileOpenError,
 )
 from usethis._file.merge import deep_merge
+from usethis._file.patch import DeleteValue, ExtendList, RemoveFromList, SetValue
 from usethis._file.print_ import print_keys
 from usethis._file.yaml.errors import (
     UnexpectedYAMLIOError,
@@ -40,8 +37,10 @@ if TYPE_CHECKING:
     from io import TextIOWrapper
     from pathlib import Path
 
+    import ruamel.yaml
     from typing_extensions import Self
 
+    from usethis._file.patch import PatchOp
     from usethis._file.types_ import Key
     from usethis._file.yaml.typing_ import YAMLLiteral
 
@@ -78,9 +77,6 @@ class YAMLFileManager(KeyValueFileManager[YAMLDocument], metaclass=ABCMeta):
             raise YAMLNotFoundError(err) from None
         except UnexpectedFileIOError as err:
             raise UnexpectedYAMLIOError(err) from None
-        except YAMLError as err:
-            msg = f"Failed to decode '{self.name}':\n{err}"
-            raise YAMLDecodeError(msg) from None
 
     @override
     def _dump_content(self) -> str:
@@ -106,7 +102,13 @@ class YAMLFileManager(KeyValueFileManager[YAMLDocument], metaclass=ABCMeta):
     @override
     def _parse_content(self, content: str) -> YAMLDocument:
         """Parse the content of the document."""
-        return get_yaml_document(StringIO(content), guess_indent=True)
+        from ruamel.yaml.error import YAMLError  # noqa: PLC0415
+
+        try:
+            return get_yaml_document(StringIO(content), guess_indent=True)
+        except YAMLError as err:
+            msg = f"Failed to decode '{self.name}':\n{err}"
+            raise YAMLDecodeError(msg) from None
 
     @property
     @override
@@ -137,6 +139,8 @@ class YAMLFileManager(KeyValueFileManager[YAMLDocument], metaclass=ABCMeta):
         except FileNotFoundError:
             return False
 
+        from ruamel.yaml.comments import CommentedMap  # noqa: PLC0415
+
         try:
             for key in keys:
                 if isinstance(current, CommentedMap):
@@ -177,62 +181,8 @@ class YAMLFileManager(KeyValueFileManager[YAMLDocument], metaclass=ABCMeta):
         An empty list of keys corresponds to the root of the document.
         """
         content = copy.deepcopy(self.get().content)
-        keys = _validate_keys(keys)
-
-        # Root level config - value must be a mapping.
-        try:
-            TypeAdapter(dict).validate_python(content)
-        except ValidationError:
-            msg = "Root level configuration must be a mapping."
-            raise UnexpectedYAMLValueError(msg) from None
-        if not isinstance(content, CommentedMap):
-            raise AssertionError
-
-        if not keys:
-            TypeAdapter(dict).validate_python(value)
-            assert isinstance(value, dict)
-            if not content or exists_ok:
-                content.update(value)
-                assert self._content is not None  # We have called .get() already.
-                update_ruamel_yaml_map(
-                    cmap=self._content.content,
-                    new_contents=content,
-                    preserve_comments=True,
-                )
-                self.commit(self._content)
-                return
-
-        d, parent = content, {}
-        shared_keys: list[str] = []
-        try:
-            # Index our way into each ID key.
-            # Eventually, we should land at a final dict, which is the one we are setting.
-            for key in keys:
-                TypeAdapter(dict).validate_python(d)
-                assert isinstance(d, dict)
-                d, parent = d[key], d
-                shared_keys.append(key)
-        except KeyError:
-            _set_value_in_existing(content=content, keys=keys, value=value)
-        except ValidationError:
-            if not exists_ok:
-                msg = f"Configuration value '{print_keys(shared_keys)}' is already set."
-                raise YAMLValueAlreadySetError(msg) from None
-            else:
-                _set_value_in_existing(content=content, keys=keys, value=value)
-        else:
-            if not exists_ok:
-                msg = f"Configuration value '{print_keys(keys)}' is already set."
-                raise YAMLValueAlreadySetError(msg)
-            else:
-                # The configuration is already present, but we're allowed to overwrite it.
-                parent[keys[-1]] = value
-
-        assert self._content is not None  # We have called .get() already.
-        update_ruamel_yaml_map(
-            cmap=self._content.content, new_contents=content, preserve_comments=True
-        )
-        self.commit(self._content)
+        _set_value(content, keys=keys, value=value, exists_ok=exists_ok)
+        self._commit_content(content)
 
     @override
     def __delitem__(self, keys: Sequence[Key]) -> None:
@@ -246,63 +196,8 @@ class YAMLFileManager(KeyValueFileManager[YAMLDocument], metaclass=ABCMeta):
             content = copy.deepcopy(self.get().content)
         except FileNotFoundError:
             return
-        try:
-            TypeAdapter(dict).validate_python(content)
-        except ValidationError:
-            # N.B. by convention a del call should raise an error if the key is not found.
-            msg = f"Configuration value '{print_keys(keys)}' is missing."
-            raise YAMLValueMissingError(msg) from None
-        assert isinstance(content, dict)
-        keys = _validate_keys(keys)
-
-        # Exit early if the configuration is not present.
-        try:
-            d = content
-            for key in keys:
-                TypeAdapter(dict).validate_python(d)
-                assert isinstance(d, dict)
-                d = d[key]
-        except (KeyError, ValidationError):
-            # N.B. by convention a del call should raise an error if the key is not found.
-            msg = f"Configuration value '{print_keys(keys)}' is missing."
-            raise YAMLValueMissingError(msg) from None
-
-        # Remove the configuration.
-        d = content
-        for key in keys[:-1]:
-            TypeAdapter(dict).validate_python(d)
-            assert isinstance(d, dict)
-            d = d[key]
-        assert isinstance(d, dict)
-        if not keys:
-            # i.e. the case where we're deleting the root of the document.
-            for key in list(d.keys()):
-                del d[key]
-        else:
-            d.__delitem__(keys[-1])
-
-            # Cleanup: any empty sections should be removed.
-            for idx in reversed(range(1, len(keys))):
-                # Navigate to the parent of the section we want to check
-                parent = content
-                for key in keys[: idx - 1]:
-                    TypeAdapter(dict).validate_python(parent)
-                    assert isinstance(parent, dict)
-                    parent = parent[key]
-
-                # If the section is empty, remove it
-                TypeAdapter(dict).validate_python(parent)
-                assert isinstance(parent, dict)
-                if not parent[keys[idx - 1]]:
-                    del parent[keys[idx - 1]]
-
-        assert self._content is not None  # We have called .get() already.
-        update_ruamel_yaml_map(
-            cmap=self._content.content,
-            new_contents=content,
-            preserve_comments=True,
-        )
-        self.commit(self._content)
+        _delete_value(content, keys=keys)
+        self._commit_content(content)
 
     @override
     def extend_list(self, *, keys: Sequence[Key], values: Sequence[Any]) -> None:
@@ -310,48 +205,10 @@ class YAMLFileManager(KeyValueFileManager[YAMLDocument], metaclass=ABCMeta):
         if not keys:
             msg = "At least one ID key must be provided."
             raise ValueError(msg)
-        keys = _validate_keys(keys)
 
         content = copy.deepcopy(self.get().content)
-        # Root level config - value must be a mapping.
-        try:
-            TypeAdapter(dict).validate_python(content)
-        except ValidationError:
-            msg = "Root level configuration must be a mapping."
-            raise UnexpectedYAMLValueError(msg) from None
-        assert isinstance(content, dict)
-
-        try:
-            d = content
-            for key in keys[:-1]:
-                TypeAdapter(dict).validate_python(d)
-                assert isinstance(d, dict)
-                d = d[key]
-            p_parent = d
-            TypeAdapter(dict).validate_python(p_parent)
-            assert isinstance(p_parent, dict)
-            d = p_parent[keys[-1]]
-        except KeyError:
-            new_content = values
-            for key in reversed(keys):
-                new_content = {key: new_content}
-            assert isinstance(new_content, dict)
-            content = deep_merge(content, new_content)
-            assert isinstance(content, dict)
-        else:
-            TypeAdapter(dict).validate_python(p_parent)
-            TypeAdapter(list).validate_python(d)
-            assert isinstance(p_parent, dict)
-            assert isinstance(d, list)
-            p_parent[keys[-1]] = d + list(values)
-
-        assert self._content is not None  # We have called .get() already.
-        update_ruamel_yaml_map(
-            cmap=self._content.content,
-            new_contents=content,
-            preserve_comments=True,
-        )
-        self.commit(self._content)
+        _extend_list(content, keys=keys, values=values)
+        self._commit_content(content)
 
     @override
     def remove_from_list(self, *, keys: Sequence[Key], values: Sequence[Any]) -> None:
@@ -359,41 +216,39 @@ class YAMLFileManager(KeyValueFileManager[YAMLDocument], metaclass=ABCMeta):
         if not keys:
             msg = "At least one ID key must be provided."
             raise ValueError(msg)
-        keys = _validate_keys(keys)
 
         content = copy.deepcopy(self.get()).content
-        # Root level config - value must be a mapping.
-        try:
-            TypeAdapter(dict).validate_python(content)
-        except ValidationError:
-            msg = "Root level configuration must be a mapping."
-            raise UnexpectedYAMLValueError(msg) from None
-        assert isinstance(content, dict)
+        if _remove_from_list(content, keys=keys, values=values):
+            self._commit_content(content)
 
-        try:
-            p = content
-            for key in keys[:-1]:
-                TypeAdapter(dict).validate_python(p)
-                assert isinstance(p, dict)
-                p = p[key]
-
-            p_parent = p
-            TypeAdapter(dict).validate_python(p_parent)
-            assert isinstance(p_parent, dict)
-            p = p_parent[keys[-1]]
-        except (KeyError, ValidationError):
-            # The configuration is not present - do not modify
-            return
-
-        try:
-            TypeAdapter(list).validate_python(p)
-        except ValidationError:
-            return
-        assert isinstance(p, list)
+    @override
+    def _patch(self, ops: Sequence[PatchOp]) -> None:
+        """Apply validated operations to a single copy of the document, then commit."""
+        for op in ops:
+            _validate_keys(op.keys)
 
-        new_values = [value for value in p if value not in values]
-        p_parent[keys[-1]] = new_values
+        content = copy.deepcopy(self.get().content)
+        for op in ops:
+            if isinstance(op, SetValue):
+                _set_value(
+                    content, keys=op.keys, value=op.value, exists_ok=op.exists_ok
+                )
+            elif isinstance(op, ExtendList):
+                _extend_list(content, keys=op.keys, values=op.values)
+            elif isinstance(op, RemoveFromList):
+                _remove_from_list(content, keys=op.keys, values=op.values)
+            elif isinstance(op, DeleteValue):
+                try:
+                    _delete_value(content, keys=op.keys)
+                except YAMLValueMissingError:
+                    if not op.missing_ok:
+                        raise
+            else:
+                assert_never(op)
+        self._commit_content(content)
 
+    def _commit_content(self, content: YAMLLiteral) -> None:
+        """Update the document in place with modified content, preserving comments."""
         assert self._content is not None  # We have called .get() already.
         update_ruamel_yaml_map(
             cmap=self._content.content,
@@ -403,6 +258,192 @@ class YAMLFileManager(KeyValueFileManager[YAMLDocument], metaclass=ABCMeta):
         self.commit(self._content)
 
 
+def _set_value(
+    content: YAMLLiteral, *, keys: Sequence[Key], value: Any, exists_ok: bool
+) -> None:
+    """Set a value in YAML content in place."""
+    keys = _validate_keys(keys)
+
+    # Root level config - value must be a mapping.
+    try:
+        TypeAdapter(dict).validate_python(content)
+    except ValidationError:
+        msg = "Root level configuration must be a mapping."
+        raise UnexpectedYAMLValueError(msg) from None
+    from ruamel.yaml.comments import CommentedMap  # noqa: PLC0415
+
+    if not isinstance(content, CommentedMap):
+        raise AssertionError
+
+    if not keys:
+        TypeAdapter(dict).validate_python(value)
+        assert isinstance(value, dict)
+        if not content or exists_ok:
+            content.update(value)
+            return
+
+    d, parent = content, {}
+    shared_keys: list[str] = []
+    try:
+        # Index our way into each ID key.
+        # Eventually, we should land at a final dict, which is the one we are setting.
+        for key in keys:
+            TypeAdapter(dict).validate_python(d)
+            assert isinstance(d, dict)
+            d, parent = d[key], d
+            shared_keys.append(key)
+    except KeyError:
+        _set_value_in_existing(content=content, keys=keys, value=value)
+    except ValidationError:
+        if not exists_ok:
+            msg = f"Configuration value '{print_keys(shared_keys)}' is already set."
+            raise YAMLValueAlreadySetError(msg) from None
+        else:
+            _set_value_in_existing(content=content, keys=keys, value=value)
+    else:
+        if not exists_ok:
+            msg = f"Configuration value '{print_keys(keys)}' is already set."
+            raise YAMLValueAlreadySetError(msg)
+        else:
+            # The configuration is already present, but we're allowed to overwrite it.
+            parent[keys[-1]] = value
+
+
+def _delete_value(content: YAMLLiteral, *, keys: Sequence[Key]) -> None:
+    """Delete a value in YAML content in place."""
+    try:
+        TypeAdapter(dict).validate_python(content)
+    except ValidationError:
+        # N.B. by convention a del call should raise an error if the key is not found.
+        msg = f"Configuration value '{print_keys(keys)}' is missing."
+        raise YAMLValueMissingError(msg) from None
+    assert isinstance(content, dict)
+    keys = _validate_keys(keys)
+
+    # Exit early if the configuration is not present.
+    try:
+        d = content
+        for key in keys:
+            TypeAdapter(dict).validate_python(d)
+            assert isinstance(d, dict)
+            d = d[key]
+    except (KeyError, ValidationError):
+        # N.B. by convention a del call should raise an error if the key is not found.
+        msg = f"Configuration value '{print_keys(keys)}' is missing."
+        raise YAMLValueMissingError(msg) from None
+
+    # Remove the configuration.
+    d = content
+    for key in keys[:-1]:
+        TypeAdapter(dict).validate_python(d)
+        assert isinstance(d, dict)
+        d = d[key]
+    assert isinstance(d, dict)
+    if not keys:
+        # i.e. the case where we're deleting the root of the document.
+        for key in list(d.keys()):
+            del d[key]
+    else:
+        d.__delitem__(keys[-1])
+
+        # Cleanup: any empty sections should be removed.
+        for idx in reversed(range(1, len(keys))):
+            # Navigate to the parent of the section we want to check
+            parent = content
+            for key in keys[: idx - 1]:
+                TypeAdapter(dict).validate_python(parent)
+                assert isinstance(parent, dict)
+                parent = parent[key]
+
+            # If the section is empty, remove it
+            TypeAdapter(dict).validate_python(parent)
+            assert isinstance(parent, dict)
+            if not parent[keys[idx - 1]]:
+                del parent[keys[idx - 1]]
+
+
+def _extend_list(
+    content: YAMLLiteral, *, keys: Sequence[Key], values: Sequence[Any]
+) -> None:
+    """Extend a list in YAML content in place, creating it if necessary."""
+    keys = _validate_keys(keys)
+
+    # Root level config - value must be a mapping.
+    try:
+        TypeAdapter(dict).validate_python(content)
+    except ValidationError:
+        msg = "Root level configuration must be a mapping."
+        raise UnexpectedYAMLValueError(msg) from None
+    assert isinstance(content, dict)
+
+    try:
+        d = content
+        for key in keys[:-1]:
+            TypeAdapter(dict).validate_python(d)
+            assert isinstance(d, dict)
+            d = d[key]
+        p_parent = d
+        TypeAdapter(dict).validate_python(p_parent)
+        assert isinstance(p_parent, dict)
+        d = p_parent[keys[-1]]
+    except KeyError:
+        new_content = values
+        for key in reversed(keys):
+            new_content = {key: new_content}
+        assert isinstance(new_content, dict)
+        deep_merge(content, new_content)
+    else:
+        TypeAdapter(dict).validate_python(p_parent)
+        TypeAdapter(list).validate_python(d)
+        assert isinstance(p_parent, dict)
+        assert isinstance(d, list)
+        p_parent[keys[-1]] = d + list(values)
+
+
+def _remove_from_list(
+    content: YAMLLiteral, *, keys: Sequence[Key], values: Sequence[Any]
+) -> bool:
+    """Remove values from a list in YAML content in place.
+
+    Returns:
+        Whether the list was found, in which case the content may have been modified.
+    """
+    keys = _validate_keys(keys)
+
+    # Root level config - value must be a mapping.
+    try:
+        TypeAdapter(dict).validate_python(content)
+    except ValidationError:
+        msg = "Root level configuration must be a mapping."
+        raise UnexpectedYAMLValueError(msg) from None
+    assert isinstance(content, dict)
+
+    try:
+        p = content
+        for key in keys[:-1]:
+            TypeAdapter(dict).validate_python(p)
+            assert isinstance(p, dict)
+            p = p[key]
+
+        p_parent = p
+        TypeAdapter(dict).validate_python(p_parent)
+        assert isinstance(p_parent, dict)
+        p = p_parent[keys[-1]]
+    except (KeyError, ValidationError):
+        # The configuration is not present - do not modify
+        return False
+
+    try:
+        TypeAdapter(list).validate_python(p)
+    except ValidationError:
+        return False
+    assert isinstance(p, list)
+
+    new_values = [value for value in p if value not in values]
+    p_parent[keys[-1]] = new_values
+    return True
+
+
 def _set_value_in_existing(
     *, content: YAMLLiteral, keys: Sequence[Key], value: Any
 ) -> None:
@@ -446,6 +487,12 @@ def get_yaml_document(
     _io: StringIO | TextIOWrapper, /, *, guess_indent: bool = True
 ) -> YAMLDocument:
     """Get a YAML document representation from a string or file-like object."""
+    # ruamel.yaml is slow to import, and it's only needed once a YAML file is read.
+    import ruamel.yaml  # noqa: PLC0415
+    from ruamel.yaml.comments import CommentedMap  # noqa: PLC0415
+    from ruamel.yaml.error import YAMLError  # noqa: PLC0415
+    from ruamel.yaml.util import load_yaml_guess_indent  # noqa: PLC0415
+
     # Can't preserve quotes so don't keep the content.
     # Yes, it's not very efficient to load the content twice.
     try:
@@ -5,10 +5,6 @@ from __future__ import annotations
 from difflib import SequenceMatcher
 from typing import TYPE_CHECKING, TypeVar
 
-from ruamel.yaml.comments import (
-    CommentedMap,
-)
-
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from typing import Any
@@ -36,6 +32,9 @@ def update_ruamel_yaml_map(
     Raises:
         TypeError: If the provided `cmap` is not a CommentedMap.
     """
+    # ruamel.yaml is slow to import, so it's only imported once a YAML file is read.
+    from ruamel.yaml.comments import CommentedMap  # noqa: PLC0415
+
     if not isinstance(cmap, CommentedMap | dict):
         msg = f"Expected CommentedMap or dict, but got '{type(cmap)}'."
         raise TypeError(msg)
@@ -21,6 +21,7 @@ from usethis._fallback import (
     FALLBACK_UV_VERSION,
     next_breaking_version,
 )
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._integrations.project.name import get_project_name
 from usethis._types.backend import BackendEnum
@@ -44,7 +45,7 @@ _BUILD_SYSTEM_CONFIG: dict[BuildBackendEnum, tuple[list[str], str]] = {
 
 def project_init():
     """Initialize the project by creating the pyproject.toml and project structure."""
-    if (usethis_config.cpd() / "pyproject.toml").exists():
+    if fs.exists(usethis_config.cpd() / "pyproject.toml"):
         return
 
     tick_print("Writing 'pyproject.toml' and initializing project.")
@@ -52,8 +53,14 @@ def project_init():
     backend = get_backend()
     if backend is BackendEnum.uv:
         opinionated_uv_init()
+        if usethis_config.dry_run:
+            # The subprocess was skipped, so write the files it would have created.
+            _write_minimal_pyproject_toml()
+            _create_project_structure()
     elif backend is BackendEnum.poetry:
         opinionated_poetry_init()
+        if usethis_config.dry_run:
+            _write_minimal_pyproject_toml()
         _create_project_structure()
     elif backend is BackendEnum.none:
         # pyproject.toml
@@ -72,24 +79,24 @@ def _create_project_structure() -> None:
     src/<package_name>/py.typed if they don't already exist.
     """
     # README.md
-    (usethis_config.cpd() / "README.md").touch(exist_ok=True)
+    fs.touch(usethis_config.cpd() / "README.md", exist_ok=True)
 
     # src/
     src_dir = usethis_config.cpd() / "src"
-    src_dir.mkdir(exist_ok=True)
+    fs.mkdir(src_dir, exist_ok=True)
     project_name = get_project_name()
     pkg_name = _regularize_package_name(project_name)
-    (src_dir / pkg_name).mkdir(exist_ok=True)
+    fs.mkdir(src_dir / pkg_name, exist_ok=True)
     init_path = src_dir / pkg_name / "__init__.py"
-    if not init_path.exists():
-        init_path.write_text(
+    if not fs.exists(init_path):
+        fs.write_text(
+            init_path,
             f"""\
 def hello() -> str:
     return "Hello from {project_name}!"
 """,
-            encoding="utf-8",
         )
-    (src_dir / pkg_name / "py.typed").touch(exist_ok=True)
+    fs.touch(src_dir / pkg_name / "py.typed", exist_ok=True)
 
 
 def _regularize_package_name(project_name: str) -> str:
@@ -114,14 +121,13 @@ def write_simple_requirements_txt(*, output_file: str = "requirements.txt") -> N
     pyproject.toml if they exist.
     """
     tick_print(f"Writing '{output_file}'.")
-    path = usethis_config.cpd() / output_file
-    with open(path, "w", encoding="utf-8") as f:
-        # Always write -e . first
-        f.write("-e .\n")
-        # Add any dependencies that exist
-        project_deps = get_project_deps()
-        if project_deps:
-            f.writelines(dep.to_requirement_string() + "\n" for dep in project_deps)
+    # Always write -e . first
+    lines = ["-e .\n"]
+    # Add any dependencies that exist
+    project_deps = get_project_deps()
+    if project_deps:
+        lines.extend(dep.to_requirement_string() + "\n" for dep in project_deps)
+    fs.write_text(usethis_config.cpd() / output_file, "".join(lines))
 
 
 def ensure_dep_declaration_file() -> None:
@@ -138,7 +144,7 @@ def ensure_dep_declaration_file() -> None:
 
 def ensure_pyproject_toml(*, author: bool = True) -> None:
     """Ensure that a pyproject.toml file exists, creating it if necessary."""
-    if (usethis_config.cpd() / "pyproject.toml").exists():
+    if fs.exists(usethis_config.cpd() / "pyproject.toml"):
         return
 
     tick_print("Writing 'pyproject.toml'.")
@@ -149,30 +155,40 @@ def ensure_pyproject_toml(*, author: bool = True) -> None:
     elif backend is BackendEnum.poetry:
         ensure_pyproject_toml_via_poetry(author=author)
     elif backend is BackendEnum.none:
-        requires, build_backend_str = _BUILD_SYSTEM_CONFIG[build_backend]
-        requires_str = ", ".join(f'"{r}"' for r in requires)
-        (usethis_config.cpd() / "pyproject.toml").write_text(
-            f"""\
-[project]
-name = "{get_project_name()}"
-version = "0.1.0"
-dependencies = []
-
-[build-system]
-requires = [{requires_str}]
-build-backend = "{build_backend_str}"
-""",
-            encoding="utf-8",
-        )
+        _write_minimal_pyproject_toml()
     else:
         assert_never(backend)
 
+    if usethis_config.dry_run and not fs.exists(
+        usethis_config.cpd() / "pyproject.toml"
+    ):
+        # The subprocess was skipped, so write the file it would have created.
+        _write_minimal_pyproject_toml()
+
     if build_backend is BuildBackendEnum.hatch and not (
-        (usethis_config.cpd() / "src").exists()
-        and (usethis_config.cpd() / "src").is_dir()
+        fs.exists(usethis_config.cpd() / "src")
+        and fs.is_dir(usethis_config.cpd() / "src")
     ):
         # hatch needs to know where to find the package
         PyprojectTOMLManager().set_value(
             keys=["tool", "hatch", "build", "targets", "wheel", "packages"],
             value=["."],
         )
+
+
+def _write_minimal_pyproject_toml() -> None:
+    requires, build_backend_str = _BUILD_SYSTEM_CONFIG[usethis_config.build_backend]
+    requires_str = ", ".join(f'"{r}"' for r in requires)
+    fs.write_text(
+        usethis_config.cpd() / "pyproject.toml",
+        f"""\
+[project]
+name = "{get_project_name()}"
+version = "0.1.0"
+dependencies = []
+
+[build-system]
+requires = [{requires_str}]
+build-backend = "{build_backend_str}"
+""",
+    )
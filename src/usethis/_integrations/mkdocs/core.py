@@ -2,27 +2,28 @@
 
 from usethis._config import usethis_config
 from usethis._console import tick_print
+from usethis._file import fs
 from usethis._integrations.project.name import get_project_name
 
 
 def add_docs_dir() -> None:
     """Create the `docs` directory and a `docs/index.md` file if they do not exist."""
     docs_dir = usethis_config.cpd() / "docs"
-    if not docs_dir.exists():
+    if not fs.exists(docs_dir):
         tick_print("Creating '/docs'.")
-        docs_dir.mkdir()
+        fs.mkdir(docs_dir)
         write_index = True
-    elif not (docs_dir / "index.md").exists():
+    elif not fs.exists(docs_dir / "index.md"):
         tick_print("Writing '/docs/index.md'.")
         write_index = True
     else:
         write_index = False
     if write_index:
-        (docs_dir / "index.md").write_text(
+        fs.write_text(
+            docs_dir / "index.md",
             f"""\
 # {get_project_name()}
 
 Welcome to the documentation for {get_project_name()}.
 """,
-            encoding="utf-8",
         )
@@ -15,6 +15,7 @@ from usethis._backend.uv.detect import is_uv_used
 from usethis._backend.uv.errors import UVSubprocessFailedError
 from usethis._config import usethis_config
 from usethis._console import info_print, instruct_print, tick_print
+from usethis._file import fs
 from usethis._integrations.pre_commit.errors import PreCommitInstallationError
 from usethis._subprocess import SubprocessFailedError, call_subprocess
 from usethis._types.backend import BackendEnum
@@ -24,12 +25,12 @@ from usethis.errors import BackendSubprocessFailedError
 def remove_pre_commit_config() -> None:
     """Remove the .pre-commit-config.yaml file from the project."""
     name = ".pre-commit-config.yaml"
-    if not (usethis_config.cpd() / name).exists():
+    if not fs.exists(usethis_config.cpd() / name):
         # Early exit; the file already doesn't exist
         return
 
     tick_print(f"Removing '{name}'.")
-    (usethis_config.cpd() / name).unlink()
+    fs.unlink(usethis_config.cpd() / name)
 
 
 def install_pre_commit_hooks() -> None:
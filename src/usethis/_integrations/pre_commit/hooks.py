@@ -6,11 +6,15 @@ from typing import TYPE_CHECKING
 
 from usethis._config import usethis_config
 from usethis._console import instruct_print, tick_print
+from usethis._file import fs
 from usethis._integrations.pre_commit import schema
 from usethis._integrations.pre_commit.init import (
     ensure_pre_commit_config_exists,
 )
 from usethis._integrations.pre_commit.language import get_system_language
+from usethis._integrations.pre_commit.projection import (
+    get_pre_commit_config_projection,
+)
 from usethis._integrations.pre_commit.yaml import PreCommitConfigYAMLManager
 from usethis._pipeweld.containers import series
 from usethis._pipeweld.func import Adder, get_predecessor
@@ -230,12 +234,10 @@ def get_hook_ids() -> list[str]:
     """Get the list of hook IDs currently configured in the pre-commit configuration file."""
     path = usethis_config.cpd() / ".pre-commit-config.yaml"
 
-    if not path.exists():
+    if not fs.exists(path):
         return []
 
-    mgr = PreCommitConfigYAMLManager()
-    model = mgr.model_validate()
-    return extract_hook_ids(model)
+    return get_pre_commit_config_projection().hook_ids
 
 
 def extract_hook_ids(
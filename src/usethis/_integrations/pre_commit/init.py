@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from usethis._config import usethis_config
 from usethis._console import tick_print
+from usethis._file import fs
 
 
 def ensure_pre_commit_config_exists() -> None:
@@ -11,6 +12,6 @@ def ensure_pre_commit_config_exists() -> None:
     name = ".pre-commit-config.yaml"
     path = usethis_config.cpd() / name
 
-    if not path.exists():
+    if not fs.exists(path):
         tick_print(f"Writing '{name}'.")
-        path.write_text("repos: []\n", encoding="utf-8")
+        fs.write_text(path, "repos: []\n")
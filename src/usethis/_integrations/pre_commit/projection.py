@@ -0,0 +1,125 @@
+"""Lightweight read-only projection of the pre-commit configuration.
+
+Simple queries, like which hooks are configured, only need a few fields of the
+configuration. Reading those fields straight from the YAML document avoids importing
+and validating against the full pre-commit configuration schema, which is left to the
+code paths that write the configuration.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import TypeGuard
+
+from usethis._integrations.pre_commit.yaml import PreCommitConfigYAMLManager
+
+
+@dataclass(frozen=True)
+class RepoProjection:
+    """The fields of a pre-commit repo configuration used by read-only queries.
+
+    Attributes:
+        repo: The repo URL, or one of the special values 'local' and 'meta'.
+        hook_ids: The IDs of the repo's hooks, in order. Hooks without IDs are omitted.
+    """
+
+    repo: str | None
+    hook_ids: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class PreCommitConfigProjection:
+    """The fields of the pre-commit configuration used by read-only queries.
+
+    Attributes:
+        repos: The configured repos, in order.
+        minimum_pre_commit_version: The declared minimum supported pre-commit version.
+    """
+
+    repos: tuple[RepoProjection, ...]
+    minimum_pre_commit_version: str | None
+
+    @property
+    def hook_ids(self) -> list[str]:
+        """All the hook IDs across the repos, in order."""
+        return [hook_id for repo in self.repos for hook_id in repo.hook_ids]
+
+
+class _UnexpectedStructureError(Exception):
+    """Raised when the configuration doesn't have the expected structure."""
+
+
+def get_pre_commit_config_projection() -> PreCommitConfigProjection:
+    """Read the projection of the pre-commit configuration file.
+
+    If the configuration doesn't have the expected structure, it is validated in full
+    so that the reason is reported.
+
+    Raises:
+        PreCommitConfigYAMLConfigError: If the configuration is invalid.
+    """
+    mgr = PreCommitConfigYAMLManager()
+    try:
+        return _project_content(mgr.get().content)
+    except _UnexpectedStructureError:
+        model = mgr.model_validate()
+
+    # In case the schema accepts something the projection doesn't, use the model.
+    return PreCommitConfigProjection(
+        repos=tuple(
+            RepoProjection(
+                repo=repo.repo,
+                hook_ids=tuple(
+                    hook.id for hook in repo.hooks or [] if hook.id is not None
+                ),
+            )
+            for repo in model.repos
+        ),
+        minimum_pre_commit_version=model.minimum_pre_commit_version,
+    )
+
+
+def _project_content(content: object) -> PreCommitConfigProjection:
+    if not isinstance(content, Mapping):
+        raise _UnexpectedStructureError
+
+    if not content:
+        # An empty file doesn't have any repos yet
+        return PreCommitConfigProjection(repos=(), minimum_pre_commit_version=None)
+
+    repos = content.get("repos")
+    minimum_pre_commit_version = content.get("minimum_pre_commit_version")
+    if not _is_list(repos) or not isinstance(minimum_pre_commit_version, str | None):
+        raise _UnexpectedStructureError
+
+    return PreCommitConfigProjection(
+        repos=tuple(_project_repo(repo) for repo in repos),
+        minimum_pre_commit_version=minimum_pre_commit_version,
+    )
+
+
+def _project_repo(repo: object) -> RepoProjection:
+    if not isinstance(repo, Mapping):
+        raise _UnexpectedStructureError
+
+    url = repo.get("repo")
+    hooks = repo.get("hooks")
+    if not isinstance(url, str | None) or not (hooks is None or _is_list(hooks)):
+        raise _UnexpectedStructureError
+
+    hook_ids: list[str] = []
+    for hook in hooks or []:
+        if not isinstance(hook, Mapping):
+            raise _UnexpectedStructureError
+        hook_id = hook.get("id")
+        if not isinstance(hook_id, str | None):
+            raise _UnexpectedStructureError
+        if hook_id is not None:
+            hook_ids.append(hook_id)
+
+    return RepoProjection(repo=url, hook_ids=tuple(hook_ids))
+
+
+def _is_list(value: object) -> TypeGuard[Sequence[object]]:
+    return isinstance(value, Sequence) and not isinstance(value, str)
@@ -11,6 +11,7 @@
 # plus manually add HookDefinition.require_serial for type hinting
 # plus manually set default to None for roundtripping
 # plus manually add unsupported and unsupported_script to Language
+# plus manually set defer_build=True on every model, to build schemas on first use
 
 from __future__ import annotations
 
@@ -22,6 +23,7 @@ from pydantic import BaseModel, ConfigDict, Field, RootModel
 class Ci(BaseModel):
     model_config = ConfigDict(
         extra="allow",
+        defer_build=True,
     )
     autofix_commit_msg: str | None = Field(
         default=None,
@@ -82,6 +84,9 @@ class Language(
         | str
     ]
 ):
+    model_config = ConfigDict(
+        defer_build=True,
+    )
     root: (
         Literal[
             "conda",
@@ -363,6 +368,9 @@ class FileType(
         | str
     ]
 ):
+    model_config = ConfigDict(
+        defer_build=True,
+    )
     root: (
         Literal[
             "adobe-illustrator",
@@ -616,6 +624,9 @@ class FileType(
 
 
 class FileTypes(RootModel[list[FileType]]):
+    model_config = ConfigDict(
+        defer_build=True,
+    )
     root: list[FileType]
 
 
@@ -639,6 +650,9 @@ class Stage(
         ]
     ]
 ):
+    model_config = ConfigDict(
+        defer_build=True,
+    )
     root: Literal[
         "commit",
         "merge-commit",
@@ -660,6 +674,7 @@ class Stage(
 class Hook(BaseModel):
     model_config = ConfigDict(
         extra="allow",
+        defer_build=True,
     )
     id: Literal["check-hooks-apply", "check-useless-excludes", "identity"]
 
@@ -667,18 +682,23 @@ class Hook(BaseModel):
 class MetaRepo(BaseModel):
     model_config = ConfigDict(
         extra="allow",
+        defer_build=True,
     )
     repo: Literal["meta"] | None = "meta"
     hooks: list[Hook] | None = None
 
 
 class Stages(RootModel[list[Stage]]):
+    model_config = ConfigDict(
+        defer_build=True,
+    )
     root: list[Stage]
 
 
 class HookDefinition(BaseModel):
     model_config = ConfigDict(
         extra="allow",
+        defer_build=True,
     )
     id: str | None = Field(
         default=None,
@@ -760,6 +780,7 @@ class HookDefinition(BaseModel):
 class LocalRepo(BaseModel):
     model_config = ConfigDict(
         extra="allow",
+        defer_build=True,
     )
     repo: Literal["local"] | None = Field(
         description="A list of local hooks\nhttps://pre-commit.com/#2-add-a-pre-commit-configuration",
@@ -790,6 +811,7 @@ class UriRepo(BaseModel):
 class JsonSchemaForPreCommitConfigYaml(BaseModel):
     model_config = ConfigDict(
         extra="allow",
+        defer_build=True,
     )
     ci: Ci | None = Field(
         default=None,
@@ -1,7 +1,10 @@
 """Pre-commit version inference."""
 
 from usethis._config import usethis_config
-from usethis._integrations.pre_commit.yaml import PreCommitConfigYAMLManager
+from usethis._file import fs
+from usethis._integrations.pre_commit.projection import (
+    get_pre_commit_config_projection,
+)
 
 
 def get_minimum_pre_commit_version() -> str | None:
@@ -13,9 +16,7 @@ def get_minimum_pre_commit_version() -> str | None:
     """
     path = usethis_config.cpd() / ".pre-commit-config.yaml"
 
-    if not path.exists():
+    if not fs.exists(path):
         return None
 
-    mgr = PreCommitConfigYAMLManager()
-    model = mgr.model_validate()
-    return model.minimum_pre_commit_version
+    return get_pre_commit_config_projection().minimum_pre_commit_version
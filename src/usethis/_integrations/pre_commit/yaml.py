@@ -6,18 +6,17 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from pydantic import ValidationError
-from ruamel.yaml.comments import CommentedMap
 from typing_extensions import override
 
 from usethis._file.yaml.io_ import YAMLFileManager
 from usethis._file.yaml.update import update_ruamel_yaml_map
-from usethis._integrations.pre_commit import schema
 from usethis._integrations.pre_commit.errors import PreCommitConfigYAMLConfigError
 from usethis._integrations.pydantic.dump import fancy_model_dump
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
 
+    from usethis._integrations.pre_commit import schema
     from usethis._integrations.pydantic.typing_ import ModelRepresentation
 
 ORDER_BY_CLS: dict[type[BaseModel], list[str]] = {}
@@ -40,6 +39,12 @@ class PreCommitConfigYAMLManager(YAMLFileManager):
         Raises:
             PreCommitConfigYAMLConfigError: If validation fails.
         """
+        # The schema is slow to import, and it's only needed when the configuration is
+        # modified. Read-only queries use `usethis._integrations.pre_commit.projection`.
+        from ruamel.yaml.comments import CommentedMap  # noqa: PLC0415
+
+        from usethis._integrations.pre_commit import schema  # noqa: PLC0415
+
         doc = self.get()
         ruamel_content = doc.content
 
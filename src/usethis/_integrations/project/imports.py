@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import sys
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-import grimp
-import grimp.exceptions
 from pydantic import BaseModel
 
 from usethis._config import usethis_config
@@ -15,9 +14,11 @@ from usethis._integrations.project.errors import ImportGraphBuildFailedError
 from usethis._integrations.project.layout import get_source_dir_str
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Sequence
     from pathlib import Path
 
+    import grimp
+
 
 class LayeredArchitecture(BaseModel):
     layers: list[set[str]]
@@ -48,7 +49,86 @@ def get_layered_architectures(pkg_name: str) -> dict[str, LayeredArchitecture]:
         A dictionary mapping module names to their layered architecture.
     """
     graph = _get_graph(pkg_name)
+    return _get_layered_architectures_from_graph(graph=graph)
+
+
+def get_layered_architectures_by_root_package(
+    pkg_names: Sequence[str],
+) -> dict[str, dict[str, LayeredArchitecture]]:
+    """Get the suggested layers for each of several packages.
+
+    A single import graph is built for all the packages together, rather than one per
+    package, which avoids re-walking and re-parsing the source directory for each of
+    them (e.g. for the many portions of a namespace package). Each package is still
+    analysed using only the imports within it, so the results are the same as for
+    `get_layered_architectures`. If the combined graph can't be built, each package's
+    graph is built separately so that one problematic package doesn't affect the
+    others.
+
+    Args:
+        pkg_names: The names of the packages.
+
+    Returns:
+        A dictionary mapping each package name to a dictionary mapping module names to
+        their layered architecture. The latter is empty if the import graph for the
+        package could not be built.
+    """
+    if not pkg_names:
+        return {}
+
+    try:
+        graph = _get_graph(*pkg_names)
+    except ImportGraphBuildFailedError:
+        if len(pkg_names) == 1:
+            return {pkg_names[0]: {}}
+
+        arch_by_module_by_root_package: dict[str, dict[str, LayeredArchitecture]] = {}
+        for pkg_name in pkg_names:
+            try:
+                arch_by_module = get_layered_architectures(pkg_name)
+            except ImportGraphBuildFailedError:
+                arch_by_module = {}
+            arch_by_module_by_root_package[pkg_name] = arch_by_module
+        return arch_by_module_by_root_package
+
+    if len(pkg_names) == 1:
+        return {pkg_names[0]: _get_layered_architectures_from_graph(graph=graph)}
+
+    return {
+        pkg_name: _get_layered_architectures_from_graph(
+            graph=_get_package_graph(pkg_name, graph=graph)
+        )
+        for pkg_name in pkg_names
+    }
 
+
+def _get_package_graph(pkg_name: str, *, graph: grimp.ImportGraph) -> grimp.ImportGraph:
+    """Get the part of an import graph within a package, with no outside imports.
+
+    Otherwise, imports via other packages would count as dependencies between the
+    package's modules, e.g. if `a.x` imports `b.y`, which imports `a.z`.
+    """
+    # grimp is slow to import, and it's only needed for the architecture tools.
+    import grimp  # noqa: PLC0415
+
+    modules = {
+        module
+        for module in graph.modules
+        if module == pkg_name or module.startswith(pkg_name + ".")
+    }
+
+    package_graph = grimp.ImportGraph()
+    for module in modules:
+        package_graph.add_module(module)
+    for module in modules:
+        for imported in graph.find_modules_directly_imported_by(module) & modules:
+            package_graph.add_import(importer=module, imported=imported)
+    return package_graph
+
+
+def _get_layered_architectures_from_graph(
+    *, graph: grimp.ImportGraph
+) -> dict[str, LayeredArchitecture]:
     arch_by_module: dict[str, LayeredArchitecture] = {}
 
     for module in sorted(graph.modules):
@@ -152,19 +232,89 @@ def _narrow_to_submodule(module: str, *, submodule: str) -> str:
     return module.removeprefix(submodule + ".").split(".")[0]
 
 
-def _get_graph(pkg_name: str) -> grimp.ImportGraph:
+@contextmanager
+def import_graph_cache() -> Generator[None, None, None]:
+    """Reuse import graphs within the context, rather than rebuilding them.
+
+    Cached graphs are not invalidated when the project's modules change, so this should
+    only wrap operations which do not modify the package's source code, unless
+    `invalidate_import_graph_cache` is called after each modification.
+    """
+    if _graph_cache.enabled:
+        # Already caching in an outer context
+        yield
+        return
+
+    _graph_cache.enabled = True
+    try:
+        yield
+    finally:
+        _graph_cache.enabled = False
+        _graph_cache.graph_by_key.clear()
+        _graph_cache.error_by_key.clear()
+
+
+def invalidate_import_graph_cache() -> None:
+    """Discard any cached import graphs, e.g. after the project's modules change."""
+    _graph_cache.graph_by_key.clear()
+    _graph_cache.error_by_key.clear()
+
+
+@dataclass
+class _ImportGraphCache:
+    enabled: bool = False
+    graph_by_key: dict[tuple[Path, tuple[str, ...]], grimp.ImportGraph] = field(
+        default_factory=dict
+    )
+    error_by_key: dict[tuple[Path, tuple[str, ...]], ImportGraphBuildFailedError] = (
+        field(default_factory=dict)
+    )
+
+
+_graph_cache = _ImportGraphCache()
+
+
+def _get_graph(*pkg_names: str) -> grimp.ImportGraph:
+    if not _graph_cache.enabled:
+        return _build_graph(*pkg_names)
+
+    key = (usethis_config.cpd() / get_source_dir_str(), pkg_names)
+    error = _graph_cache.error_by_key.get(key)
+    if error is not None:
+        raise error
+
+    graph = _graph_cache.graph_by_key.get(key)
+    if graph is None:
+        try:
+            graph = _build_graph(*pkg_names)
+        except ImportGraphBuildFailedError as err:
+            _graph_cache.error_by_key[key] = err
+            raise
+        _graph_cache.graph_by_key[key] = graph
+    return graph
+
+
+def _build_graph(*pkg_names: str) -> grimp.ImportGraph:
+    # grimp is slow to import, and it's only needed for the architecture tools.
+    import grimp  # noqa: PLC0415
+    import grimp.exceptions  # noqa: PLC0415
+
     # PYTHONPATH is used by grimp to find the package. When running in the test suite,
     # or via uvx, this is problematic. So we'll patch it.
 
     with augment_pythonpath(usethis_config.cpd() / get_source_dir_str()):
         try:
-            graph = grimp.build_graph(pkg_name, cache_dir=None)
+            graph = grimp.build_graph(*pkg_names, cache_dir=None)
         except ValueError as err:
             raise ImportGraphBuildFailedError(err) from None
         except ModuleNotFoundError as err:
             raise ImportGraphBuildFailedError(err) from None
         except grimp.exceptions.NotATopLevelModule:
-            msg = f"Module '{pkg_name}' is not a top-level module; cannot build graph."
+            if len(pkg_names) == 1:
+                msg = f"Module '{pkg_names[0]}' is not a top-level module; cannot build graph."
+            else:
+                names = ", ".join(f"'{pkg_name}'" for pkg_name in pkg_names)
+                msg = f"Modules {names} are not all top-level modules; cannot build graph."
             raise ImportGraphBuildFailedError(msg) from None
         return graph
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from usethis._config import usethis_config
+from usethis._file.snapshot import get_project_snapshot
 
 if TYPE_CHECKING:
     from typing import Literal
@@ -12,9 +12,7 @@ if TYPE_CHECKING:
 
 def get_source_dir_str() -> Literal["src", "."]:
     """Get the source directory as a string ('src' or '.')."""
-    src_dir = usethis_config.cpd() / "src"
-
-    if src_dir.exists() and src_dir.is_dir():
+    if get_project_snapshot().is_dir("src"):
         return "src"
     return "."
 
@@ -26,14 +24,14 @@ def get_tests_dir_str() -> str:
     exists, returns 'tests'. If a 'test' directory exists, returns 'test'. Otherwise,
     defaults to 'tests' (the most common convention).
     """
-    cpd = usethis_config.cpd()
+    snapshot = get_project_snapshot()
 
     # Check for 'tests' directory first (most common)
-    if (cpd / "tests").is_dir():
+    if snapshot.is_dir("tests"):
         return "tests"
 
     # Check for 'test' directory (alternative naming convention)
-    if (cpd / "test").is_dir():
+    if snapshot.is_dir("test"):
         return "test"
 
     # Default to 'tests' if neither exists
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
-import os
+import functools
+import hashlib
+import re
+from typing import TYPE_CHECKING
 
 from identify.identify import license_id
+from identify.vendor import licenses
 
+from usethis._config import usethis_config
 from usethis._file.pyproject_toml.errors import PyprojectTOMLError
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._integrations.project.errors import LicenseDetectionError
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 _CANDIDATE_LICENSE_FILENAMES = [
     "LICENSE",
     "LICENSE.md",
@@ -24,6 +32,14 @@ _CANDIDATE_LICENSE_FILENAMES = [
     "COPYING.txt",
 ]
 
+_COPYRIGHT_REGEX = re.compile(
+    r"^\s*(Copyright|\(C\)) .*$", re.IGNORECASE | re.MULTILINE
+)
+_WHITESPACE_REGEX = re.compile(r"\s+")
+_NON_ALPHANUMERIC_REGEX = re.compile(r"[\W_]+")
+
+_LICENSE_ID_BY_CONTENT_HASH: dict[bytes, str | None] = {}
+
 _CLASSIFIER_TO_SPDX: dict[str, str] = {
     "License :: OSI Approved :: Academic Free License (AFL)": "AFL-3.0",
     "License :: OSI Approved :: Apache Software License": "Apache-2.0",
@@ -88,21 +104,87 @@ def get_license_id() -> str:
 def _get_license_from_file() -> str | None:
     """Try to detect the license from common license files at the project root."""
     for filename in _CANDIDATE_LICENSE_FILENAMES:
-        if os.path.isfile(filename):
-            spdx_id = license_id(filename)
+        path = usethis_config.cpd() / filename
+        if path.is_file():
+            spdx_id = _get_license_id_from_path(path)
             if spdx_id is not None:
                 return spdx_id
     return None
 
 
+def _get_license_id_from_path(path: Path) -> str | None:
+    """Get the SPDX identifier for the license text in a file, if it is recognized.
+
+    This gives the same result as `identify`'s `license_id`, but results are cached by
+    the file's content, and exact or near-exact matches against the known license texts
+    are looked up directly rather than by computing edit distances.
+    """
+    content = path.read_bytes()
+    content_hash = hashlib.sha256(content).digest()
+    if content_hash in _LICENSE_ID_BY_CONTENT_HASH:
+        return _LICENSE_ID_BY_CONTENT_HASH[content_hash]
+
+    # Decode like `license_id`, i.e. as UTF-8 with universal newlines.
+    text = content.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    norm = _normalize_license_text(text)
+    spdx_id = _get_license_index().get(norm)
+    if spdx_id is None:
+        spdx_id = _get_simplified_license_index().get(_simplify_license_text(norm))
+    if spdx_id is None and norm:
+        # Fall back to fuzzy matching.
+        spdx_id = license_id(path.as_posix())
+
+    _LICENSE_ID_BY_CONTENT_HASH[content_hash] = spdx_id
+    return spdx_id
+
+
+def _normalize_license_text(text: str) -> str:
+    # The same normalization as `license_id` applies before matching.
+    text = _COPYRIGHT_REGEX.sub("", text)
+    text = _WHITESPACE_REGEX.sub(" ", text)
+    return text.strip()
+
+
+def _simplify_license_text(norm: str) -> str:
+    # Ignore differences in case and punctuation, e.g. from reformatting.
+    return _NON_ALPHANUMERIC_REGEX.sub("", norm.casefold())
+
+
+@functools.cache
+def _get_license_index() -> dict[str, str]:
+    """Get the SPDX identifiers of the known licenses, by their normalized text."""
+    index: dict[str, str] = {}
+    for spdx_id, text in licenses.LICENSES:
+        # The first license wins, as with `license_id`.
+        index.setdefault(_normalize_license_text(text), spdx_id)
+    return index
+
+
+@functools.cache
+def _get_simplified_license_index() -> dict[str, str]:
+    """Get the SPDX identifiers of the known licenses, by their simplified text.
+
+    Texts which are ambiguous after simplification are omitted.
+    """
+    index: dict[str, str] = {}
+    ambiguous: set[str] = set()
+    for norm, spdx_id in _get_license_index().items():
+        simplified = _simplify_license_text(norm)
+        if simplified in index:
+            ambiguous.add(simplified)
+        index[simplified] = spdx_id
+    for simplified in ambiguous:
+        del index[simplified]
+    return index
+
+
 def _get_license_from_pyproject_field() -> str | None:
     """Try to detect the license from pyproject.toml `project.license` field."""
     try:
-        pyproject = PyprojectTOMLManager().get().value
-    except PyprojectTOMLError:
+        project = PyprojectTOMLManager()[["project"]]
+    except (PyprojectTOMLError, KeyError):
         return None
 
-    project = pyproject.get("project")
     if not isinstance(project, dict):
         return None
 
@@ -130,8 +212,8 @@ def _resolve_license_table(license_value: dict[str, object]) -> str | None:
 
     # If it has a 'file' key, try to scan that file
     file_path = license_value.get("file")
-    if isinstance(file_path, str) and os.path.isfile(file_path):
-        return license_id(file_path)
+    if isinstance(file_path, str) and (usethis_config.cpd() / file_path).is_file():
+        return _get_license_id_from_path(usethis_config.cpd() / file_path)
 
     return None
 
@@ -139,11 +221,10 @@ def _resolve_license_table(license_value: dict[str, object]) -> str | None:
 def _get_license_from_classifiers() -> str | None:
     """Try to detect the license from pyproject.toml `project.classifiers`."""
     try:
-        pyproject = PyprojectTOMLManager().get().value
-    except PyprojectTOMLError:
+        project = PyprojectTOMLManager()[["project"]]
+    except (PyprojectTOMLError, KeyError):
         return None
 
-    project = pyproject.get("project")
     if not isinstance(project, dict):
         return None
 
@@ -1,13 +1,20 @@
 """Importable package discovery."""
 
-import pkgutil
-from pathlib import Path
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING
 
 from typing_extensions import assert_never
 
-from usethis._config import usethis_config
+from usethis._file.snapshot import get_project_snapshot
 from usethis._integrations.project.layout import get_source_dir_str
 
+if TYPE_CHECKING:
+    from pathlib import PurePath
+
+    from usethis._file.snapshot import ProjectSnapshot
+
 IMPORTABLE_PACKAGE_EXCLUSIONS = {"tests", "test", "doc", "docs"}
 
 
@@ -28,31 +35,46 @@ def get_importable_packages() -> set[str]:
     source_dir_str = get_source_dir_str()
 
     if source_dir_str in ("src", "."):
-        path = usethis_config.cpd() / source_dir_str
+        relative_dir = source_dir_str
     else:
         assert_never(source_dir_str)
 
-    packages = _get_packages_in_dir(path)
+    snapshot = get_project_snapshot()
+    packages = _get_packages_in_dir(snapshot, relative_dir)
 
     if packages:
         return packages
 
     # Otherwise, perhaps it's a namespace package. We will only search one level deep
     # though.
-    for parent in path.iterdir():
-        if parent.is_dir() and not _is_excluded(parent.name):
+    for parent in snapshot.iterdir(relative_dir):
+        if snapshot.is_dir(parent) and not _is_excluded(parent.name):
             # Check if the directory is a package by looking for an __init__.py file
-            packages |= {f"{parent.name}.{pkg}" for pkg in _get_packages_in_dir(parent)}
+            packages |= {
+                f"{parent.name}.{pkg}" for pkg in _get_packages_in_dir(snapshot, parent)
+            }
 
     return packages
 
 
-def _get_packages_in_dir(path: Path) -> set[str]:
-    """Get the names of packages in the given directory."""
+def _get_packages_in_dir(
+    snapshot: ProjectSnapshot, relative_dir: PurePath | str
+) -> set[str]:
+    """Get the names of packages in the given directory.
+
+    Like `pkgutil.iter_modules`, a package is a directory without a dot in its name,
+    containing an `__init__` module.
+    """
     return {
-        Path(module_name).name
-        for _, module_name, ispkg in pkgutil.iter_modules([path.as_posix()])
-        if ispkg and not _is_excluded(module_name)
+        path.name
+        for path in snapshot.iterdir(relative_dir)
+        if "." not in path.name
+        and snapshot.is_dir(path)
+        and not _is_excluded(path.name)
+        and any(
+            inspect.getmodulename(child.name) == "__init__"
+            for child in snapshot.iterdir(path)
+        )
     }
 
 
@@ -2,20 +2,16 @@
 
 from __future__ import annotations
 
-from itertools import zip_longest
+import functools
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, RootModel
 
 if TYPE_CHECKING:
-    from usethis._integrations.pydantic.typing_ import ModelRepresentation
-
-
-class _FillValue:
-    pass
-
+    from collections.abc import Mapping
 
-_FILL_VALUE = _FillValue()
+    from usethis._integrations.pydantic.typing_ import ModelRepresentation
 
 
 def fancy_model_dump(
@@ -66,25 +62,14 @@ def _fancy_model_dump_list(
     reference: ModelRepresentation | None = None,
     order_by_cls: dict[type[BaseModel], list[str]] | None = None,
 ) -> ModelRepresentation:
-    if order_by_cls is None:
-        order_by_cls = {}
-
-    if reference is None:
-        reference = []
     if not isinstance(reference, list):
         reference = []
 
     x: list[ModelRepresentation] = []
-    for value, ref in zip_longest(model, reference, fillvalue=_FILL_VALUE):
-        if value is _FILL_VALUE:
-            # we've exhausted all the content.
-            break
-        if ref is _FILL_VALUE:
-            # there's still content but nothing to compare it against
-            ref = None
-
-        # We don't use None as the fillvalue because it could be confused with the
-        # case where the content itself is None.
+    for idx, value in enumerate(model):
+        # If there's still content but nothing to compare it against, use no reference
+        ref = reference[idx] if idx < len(reference) else None
+
         dump = fancy_model_dump(value, reference=ref, order_by_cls=order_by_cls)
         x.append(dump)
     return x
@@ -96,21 +81,13 @@ def _fancy_model_dump_dict(
     reference: ModelRepresentation | None = None,
     order_by_cls: dict[type[BaseModel], list[str]] | None = None,
 ) -> ModelRepresentation:
-    if order_by_cls is None:
-        order_by_cls = {}
+    ref_by_key = _get_ref_by_key(reference)
+
     d: dict[str, ModelRepresentation] = {}
     for key, value in model.items():
-        if reference is None:
-            value_ref = None
-        elif isinstance(reference, dict | BaseModel):
-            try:
-                value_ref = dict(reference)[key]
-            except (KeyError, TypeError):
-                value_ref = None
-        else:
-            value_ref = None
-
-        d[key] = fancy_model_dump(value, reference=value_ref, order_by_cls=order_by_cls)
+        d[key] = fancy_model_dump(
+            value, reference=ref_by_key.get(key), order_by_cls=order_by_cls
+        )
 
     return d
 
@@ -124,15 +101,19 @@ def _fancy_model_dump_base_model(
     if order_by_cls is None:
         order_by_cls = {}
 
+    order = order_by_cls.get(type(model))
+    plan = _get_dump_plan(
+        type(model), order=tuple(order) if order is not None else None
+    )
+    ref_by_key = _get_ref_by_key(reference)
+
     d: dict[str, ModelRepresentation] = {}
     for key, value in model:
         # The value for the reference (for recursion)
-        value_ref = _get_value_ref(reference, key=key)
-
-        field_info = model.__class__.model_fields.get(key)
-        if field_info is not None:
-            default_value = field_info.default
+        value_ref = ref_by_key.get(key)
 
+        field_plan = plan.field_plan_by_name.get(key)
+        if field_plan is not None:
             # If the model has default value, we usually won't dump it.
             # There is an exception though: if we have a reference which we are trying
             # to minimize the diff against, then if the diff includes the default
@@ -141,17 +122,14 @@ def _fancy_model_dump_base_model(
             # the dump but it's a relatively minor one.
 
             if value_ref is not None:
-                ref_has_default = value_ref == default_value
+                ref_has_default = value_ref == field_plan.default
             else:
                 ref_has_default = False
 
-            if (value == default_value) and not ref_has_default:
+            if (value == field_plan.default) and not ref_has_default:
                 continue
 
-            # Find the key for display - there might be an alias
-            display_key = field_info.alias
-            if display_key is None:
-                display_key = key
+            display_key = field_plan.display_key
         else:
             # Extra field not defined in the model schema (e.g. from prek syntax).
             # Always include it using the raw key.
@@ -161,13 +139,11 @@ def _fancy_model_dump_base_model(
             value, reference=value_ref, order_by_cls=order_by_cls
         )
 
-    try:
-        order = order_by_cls[type(model)]
-    except KeyError:
+    if plan.order is None:
         return d
 
     ordered_d: dict[str, ModelRepresentation] = {}
-    for key in order:
+    for key in plan.order:
         if key in d:
             ordered_d[key] = d.pop(key)
     ordered_d.update(d)
@@ -175,16 +151,42 @@ def _fancy_model_dump_base_model(
     return ordered_d
 
 
-def _get_value_ref(
-    reference: ModelRepresentation | None, *, key: str
-) -> ModelRepresentation | None:
-    # The reference for the value (for recursion)
-    if isinstance(reference, dict | BaseModel):
-        try:
-            value_ref = dict(reference)[key]  # ty: ignore[no-matching-overload]
-        except KeyError:
-            value_ref = None
-    else:
-        value_ref = None
+@dataclass(frozen=True)
+class _FieldDumpPlan:
+    display_key: str
+    default: object
+
+
+@dataclass(frozen=True)
+class _DumpPlan:
+    field_plan_by_name: dict[str, _FieldDumpPlan]
+    order: tuple[str, ...] | None
 
-    return value_ref
+
+@functools.cache
+def _get_dump_plan(
+    model_cls: type[BaseModel], *, order: tuple[str, ...] | None
+) -> _DumpPlan:
+    # Everything about dumping a model which depends only on its class, so that it
+    # isn't re-derived for every instance.
+    field_plan_by_name: dict[str, _FieldDumpPlan] = {}
+    for name, field_info in model_cls.model_fields.items():
+        # Find the key for display - there might be an alias
+        display_key = field_info.alias if field_info.alias is not None else name
+        field_plan_by_name[name] = _FieldDumpPlan(
+            display_key=display_key, default=field_info.default
+        )
+
+    return _DumpPlan(field_plan_by_name=field_plan_by_name, order=order)
+
+
+def _get_ref_by_key(
+    reference: ModelRepresentation | None,
+) -> Mapping[str, ModelRepresentation]:
+    # The reference for each value (for recursion)
+    if isinstance(reference, dict):
+        return reference
+    elif isinstance(reference, BaseModel):
+        return dict(reference)
+    else:
+        return {}
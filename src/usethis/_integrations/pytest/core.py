@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import shutil
-
 from usethis._config import usethis_config
 from usethis._console import instruct_print, tick_print
+from usethis._file import fs
 from usethis._integrations.project.layout import get_tests_dir_str
 
 _EXAMPLE_TEST_CONTENT = '''\
@@ -20,17 +19,17 @@ def add_pytest_dir() -> None:
     tests_dir_name = get_tests_dir_str()
     tests_dir = usethis_config.cpd() / tests_dir_name
 
-    if not tests_dir.exists():
+    if not fs.exists(tests_dir):
         tick_print(f"Creating '/{tests_dir_name}'.")
-        tests_dir.mkdir()
+        fs.mkdir(tests_dir)
 
-    if (tests_dir / "conftest.py").exists():
+    if fs.exists(tests_dir / "conftest.py"):
         # Early exit; conftest.py already exists
         return
 
     tick_print(f"Writing '/{tests_dir_name}/conftest.py'.")
-    (tests_dir / "conftest.py").write_text(
-        "collect_ignore_glob = []\npytest_plugins = []\n", encoding="utf-8"
+    fs.write_text(
+        tests_dir / "conftest.py", "collect_ignore_glob = []\npytest_plugins = []\n"
     )
 
 
@@ -39,12 +38,12 @@ def add_example_test() -> None:
     tests_dir_name = get_tests_dir_str()
     tests_dir = usethis_config.cpd() / tests_dir_name
 
-    if (tests_dir / "test_example.py").exists():
+    if fs.exists(tests_dir / "test_example.py"):
         # Early exit; example test already exists
         return
 
     tick_print(f"Writing '/{tests_dir_name}/test_example.py'.")
-    (tests_dir / "test_example.py").write_text(_EXAMPLE_TEST_CONTENT, encoding="utf-8")
+    fs.write_text(tests_dir / "test_example.py", _EXAMPLE_TEST_CONTENT)
 
 
 def remove_pytest_dir() -> None:
@@ -52,15 +51,15 @@ def remove_pytest_dir() -> None:
     tests_dir_name = get_tests_dir_str()
     tests_dir = usethis_config.cpd() / tests_dir_name
 
-    if not tests_dir.exists():
+    if not fs.exists(tests_dir):
         # Early exit; tests directory does not exist
         return
 
-    managed_files = {tests_dir / "conftest.py", tests_dir / "test_example.py"}
-    if set(tests_dir.iterdir()) <= managed_files:
+    managed_file_names = {"conftest.py", "test_example.py"}
+    if {path.name for path in fs.iterdir(tests_dir)} <= managed_file_names:
         # The only files in the directory are managed files
         tick_print(f"Removing '/{tests_dir_name}'.")
-        shutil.rmtree(tests_dir)
+        fs.rmtree(tests_dir)
     else:
         instruct_print(
             f"Reconfigure the '/{tests_dir_name}' directory to run without pytest."
@@ -0,0 +1,134 @@
+"""Markdown file manager for the README."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from usethis._config import usethis_config
+from usethis._file.manager import FileManager
+from usethis._integrations.readme.path import get_readme_path
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import ClassVar
+
+# A badge is an image, optionally wrapped in a link. The lenient patterns allow
+# surrounding whitespace, and are used to identify badges by name; the strict patterns
+# are used to identify lines which consist of nothing but a badge.
+_LINKED_BADGE_REGEX = re.compile(r"^\s*\[!\[(.*)\]\(.*\)\]\(.*\)\s*$")
+_BADGE_REGEX = re.compile(r"^\s*\!\[(.*)\]\(.*\)\s*$")
+_STRICT_LINKED_BADGE_REGEX = re.compile(r"^\[!\[.*\]\(.*\)\]\(.*\)$")
+_STRICT_BADGE_REGEX = re.compile(r"^\!\[.*\]\(.*\)$")
+
+
+def get_badge_name(markdown: str) -> str | None:
+    """Get the name of a Markdown badge, i.e. its image's alt text.
+
+    Returns:
+        The name, or None if the markdown isn't a badge.
+    """
+    match = _LINKED_BADGE_REGEX.match(markdown)
+    if match:
+        return match.group(1)
+    match = _BADGE_REGEX.match(markdown)
+    if match:
+        return match.group(1)
+    return None
+
+
+def is_badge_line(line: str) -> bool:
+    """Return True if the line consists of a Markdown badge and nothing else."""
+    return (
+        _STRICT_LINKED_BADGE_REGEX.match(line) is not None
+        or _STRICT_BADGE_REGEX.match(line) is not None
+    )
+
+
+@dataclass(frozen=True)
+class READMELine:
+    """A line of the README, with any badge on it identified.
+
+    Attributes:
+        text: The text of the line, without a line ending.
+        badge_name: The name of the badge on the line, if any.
+        is_badge: Whether the line consists of a badge and nothing else.
+    """
+
+    text: str
+    badge_name: str | None
+    is_badge: bool
+
+    @classmethod
+    def from_text(cls, text: str) -> READMELine:
+        return cls(
+            text=text, badge_name=get_badge_name(text), is_badge=is_badge_line(text)
+        )
+
+
+class READMEMarkdownManager(FileManager[str]):
+    """Class to manage the Markdown README file.
+
+    The badges in the README are located once per version of its content, so that many
+    badges can be added or removed without re-scanning the file each time.
+    """
+
+    _lines_by_path: ClassVar[dict[Path, list[READMELine]]] = {}
+
+    @property
+    @override
+    def relative_path(self) -> Path:
+        try:
+            return get_readme_path().relative_to(usethis_config.cpd())
+        except FileNotFoundError:
+            return Path("README.md")
+
+    @override
+    def _dump_content(self) -> str:
+        if self._content is None:
+            msg = "Content is None, cannot dump."
+            raise ValueError(msg)
+
+        return self._content
+
+    @override
+    def _parse_content(self, content: str) -> str:
+        return content
+
+    @property
+    @override
+    def _content(self) -> str | None:
+        return super()._content
+
+    @_content.setter
+    def _content(self, value: str | None) -> None:
+        self._content_by_path[self.path] = value
+        # The lines are superseded by (or stale relative to) the new content.
+        self._lines_by_path.pop(self.path, None)
+
+    @override
+    def unlock(self) -> None:
+        super().unlock()
+        self._lines_by_path.pop(self.path, None)
+
+    def get_lines(self) -> list[READMELine]:
+        """Get the lines of the README, reading from disk if necessary.
+
+        The returned list is a copy, so it can be modified and passed to
+        `commit_lines`.
+        """
+        lines = self._lines_by_path.get(self.path)
+        if lines is None:
+            lines = [READMELine.from_text(text) for text in self.get().splitlines()]
+            self._lines_by_path[self.path] = lines
+        return list(lines)
+
+    def commit_lines(self, lines: Sequence[READMELine]) -> None:
+        """Store the given lines in memory for deferred writing, with a final newline."""
+        self.commit("\n".join(line.text for line in lines) + "\n")
+        if lines:
+            self._lines_by_path[self.path] = list(lines)
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from usethis._config import usethis_config
 from usethis._console import warn_print
+from usethis._file.snapshot import get_project_snapshot
 from usethis.errors import UsethisError
 
 if TYPE_CHECKING:
@@ -18,16 +19,15 @@ class NonMarkdownREADMEError(UsethisError):
 
 def get_readme_path():
     """Return the path to the README file, searching for common README filenames."""
-    path_readme_md = usethis_config.cpd() / "README.md"
-    path_readme = usethis_config.cpd() / "README"
+    snapshot = get_project_snapshot()
 
-    if path_readme_md.exists() and path_readme_md.is_file():
-        return path_readme_md
-    elif path_readme.exists() and path_readme.is_file():
-        return path_readme
+    if snapshot.is_file("README.md"):
+        return usethis_config.cpd() / "README.md"
+    elif snapshot.is_file("README"):
+        return usethis_config.cpd() / "README"
 
-    for path in usethis_config.cpd().glob("README*"):
-        if path.is_file() and path.stem == "README":
+    for path in snapshot.glob("README*"):
+        if snapshot.is_file(path.name) and path.stem == "README":
             return path
 
     msg = "No README file found."
@@ -9,6 +9,7 @@ from pydantic import TypeAdapter, ValidationError
 
 from usethis._config import usethis_config
 from usethis._console import warn_print
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._integrations.project.layout import get_source_dir_str, get_tests_dir_str
 from usethis._integrations.sonarqube.errors import (
@@ -22,9 +23,17 @@ from usethis._python.version import PythonVersion, PythonVersionParseError
 def get_sonar_project_properties(*, project_key: str | None = None) -> str:
     """Get contents for (or from) the sonar-project.properties file."""
     path = usethis_config.cpd() / "sonar-project.properties"
-    if path.exists() and path.is_file():
-        return path.read_text(encoding="utf-8")
+    if fs.exists(path) and fs.is_file(path):
+        return fs.read_text(path)
 
+    return build_sonar_project_properties(project_key=project_key)
+
+
+def build_sonar_project_properties(*, project_key: str | None = None) -> str:
+    """Construct contents for the sonar-project.properties file.
+
+    Unlike `get_sonar_project_properties`, any existing file is ignored.
+    """
     # Get Python version
     try:
         python_version = PythonVersion.from_python_version_file(
@@ -45,7 +54,6 @@ def get_sonar_project_properties(*, project_key: str | None = None) -> str:
     extra_properties = _get_sonarqube_extra_properties()
     coverage_path = _get_coverage_path()
 
-    # No file, so construct the contents
     source_dir_str = get_source_dir_str()
     tests_dir_str = get_tests_dir_str()
     if source_dir_str == ".":
@@ -46,9 +46,10 @@ class Parallel(RootModel[frozenset["Series | Parallel | DepGroup | str"]]):
         if not isinstance(other, Parallel):
             return False
 
-        if any(component not in list(self.root) for component in other.root):
-            return False
-        return not any(component not in list(other.root) for component in self.root)
+        # Rehash the components rather than comparing the frozensets directly, since a
+        # (mutable) series may have changed since its hash was stored. N.B. iterating
+        # avoids copying the stored hashes.
+        return set(iter(self.root)) == set(iter(other.root))
 
     def __len__(self):
         return len(self.root)
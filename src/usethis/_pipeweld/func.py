@@ -3,28 +3,37 @@
 from __future__ import annotations
 
 import contextlib
+from dataclasses import dataclass, field
 from functools import reduce
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel
 from typing_extensions import assert_never
 
-from usethis._pipeweld.containers import (
-    DepGroup,
-    Parallel,
-    Series,
-    depgroup,
-    parallel,
-    series,
+from usethis._pipeweld.containers import series
+from usethis._pipeweld.nodes import (
+    DepGroupNode,
+    ParallelNode,
+    SeriesNode,
+    depgroup_node,
+    from_series_node,
+    parallel_node,
+    series_node,
+    to_node,
+    to_series_node,
 )
 from usethis._pipeweld.ops import InsertParallel, InsertSuccessor
 from usethis._pipeweld.result import WeldResult
 
 if TYPE_CHECKING:
+    from usethis._pipeweld.containers import DepGroup, Parallel, Series
+    from usethis._pipeweld.nodes import (
+        Node,
+    )
     from usethis._pipeweld.ops import Instruction
 
 
-class Partition(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Partition:
     """A three-way partition of a pipeline component relative to a new step's dependencies.
 
     The three parts are: steps that must run before the new step (prerequisite),
@@ -32,19 +41,20 @@ class Partition(BaseModel):
     the new step (postrequisite).
     """
 
-    prerequisite_component: str | Series | DepGroup | Parallel | None = None
-    nondependent_component: str | Series | DepGroup | Parallel | None = None
-    postrequisite_component: str | Series | DepGroup | Parallel | None = None
+    prerequisite_component: Node | None = None
+    nondependent_component: Node | None = None
+    postrequisite_component: Node | None = None
     top_ranked_endpoint: str
 
 
-class Adder(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Adder:
     """Add a new step into an existing pipeline, respecting dependency ordering."""
 
     pipeline: Series
     step: str
-    prerequisites: set[str] = set()
-    postrequisites: set[str] = set()
+    prerequisites: set[str] = field(default_factory=set)
+    postrequisites: set[str] = field(default_factory=set)
     force_linear: bool = False
 
     def add(self) -> WeldResult:
@@ -56,32 +66,34 @@ class Adder(BaseModel):
                 solution=series(self.step),
             )
 
-        partition, instructions = self.partition_component(
-            self.pipeline, predecessor=None
-        )
+        # The pipeline is converted to compact immutable nodes for the duration of the
+        # weld, since components are rebuilt many times over.
+        pipeline = to_series_node(self.pipeline)
+
+        partition, instructions = self.partition_component(pipeline, predecessor=None)
         rearranged_pipeline = _flatten_partition(partition)
-        new_instructions = self._insert_step(rearranged_pipeline)
+        rearranged_pipeline, new_instructions = self._insert_step(rearranged_pipeline)
 
         if not new_instructions:
             # Didn't find a pre-requisite so just add the step in parallel to everything
-            new_instructions = self._insert_before_postrequisites(
+            rearranged_pipeline, new_instructions = self._insert_before_postrequisites(
                 rearranged_pipeline, idx=-1, predecessor=None
             )
 
         instructions += new_instructions
 
         if self.force_linear:
-            original_order = _extract_ordered_steps(self.pipeline)
+            original_order = _extract_ordered_steps(pipeline)
             flat = _linearize_component(rearranged_pipeline, self.step, original_order)
-            rearranged_pipeline = series(*flat)
+            rearranged_pipeline = series_node(*flat)
 
         return WeldResult(
-            solution=rearranged_pipeline,
+            solution=from_series_node(rearranged_pipeline),
             instructions=instructions,
         )
 
     def partition_component(
-        self, component: str | Series | Parallel | DepGroup, *, predecessor: str | None
+        self, component: Node, *, predecessor: str | None
     ) -> tuple[Partition, list[Instruction]]:
         """Partition a component into prerequisite, nondependent, and postrequisite parts.
 
@@ -103,13 +115,13 @@ class Adder(BaseModel):
                     nondependent_component=component,
                     top_ranked_endpoint=component,
                 ), []
-        elif isinstance(component, Series):
+        elif isinstance(component, SeriesNode):
             return self._partition_series_component(component, predecessor=predecessor)
-        elif isinstance(component, Parallel):
+        elif isinstance(component, ParallelNode):
             return self._partition_parallel_component(
                 component, predecessor=predecessor
             )
-        elif isinstance(component, DepGroup):
+        elif isinstance(component, DepGroupNode):
             return self._partition_depgroup_component(
                 component, predecessor=predecessor
             )
@@ -117,11 +129,11 @@ class Adder(BaseModel):
             assert_never(component)
 
     def _partition_series_component(
-        self, component: Series, *, predecessor: str | None
+        self, component: SeriesNode, *, predecessor: str | None
     ) -> tuple[Partition, list[Instruction]]:
         partitions: list[Partition] = []
         instructions: list[Instruction] = []
-        for subcomponent in component.root:
+        for subcomponent in component.items:
             partition, these_instructions = self.partition_component(
                 subcomponent,
                 predecessor=predecessor,
@@ -135,27 +147,27 @@ class Adder(BaseModel):
         else:
             partition = partitions[0]
             return Partition(
-                prerequisite_component=series(partition.prerequisite_component)
+                prerequisite_component=series_node(partition.prerequisite_component)
                 if partition.prerequisite_component is not None
                 else None,
-                nondependent_component=series(partition.nondependent_component)
+                nondependent_component=series_node(partition.nondependent_component)
                 if partition.nondependent_component is not None
                 else None,
-                postrequisite_component=series(partition.postrequisite_component)
+                postrequisite_component=series_node(partition.postrequisite_component)
                 if partition.postrequisite_component is not None
                 else None,
                 top_ranked_endpoint=partition.top_ranked_endpoint,
             ), instructions
 
     def _partition_parallel_component(
-        self, component: Parallel, *, predecessor: str | None
+        self, component: ParallelNode, *, predecessor: str | None
     ) -> tuple[Partition, list[Instruction]]:
         partition_with_instruction_tuples = [
             self.partition_component(
                 subcomponent,
                 predecessor=predecessor,
             )
-            for subcomponent in component.root
+            for subcomponent in component.items
         ]
 
         partitions = [_[0] for _ in partition_with_instruction_tuples]
@@ -187,24 +199,24 @@ class Adder(BaseModel):
             ), instructions
 
     def _partition_depgroup_component(
-        self, component: DepGroup, *, predecessor: str | None
+        self, component: DepGroupNode, *, predecessor: str | None
     ) -> tuple[Partition, list[Instruction]]:
         partition, instructions = self.partition_component(
             component.series,
             predecessor=predecessor,
         )
         partition = Partition(
-            prerequisite_component=depgroup(
+            prerequisite_component=depgroup_node(
                 partition.prerequisite_component, config_group=component.config_group
             )
             if partition.prerequisite_component is not None
             else None,
-            nondependent_component=depgroup(
+            nondependent_component=depgroup_node(
                 partition.nondependent_component, config_group=component.config_group
             )
             if partition.nondependent_component is not None
             else None,
-            postrequisite_component=depgroup(
+            postrequisite_component=depgroup_node(
                 partition.postrequisite_component, config_group=component.config_group
             )
             if partition.postrequisite_component is not None
@@ -215,13 +227,13 @@ class Adder(BaseModel):
 
     def _insert_step(
         self,
-        component: Series,
-    ) -> list[Instruction]:
+        component: SeriesNode,
+    ) -> tuple[SeriesNode, list[Instruction]]:
         # Iterate through the pipeline and insert the step
         # Work backwards until we find a pre-requisite (which is the final one), and then
         # insert after it - in parallel to its successor (or append if no successor). If we
         # don't find any pre-requsite then we insert in parallel to everything.
-        for idx, subcomponent in reversed(list(enumerate(component.root))):
+        for idx, subcomponent in reversed(list(enumerate(component.items))):
             if isinstance(subcomponent, str):
                 if subcomponent in self.prerequisites:
                     return self._insert_before_postrequisites(
@@ -229,93 +241,124 @@ class Adder(BaseModel):
                         idx=idx,
                         predecessor=subcomponent,
                     )
-            elif isinstance(subcomponent, Series):
-                added = self._insert_step(subcomponent)
+            elif isinstance(subcomponent, SeriesNode):
+                new_subcomponent, added = self._insert_step(subcomponent)
                 if added:
-                    return added
-            elif isinstance(subcomponent, Parallel):
-                added = self._insert_step(Series(list(subcomponent.root)))
+                    return component.replace(idx, new_subcomponent), added
+            elif isinstance(subcomponent, ParallelNode):
+                block = SeriesNode(tuple(subcomponent.items))
+                new_block, added = self._insert_step(block)
                 if added:
-                    return added
-            elif isinstance(subcomponent, DepGroup):
+                    new_subcomponent = self._carry_nested_changes(
+                        subcomponent, block=block, new_block=new_block
+                    )
+                    return component.replace(idx, new_subcomponent), added
+            elif isinstance(subcomponent, DepGroupNode):
                 if _has_any_steps(subcomponent, steps=self.prerequisites):
-                    added = self._insert_before_postrequisites(
+                    new_component, added = self._insert_before_postrequisites(
                         component,
                         idx=idx,
-                        predecessor=get_endpoint(subcomponent),
+                        predecessor=_get_endpoint(subcomponent),
                     )
                     if added:
-                        return added
+                        return new_component, added
             else:
                 assert_never(subcomponent)
 
-        return []
+        return component, []
 
     def _insert_before_postrequisites(
-        self, component: Series, *, idx: int, predecessor: str | None
-    ) -> list[Instruction]:
-        if idx + 1 >= len(component.root):
+        self, component: SeriesNode, *, idx: int, predecessor: str | None
+    ) -> tuple[SeriesNode, list[Instruction]]:
+        if idx + 1 >= len(component):
             # i.e. there is no successor; append
-            component.root.append(self.step)
-            return [InsertSuccessor(after=predecessor, step=self.step)]
+            return component.append(self.step), [
+                InsertSuccessor(after=predecessor, step=self.step)
+            ]
 
-        successor_component = component.root[idx + 1]
+        successor_component = component[idx + 1]
 
         if (
-            isinstance(successor_component, Parallel)
-            and len(successor_component.root) == 1
+            isinstance(successor_component, ParallelNode)
+            and len(successor_component) == 1
         ):
-            container = Series(list(successor_component.root))
-            instructions = self._insert_before_postrequisites(
-                container,
+            block = SeriesNode(tuple(successor_component.items))
+            new_block, instructions = self._insert_before_postrequisites(
+                block,
                 idx=-1,
                 predecessor=predecessor,
             )
             union = _union(successor_component, self.step)
-            if len(container) == 1 and container[0] == union:
-                if union is None:
-                    raise NotImplementedError
-                component[idx + 1] = union
+            if union is None:
+                raise NotImplementedError
+            if len(new_block) == 1 and new_block[0] == union:
+                return component.replace(idx + 1, union), instructions
 
-            return instructions
-        elif isinstance(successor_component, Parallel | DepGroup | str):
+            new_successor_component = self._carry_nested_changes(
+                successor_component, block=block, new_block=new_block
+            )
+            return component.replace(idx + 1, new_successor_component), instructions
+        elif isinstance(successor_component, ParallelNode | DepGroupNode | str):
             if _has_any_steps(successor_component, steps=self.postrequisites):
                 # Insert before this step
-                component.root.insert(idx + 1, self.step)
-                return [InsertSuccessor(after=predecessor, step=self.step)]
+                return component.insert(idx + 1, self.step), [
+                    InsertSuccessor(after=predecessor, step=self.step)
+                ]
             else:
                 union = _union(successor_component, self.step)
                 if union is None:
                     raise AssertionError
-                component.root[idx + 1] = union
-                return [InsertParallel(after=predecessor, step=self.step)]
-        elif isinstance(successor_component, Series):
-            return self._insert_before_postrequisites(
+                return component.replace(idx + 1, union), [
+                    InsertParallel(after=predecessor, step=self.step)
+                ]
+        elif isinstance(successor_component, SeriesNode):
+            new_successor_component, instructions = self._insert_before_postrequisites(
                 successor_component,
                 idx=-1,
                 predecessor=predecessor,
             )
+            return component.replace(idx + 1, new_successor_component), instructions
         else:
             assert_never(successor_component)
 
+    def _carry_nested_changes(
+        self, component: ParallelNode, *, block: SeriesNode, new_block: SeriesNode
+    ) -> ParallelNode:
+        """Apply changes made to a series block of a parallel component's elements.
 
-def _has_any_steps(
-    component: Series | Parallel | DepGroup | str, *, steps: set[str]
-) -> bool:
+        A parallel component is processed by treating its elements as a series block.
+        Changes made within those elements carry over to the parallel component, but
+        the step being placed directly into the block itself does not.
+        """
+        if len(new_block) != len(block):
+            # The step was inserted into the block
+            return component
+
+        elements: list[Node] = []
+        for element, new_element in zip(block.items, new_block.items, strict=True):
+            if isinstance(new_element, ParallelNode) and self.step in new_element.items:
+                # The step was placed in parallel with the element
+                elements.append(element)
+            else:
+                elements.append(new_element)
+        return ParallelNode(frozenset(elements))
+
+
+def _has_any_steps(component: Node, *, steps: set[str]) -> bool:
     if isinstance(component, str):
         return component in steps
-    elif isinstance(component, Parallel | Series):
-        for subcomponent in component.root:  # ty: ignore[possibly-missing-attribute]
+    elif isinstance(component, ParallelNode | SeriesNode):
+        for subcomponent in component.items:
             if _has_any_steps(subcomponent, steps=steps):
                 return True
         return False
-    elif isinstance(component, DepGroup):
+    elif isinstance(component, DepGroupNode):
         return _has_any_steps(component.series, steps=steps)
     else:
         assert_never(component)
 
 
-def _flatten_partition(partition: Partition) -> Series:
+def _flatten_partition(partition: Partition) -> SeriesNode:
     component = _concat(
         partition.prerequisite_component,
         partition.nondependent_component,
@@ -440,7 +483,7 @@ def _parallel_merge_partitions(
         instructions.extend(new_instructions)
     if nondependent_component is not None:
         if prerequisite_component is not None:
-            after = get_endpoint(prerequisite_component)
+            after = _get_endpoint(prerequisite_component)
         else:
             after = predecessor
         new_instructions, _ = _get_instructions_for_insertion(
@@ -449,9 +492,9 @@ def _parallel_merge_partitions(
         instructions.extend(new_instructions)
     if postrequisite_component is not None:
         if nondependent_component is not None:
-            after = get_endpoint(nondependent_component)
+            after = _get_endpoint(nondependent_component)
         elif prerequisite_component is not None:
-            after = get_endpoint(prerequisite_component)
+            after = _get_endpoint(prerequisite_component)
         else:
             after = predecessor
         new_instructions, _ = _get_instructions_for_insertion(
@@ -468,17 +511,17 @@ def _parallel_merge_partitions(
 
 
 def _collapsed_union(
-    *components: str | Series | DepGroup | Parallel | None,
-) -> str | Series | DepGroup | Parallel | None:
+    *components: Node | None,
+) -> Node | None:
     component = _union(*components)
     if component is not None and len(component) == 1:
         # Collapse singleton
-        (component,) = component.root
+        (component,) = component.items
     return component
 
 
 def _get_instructions_for_insertion(
-    component: str | Series | Parallel | DepGroup, *, after: str | None
+    component: Node, *, after: str | None
 ) -> tuple[list[Instruction], str | None]:
     """Get the instructions to insert a component after the given step.
 
@@ -495,24 +538,24 @@ def _get_instructions_for_insertion(
     """
     if isinstance(component, str):
         return [InsertSuccessor(after=after, step=component)], component
-    elif isinstance(component, Series):
+    elif isinstance(component, SeriesNode):
         instructions: list[Instruction] = []
-        for subcomponent in component.root:
+        for subcomponent in component.items:
             new_instructions, endpoint = _get_instructions_for_insertion(
                 subcomponent, after=after
             )
             instructions.extend(new_instructions)
             after = endpoint
         return instructions, after
-    elif isinstance(component, Parallel):
-        if len(component.root) == 0:
+    elif isinstance(component, ParallelNode):
+        if len(component.items) == 0:
             return [], after
 
         instructions_per_sub: list[list[Instruction]] = []
         endpoints: list[str | None] = []
         min_idx: int | None = None
         min_endpoint: str | None = None
-        for idx, subcomponent in enumerate(component.root):
+        for idx, subcomponent in enumerate(component.items):
             new_instructions, endpoint = _get_instructions_for_insertion(
                 subcomponent,
                 after=after,
@@ -531,7 +574,7 @@ def _get_instructions_for_insertion(
             # If the existing components are empty...
             min_endpoint = after
 
-        for idx in range(len(component.root)):
+        for idx in range(len(component.items)):
             if idx != min_idx and instructions_per_sub[idx]:
                 instructions_per_sub[idx][0] = InsertParallel(
                     after=instructions_per_sub[idx][0].after,
@@ -551,20 +594,20 @@ def _get_instructions_for_insertion(
         ]
 
         return instructions, min_endpoint
-    elif isinstance(component, DepGroup):
+    elif isinstance(component, DepGroupNode):
         return _get_instructions_for_insertion(component.series, after=after)
     else:
         assert_never(component)
 
 
-def _concat(*components: str | Series | DepGroup | Parallel | None) -> Series | None:
-    s: list[str | Series | DepGroup | Parallel] = []
+def _concat(*components: Node | None) -> SeriesNode | None:
+    s: list[Node] = []
     for component in components:
         if component is None:
             pass
-        elif isinstance(component, Series):
-            s.extend(component.root)
-        elif isinstance(component, (Parallel | str, DepGroup)):
+        elif isinstance(component, SeriesNode):
+            s.extend(component.items)
+        elif isinstance(component, (ParallelNode | str, DepGroupNode)):
             s.append(component)
         else:
             assert_never(component)
@@ -572,17 +615,17 @@ def _concat(*components: str | Series | DepGroup | Parallel | None) -> Series |
     if not s:
         return None
 
-    return series(*s)
+    return series_node(*s)
 
 
-def _union(*components: str | Series | DepGroup | Parallel | None) -> Parallel | None:
-    p: set[str | Series | DepGroup | Parallel] = set()
+def _union(*components: Node | None) -> ParallelNode | None:
+    p: set[Node] = set()
     for component in components:
         if component is None:
             pass
-        elif isinstance(component, Parallel):
-            p.update(component.root)
-        elif isinstance(component, (Series | str, DepGroup)):
+        elif isinstance(component, ParallelNode):
+            p.update(component.items)
+        elif isinstance(component, (SeriesNode | str, DepGroupNode)):
             p.add(component)
         else:
             assert_never(component)
@@ -590,35 +633,34 @@ def _union(*components: str | Series | DepGroup | Parallel | None) -> Parallel |
     if not p:
         return None
 
-    return parallel(*p)
+    return parallel_node(*p)
 
 
-def get_endpoint(component: str | Series | DepGroup | Parallel) -> str:
-    """Get the last step name (endpoint) from a pipeline component."""
+def _get_endpoint(component: Node) -> str:
     if isinstance(component, str):
         return component
-    elif isinstance(component, Series):
-        for subcomponent in reversed(component.root):
+    elif isinstance(component, SeriesNode):
+        for subcomponent in reversed(component.items):
             try:
-                return get_endpoint(subcomponent)
+                return _get_endpoint(subcomponent)
             except ValueError:
                 pass
 
         msg = "No endpoints are defined for a Series with no steps."
         raise ValueError(msg)
-    elif isinstance(component, Parallel):
+    elif isinstance(component, ParallelNode):
         endpoints: list[str] = []
-        for subcomponent in component.root:
+        for subcomponent in component.items:
             with contextlib.suppress(ValueError):
-                endpoints.append(get_endpoint(subcomponent))
+                endpoints.append(_get_endpoint(subcomponent))
         # Any endpoint will do so choose the first one
         # alphabetically
         if not endpoints:
             msg = "No endpoints are defined for a Parallel block with no steps."
             raise ValueError(msg)
         return sorted(endpoints)[0]
-    elif isinstance(component, DepGroup):
-        return get_endpoint(component.series)
+    elif isinstance(component, DepGroupNode):
+        return _get_endpoint(component.series)
     else:
         assert_never(component)
 
@@ -631,51 +673,55 @@ def get_predecessor(
     Returns `None` if `step` is the first step in the component.
     Raises `ValueError` if `step` is not found in the component.
     """
+    return _get_predecessor(to_node(component), step)
+
+
+def _get_predecessor(component: Node, step: str) -> str | None:
     if isinstance(component, str):
         if component == step:
             return None
         msg = f"Step '{step}' not found in component."
         raise ValueError(msg)
-    elif isinstance(component, Series):
-        for i, sub in enumerate(component.root):
+    elif isinstance(component, SeriesNode):
+        for i, sub in enumerate(component.items):
             if _has_any_steps(sub, steps={step}):
-                inner = get_predecessor(sub, step)
+                inner = _get_predecessor(sub, step)
                 if inner is not None:
                     return inner
                 # step is first within this sub-component; look to previous sub
                 if i > 0:
-                    return get_endpoint(component.root[i - 1])
+                    return _get_endpoint(component.items[i - 1])
                 return None
         msg = f"Step '{step}' not found in component."
         raise ValueError(msg)
-    elif isinstance(component, Parallel):
-        for sub in component.root:
+    elif isinstance(component, ParallelNode):
+        for sub in component.items:
             if _has_any_steps(sub, steps={step}):
-                return get_predecessor(sub, step)
+                return _get_predecessor(sub, step)
         msg = f"Step '{step}' not found in component."
         raise ValueError(msg)
-    elif isinstance(component, DepGroup):
-        return get_predecessor(component.series, step)
+    elif isinstance(component, DepGroupNode):
+        return _get_predecessor(component.series, step)
     else:
         assert_never(component)
 
 
 def _extract_ordered_steps(
-    component: str | Series | Parallel | DepGroup,
+    component: Node,
 ) -> list[str]:
     """Extract all step names from a component in depth-first order."""
     if isinstance(component, str):
         return [component]
-    elif isinstance(component, Series | Parallel):
-        return [s for sub in component.root for s in _extract_ordered_steps(sub)]
-    elif isinstance(component, DepGroup):
+    elif isinstance(component, SeriesNode | ParallelNode):
+        return [s for sub in component.items for s in _extract_ordered_steps(sub)]
+    elif isinstance(component, DepGroupNode):
         return _extract_ordered_steps(component.series)
     else:
         assert_never(component)
 
 
 def _linearize_component(
-    component: str | Series | Parallel | DepGroup,
+    component: Node,
     new_step: str,
     original_order: list[str],
 ) -> list[str]:
@@ -686,15 +732,15 @@ def _linearize_component(
     """
     if isinstance(component, str):
         return [component]
-    elif isinstance(component, Series):
+    elif isinstance(component, SeriesNode):
         result: list[str] = []
-        for sub in component.root:
+        for sub in component.items:
             result.extend(_linearize_component(sub, new_step, original_order))
         return result
-    elif isinstance(component, Parallel):
+    elif isinstance(component, ParallelNode):
         sublists = [
             _linearize_component(sub, new_step, original_order)
-            for sub in component.root
+            for sub in component.items
         ]
         all_items = [item for sublist in sublists for item in sublist]
 
@@ -711,7 +757,7 @@ def _linearize_component(
 
         all_items.sort(key=sort_key)
         return all_items
-    elif isinstance(component, DepGroup):
+    elif isinstance(component, DepGroupNode):
         return _linearize_component(component.series, new_step, original_order)
     else:
         assert_never(component)
@@ -0,0 +1,182 @@
+"""Compact immutable pipeline components used internally while welding.
+
+The pydantic containers in `usethis._pipeweld.containers` are the public
+representation of a pipeline. The welding algorithm rebuilds components many times
+over, so it works with these lightweight equivalents instead, which have cached hashes
+and linear-time equality checks. Conversion happens only at the API boundary.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TypeAlias
+
+from typing_extensions import assert_never, override
+
+from usethis._pipeweld.containers import (
+    DepGroup,
+    Parallel,
+    Series,
+    depgroup,
+    parallel,
+)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class SeriesNode:
+    """An ordered sequence of pipeline components executed one after another."""
+
+    items: tuple[Node, ...]
+    _hash: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((SeriesNode, self.items)))
+
+    @override
+    def __hash__(self) -> int:
+        return self._hash
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SeriesNode):
+            return False
+        return self._hash == other._hash and self.items == other.items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, idx: int) -> Node:
+        return self.items[idx]
+
+    def replace(self, idx: int, node: Node) -> SeriesNode:
+        """Get a copy of the series with the component at an index replaced."""
+        items = list(self.items)
+        items[idx] = node
+        return SeriesNode(tuple(items))
+
+    def insert(self, idx: int, node: Node) -> SeriesNode:
+        """Get a copy of the series with a component inserted at an index."""
+        items = list(self.items)
+        items.insert(idx, node)
+        return SeriesNode(tuple(items))
+
+    def append(self, node: Node) -> SeriesNode:
+        """Get a copy of the series with a component added at the end."""
+        return SeriesNode((*self.items, node))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ParallelNode:
+    """An unordered set of pipeline components executed in parallel."""
+
+    items: frozenset[Node]
+    _hash: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((ParallelNode, self.items)))
+
+    @override
+    def __hash__(self) -> int:
+        return self._hash
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParallelNode):
+            return False
+        return self._hash == other._hash and self.items == other.items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DepGroupNode:
+    """A pipeline component tied to a named dependency configuration group."""
+
+    series: SeriesNode
+    config_group: str
+    _hash: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_hash", hash((DepGroupNode, self.series, self.config_group))
+        )
+
+    @override
+    def __hash__(self) -> int:
+        return self._hash
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DepGroupNode):
+            return False
+        return (
+            self._hash == other._hash
+            and self.config_group == other.config_group
+            and self.series == other.series
+        )
+
+
+Node: TypeAlias = str | SeriesNode | ParallelNode | DepGroupNode
+
+
+def series_node(*args: Node) -> SeriesNode:
+    """Create a series node from the given components."""
+    return SeriesNode(args)
+
+
+def parallel_node(*args: Node) -> ParallelNode:
+    """Create a parallel node from the given components."""
+    return ParallelNode(frozenset(args))
+
+
+def depgroup_node(*args: Node, config_group: str) -> DepGroupNode:
+    """Create a dependency group node from the given components."""
+    return DepGroupNode(series=SeriesNode(args), config_group=config_group)
+
+
+def to_node(component: str | Series | Parallel | DepGroup) -> Node:
+    """Convert a pipeline component to its internal node representation."""
+    if isinstance(component, str):
+        return component
+    elif isinstance(component, Series):
+        return to_series_node(component)
+    elif isinstance(component, Parallel):
+        return ParallelNode(frozenset(to_node(item) for item in component.root))
+    elif isinstance(component, DepGroup):
+        return DepGroupNode(
+            series=to_series_node(component.series),
+            config_group=component.config_group,
+        )
+    else:
+        assert_never(component)
+
+
+def from_node(node: Node) -> str | Series | Parallel | DepGroup:
+    """Convert an internal node back to its pipeline component representation."""
+    if isinstance(node, str):
+        return node
+    elif isinstance(node, SeriesNode):
+        return from_series_node(node)
+    elif isinstance(node, ParallelNode):
+        return parallel(*(from_node(item) for item in node.items))
+    elif isinstance(node, DepGroupNode):
+        return depgroup(
+            *(from_node(item) for item in node.series.items),
+            config_group=node.config_group,
+        )
+    else:
+        assert_never(node)
+
+
+def to_series_node(component: Series) -> SeriesNode:
+    """Convert a series to its internal node representation."""
+    return SeriesNode(tuple(to_node(item) for item in component.root))
+
+
+def from_series_node(node: SeriesNode) -> Series:
+    """Convert an internal series node back to a series.
+
+    Nodes are only ever built from valid components, so validation is skipped.
+    """
+    return Series.model_construct([from_node(item) for item in node.items])
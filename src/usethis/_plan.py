@@ -0,0 +1,153 @@
+"""Plans of the changes which a command would make to a project.
+
+In dry-run mode, subprocesses are skipped and recorded in the current plan rather than
+being run. File changes are held in memory rather than written to disk, and are then
+compared against the files on disk.
+"""
+
+from __future__ import annotations
+
+import difflib
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@dataclass(frozen=True)
+class PlannedSubprocess:
+    """A subprocess which would be run by a command.
+
+    Attributes:
+        args: The command-line arguments of the subprocess.
+    """
+
+    args: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class PlannedFileChange:
+    """A change which would be made to a file by a command.
+
+    Attributes:
+        path: The path of the file relative to the project directory, in POSIX form.
+        change: Whether the file would be created, modified, or deleted.
+        diff: A unified diff of the change.
+    """
+
+    path: str
+    change: Literal["create", "modify", "delete"]
+    diff: str
+
+
+@dataclass
+class ChangePlan:
+    """The changes which a command would make to a project.
+
+    Attributes:
+        file_changes: The file changes, ordered by path.
+        subprocesses: The subprocesses, in the order they would be run.
+    """
+
+    file_changes: list[PlannedFileChange] = field(default_factory=list)
+    subprocesses: list[PlannedSubprocess] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """Whether the command would make no changes at all."""
+        return not self.file_changes and not self.subprocesses
+
+    def get_unified_diff(self) -> str:
+        """Get a unified diff of all the file changes."""
+        return "".join(file_change.diff for file_change in self.file_changes)
+
+    def to_json(self) -> str:
+        """Get a machine-readable JSON representation of the plan."""
+        return json.dumps(
+            {
+                "files": [
+                    {"path": file_change.path, "change": file_change.change}
+                    for file_change in self.file_changes
+                ],
+                "subprocesses": [
+                    {"args": list(subprocess.args)} for subprocess in self.subprocesses
+                ],
+            },
+            indent=2,
+        )
+
+
+@dataclass
+class _PlanRecorder:
+    plan: ChangePlan | None = None
+
+
+_plan_recorder = _PlanRecorder()
+
+
+@contextmanager
+def record_plan() -> Iterator[ChangePlan]:
+    """Context manager which collects skipped subprocesses into a new plan."""
+    old_plan = _plan_recorder.plan
+    plan = ChangePlan()
+    _plan_recorder.plan = plan
+    try:
+        yield plan
+    finally:
+        _plan_recorder.plan = old_plan
+
+
+def record_subprocess(args: list[str]) -> None:
+    """Record a skipped subprocess in the current plan, if there is one."""
+    if _plan_recorder.plan is not None:
+        _plan_recorder.plan.subprocesses.append(PlannedSubprocess(args=tuple(args)))
+
+
+def get_planned_file_change(
+    path: str, *, before: bytes | None, after: bytes | None
+) -> PlannedFileChange:
+    """Describe the change which would turn one version of a file into another.
+
+    Args:
+        path: The path of the file relative to the project directory, in POSIX form.
+        before: The content of the file before the change, or None if it doesn't exist.
+        after: The content of the file after the change, or None if it doesn't exist.
+    """
+    if before is None:
+        change = "create"
+    elif after is None:
+        change = "delete"
+    else:
+        change = "modify"
+
+    return PlannedFileChange(
+        path=path,
+        change=change,
+        diff=_get_unified_diff(path, before=before, after=after),
+    )
+
+
+def _get_unified_diff(path: str, *, before: bytes | None, after: bytes | None) -> str:
+    fromfile = f"a/{path}" if before is not None else "/dev/null"
+    tofile = f"b/{path}" if after is not None else "/dev/null"
+
+    try:
+        before_lines = (before or b"").decode("utf-8").splitlines(keepends=True)
+        after_lines = (after or b"").decode("utf-8").splitlines(keepends=True)
+    except UnicodeDecodeError:
+        return f"Binary files {fromfile} and {tofile} differ\n"
+
+    if not before_lines and not after_lines:
+        # An empty file was created or deleted, which difflib doesn't show.
+        return f"--- {fromfile}\n+++ {tofile}\n"
+
+    lines: list[str] = []
+    for line in difflib.unified_diff(
+        before_lines, after_lines, fromfile=fromfile, tofile=tofile
+    ):
+        lines.append(line)
+        if not line.endswith("\n"):
+            lines.append("\n\\ No newline at end of file\n")
+    return "".join(lines)
@@ -2,47 +2,287 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
+import queue
+import signal
 import subprocess
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import IO, TYPE_CHECKING, Any, Literal
+
+from usethis._config import usethis_config
+from usethis._plan import record_subprocess
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
+MAX_RETAINED_OUTPUT_CHARS = 10_000_000
+"""The maximum number of characters of output retained per stream; older is dropped."""
+
+_TERMINATE_GRACE_PERIOD = 5.0
+
 
 class SubprocessFailedError(Exception):
     pass
 
 
+class SubprocessTimeoutError(SubprocessFailedError):
+    """Raised when a subprocess doesn't finish within its timeout."""
+
+
 @dataclass
 class SubprocessResult:
-    """The result of a successful subprocess invocation."""
+    """The result of a successful subprocess invocation.
+
+    Attributes:
+        stdout: The (possibly truncated) standard output of the subprocess.
+        stderr: The (possibly truncated) standard error of the subprocess.
+    """
 
     stdout: str
     stderr: str
 
 
-def call_subprocess(args: list[str], *, cwd: Path | None = None) -> SubprocessResult:
-    """Run a subprocess and return its output, raising SubprocessFailedError on failure."""
+def call_subprocess(
+    args: list[str],
+    *,
+    cwd: Path | None = None,
+    timeout: float | None = None,
+    on_stderr_line: Callable[[str], None] | None = None,
+) -> SubprocessResult:
+    """Run a subprocess and return its output, raising SubprocessFailedError on failure.
+
+    The output is read incrementally while the subprocess runs, so lines written to
+    stderr can be handled as soon as they arrive. Only the most recent
+    `MAX_RETAINED_OUTPUT_CHARS` characters of each stream are retained.
+
+    In dry-run mode, the subprocess is recorded in the current plan instead, and it is
+    treated as having succeeded without output.
+
+    Args:
+        args: The command-line arguments of the subprocess.
+        cwd: The working directory for the subprocess.
+        timeout: The maximum time in seconds to wait for the subprocess before
+                 terminating it (along with any processes it started, unless stdin is a
+                 terminal). Defaults to the global `subprocess_timeout` configuration.
+        on_stderr_line: A callback for each line written to stderr, as it arrives.
+
+    Raises:
+        SubprocessFailedError: If the subprocess exits with a non-zero status.
+        SubprocessTimeoutError: If the subprocess doesn't finish within the timeout.
+    """
+    if usethis_config.dry_run:
+        record_subprocess(args)
+        return SubprocessResult(stdout="", stderr="")
+
+    if timeout is None:
+        timeout = usethis_config.subprocess_timeout
+
+    # A separate process group is only needed to terminate the processes started by
+    # the subprocess on timeout.
+    is_group = timeout is not None and _can_use_process_group()
+    start = time.perf_counter()
+    process = subprocess.Popen(  # noqa: S603
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd.as_posix() if cwd else None,
+        **(_get_process_group_kwargs() if is_group else {}),
+    )
     try:
-        process = subprocess.run(  # noqa: S603
-            args, check=True, capture_output=True, cwd=cwd.as_posix() if cwd else None
+        stdout, stderr = _read_output(
+            process,
+            deadline=start + timeout if timeout is not None else None,
+            on_stderr_line=on_stderr_line,
         )
-        return SubprocessResult(
-            stdout=process.stdout.decode(),
-            stderr=process.stderr.decode(),
-        )
-    except subprocess.CalledProcessError as err:
-        bmsg_stderr: bytes = err.stderr
-        bmsg_stdout: bytes = err.stdout
-
-        stderr = bmsg_stderr.decode()
-        stdout = bmsg_stdout.decode()
+    except _DeadlineExceededError:
+        _terminate(process, is_group=is_group)
+        msg = "Subprocess timed out:"
+        msg += f"\n  {' '.join(args)}"
+        msg += f"\nNo exit after {timeout:g} seconds."
+        raise SubprocessTimeoutError(msg) from None
+    except BaseException:
+        # e.g. KeyboardInterrupt; don't leave the subprocess running.
+        _terminate(process, is_group=is_group)
+        raise
+    duration = time.perf_counter() - start
 
+    if process.returncode != 0:
         msg = "Failed to run subprocess:"
         msg += f"\n  {' '.join(args)}"
+        msg += f"\nExit status {process.returncode} after {duration:.1f} seconds."
         if stderr:
             msg += f"\n{stderr=}"
         if stdout:
             msg += f"\n{stdout=}"
-        raise SubprocessFailedError(msg) from None
+        raise SubprocessFailedError(msg)
+
+    return SubprocessResult(stdout=stdout, stderr=stderr)
+
+
+class _DeadlineExceededError(Exception):
+    pass
+
+
+@dataclass
+class _OutputBuffer:
+    """The most recent lines of output from a stream, up to a character limit."""
+
+    lines: deque[str] = field(default_factory=deque)
+    size: int = 0
+
+    def append(self, line: str) -> None:
+        self.lines.append(line)
+        self.size += len(line)
+        while self.size > MAX_RETAINED_OUTPUT_CHARS and len(self.lines) > 1:
+            self.size -= len(self.lines.popleft())
+
+    def getvalue(self) -> str:
+        return "".join(self.lines)
+
+
+def _read_output(
+    process: subprocess.Popen[bytes],
+    *,
+    deadline: float | None,
+    on_stderr_line: Callable[[str], None] | None,
+) -> tuple[str, str]:
+    """Read a subprocess's output until it exits, returning its stdout and stderr."""
+    # Each stream is read by its own thread to avoid deadlocks when a pipe fills up,
+    # but the lines are handled here, in the calling thread.
+    lines: queue.Queue[tuple[Literal["stdout", "stderr"], str | None]] = queue.Queue()
+    assert process.stdout is not None
+    assert process.stderr is not None
+    readers = [
+        threading.Thread(
+            target=_enqueue_lines, args=(process.stdout, "stdout", lines), daemon=True
+        ),
+        threading.Thread(
+            target=_enqueue_lines, args=(process.stderr, "stderr", lines), daemon=True
+        ),
+    ]
+    for reader in readers:
+        reader.start()
+
+    buffers = {"stdout": _OutputBuffer(), "stderr": _OutputBuffer()}
+    n_open = len(readers)
+    while n_open:
+        try:
+            name, line = lines.get(timeout=_get_remaining(deadline))
+        except queue.Empty:
+            continue  # Check the deadline again
+
+        if line is None:
+            n_open -= 1
+            continue
+
+        buffers[name].append(line)
+        if name == "stderr" and on_stderr_line is not None:
+            on_stderr_line(line.rstrip("\r\n"))
+
+    try:
+        process.wait(timeout=_get_remaining(deadline))
+    except subprocess.TimeoutExpired:
+        raise _DeadlineExceededError from None
+
+    return buffers["stdout"].getvalue(), buffers["stderr"].getvalue()
+
+
+def _enqueue_lines(
+    stream: IO[bytes],
+    name: Literal["stdout", "stderr"],
+    lines: queue.Queue[tuple[Literal["stdout", "stderr"], str | None]],
+) -> None:
+    with stream:
+        for line in iter(stream.readline, b""):
+            lines.put((name, line.decode(errors="replace")))
+    lines.put((name, None))
+
+
+def _get_remaining(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+
+    remaining = deadline - time.perf_counter()
+    if remaining <= 0:
+        raise _DeadlineExceededError
+    return remaining
+
+
+def _can_use_process_group() -> bool:
+    """Whether a subprocess can be run in a new process group.
+
+    A new process group is in the background, so any process in it which reads from the
+    terminal would be stopped, e.g. when prompting for git credentials or a GPG
+    passphrase. So when stdin is a terminal, the subprocess stays in the foreground
+    process group instead.
+    """
+    if os.name != "posix":
+        return False
+    try:
+        return not os.isatty(sys.stdin.fileno())
+    except (AttributeError, OSError, ValueError):
+        # e.g. stdin has been replaced or closed.
+        return True
+
+
+def _get_process_group_kwargs() -> dict[str, Any]:
+    """Get the arguments to run a subprocess in a new process group.
+
+    The subprocess can then be terminated along with any processes it starts.
+    """
+    if sys.version_info >= (3, 11):
+        return {"process_group": 0}
+    return {"preexec_fn": _set_process_group}
+
+
+def _set_process_group() -> None:
+    os.setpgid(0, 0)
+
+
+def _terminate(process: subprocess.Popen[bytes], *, is_group: bool) -> None:
+    """Terminate a subprocess, killing it if it doesn't exit.
+
+    If the subprocess is in its own process group, the whole group is terminated. The
+    group is signalled even if the subprocess itself has already exited, since processes
+    it started may still be running.
+    """
+    if not is_group:
+        if process.poll() is None:
+            process.terminate()
+        try:
+            process.wait(timeout=_TERMINATE_GRACE_PERIOD)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        return
+
+    _send_signal_to_group(process, signal.SIGTERM)
+    deadline = time.perf_counter() + _TERMINATE_GRACE_PERIOD
+    with contextlib.suppress(subprocess.TimeoutExpired):
+        process.wait(timeout=_TERMINATE_GRACE_PERIOD)
+
+    while _is_group_running(process) and time.perf_counter() < deadline:
+        time.sleep(0.05)
+    _send_signal_to_group(process, signal.SIGKILL)
+    process.wait()
+
+
+def _is_group_running(process: subprocess.Popen[bytes]) -> bool:
+    try:
+        os.killpg(process.pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def _send_signal_to_group(
+    process: subprocess.Popen[bytes], sig: signal.Signals
+) -> None:
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(process.pid, sig)
@@ -1,4 +1,8 @@
-"""Registry of all available tools."""
+"""The type of all available tools.
+
+Importing this module imports every tool implementation; see `usethis._tool.registry`
+for access to tools by name, and their static metadata, without doing so.
+"""
 
 from __future__ import annotations
 
@@ -33,20 +37,3 @@ SupportedToolType: TypeAlias = (
     | TachTool
     | TyTool
 )
-
-ALL_TOOLS: list[SupportedToolType] = [
-    # Alphabetical order
-    CodespellTool(),
-    CoveragePyTool(),
-    DeptryTool(),
-    ImportLinterTool(),
-    MkDocsTool(),
-    PreCommitTool(),
-    PyprojectFmtTool(),
-    PyprojectTOMLTool(),
-    PytestTool(),
-    RequirementsTxtTool(),
-    RuffTool(),
-    TachTool(),
-    TyTool(),
-]
@@ -13,6 +13,8 @@ from usethis._config import usethis_config
 from usethis._console import how_print, tick_print
 from usethis._deps import add_deps_to_group, remove_deps_from_group
 from usethis._detect.pre_commit import is_pre_commit_used
+from usethis._file import fs
+from usethis._file.patch import DeleteValue, SetValue
 from usethis._integrations.pre_commit.cmd_ import pre_commit_raw_cmd
 from usethis._integrations.pre_commit.hooks import (
     add_repo,
@@ -31,6 +33,7 @@ from usethis.errors import (
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from pathlib import Path
 
     from usethis._file.manager import Document, KeyValueFileManager
     from usethis._file.types_ import Key
@@ -51,7 +54,7 @@ class Tool(ToolSpec, Protocol):
         provide extra details, e.g. a word to describe what the tool does
         (e.g. "... to run {self.name} spellchecker").
         """
-        how_print(f"Run '{self.how_to_use_cmd()}' to run {self.name}.")
+        how_print(f"Run '{self.how_to_use_cmd()}' to run {self.name}.", tool=self.name)
 
     def how_to_use_cmd(self) -> str:
         """The command used when explaining to run the tool.
@@ -248,6 +251,10 @@ class Tool(ToolSpec, Protocol):
 
         active_config_file_managers = self.get_active_config_file_managers()
 
+        # The changes are collected per file and applied in a single patch at the end,
+        # rather than copying and committing the document once per config item.
+        pending_ops: dict[KeyValueFileManager[Document], list[SetValue]] = {}
+
         already_added = False  # Only print messages for the first added config item.
         for config_item in self.config_spec().config_items:
             with usethis_config.set(
@@ -255,16 +262,22 @@ class Tool(ToolSpec, Protocol):
                 instruct_only=already_added or usethis_config.instruct_only,
             ):
                 added = self._add_config_item(
-                    config_item, file_managers=active_config_file_managers
+                    config_item,
+                    file_managers=active_config_file_managers,
+                    pending_ops=pending_ops,
                 )
                 if added:
                     already_added = True
 
+        for file_manager, ops in pending_ops.items():
+            file_manager.patch(ops)
+
     def _add_config_item(
         self,
         config_item: ConfigItem,
         *,
         file_managers: set[KeyValueFileManager[Document]],
+        pending_ops: dict[KeyValueFileManager[Document], list[SetValue]],
     ) -> bool:
         """Add a specific configuration item using specified file managers.
 
@@ -272,6 +285,9 @@ class Tool(ToolSpec, Protocol):
             config_item: The configuration item to add.
             file_managers: The set of (active) file managers to consider for adding the
                            config.
+            pending_ops: Changes which have been decided on but not yet applied, by
+                         file manager. The change for this config item is appended
+                         here, rather than being applied immediately.
 
         Returns:
             Whether any config was added. Config might not be added in some cases where
@@ -330,9 +346,13 @@ class Tool(ToolSpec, Protocol):
         # N.B. we wait to do this until after all `return False` lines to avoid
         # creating empty files unnecessarily.
         for file_manager in used_file_managers:
-            if not (file_manager.path.exists() and file_manager.path.is_file()):
-                tick_print(f"Writing '{file_manager.relative_path}'.")
-                file_manager.path.touch(exist_ok=True)
+            if not (fs.exists(file_manager.path) and fs.is_file(file_manager.path)):
+                tick_print(
+                    f"Writing '{file_manager.relative_path}'.",
+                    file=file_manager.relative_path.as_posix(),
+                    tool=self.name,
+                )
+                fs.touch(file_manager.path, exist_ok=True)
 
         # Try and identify which file manager to use for adding the config, based on
         # where existing config is located and our priority order
@@ -347,7 +367,9 @@ class Tool(ToolSpec, Protocol):
             new_file_managers = [
                 file_manager
                 for file_manager in used_file_managers
-                if shared_keys in file_manager
+                if _has_keys(
+                    file_manager, shared_keys, pending_ops=pending_ops.get(file_manager)
+                )
             ]
             if not new_file_managers:
                 break
@@ -355,12 +377,22 @@ class Tool(ToolSpec, Protocol):
         # Now, use the highest-priority file manager to add the config
         (used_file_manager, *_) = used_file_managers
 
-        if not config_item.force and entry.keys in used_file_manager:
+        if not config_item.force and _has_keys(
+            used_file_manager,
+            entry.keys,
+            pending_ops=pending_ops.get(used_file_manager),
+        ):
             # We won't overwrite, so skip if there is already a value set.
             return False
 
-        tick_print(f"Adding {self.name} config to '{used_file_manager.relative_path}'.")
-        used_file_manager[entry.keys] = entry.get_value()
+        tick_print(
+            f"Adding {self.name} config to '{used_file_manager.relative_path}'.",
+            file=used_file_manager.relative_path.as_posix(),
+            tool=self.name,
+        )
+        pending_ops.setdefault(used_file_manager, []).append(
+            SetValue(keys=entry.keys, value=entry.get_value(), exists_ok=True)
+        )
 
         return True
 
@@ -372,7 +404,8 @@ class Tool(ToolSpec, Protocol):
         """
         config_spec = self.config_spec()
 
-        first_removal = True
+        # The removals are collected per file and applied in a single patch each.
+        ops_by_relative_path: dict[Path, list[DeleteValue]] = {}
         for config_item in config_spec.config_items:
             if not config_item.managed:
                 continue
@@ -382,21 +415,71 @@ class Tool(ToolSpec, Protocol):
                 file_manager,
             ) in config_spec.file_manager_by_relative_path.items():
                 if file_manager.path in config_item.paths:
-                    if not (file_manager.path.exists() and file_manager.path.is_file()):
+                    if not (
+                        fs.exists(file_manager.path) and fs.is_file(file_manager.path)
+                    ):
                         # This is mostly for the sake of the first_removal message
                         continue
 
                     entry = config_item.root[relative_path]
-                    try:
-                        del file_manager[entry.keys]
-                    except KeyError:
-                        pass
-                    else:
-                        if first_removal:
-                            tick_print(
-                                f"Removing {self.name} config from '{relative_path}'."
-                            )
-                            first_removal = False
+                    if entry.keys in file_manager:
+                        # N.B. an earlier removal might have removed this value too.
+                        ops_by_relative_path.setdefault(relative_path, []).append(
+                            DeleteValue(keys=entry.keys, missing_ok=True)
+                        )
+
+        if ops_by_relative_path:
+            (first_relative_path, *_) = ops_by_relative_path
+            tick_print(
+                f"Removing {self.name} config from '{first_relative_path}'.",
+                file=first_relative_path.as_posix(),
+                tool=self.name,
+            )
+        for relative_path, ops in ops_by_relative_path.items():
+            config_spec.file_manager_by_relative_path[relative_path].patch(ops)
+
+    def sync_derived_configs(self) -> bool:
+        """Update the tool's derived configuration to match the current project state.
+
+        Derived configuration (see `ConfigItem.derived`) is only updated where it is
+        already present; it is never added, so this has no effect on projects which
+        don't use the tool.
+
+        Returns:
+            True if any configuration was updated, False if it was already up to date.
+        """
+        active_config_file_managers = self.get_active_config_file_managers()
+
+        pending_ops: dict[KeyValueFileManager[Document], list[SetValue]] = {}
+        for config_item in self.config_spec().config_items:
+            if not config_item.derived:
+                continue
+
+            for file_manager in active_config_file_managers:
+                entry = config_item.root.get(file_manager.relative_path)
+                if entry is None or entry.keys not in file_manager:
+                    continue
+
+                value = entry.get_value()
+                if (
+                    isinstance(value, NoConfigValue)
+                    or file_manager[entry.keys] == value
+                ):
+                    continue
+
+                pending_ops.setdefault(file_manager, []).append(
+                    SetValue(keys=entry.keys, value=value, exists_ok=True)
+                )
+
+        for file_manager, ops in pending_ops.items():
+            tick_print(
+                f"Updating {self.name} config in '{file_manager.relative_path}'.",
+                file=file_manager.relative_path.as_posix(),
+                tool=self.name,
+            )
+            file_manager.patch(ops)
+
+        return bool(pending_ops)
 
     def remove_managed_files(self) -> None:
         """Remove all files managed by this tool.
@@ -405,11 +488,10 @@ class Tool(ToolSpec, Protocol):
         If no files exist, this method has no effect.
         """
         for file in self.managed_files:
-            if (usethis_config.cpd() / file).exists() and (
-                usethis_config.cpd() / file
-            ).is_file():
-                tick_print(f"Removing '{file}'.")
-                file.unlink()
+            path = usethis_config.cpd() / file
+            if fs.exists(path) and fs.is_file(path):
+                tick_print(f"Removing '{file}'.", file=file.as_posix(), tool=self.name)
+                fs.unlink(path)
 
     def get_install_method(self) -> Literal["devdep", "pre-commit"] | None:
         """Infer the method used to install the tool, return None if uninstalled.
@@ -478,7 +560,9 @@ class Tool(ToolSpec, Protocol):
             remove_str = ", ".join([f"'{rule}'" for rule in reconciliation.to_remove])
             s = "" if len(reconciliation.to_remove) == 1 else "s"
             tick_print(
-                f"Deselecting {self.name} rule{s} {remove_str} in '{file_manager.name}'."
+                f"Deselecting {self.name} rule{s} {remove_str} in '{file_manager.name}'.",
+                file=file_manager.relative_path.as_posix(),
+                tool=self.name,
             )
             file_manager.remove_from_list(keys=keys, values=reconciliation.to_remove)
 
@@ -486,7 +570,9 @@ class Tool(ToolSpec, Protocol):
             add_str = ", ".join([f"'{rule}'" for rule in reconciliation.to_add])
             s = "" if len(reconciliation.to_add) == 1 else "s"
             tick_print(
-                f"Selecting {self.name} rule{s} {add_str} in '{file_manager.name}'."
+                f"Selecting {self.name} rule{s} {add_str} in '{file_manager.name}'.",
+                file=file_manager.relative_path.as_posix(),
+                tool=self.name,
             )
             file_manager.extend_list(keys=keys, values=reconciliation.to_add)
 
@@ -547,7 +633,9 @@ class Tool(ToolSpec, Protocol):
             remove_str = ", ".join([f"'{rule}'" for rule in reconciliation.to_remove])
             s = "" if len(reconciliation.to_remove) == 1 else "s"
             tick_print(
-                f"No longer ignoring {self.name} rule{s} {remove_str} in '{file_manager.name}'."
+                f"No longer ignoring {self.name} rule{s} {remove_str} in '{file_manager.name}'.",
+                file=file_manager.relative_path.as_posix(),
+                tool=self.name,
             )
             file_manager.remove_from_list(keys=keys, values=reconciliation.to_remove)
 
@@ -555,7 +643,9 @@ class Tool(ToolSpec, Protocol):
             add_str = ", ".join([f"'{rule}'" for rule in reconciliation.to_add])
             s = "" if len(reconciliation.to_add) == 1 else "s"
             tick_print(
-                f"Ignoring {self.name} rule{s} {add_str} in '{file_manager.name}'."
+                f"Ignoring {self.name} rule{s} {add_str} in '{file_manager.name}'.",
+                file=file_manager.relative_path.as_posix(),
+                tool=self.name,
             )
             file_manager.extend_list(keys=keys, values=reconciliation.to_add)
 
@@ -585,7 +675,9 @@ class Tool(ToolSpec, Protocol):
         (file_manager,) = self.get_active_config_file_managers()
         ensure_managed_file_exists(file_manager)
         tick_print(
-            f"No longer ignoring {self.name} rule{s} {rules_str} in '{file_manager.name}'."
+            f"No longer ignoring {self.name} rule{s} {rules_str} in '{file_manager.name}'.",
+            file=file_manager.relative_path.as_posix(),
+            tool=self.name,
         )
         keys = self._get_ignore_keys(file_manager)
         file_manager.remove_from_list(keys=keys, values=rules)
@@ -615,9 +707,39 @@ class Tool(ToolSpec, Protocol):
         (file_manager,) = self.get_active_config_file_managers()
         ensure_managed_file_exists(file_manager)
         tick_print(
-            f"Deselecting {self.name} rule{s} {rules_str} in '{file_manager.name}'."
+            f"Deselecting {self.name} rule{s} {rules_str} in '{file_manager.name}'.",
+            file=file_manager.relative_path.as_posix(),
+            tool=self.name,
         )
         keys = self._get_select_keys(file_manager)
         file_manager.remove_from_list(keys=keys, values=rules)
 
         return True
+
+
+def _has_keys(
+    file_manager: KeyValueFileManager[Document],
+    keys: Sequence[Key],
+    *,
+    pending_ops: Sequence[SetValue] | None,
+) -> bool:
+    """Check whether a file has a value at the given keys, including pending changes."""
+    if keys in file_manager:
+        return True
+
+    for op in pending_ops or []:
+        if list(op.keys[: len(keys)]) == list(keys):
+            # The pending value is at (or nested under) the keys.
+            return True
+
+        if list(keys[: len(op.keys)]) == list(op.keys):
+            # The keys are nested under the pending value, so look inside it.
+            value = op.value
+            for key in keys[len(op.keys) :]:
+                if not isinstance(value, dict) or key not in value:
+                    break
+                value = value[key]
+            else:
+                return True
+
+    return False
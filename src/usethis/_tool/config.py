@@ -2,27 +2,28 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from pathlib import Path
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal, TypeAlias
 
-from pydantic import BaseModel, InstanceOf
-
 from usethis._config import usethis_config
-from usethis._file.manager import Document, KeyValueFileManager
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
-from usethis._file.types_ import Key
 from usethis._init import ensure_pyproject_toml
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
     from typing_extensions import Self
 
-    from usethis._file.manager import FileManager
+    from usethis._file.manager import Document, FileManager, KeyValueFileManager
+    from usethis._file.types_ import Key
 
 ResolutionT: TypeAlias = Literal["first", "first_content", "bespoke"]
 
 
-class ConfigSpec(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ConfigSpec:
     """Specification of configuration files for a tool.
 
     Attributes:
@@ -43,7 +44,7 @@ class ConfigSpec(BaseModel):
         config_items: A list of configuration items that can be managed by the tool.
     """
 
-    file_manager_by_relative_path: dict[Path, InstanceOf[KeyValueFileManager[Document]]]
+    file_manager_by_relative_path: dict[Path, KeyValueFileManager[Document]]
     resolution: ResolutionT
     config_items: list[ConfigItem]
 
@@ -78,7 +79,7 @@ class ConfigSpec(BaseModel):
 
             for relative_path, entry in config_item.root.items():
                 file_manager = self.file_manager_by_relative_path[relative_path]
-                if not (file_manager.path.exists() and file_manager.path.is_file()):
+                if not (fs.exists(file_manager.path) and fs.is_file(file_manager.path)):
                     continue
 
                 if file_manager.__contains__(entry.keys):
@@ -95,7 +96,8 @@ def _get_no_config_value() -> NoConfigValue:
     return NoConfigValue()
 
 
-class ConfigEntry(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ConfigEntry:
     """A configuration entry in a config file associated with a tool.
 
     Attributes:
@@ -110,7 +112,8 @@ class ConfigEntry(BaseModel):
     get_value: Callable[[], object] = _get_no_config_value
 
 
-class ConfigItem(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ConfigItem:
     """A config item which can potentially live in different files.
 
     Attributes:
@@ -135,6 +138,9 @@ class ConfigItem(BaseModel):
                         we might have the [tool.coverage] section in pyproject.toml
                         but in tox.ini we have [coverage:run] and [coverage:report]
                         but no overall root [coverage] section.
+        derived: Whether the value is derived from the state of the project (e.g. its
+                 import graph), rather than being a fixed default. Existing derived
+                 config is kept up to date by `usethis watch`.
     """
 
     description: str | None = None
@@ -142,6 +148,7 @@ class ConfigItem(BaseModel):
     managed: bool = True
     force: bool = False
     applies_to_all: bool = True
+    derived: bool = False
 
     @property
     def paths(self) -> set[Path]:
@@ -153,6 +160,6 @@ def ensure_managed_file_exists(file_manager: FileManager[Document]) -> None:
     """Ensure a file manager's managed file exists."""
     if isinstance(file_manager, PyprojectTOMLManager):
         ensure_pyproject_toml()
-    elif not file_manager.path.exists():
+    elif not fs.exists(file_manager.path):
         # Create the file if it doesn't exist. By assumption, an empty file is valid.
-        file_manager.path.touch()
+        fs.touch(file_manager.path)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from usethis._console import warn_print
+from usethis._file.snapshot import get_project_snapshot
 from usethis.errors import FileConfigError
 
 if TYPE_CHECKING:
@@ -29,7 +30,8 @@ def is_likely_used(tool_spec: ToolSpec) -> bool:
     decode_err_by_name: dict[str, FileConfigError] = {}
     _is_used = False
 
-    _is_used = any(file.exists() and file.is_file() for file in tool_spec.managed_files)
+    snapshot = get_project_snapshot()
+    _is_used = any(snapshot.is_file(file) for file in tool_spec.managed_files)
 
     if not _is_used:
         try:
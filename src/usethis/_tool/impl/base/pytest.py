@@ -6,9 +6,9 @@ from typing import TYPE_CHECKING, final
 
 from typing_extensions import override
 
-from usethis._config import usethis_config
 from usethis._console import how_print
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+from usethis._file.snapshot import get_project_snapshot
 from usethis._integrations.project.layout import get_tests_dir_str
 from usethis._tool.base import Tool
 from usethis._tool.heuristics import is_likely_used
@@ -61,12 +61,12 @@ class PytestTool(PytestToolSpec, Tool):
         # Also, the docs mention that the hidden .pytest.ini variant is allowed, in my
         # experimentation is takes precedence over pyproject.toml but not pytest.ini.
 
+        snapshot = get_project_snapshot()
         for (
             relative_path,
             file_manager,
         ) in config_spec.file_manager_by_relative_path.items():
-            path = usethis_config.cpd() / relative_path
-            if path.exists() and path.is_file():
+            if snapshot.is_file(relative_path):
                 if isinstance(file_manager, PyprojectTOMLManager):
                     if ["tool", "pytest", "ini_options"] in file_manager:
                         return {file_manager}
@@ -79,11 +79,8 @@ class PytestTool(PytestToolSpec, Tool):
             relative_path,
             file_manager,
         ) in config_spec.file_manager_by_relative_path.items():
-            path = usethis_config.cpd() / relative_path
-            if (
-                path.exists()
-                and path.is_file()
-                and isinstance(file_manager, PyprojectTOMLManager)
+            if snapshot.is_file(relative_path) and isinstance(
+                file_manager, PyprojectTOMLManager
             ):
                 return {file_manager}
 
@@ -9,6 +9,7 @@ from typing_extensions import assert_never, override
 from usethis._backend.dispatch import get_backend
 from usethis._config import usethis_config
 from usethis._console import how_print
+from usethis._file import fs
 from usethis._tool.base import Tool
 from usethis._tool.impl.spec.requirements_txt import RequirementsTxtToolSpec
 from usethis._types.backend import BackendEnum
@@ -34,7 +35,7 @@ class RequirementsTxtTool(RequirementsTxtToolSpec, Tool):
             if backend is BackendEnum.uv:
                 how_print(f"Run 'uv export -o={name}' to write '{name}'.")
             elif backend in (BackendEnum.poetry, BackendEnum.none):
-                if not (usethis_config.cpd() / name).exists():
+                if not fs.exists(usethis_config.cpd() / name):
                     if name == "requirements.txt":
                         cmd = "usethis tool requirements.txt"
                     else:
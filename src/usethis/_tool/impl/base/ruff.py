@@ -18,6 +18,7 @@ from usethis._config import usethis_config
 from usethis._config_file import DotRuffTOMLManager, RuffTOMLManager
 from usethis._console import how_print, tick_print
 from usethis._fallback import FALLBACK_RUFF_VERSION
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._integrations.pre_commit import schema as pre_commit_schema
 from usethis._integrations.project.layout import get_tests_dir_str
@@ -255,7 +256,7 @@ class RuffTool(RuffToolSpec, Tool):
         ):
             # Only add test-related directory ignore rules if the tests directory exists
             tests_dir = get_tests_dir_str()
-            if (usethis_config.cpd() / tests_dir).exists():
+            if fs.exists(usethis_config.cpd() / tests_dir):
                 self.ignore_rules_in_glob(
                     rule_config.tests_ignored, glob=f"{tests_dir}/**"
                 )
@@ -31,7 +31,7 @@ ALL_TOOL_SPECS: list[
     | TachToolSpec
     | TyToolSpec
 ] = [
-    # Alphabetical order, matching ALL_TOOLS in usethis._tool.all_
+    # Alphabetical order, matching TOOL_REGISTRY in usethis._tool.registry
     CodespellToolSpec(),
     CoveragePyToolSpec(),
     DeptryToolSpec(),
@@ -10,6 +10,7 @@ from typing_extensions import override
 from usethis._config import usethis_config
 from usethis._config_file import DotCodespellRCManager
 from usethis._fallback import FALLBACK_CODESPELL_VERSION
+from usethis._file import fs
 from usethis._file.pyproject_toml.errors import PyprojectTOMLNotFoundError
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._file.pyproject_toml.requires_python import (
@@ -42,7 +43,7 @@ class CodespellToolSpec(ToolSpec):
     @override
     @final
     def preferred_file_manager(self) -> KeyValueFileManager[Document]:
-        if (usethis_config.cpd() / "pyproject.toml").exists():
+        if fs.exists(usethis_config.cpd() / "pyproject.toml"):
             return PyprojectTOMLManager()
         return DotCodespellRCManager()
 
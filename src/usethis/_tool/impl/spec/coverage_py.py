@@ -13,6 +13,7 @@ from usethis._config_file import (
     DotCoverageRCTOMLManager,
     ToxINIManager,
 )
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._file.setup_cfg.io_ import SetupCFGManager
 from usethis._integrations.project.layout import get_source_dir_str
@@ -37,7 +38,7 @@ class CoveragePyToolSpec(ToolSpec):
     @override
     @final
     def preferred_file_manager(self) -> KeyValueFileManager[Document]:
-        if (usethis_config.cpd() / "pyproject.toml").exists():
+        if fs.exists(usethis_config.cpd() / "pyproject.toml"):
             return PyprojectTOMLManager()
         return DotCoverageRCManager()
 
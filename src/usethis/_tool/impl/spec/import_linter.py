@@ -12,13 +12,13 @@ from typing_extensions import override
 from usethis._config import usethis_config
 from usethis._config_file import DotImportLinterManager
 from usethis._console import warn_print
+from usethis._file import fs
 from usethis._file.ini.io_ import INIFileManager
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._file.setup_cfg.io_ import SetupCFGManager
-from usethis._integrations.project.errors import ImportGraphBuildFailedError
 from usethis._integrations.project.imports import (
     LayeredArchitecture,
-    get_layered_architectures,
+    get_layered_architectures_by_root_package,
 )
 from usethis._integrations.project.name import get_project_name
 from usethis._integrations.project.packages import get_importable_packages
@@ -64,7 +64,7 @@ class ImportLinterToolSpec(ToolSpec):
     @override
     @final
     def preferred_file_manager(self) -> KeyValueFileManager[Document]:
-        if (usethis_config.cpd() / "pyproject.toml").exists():
+        if fs.exists(usethis_config.cpd() / "pyproject.toml"):
             return PyprojectTOMLManager()
         return DotImportLinterManager()
 
@@ -172,6 +172,7 @@ class ImportLinterToolSpec(ToolSpec):
                         ),
                     },
                     applies_to_all=False,
+                    derived=True,
                 )
             )
 
@@ -205,6 +206,7 @@ class ImportLinterToolSpec(ToolSpec):
                             get_value=get_root_packages,
                         ),
                     },
+                    derived=True,
                 ),
                 ConfigItem(
                     description="Listed Contracts",
@@ -225,6 +227,7 @@ class ImportLinterToolSpec(ToolSpec):
                         ),
                     },
                     applies_to_all=False,
+                    derived=True,
                 ),
                 *ini_contracts_config_items,
             ],
@@ -271,12 +274,10 @@ class ImportLinterToolSpec(ToolSpec):
         layered_architecture_by_module_by_root_package: dict[
             str, dict[str, LayeredArchitecture]
         ] = {}
-        for root_package in root_packages:
-            try:
-                layered_architecture_by_module = get_layered_architectures(root_package)
-            except ImportGraphBuildFailedError:
-                layered_architecture_by_module: dict[str, LayeredArchitecture] = {}
-
+        for (
+            root_package,
+            layered_architecture_by_module,
+        ) in get_layered_architectures_by_root_package(root_packages).items():
             if not layered_architecture_by_module:
                 layered_architecture_by_module = {
                     root_package: LayeredArchitecture(layers=[], excluded=set())
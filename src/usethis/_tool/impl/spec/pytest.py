@@ -10,6 +10,7 @@ from typing_extensions import assert_never, override
 from usethis._backend.uv.detect import is_uv_used
 from usethis._config import usethis_config
 from usethis._config_file import DotPytestINIManager, PytestINIManager, ToxINIManager
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._file.setup_cfg.io_ import SetupCFGManager
 from usethis._integrations.project.build import has_pyproject_toml_declared_build_system
@@ -47,7 +48,7 @@ class PytestToolSpec(ToolSpec):
     @override
     @final
     def preferred_file_manager(self) -> KeyValueFileManager[Document]:
-        if (usethis_config.cpd() / "pyproject.toml").exists():
+        if fs.exists(usethis_config.cpd() / "pyproject.toml"):
             return PyprojectTOMLManager()
         return PytestINIManager()
 
@@ -9,6 +9,7 @@ from typing_extensions import override
 
 from usethis._config import usethis_config
 from usethis._config_file import DotRuffTOMLManager, RuffTOMLManager
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._tool.base import ToolMeta, ToolSpec
 from usethis._tool.config import ConfigEntry, ConfigItem, ConfigSpec
@@ -65,7 +66,7 @@ class RuffToolSpec(ToolSpec):
     @override
     @final
     def preferred_file_manager(self) -> KeyValueFileManager[Document]:
-        if (usethis_config.cpd() / "pyproject.toml").exists():
+        if fs.exists(usethis_config.cpd() / "pyproject.toml"):
             return PyprojectTOMLManager()
         return RuffTOMLManager()
 
@@ -10,10 +10,9 @@ from typing_extensions import override
 
 from usethis._config_file import TachTOMLManager
 from usethis._console import warn_print
-from usethis._integrations.project.errors import ImportGraphBuildFailedError
 from usethis._integrations.project.imports import (
     LayeredArchitecture,
-    get_layered_architectures,
+    get_layered_architectures_by_root_package,
 )
 from usethis._integrations.project.layout import get_source_dir_str, get_tests_dir_str
 from usethis._integrations.project.name import get_project_name
@@ -136,6 +135,7 @@ class TachToolSpec(ToolSpec):
                         get_value=lambda: [source_root],
                     ),
                 },
+                derived=True,
             ),
             ConfigItem(
                 description="Exclude patterns",
@@ -165,6 +165,7 @@ class TachToolSpec(ToolSpec):
                             get_value=lambda: all_layer_names,
                         ),
                     },
+                    derived=True,
                 ),
             )
 
@@ -178,6 +179,7 @@ class TachToolSpec(ToolSpec):
                             get_value=lambda: modules,
                         ),
                     },
+                    derived=True,
                 ),
             )
 
@@ -200,12 +202,10 @@ class TachToolSpec(ToolSpec):
         layered_architecture_by_module_by_root_package: dict[
             str, dict[str, LayeredArchitecture]
         ] = {}
-        for root_package in root_packages:
-            try:
-                layered_architecture_by_module = get_layered_architectures(root_package)
-            except ImportGraphBuildFailedError:
-                layered_architecture_by_module: dict[str, LayeredArchitecture] = {}
-
+        for (
+            root_package,
+            layered_architecture_by_module,
+        ) in get_layered_architectures_by_root_package(root_packages).items():
             if not layered_architecture_by_module:
                 layered_architecture_by_module = {
                     root_package: LayeredArchitecture(layers=[], excluded=set())
@@ -9,6 +9,7 @@ from typing_extensions import override
 
 from usethis._config import usethis_config
 from usethis._config_file import DotTyTOMLManager, TyTOMLManager
+from usethis._file import fs
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._integrations.project.layout import get_source_dir_str, get_tests_dir_str
 from usethis._integrations.project.packages import get_importable_packages
@@ -35,7 +36,7 @@ class TyToolSpec(ToolSpec):
     @override
     @final
     def preferred_file_manager(self) -> KeyValueFileManager[Document]:
-        if (usethis_config.cpd() / "pyproject.toml").exists():
+        if fs.exists(usethis_config.cpd() / "pyproject.toml"):
             return PyprojectTOMLManager()
         return TyTOMLManager()
 
@@ -0,0 +1,169 @@
+"""Lazy registry of all available tools, indexed by name.
+
+Importing the tool implementations is relatively expensive, so the registry holds static
+metadata about each tool, which is enough to decide whether a tool could be relevant
+without importing it. The implementation is only imported when the tool is loaded.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from usethis._tool.rule import RuleConfig
+
+if TYPE_CHECKING:
+    from usethis._tool.all_ import SupportedToolType
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ToolRegistration:
+    """Static metadata about a tool, available without importing its implementation.
+
+    These should match the tool itself in its default configuration, independent of the
+    current project (see the respective `ToolSpec` properties and methods).
+
+    Attributes:
+        name: The name of the tool, for display purposes.
+        module: The module containing the tool's implementation.
+        class_name: The name of the tool's implementation class within its module.
+        url: The URL of the tool's documentation or repository.
+        managed_files: (Relative) paths to files managed by (solely) this tool.
+        hook_ids: The IDs of all the tool's characteristic pre-commit hooks, in any
+                  configuration.
+        rule_config: The linter rule configuration associated with the tool.
+    """
+
+    name: str
+    module: str
+    class_name: str
+    url: str
+    managed_files: tuple[Path, ...] = ()
+    hook_ids: tuple[str, ...] = ()
+    rule_config: RuleConfig = field(default_factory=RuleConfig)
+
+    @property
+    def command(self) -> str:
+        """The name of the CLI command for the tool, e.g. `usethis tool <command>`."""
+        return self.name.lower().replace(" ", "-")
+
+    def load(self) -> SupportedToolType:
+        """Import the tool's implementation, and get an instance of the tool."""
+        module = importlib.import_module(self.module)
+        return cast("SupportedToolType", getattr(module, self.class_name)())
+
+
+TOOL_REGISTRY: dict[str, ToolRegistration] = {
+    registration.name: registration
+    for registration in [
+        # Alphabetical order
+        ToolRegistration(
+            name="Codespell",
+            module="usethis._tool.impl.base.codespell",
+            class_name="CodespellTool",
+            url="https://github.com/codespell-project/codespell",
+            managed_files=(Path(".codespellrc"),),
+            hook_ids=("codespell",),
+        ),
+        ToolRegistration(
+            name="Coverage.py",
+            module="usethis._tool.impl.base.coverage_py",
+            class_name="CoveragePyTool",
+            url="https://github.com/nedbat/coveragepy",
+            managed_files=(Path(".coveragerc"), Path(".coveragerc.toml")),
+        ),
+        ToolRegistration(
+            name="deptry",
+            module="usethis._tool.impl.base.deptry",
+            class_name="DeptryTool",
+            url="https://github.com/osprey-oss/deptry",
+            hook_ids=("deptry",),
+        ),
+        ToolRegistration(
+            name="Import Linter",
+            module="usethis._tool.impl.base.import_linter",
+            class_name="ImportLinterTool",
+            url="https://github.com/seddonym/import-linter",
+            managed_files=(Path(".importlinter"),),
+            hook_ids=("import-linter",),
+            rule_config=RuleConfig(
+                unmanaged_selected=["INP"], tests_unmanaged_ignored=["INP"]
+            ),
+        ),
+        ToolRegistration(
+            name="MkDocs",
+            module="usethis._tool.impl.base.mkdocs",
+            class_name="MkDocsTool",
+            url="https://www.mkdocs.org/",
+            managed_files=(Path("mkdocs.yml"),),
+        ),
+        ToolRegistration(
+            name="pre-commit",
+            module="usethis._tool.impl.base.pre_commit",
+            class_name="PreCommitTool",
+            url="https://github.com/pre-commit/pre-commit",
+            managed_files=(Path(".pre-commit-config.yaml"),),
+            hook_ids=("sync-with-uv",),
+        ),
+        ToolRegistration(
+            name="pyproject-fmt",
+            module="usethis._tool.impl.base.pyproject_fmt",
+            class_name="PyprojectFmtTool",
+            url="https://github.com/tox-dev/toml-fmt/tree/main/pyproject-fmt",
+            hook_ids=("pyproject-fmt",),
+        ),
+        ToolRegistration(
+            name="pyproject.toml",
+            module="usethis._tool.impl.base.pyproject_toml",
+            class_name="PyprojectTOMLTool",
+            url="https://packaging.python.org/en/latest/guides/writing-pyproject-toml/",
+            managed_files=(Path("pyproject.toml"),),
+        ),
+        ToolRegistration(
+            name="pytest",
+            module="usethis._tool.impl.base.pytest",
+            class_name="PytestTool",
+            url="https://github.com/pytest-dev/pytest",
+            managed_files=(
+                Path(".pytest.ini"),
+                Path("pytest.ini"),
+                Path("tests/conftest.py"),
+            ),
+            rule_config=RuleConfig(selected=["PT"], nontests_unmanaged_ignored=["PT"]),
+        ),
+        ToolRegistration(
+            name="requirements.txt",
+            module="usethis._tool.impl.base.requirements_txt",
+            class_name="RequirementsTxtTool",
+            url="https://pip.pypa.io/en/stable/reference/requirements-file-format/",
+            managed_files=(Path("requirements.txt"),),
+            hook_ids=("uv-export",),
+        ),
+        ToolRegistration(
+            name="Ruff",
+            module="usethis._tool.impl.base.ruff",
+            class_name="RuffTool",
+            url="https://github.com/astral-sh/ruff",
+            managed_files=(Path(".ruff.toml"), Path("ruff.toml")),
+            hook_ids=("ruff-check", "ruff-format"),
+        ),
+        ToolRegistration(
+            name="Tach",
+            module="usethis._tool.impl.base.tach",
+            class_name="TachTool",
+            url="https://github.com/gauge-sh/tach",
+            managed_files=(Path("tach.toml"),),
+            hook_ids=("tach",),
+        ),
+        ToolRegistration(
+            name="ty",
+            module="usethis._tool.impl.base.ty",
+            class_name="TyTool",
+            url="https://docs.astral.sh/ty/",
+            managed_files=(Path("ty.toml"), Path(".ty.toml")),
+            hook_ids=("ty",),
+        ),
+    ]
+}
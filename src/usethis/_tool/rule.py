@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, TypeAlias
 
-from pydantic import BaseModel, Field
 from typing_extensions import override
 
 if TYPE_CHECKING:
@@ -104,7 +103,8 @@ def reconcile_rules(
     )
 
 
-class RuleConfig(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RuleConfig:
     """Configuration for linter rules associated with a tool.
 
     There is a distinction between selected and ignored rules. Selected rules are those
@@ -132,14 +132,14 @@ class RuleConfig(BaseModel):
                                     non-test directories (using !tests/**/*.py glob).
     """
 
-    selected: list[Rule] = Field(default_factory=list)
-    ignored: list[Rule] = Field(default_factory=list)
-    unmanaged_selected: list[Rule] = Field(default_factory=list)
-    unmanaged_ignored: list[Rule] = Field(default_factory=list)
-    tests_ignored: list[Rule] = Field(default_factory=list)
-    nontests_ignored: list[Rule] = Field(default_factory=list)
-    tests_unmanaged_ignored: list[Rule] = Field(default_factory=list)
-    nontests_unmanaged_ignored: list[Rule] = Field(default_factory=list)
+    selected: list[Rule] = field(default_factory=list)
+    ignored: list[Rule] = field(default_factory=list)
+    unmanaged_selected: list[Rule] = field(default_factory=list)
+    unmanaged_ignored: list[Rule] = field(default_factory=list)
+    tests_ignored: list[Rule] = field(default_factory=list)
+    nontests_ignored: list[Rule] = field(default_factory=list)
+    tests_unmanaged_ignored: list[Rule] = field(default_factory=list)
+    nontests_unmanaged_ignored: list[Rule] = field(default_factory=list)
 
     def get_all_selected(self) -> list[Rule]:
         """Get all (project-scope) selected rules."""
@@ -155,16 +155,13 @@ class RuleConfig(BaseModel):
         This is useful for cases where we are introducing pytest into a project, and
         then we want to introduce specifically this subset of rules.
         """
-        self = self.model_copy()
-        self.selected = []
-        self.ignored = []
-        self.unmanaged_selected = []
-        self.unmanaged_ignored = []
         # tests_ignored, nontests_ignored, tests_unmanaged_ignored, and
         # nontests_unmanaged_ignored are preserved because they are per-file-ignores
         # specific to test directories and should not be cleared when removing global
         # rules.
-        return self
+        return replace(
+            self, selected=[], ignored=[], unmanaged_selected=[], unmanaged_ignored=[]
+        )
 
     @property
     def empty(self) -> bool:
@@ -229,17 +226,18 @@ class RuleConfig(BaseModel):
             )
             raise NotImplementedError(msg)
 
-        new = self.model_copy()
-        new.selected = self.selected + other.selected
-        new.ignored = self.ignored + other.ignored
-        new.unmanaged_selected = self.unmanaged_selected + other.unmanaged_selected
-        new.unmanaged_ignored = self.unmanaged_ignored + other.unmanaged_ignored
-        new.tests_ignored = self.tests_ignored + other.tests_ignored
-        new.nontests_ignored = self.nontests_ignored + other.nontests_ignored
-        new.tests_unmanaged_ignored = (
-            self.tests_unmanaged_ignored + other.tests_unmanaged_ignored
-        )
-        new.nontests_unmanaged_ignored = (
-            self.nontests_unmanaged_ignored + other.nontests_unmanaged_ignored
+        return replace(
+            self,
+            selected=self.selected + other.selected,
+            ignored=self.ignored + other.ignored,
+            unmanaged_selected=self.unmanaged_selected + other.unmanaged_selected,
+            unmanaged_ignored=self.unmanaged_ignored + other.unmanaged_ignored,
+            tests_ignored=self.tests_ignored + other.tests_ignored,
+            nontests_ignored=self.nontests_ignored + other.nontests_ignored,
+            tests_unmanaged_ignored=(
+                self.tests_unmanaged_ignored + other.tests_unmanaged_ignored
+            ),
+            nontests_unmanaged_ignored=(
+                self.nontests_unmanaged_ignored + other.nontests_unmanaged_ignored
+            ),
         )
-        return new
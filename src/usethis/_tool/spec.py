@@ -8,9 +8,9 @@ from typing import TYPE_CHECKING, Protocol, final
 
 from typing_extensions import assert_never
 
-from usethis._config import usethis_config
 from usethis._deps import is_dep_in_any_group
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+from usethis._file.snapshot import get_project_snapshot
 from usethis._integrations.pre_commit.hooks import get_hook_ids, hook_ids_are_equivalent
 from usethis._tool.config import ConfigSpec
 from usethis._tool.pre_commit import PreCommitConfig
@@ -125,6 +125,7 @@ class ToolSpec(Protocol, metaclass=ABCMeta):
         *,
         file_manager_by_relative_path: dict[Path, KeyValueFileManager[Document]],
     ) -> set[KeyValueFileManager[Document]]:
+        snapshot = get_project_snapshot()
         if resolution == "first":
             # N.B. keep this roughly in sync with the bespoke logic for pytest
             # since that logic is based on this logic.
@@ -132,14 +133,12 @@ class ToolSpec(Protocol, metaclass=ABCMeta):
                 relative_path,
                 file_manager,
             ) in file_manager_by_relative_path.items():
-                path = usethis_config.cpd() / relative_path
-                if path.exists() and path.is_file():
+                if snapshot.is_file(relative_path):
                     return {file_manager}
         elif resolution == "first_content":
             config_spec = self.config_spec()
             for relative_path, file_manager in file_manager_by_relative_path.items():
-                path = usethis_config.cpd() / relative_path
-                if path.exists() and path.is_file():
+                if snapshot.is_file(relative_path):
                     # We check whether any of the managed config exists
                     for config_item in config_spec.config_items:
                         if config_item.root[relative_path].keys in file_manager:
@@ -1,12 +1,20 @@
 """Dependency model definitions."""
 
-from pydantic import BaseModel
+from dataclasses import dataclass, field
+
 from typing_extensions import override
 
 
-class Dependency(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Dependency:
     name: str
     extras: frozenset[str] = frozenset()
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_hash", hash((self.__class__.__name__, self.name, self.extras))
+        )
 
     @override
     def __str__(self) -> str:
@@ -14,7 +22,7 @@ class Dependency(BaseModel):
 
     @override
     def __hash__(self) -> int:
-        return hash((self.__class__.__name__, self.name, self.extras))
+        return self._hash
 
     def to_requirement_string(self) -> str:
         """Convert the dependency to a requirements string."""
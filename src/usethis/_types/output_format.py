@@ -0,0 +1,8 @@
+"""Machine-readable output format enumeration."""
+
+from enum import Enum
+
+
+class OutputFormatEnum(Enum):
+    json = "json"
+    ndjson = "ndjson"
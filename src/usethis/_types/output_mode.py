@@ -0,0 +1,16 @@
+"""Console output mode enumeration."""
+
+from enum import Enum
+
+
+class OutputModeEnum(Enum):
+    """Enumeration of the ways usethis can write messages to the console.
+
+    "auto" uses Rich's styled output when standard output is an interactive terminal,
+    and plain text otherwise. "ndjson" writes a JSON object per message, for tooling.
+    """
+
+    auto = "auto"
+    rich = "rich"
+    plain = "plain"
+    ndjson = "ndjson"
@@ -13,6 +13,7 @@ import usethis._ui.interface.hook
 import usethis._ui.interface.init
 import usethis._ui.interface.lint
 import usethis._ui.interface.list
+import usethis._ui.interface.main
 import usethis._ui.interface.readme
 import usethis._ui.interface.rule
 import usethis._ui.interface.show
@@ -22,6 +23,7 @@ import usethis._ui.interface.test
 import usethis._ui.interface.tool
 import usethis._ui.interface.typecheck
 import usethis._ui.interface.version
+import usethis._ui.interface.watch
 
 app = typer.Typer(
     help=(
@@ -29,6 +31,9 @@ app = typer.Typer(
     ),
     add_completion=False,
 )
+app.callback()(
+    usethis._ui.interface.main.main,
+)
 
 rich_help_panel = "Start a New Project"
 app.command(
@@ -110,6 +115,12 @@ app.command(
 )(
     usethis._ui.interface.status.status,
 )
+app.command(
+    help="Watch the project, and sync derived configuration when files change.",
+    rich_help_panel=rich_help_panel,
+)(
+    usethis._ui.interface.watch.watch,
+)
 
 rich_help_panel = "Manage the README"
 app.add_typer(
@@ -25,6 +25,7 @@ def arch(
     """Add recommended architecture analysis tools to the project."""
     from usethis._config_file import files_manager
     from usethis._console import err_print
+    from usethis._integrations.project.imports import import_graph_cache
     from usethis._toolset.arch import use_arch_tools
     from usethis.errors import UsethisError
 
@@ -33,6 +34,7 @@ def arch(
             offline=offline, quiet=quiet, frozen=frozen, backend=backend
         ),
         files_manager(),
+        import_graph_cache(),
     ):
         try:
             use_arch_tools(remove=remove, how=how)
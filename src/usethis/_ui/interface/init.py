@@ -24,6 +24,7 @@ from usethis._ui.options import (
     init_path_arg,
     init_spellcheck_opt,
     init_status_opt,
+    init_template_cache_opt,
     init_test_opt,
     init_typecheck_opt,
     offline_opt,
@@ -47,6 +48,7 @@ def init(
     frozen: bool = frozen_opt,
     backend: BackendEnum = backend_opt,
     build_backend: BuildBackendEnum = init_build_backend_opt,
+    template_cache: Path | None = init_template_cache_opt,
     path: str | None = init_path_arg,
 ) -> None:
     """Initialize a new project with recommended tooling."""
@@ -54,6 +56,13 @@ def init(
     from usethis._console import err_print, instruct_print
     from usethis.errors import UsethisError
 
+    if path is not None and usethis_config.dry_run:
+        # The dry run only covers the current project directory.
+        err_print(
+            "A path cannot be given for a dry run; change to that directory instead."
+        )
+        raise typer.Exit(code=1)
+
     if path is not None:
         path_ = Path(path)
         if not path_.exists():
@@ -68,6 +77,7 @@ def init(
             frozen=frozen,
             backend=backend,
             build_backend=build_backend,
+            template_cache_dir=template_cache,
             project_dir=path,
         ),
         files_manager(),
@@ -108,6 +118,7 @@ def _init(  # noqa: PLR0915
     from usethis._core.readme import add_readme
     from usethis._core.status import use_development_status
     from usethis._init import project_init
+    from usethis._integrations.project.imports import import_graph_cache
     from usethis._toolset.arch import use_arch_tools
     from usethis._toolset.doc import use_doc_frameworks
     from usethis._toolset.format_ import use_formatters
@@ -117,53 +128,55 @@ def _init(  # noqa: PLR0915
     from usethis._toolset.test import use_test_frameworks
     from usethis._toolset.typecheck import use_typecheckers
 
-    project_init()
-    add_readme()
-
-    use_development_status(status)
-
-    if hook:
-        tick_print("Adding a recommended git hook framework.")
-        with usethis_config.set(instruct_only=True):
-            use_hook_framework()
-        use_hook_framework(how=True)
-
-    if doc:
-        tick_print("Adding recommended documentation tools.")
-        with usethis_config.set(instruct_only=True):
-            use_doc_frameworks()
-        use_doc_frameworks(how=True)
-    if lint:
-        tick_print("Adding recommended linters.")
-        with usethis_config.set(instruct_only=True):
-            use_linters()
-        use_linters(how=True)
-    if format_:
-        tick_print("Adding recommended formatters.")
-        with usethis_config.set(instruct_only=True):
-            use_formatters()
-        use_formatters(how=True)
-    if docstyle is not None:
-        tick_print(f"Setting docstring style to {docstyle.value}.")
-        with usethis_config.set(instruct_only=True):
-            use_docstyle(style=docstyle)
-    if spellcheck:
-        tick_print("Adding recommended spellcheckers.")
-        with usethis_config.set(instruct_only=True):
-            use_spellcheckers()
-        use_spellcheckers(how=True)
-    if test:
-        tick_print("Adding recommended test frameworks.")
-        with usethis_config.set(instruct_only=True):
-            use_test_frameworks()
-        use_test_frameworks(how=True)
-    if typecheck:
-        tick_print("Adding recommended type checkers.")
-        with usethis_config.set(instruct_only=True):
-            use_typecheckers()
-        use_typecheckers(how=True)
-    if arch:
-        tick_print("Adding recommended architecture analysis tools.")
-        with usethis_config.set(instruct_only=True):
-            use_arch_tools()
-        use_arch_tools(how=True)
+    # Import graphs are built once, and shared by the steps which need them.
+    with import_graph_cache():
+        project_init()
+        add_readme()
+
+        use_development_status(status)
+
+        if hook:
+            tick_print("Adding a recommended git hook framework.")
+            with usethis_config.set(instruct_only=True):
+                use_hook_framework()
+            use_hook_framework(how=True)
+
+        if doc:
+            tick_print("Adding recommended documentation tools.")
+            with usethis_config.set(instruct_only=True):
+                use_doc_frameworks()
+            use_doc_frameworks(how=True)
+        if lint:
+            tick_print("Adding recommended linters.")
+            with usethis_config.set(instruct_only=True):
+                use_linters()
+            use_linters(how=True)
+        if format_:
+            tick_print("Adding recommended formatters.")
+            with usethis_config.set(instruct_only=True):
+                use_formatters()
+            use_formatters(how=True)
+        if docstyle is not None:
+            tick_print(f"Setting docstring style to {docstyle.value}.")
+            with usethis_config.set(instruct_only=True):
+                use_docstyle(style=docstyle)
+        if spellcheck:
+            tick_print("Adding recommended spellcheckers.")
+            with usethis_config.set(instruct_only=True):
+                use_spellcheckers()
+            use_spellcheckers(how=True)
+        if test:
+            tick_print("Adding recommended test frameworks.")
+            with usethis_config.set(instruct_only=True):
+                use_test_frameworks()
+            use_test_frameworks(how=True)
+        if typecheck:
+            tick_print("Adding recommended type checkers.")
+            with usethis_config.set(instruct_only=True):
+                use_typecheckers()
+            use_typecheckers(how=True)
+        if arch:
+            tick_print("Adding recommended architecture analysis tools.")
+            with usethis_config.set(instruct_only=True):
+                use_arch_tools()
+            use_arch_tools(how=True)
@@ -0,0 +1,47 @@
+"""CLI options which apply to every command."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from usethis._config import usethis_config
+from usethis._types.output_mode import OutputModeEnum
+from usethis._ui.options import (
+    dry_run_opt,
+    lock_timeout_opt,
+    output_opt,
+    plan_file_opt,
+    subprocess_timeout_opt,
+)
+
+
+def main(
+    ctx: typer.Context,
+    dry_run: bool = dry_run_opt,
+    plan_file: Path | None = plan_file_opt,
+    output: OutputModeEnum = output_opt,
+    subprocess_timeout: float | None = subprocess_timeout_opt,
+    lock_timeout: float | None = lock_timeout_opt,
+) -> None:
+    """Apply options which affect whichever command is run."""
+    from usethis._console import err_print
+    from usethis._core.dry_run import dry_run as dry_run_context
+
+    # The output mode and timeouts last until the command has finished.
+    ctx.with_resource(
+        usethis_config.set(
+            output_mode=output,
+            subprocess_timeout=subprocess_timeout,
+            lock_timeout=lock_timeout,
+        )
+    )
+
+    if plan_file is not None and not dry_run:
+        err_print("The '--plan-file' option can only be used with '--dry-run'.")
+        raise typer.Exit(code=1)
+
+    if dry_run:
+        # The dry run lasts until the command has finished.
+        ctx.with_resource(dry_run_context(plan_file=plan_file))
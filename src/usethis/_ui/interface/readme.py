@@ -19,7 +19,8 @@ def readme(
     from usethis._config_file import files_manager
     from usethis._console import err_print
     from usethis._core.badge import (
-        add_badge,
+        Badge,
+        add_badges,
         get_pre_commit_badge,
         get_ruff_badge,
         get_usethis_badge,
@@ -35,16 +36,18 @@ def readme(
             add_readme()
 
             if badges:
+                badges_to_add: list[Badge] = []
                 if RuffTool().is_used():
-                    add_badge(get_ruff_badge())
+                    badges_to_add.append(get_ruff_badge())
 
                 if PreCommitTool().is_used():
-                    add_badge(get_pre_commit_badge())
+                    badges_to_add.append(get_pre_commit_badge())
 
                 if is_uv_used():
-                    add_badge(get_uv_badge())
+                    badges_to_add.append(get_uv_badge())
 
-                add_badge(get_usethis_badge())
+                badges_to_add.append(get_usethis_badge())
+                add_badges(badges_to_add)
         except UsethisError as err:
             err_print(err)
             raise typer.Exit(code=1) from None
@@ -5,12 +5,14 @@ from pathlib import Path
 import typer
 
 from usethis._config import usethis_config
+from usethis._types.output_format import OutputFormatEnum
 from usethis._ui.options import offline_opt, output_file_opt, quiet_opt
 
 app = typer.Typer(
     help="Show information about the current project.", add_completion=False
 )
 
+
 # show sonarqube options
 project_key_opt = typer.Option(
     None,
@@ -19,6 +21,47 @@ project_key_opt = typer.Option(
 )
 
 
+# show all options
+format_opt = typer.Option(
+    "json",
+    "--format",
+    help="The output format: 'json' for a single document, or 'ndjson' for one line per project.",
+)
+project_dirs_opt = typer.Option(
+    None,
+    "--project-dir",
+    help="A project directory to describe. Can be given several times. Defaults to the current directory.",
+)
+
+
+@app.command(
+    name="all",
+    help="Show every fact about the project (name, backend, license, SonarQube configuration and tool usage) as JSON.",
+)
+def all_(
+    offline: bool = offline_opt,
+    quiet: bool = quiet_opt,
+    output_format: OutputFormatEnum = format_opt,
+    project_dirs: list[Path] | None = project_dirs_opt,
+    output_file: Path | None = output_file_opt,
+) -> None:
+    """Show every fact about the project as JSON."""
+    from usethis._console import err_print
+    from usethis._core.show import show_all
+    from usethis.errors import UsethisError
+
+    with usethis_config.set(offline=offline, quiet=quiet):
+        try:
+            show_all(
+                project_dirs=project_dirs or [],
+                output_format=output_format,
+                output_file=output_file,
+            )
+        except UsethisError as err:
+            err_print(err)
+            raise typer.Exit(code=1) from None
+
+
 @app.command(help="Show the inferred project manager backend, e.g. 'uv' or 'none'.")
 def backend(
     offline: bool = offline_opt,
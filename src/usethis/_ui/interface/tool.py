@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 import typer
@@ -20,7 +21,9 @@ from usethis._ui.options import (
     offline_opt,
     quiet_opt,
     remove_opt,
+    requirements_txt_force_opt,
     requirements_txt_output_file_opt,
+    workspace_opt,
 )
 
 if TYPE_CHECKING:
@@ -42,6 +45,7 @@ def codespell(
     frozen: bool = frozen_opt,
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use the codespell spellchecker: detect common spelling mistakes."""
     from usethis._config_file import files_manager
@@ -57,7 +61,7 @@ def codespell(
         ),
         files_manager(),
     ):
-        _run_tool(use_codespell, remove=remove, how=how)
+        _run_tool(use_codespell, remove=remove, how=how, workspace=workspace)
 
 
 @app.command(
@@ -80,6 +84,7 @@ def coverage_py(
     frozen: bool = frozen_opt,
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use Coverage.py: a code coverage measurement tool."""
     from usethis._config_file import files_manager
@@ -95,7 +100,7 @@ def coverage_py(
         ),
         files_manager(),
     ):
-        _run_tool(use_coverage_py, remove=remove, how=how)
+        _run_tool(use_coverage_py, remove=remove, how=how, workspace=workspace)
 
 
 @app.command(
@@ -111,6 +116,7 @@ def deptry(
     frozen: bool = frozen_opt,
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use the deptry linter: avoid missing or superfluous dependency declarations."""
     from usethis._config_file import files_manager
@@ -126,7 +132,7 @@ def deptry(
         ),
         files_manager(),
     ):
-        _run_tool(use_deptry, remove=remove, how=how)
+        _run_tool(use_deptry, remove=remove, how=how, workspace=workspace)
 
 
 @app.command(
@@ -142,10 +148,12 @@ def import_linter(
     frozen: bool = frozen_opt,
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use Import Linter: enforce a self-imposed architecture on imports."""
     from usethis._config_file import files_manager
     from usethis._core.tool import use_import_linter
+    from usethis._integrations.project.imports import import_graph_cache
 
     with (
         usethis_config.set(
@@ -156,8 +164,9 @@ def import_linter(
             disable_pre_commit=no_hook,
         ),
         files_manager(),
+        import_graph_cache(),
     ):
-        _run_tool(use_import_linter, remove=remove, how=how)
+        _run_tool(use_import_linter, remove=remove, how=how, workspace=workspace)
 
 
 @app.command(
@@ -173,6 +182,7 @@ def mkdocs(
     frozen: bool = frozen_opt,
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use MkDocs: Generate project documentation sites with Markdown."""
     from usethis._config_file import files_manager
@@ -188,7 +198,7 @@ def mkdocs(
         ),
         files_manager(),
     ):
-        _run_tool(use_mkdocs, remove=remove, how=how)
+        _run_tool(use_mkdocs, remove=remove, how=how, workspace=workspace)
 
 
 @app.command(
@@ -236,6 +246,7 @@ def pyproject_fmt(
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
     no_apply: bool = no_apply_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use the pyproject-fmt linter: opinionated formatting of 'pyproject.toml' files."""
     from usethis._config_file import files_manager
@@ -251,7 +262,13 @@ def pyproject_fmt(
         ),
         files_manager(),
     ):
-        _run_tool(use_pyproject_fmt, remove=remove, how=how, no_apply=no_apply)
+        _run_tool(
+            use_pyproject_fmt,
+            remove=remove,
+            how=how,
+            no_apply=no_apply,
+            workspace=workspace,
+        )
 
 
 @app.command(
@@ -267,6 +284,7 @@ def pyproject_toml(
     frozen: bool = frozen_opt,
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use a pyproject.toml file to configure the project."""
     from usethis._config_file import files_manager
@@ -282,7 +300,7 @@ def pyproject_toml(
         ),
         files_manager(),
     ):
-        _run_tool(use_pyproject_toml, remove=remove, how=how)
+        _run_tool(use_pyproject_toml, remove=remove, how=how, workspace=workspace)
 
 
 @app.command(
@@ -297,6 +315,7 @@ def pytest(
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
     example: bool = example_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use the pytest testing framework."""
     from usethis._config_file import files_manager
@@ -312,7 +331,9 @@ def pytest(
         ),
         files_manager(),
     ):
-        _run_tool(use_pytest, remove=remove, how=how, example=example)
+        _run_tool(
+            use_pytest, remove=remove, how=how, example=example, workspace=workspace
+        )
 
 
 @app.command(
@@ -329,6 +350,7 @@ def requirements_txt(
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
     output_file: str = requirements_txt_output_file_opt,
+    force: bool = requirements_txt_force_opt,
 ) -> None:
     """Use a requirements.txt file exported from the uv lockfile."""
     from usethis._config_file import files_manager
@@ -344,7 +366,13 @@ def requirements_txt(
         ),
         files_manager(),
     ):
-        _run_tool(use_requirements_txt, remove=remove, how=how, output_file=output_file)
+        _run_tool(
+            use_requirements_txt,
+            remove=remove,
+            how=how,
+            output_file=output_file,
+            force=force,
+        )
 
 
 @app.command(
@@ -363,6 +391,7 @@ def ruff(
     formatter: bool = formatter_opt,
     no_hook: bool = no_hook_opt,
     no_apply: bool = no_apply_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use Ruff: an extremely fast Python linter and code formatter."""
     from usethis._config_file import files_manager
@@ -385,6 +414,7 @@ def ruff(
             linter=linter,
             formatter=formatter,
             no_apply=no_apply,
+            workspace=workspace,
         )
 
 
@@ -401,10 +431,12 @@ def tach(
     frozen: bool = frozen_opt,
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use Tach: enforce self-imposed dependency and interface rules."""
     from usethis._config_file import files_manager
     from usethis._core.tool import use_tach
+    from usethis._integrations.project.imports import import_graph_cache
 
     with (
         usethis_config.set(
@@ -415,8 +447,9 @@ def tach(
             disable_pre_commit=no_hook,
         ),
         files_manager(),
+        import_graph_cache(),
     ):
-        _run_tool(use_tach, remove=remove, how=how)
+        _run_tool(use_tach, remove=remove, how=how, workspace=workspace)
 
 
 @app.command(
@@ -432,6 +465,7 @@ def ty(
     frozen: bool = frozen_opt,
     backend: BackendEnum = backend_opt,
     no_hook: bool = no_hook_opt,
+    workspace: bool = workspace_opt,
 ) -> None:
     """Use the ty type checker: an extremely fast Python type checker."""
     from usethis._config_file import files_manager
@@ -447,24 +481,35 @@ def ty(
         ),
         files_manager(),
     ):
-        _run_tool(use_ty, remove=remove, how=how)
+        _run_tool(use_ty, remove=remove, how=how, workspace=workspace)
 
 
-def _run_tool(caller: UseToolFunc, *, remove: bool, how: bool, **kwargs: object):
+def _run_tool(
+    caller: UseToolFunc,
+    *,
+    remove: bool,
+    how: bool,
+    workspace: bool = False,
+    **kwargs: object,
+):
     from usethis._console import err_print
+    from usethis._core.workspace import use_in_workspace
     from usethis.errors import UsethisError
 
     try:
-        caller(remove=remove, how=how, **kwargs)
+        if workspace:
+            use_in_workspace(partial(caller, remove=remove, how=how, **kwargs))
+        else:
+            caller(remove=remove, how=how, **kwargs)
     except UsethisError as err:
         err_print(err)
         raise typer.Exit(code=1) from None
 
 
 def _get_all_tool_commands() -> list[str]:
-    from usethis._tool.all_ import ALL_TOOLS
+    from usethis._tool.registry import TOOL_REGISTRY
 
-    return [tool.name.lower().replace(" ", "-") for tool in ALL_TOOLS]
+    return [registration.command for registration in TOOL_REGISTRY.values()]
 
 
 ALL_TOOL_COMMANDS: list[str] = _get_all_tool_commands()
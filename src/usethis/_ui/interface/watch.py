@@ -0,0 +1,45 @@
+"""CLI commands for keeping derived configuration in sync."""
+
+from __future__ import annotations
+
+import typer
+
+from usethis._config import usethis_config
+from usethis._types.backend import BackendEnum
+from usethis._ui.options import backend_opt, frozen_opt, offline_opt, quiet_opt
+
+interval_opt = typer.Option(
+    0.5, "--interval", help="The time in seconds between checks for changes.", min=0
+)
+debounce_opt = typer.Option(
+    0.3,
+    "--debounce",
+    help="The time in seconds without further changes to wait for before syncing.",
+    min=0,
+)
+
+
+def watch(
+    interval: float = interval_opt,
+    debounce: float = debounce_opt,
+    offline: bool = offline_opt,
+    quiet: bool = quiet_opt,
+    frozen: bool = frozen_opt,
+    backend: BackendEnum = backend_opt,
+) -> None:
+    """Watch the project, and sync derived configuration when files change."""
+    from usethis._console import err_print
+    from usethis._core.watch import watch
+    from usethis.errors import UsethisError
+
+    with usethis_config.set(
+        offline=offline, quiet=quiet, frozen=frozen, backend=backend
+    ):
+        try:
+            watch(interval=interval, debounce=debounce)
+        except KeyboardInterrupt:
+            # Stopping with Ctrl+C is the usual way to finish.
+            raise typer.Exit(code=0) from None
+        except UsethisError as err:
+            err_print(err)
+            raise typer.Exit(code=1) from None
@@ -5,9 +5,11 @@ import typer
 from usethis._config import (
     BACKEND_DEFAULT,
     BUILD_BACKEND_DEFAULT,
+    DRY_RUN_DEFAULT,
     FROZEN_DEFAULT,
     HOW_DEFAULT,
     OFFLINE_DEFAULT,
+    OUTPUT_MODE_DEFAULT,
     QUIET_DEFAULT,
     REMOVE_DEFAULT,
 )
@@ -41,6 +43,44 @@ no_apply_opt = typer.Option(
     "--no-apply",
     help="Don't run formatters after adding them.",
 )
+workspace_opt = typer.Option(
+    False,
+    "--workspace",
+    help="Configure every member of the uv workspace, locking once at the end.",
+)
+
+# global options
+dry_run_opt = typer.Option(
+    DRY_RUN_DEFAULT,
+    "--dry-run",
+    help="Show the changes a command would make, without making them.",
+)
+plan_file_opt = typer.Option(
+    None,
+    "--plan-file",
+    help="With --dry-run, also write a machine-readable JSON plan to this file.",
+)
+subprocess_timeout_opt = typer.Option(
+    None,
+    "--subprocess-timeout",
+    envvar="USETHIS_SUBPROCESS_TIMEOUT",
+    help="The maximum time in seconds to wait for each subprocess, e.g. 'uv add'.",
+    min=0,
+)
+lock_timeout_opt = typer.Option(
+    None,
+    "--lock-timeout",
+    envvar="USETHIS_LOCK_TIMEOUT",
+    help="The maximum time in seconds to wait for other usethis processes working on "
+    "the same project.",
+    min=0,
+)
+output_opt = typer.Option(
+    OUTPUT_MODE_DEFAULT,
+    "--output",
+    help="How to write messages: 'rich' styling, 'plain' text, or 'ndjson' events. "
+    "By default, styling is only used for interactive terminals.",
+)
 
 # author command options
 author_name_opt = typer.Option(..., "--name", help="Author name")
@@ -109,6 +149,11 @@ init_build_backend_opt = typer.Option(
     "--build-backend",
     help="The build backend to use for the project.",
 )
+init_template_cache_opt = typer.Option(
+    None,
+    "--template-cache",
+    help="Directory in which to cache the project skeleton, to reuse it for new projects with the same options.",
+)
 
 # readme command options
 badges_opt = typer.Option(False, "--badges", help="Add relevant badges")
@@ -129,6 +174,11 @@ requirements_txt_output_file_opt = typer.Option(
     "--output-file",
     help="The name of the output requirements file.",
 )
+requirements_txt_force_opt = typer.Option(
+    False,
+    "--force",
+    help="Regenerate the requirements file even if the dependencies are unchanged.",
+)
 
 # ruff command options
 linter_opt = typer.Option(
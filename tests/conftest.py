@@ -9,10 +9,14 @@ import pytest
 
 from _test import change_cwd, is_offline
 from usethis._backend.uv.call import call_uv_subprocess
+from usethis._backend.uv.template import _get_uv_version
 from usethis._config import UsethisConfig, usethis_config
 from usethis._config_file import files_manager
 from usethis._console import _cached_warn_print, get_icon_mode
+from usethis._file.pyproject_toml.fingerprint import CACHE_DIR_ENV_VAR
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+from usethis._file.toml.io_ import TOMLFileManager
+from usethis._integrations.pydantic.dump import _get_dump_plan
 from usethis._subprocess import call_subprocess
 from usethis._tool.impl.spec.import_linter import _importlinter_warn_no_packages_found
 
@@ -35,6 +39,26 @@ def clear_functools_caches():
     _cached_warn_print.cache_clear()
     get_icon_mode.cache_clear()
     _importlinter_warn_no_packages_found.cache_clear()
+    _get_dump_plan.cache_clear()
+    _get_uv_version.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def user_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Fixture to keep each test's user cache directory out of the real one."""
+
+    cache_dir = tmp_path_factory.mktemp("user_cache")
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, cache_dir.as_posix())
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def verify_incremental_toml_dumps(monkeypatch: pytest.MonkeyPatch):
+    """Fixture to check incremental TOML renders against full renders in every test."""
+
+    monkeypatch.setattr(TOMLFileManager, "verify_incremental_dumps", True)
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,97 @@
+import subprocess
+import sys
+
+import pytest
+
+# Generous budgets, in milliseconds, for the cumulative time to import each module in a
+# fresh interpreter. These are roughly three times the typical import time, so they
+# should only be exceeded by a regression, e.g. a new eager import of a heavy
+# dependency.
+IMPORT_TIME_BUDGETS_MS: dict[str, int] = {
+    "usethis._config_file": 500,
+    "usethis._file.ini.io_": 250,
+    "usethis._file.pyproject_toml.io_": 250,
+    "usethis._file.yaml.io_": 250,
+    "usethis._integrations.pre_commit.schema": 350,
+    "usethis._integrations.project.imports": 300,
+    "usethis._ui.app": 250,
+}
+
+# Heavy modules which are only needed once a file of the relevant type is read or
+# modified, a tool is used, or styled output is written to a terminal, so they shouldn't
+# be imported by the file managers, the console helpers, or the CLI app themselves.
+LAZY_MODULES: list[str] = [
+    "configupdater",
+    "grimp",
+    "rich.console",
+    "ruamel.yaml",
+    "usethis._integrations.pre_commit.schema",
+    "usethis._tool.all_",
+]
+
+
+def _get_import_time_ms(module: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    for line in output.splitlines():
+        # e.g. "import time:      1409 |     152092 | usethis._config_file"
+        _, cumulative_us, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative_us) / 1000
+
+    msg = f"Import time for '{module}' not found in output:\n{output}"
+    raise AssertionError(msg)
+
+
+def _get_imported_modules(module: str) -> set[str]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; import {module}; print('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(output.splitlines())
+
+
+class TestImportTime:
+    @pytest.mark.parametrize(
+        ("module", "budget_ms"), list(IMPORT_TIME_BUDGETS_MS.items())
+    )
+    def test_within_budget(self, module: str, budget_ms: int):
+        # Act
+        # Take the best of a few runs, to reduce noise from the machine's load.
+        import_time_ms = min(_get_import_time_ms(module) for _ in range(3))
+
+        # Assert
+        assert import_time_ms <= budget_ms, (
+            f"Importing '{module}' took {import_time_ms:.0f}ms, "
+            f"exceeding the budget of {budget_ms}ms."
+        )
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "usethis._config_file",
+            "usethis._console",
+            "usethis._file.ini.io_",
+            "usethis._file.yaml.io_",
+            "usethis._integrations.pre_commit.yaml",
+            "usethis._integrations.project.imports",
+            "usethis._ui.app",
+        ],
+    )
+    def test_heavy_dependencies_are_lazy(self, module: str):
+        # Act
+        imported = _get_imported_modules(module)
+
+        # Assert
+        assert not imported & set(LAZY_MODULES)
@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -14,6 +17,9 @@ from usethis._subprocess import SubprocessFailedError, SubprocessResult
 from usethis._types.backend import BackendEnum
 from usethis.errors import ForbiddenBackendError
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class TestCallPoetrySubprocess:
     def test_forbidden_when_uv_backend(self):
@@ -386,8 +392,15 @@ class TestCallPoetrySubprocess:
     ):
         """Warnings emitted on stderr by Poetry should be surfaced via warn_print."""
 
-        def mock_call_subprocess(args: list[str], **__: object) -> SubprocessResult:
+        def mock_call_subprocess(
+            args: list[str],
+            *,
+            on_stderr_line: Callable[[str], None] | None = None,
+            **__: object,
+        ) -> SubprocessResult:
             _ = args
+            if on_stderr_line is not None:
+                on_stderr_line("Warning: something")
             return SubprocessResult("Poetry (version 2.0.0)\n", "Warning: something\n")
 
         monkeypatch.setattr(
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -10,6 +13,9 @@ from usethis._config import usethis_config
 from usethis._config_file import files_manager
 from usethis._subprocess import SubprocessResult
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class TestCallUVSubprocess:
     def test_help_output_suppressed(self, capfd: pytest.CaptureFixture[str]):
@@ -32,9 +38,12 @@ class TestCallUVSubprocess:
         # Arrange
         # Mock the call_subprocess function to check the args passed
         def mock_call_subprocess(
-            args: list[str], *, cwd: Path | None = None
+            args: list[str],
+            *,
+            cwd: Path | None = None,
+            on_stderr_line: Callable[[str], None] | None = None,
         ) -> SubprocessResult:
-            _ = cwd
+            _ = cwd, on_stderr_line
             return SubprocessResult(" ".join(args), "")
 
         monkeypatch.setattr(
@@ -98,10 +107,17 @@ link-mode = "symlink"
         """Warnings emitted on stderr by uv should be surfaced via warn_print."""
 
         def mock_call_subprocess(
-            args: list[str], *, cwd: Path | None = None
+            args: list[str],
+            *,
+            cwd: Path | None = None,
+            on_stderr_line: Callable[[str], None] | None = None,
         ) -> SubprocessResult:
             _ = args, cwd
-            return SubprocessResult("", "warning: something went wrong\n")
+            stderr = "warning: something went wrong\n"
+            if on_stderr_line is not None:
+                for line in stderr.splitlines():
+                    on_stderr_line(line)
+            return SubprocessResult("", stderr)
 
         monkeypatch.setattr(
             usethis._backend.uv.call,
@@ -125,10 +141,17 @@ link-mode = "symlink"
         """When stderr is empty, no warning should be printed."""
 
         def mock_call_subprocess(
-            args: list[str], *, cwd: Path | None = None
+            args: list[str],
+            *,
+            cwd: Path | None = None,
+            on_stderr_line: Callable[[str], None] | None = None,
         ) -> SubprocessResult:
             _ = args, cwd
-            return SubprocessResult("", "")
+            stderr = ""
+            if on_stderr_line is not None:
+                for line in stderr.splitlines():
+                    on_stderr_line(line)
+            return SubprocessResult("", stderr)
 
         monkeypatch.setattr(
             usethis._backend.uv.call,
@@ -152,10 +175,17 @@ link-mode = "symlink"
         """Multiple warning lines on stderr should each be surfaced."""
 
         def mock_call_subprocess(
-            args: list[str], *, cwd: Path | None = None
+            args: list[str],
+            *,
+            cwd: Path | None = None,
+            on_stderr_line: Callable[[str], None] | None = None,
         ) -> SubprocessResult:
             _ = args, cwd
-            return SubprocessResult("", "warning: first\nwarning: second\n")
+            stderr = "warning: first\nwarning: second\n"
+            if on_stderr_line is not None:
+                for line in stderr.splitlines():
+                    on_stderr_line(line)
+            return SubprocessResult("", stderr)
 
         monkeypatch.setattr(
             usethis._backend.uv.call,
@@ -179,10 +209,17 @@ link-mode = "symlink"
         """Non-warning lines on stderr should not be surfaced."""
 
         def mock_call_subprocess(
-            args: list[str], *, cwd: Path | None = None
+            args: list[str],
+            *,
+            cwd: Path | None = None,
+            on_stderr_line: Callable[[str], None] | None = None,
         ) -> SubprocessResult:
             _ = args, cwd
-            return SubprocessResult("", "Resolved 31 packages in 265ms\n")
+            stderr = "Resolved 31 packages in 265ms\n"
+            if on_stderr_line is not None:
+                for line in stderr.splitlines():
+                    on_stderr_line(line)
+            return SubprocessResult("", stderr)
 
         monkeypatch.setattr(
             usethis._backend.uv.call,
@@ -5,6 +5,10 @@ import pytest
 import usethis._backend.uv.lockfile
 from _test import change_cwd
 from usethis._backend.uv.lockfile import ensure_uv_lock
+from usethis._file.pyproject_toml.fingerprint import (
+    is_fingerprint_stale,
+    record_fingerprint,
+)
 
 
 class TestEnsureUVLock:
@@ -121,3 +125,122 @@ dependencies = []
         out, err = capfd.readouterr()
         assert not err
         assert not out
+
+    def test_updates_stale_lock_file(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+    ):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+version = "0.1.0"
+dependencies = []
+"""
+        )
+        (tmp_path / "uv.lock").write_text("version = 1\n")
+        with change_cwd(tmp_path):
+            record_fingerprint("uv.lock")
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+version = "0.1.0"
+dependencies = ["requests"]
+"""
+        )
+
+        calls: list[list[str]] = []
+
+        def mock_call_uv_subprocess(args: list[str], *, change_toml: bool) -> str:
+            _ = change_toml
+            calls.append(args)
+            return ""
+
+        monkeypatch.setattr(
+            usethis._backend.uv.lockfile,
+            "call_uv_subprocess",
+            mock_call_uv_subprocess,
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            ensure_uv_lock()
+
+            # Assert
+            assert not is_fingerprint_stale("uv.lock")
+        assert calls == [["lock"]]
+        out, err = capfd.readouterr()
+        assert not err
+        assert out == "✔ Updating 'uv.lock'.\n"
+
+    def test_does_nothing_when_fresh(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+version = "0.1.0"
+dependencies = []
+"""
+        )
+        (tmp_path / "uv.lock").write_text("version = 1\n")
+        with change_cwd(tmp_path):
+            record_fingerprint("uv.lock")
+
+        called = False
+
+        def mock_call_uv_subprocess(*_: object, **__: object) -> str:
+            nonlocal called
+            called = True
+            return ""
+
+        monkeypatch.setattr(
+            usethis._backend.uv.lockfile,
+            "call_uv_subprocess",
+            mock_call_uv_subprocess,
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            ensure_uv_lock()
+
+        # Assert
+        assert not called
+
+    def test_force(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+version = "0.1.0"
+dependencies = []
+"""
+        )
+        (tmp_path / "uv.lock").write_text("version = 1\n")
+
+        called = False
+
+        def mock_call_uv_subprocess(*_: object, **__: object) -> str:
+            nonlocal called
+            called = True
+            return ""
+
+        monkeypatch.setattr(
+            usethis._backend.uv.lockfile,
+            "call_uv_subprocess",
+            mock_call_uv_subprocess,
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            ensure_uv_lock(force=True)
+
+        # Assert
+        assert called
@@ -0,0 +1,156 @@
+from pathlib import Path
+
+import pytest
+
+import usethis._backend.uv.call
+from _test import change_cwd
+from usethis._backend.uv.errors import UVSubprocessFailedError
+from usethis._backend.uv.template import init_from_template
+from usethis._config import usethis_config
+from usethis._config_file import files_manager
+from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+
+
+@pytest.fixture
+def uv_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+    call_uv_subprocess = usethis._backend.uv.call.call_uv_subprocess
+
+    def _call_uv_subprocess(args: list[str], change_toml: bool) -> str:
+        calls.append(args)
+        return call_uv_subprocess(args, change_toml=change_toml)
+
+    monkeypatch.setattr(
+        usethis._backend.uv.call, "call_uv_subprocess", _call_uv_subprocess
+    )
+    return calls
+
+
+class TestInitFromTemplate:
+    def test_disabled(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            result = init_from_template()
+
+        # Assert
+        assert not result
+        assert not (tmp_path / "pyproject.toml").exists()
+
+    def test_reused(self, tmp_path: Path, uv_calls: list[list[str]]):
+        # Arrange
+        cache_dir = tmp_path / "cache"
+        (tmp_path / "first-proj").mkdir()
+        (tmp_path / "second-proj").mkdir()
+
+        # Act
+        with usethis_config.set(template_cache_dir=cache_dir):
+            with change_cwd(tmp_path / "first-proj"), files_manager():
+                first = init_from_template()
+            with change_cwd(tmp_path / "second-proj"), files_manager():
+                second = init_from_template()
+                name = PyprojectTOMLManager()[["project", "name"]]
+
+        # Assert
+        assert first
+        assert second
+        assert [args[0] for args in uv_calls].count("init") == 1
+        assert [args[0] for args in uv_calls].count("--version") == 1
+        assert name == "second-proj"
+        init_path = tmp_path / "second-proj" / "src" / "second_proj" / "__init__.py"
+        assert "Hello from second-proj!" in init_path.read_text()
+        assert (tmp_path / "second-proj" / "src" / "second_proj" / "py.typed").exists()
+        assert (tmp_path / "second-proj" / "README.md").exists()
+
+    def test_uv_version_unavailable(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # e.g. a uv build which can't report its version
+
+        # Arrange
+        def mock_call_uv_subprocess(args: list[str], **__: object) -> str:
+            msg = f"Failed to run 'uv {' '.join(args)}'."
+            raise UVSubprocessFailedError(msg)
+
+        monkeypatch.setattr(
+            usethis._backend.uv.call, "call_uv_subprocess", mock_call_uv_subprocess
+        )
+        cache_dir = tmp_path / "cache"
+        (tmp_path / "proj").mkdir()
+
+        # Act
+        with (
+            usethis_config.set(template_cache_dir=cache_dir),
+            change_cwd(tmp_path / "proj"),
+            files_manager(),
+        ):
+            result = init_from_template()
+
+        # Assert
+        assert not result
+        assert not cache_dir.exists()
+
+    def test_complex_name(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "My.Project"
+        path.mkdir()
+
+        # Act
+        with (
+            change_cwd(path),
+            usethis_config.set(template_cache_dir=tmp_path / "cache"),
+            files_manager(),
+        ):
+            result = init_from_template()
+
+        # Assert
+        assert not result
+        assert not (tmp_path / "cache").exists()
+
+    def test_python_version_pinned(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "proj"
+        path.mkdir()
+        (path / ".python-version").write_text("3.12\n")
+
+        # Act
+        with (
+            change_cwd(path),
+            usethis_config.set(template_cache_dir=tmp_path / "cache"),
+            files_manager(),
+        ):
+            result = init_from_template()
+
+        # Assert
+        assert not result
+
+    def test_in_git_repo(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".git").mkdir()
+        path = tmp_path / "proj"
+        path.mkdir()
+
+        # Act
+        with (
+            change_cwd(path),
+            usethis_config.set(template_cache_dir=tmp_path / "cache"),
+            files_manager(),
+        ):
+            result = init_from_template()
+
+        # Assert
+        assert result
+        assert (path / "pyproject.toml").exists()
+        assert not (path / ".gitignore").exists()
+        assert not (path / ".git").exists()
+
+    def test_dry_run(self, tmp_path: Path):
+        # Act
+        with (
+            change_cwd(tmp_path),
+            usethis_config.set(template_cache_dir=tmp_path / "cache", dry_run=True),
+            files_manager(),
+        ):
+            result = init_from_template()
+
+        # Assert
+        assert not result
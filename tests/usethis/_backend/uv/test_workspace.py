@@ -0,0 +1,131 @@
+from pathlib import Path
+
+import pytest
+
+from _test import change_cwd
+from usethis._backend.uv.errors import UVWorkspaceError
+from usethis._backend.uv.workspace import get_workspace_members
+from usethis._config_file import files_manager
+
+
+def _make_member(path: Path) -> None:
+    path.mkdir(parents=True)
+    (path / "pyproject.toml").write_text(f'[project]\nname = "{path.name}"\n')
+
+
+class TestGetWorkspaceMembers:
+    def test_members(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[tool.uv.workspace]
+members = ["packages/*"]
+"""
+        )
+        _make_member(tmp_path / "packages" / "b")
+        _make_member(tmp_path / "packages" / "a")
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            members = get_workspace_members()
+
+        # Assert
+        assert members == [tmp_path / "packages" / "a", tmp_path / "packages" / "b"]
+
+    def test_root_project_first(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "root"
+
+[tool.uv.workspace]
+members = ["packages/*"]
+"""
+        )
+        _make_member(tmp_path / "packages" / "a")
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            members = get_workspace_members()
+
+        # Assert
+        assert members == [tmp_path, tmp_path / "packages" / "a"]
+
+    def test_exclude(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[tool.uv.workspace]
+members = ["packages/*"]
+exclude = ["packages/b"]
+"""
+        )
+        _make_member(tmp_path / "packages" / "a")
+        _make_member(tmp_path / "packages" / "b")
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            members = get_workspace_members()
+
+        # Assert
+        assert members == [tmp_path / "packages" / "a"]
+
+    def test_dirs_without_pyproject_toml_ignored(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[tool.uv.workspace]
+members = ["packages/*"]
+"""
+        )
+        _make_member(tmp_path / "packages" / "a")
+        (tmp_path / "packages" / "notes").mkdir()
+        (tmp_path / "packages" / "README.md").touch()
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            members = get_workspace_members()
+
+        # Assert
+        assert members == [tmp_path / "packages" / "a"]
+
+    def test_no_workspace(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "root"\n')
+
+        # Act, Assert
+        with (
+            change_cwd(tmp_path),
+            files_manager(),
+            pytest.raises(UVWorkspaceError, match="No uv workspace is configured"),
+        ):
+            get_workspace_members()
+
+    def test_no_pyproject_toml(self, tmp_path: Path):
+        # Act, Assert
+        with (
+            change_cwd(tmp_path),
+            files_manager(),
+            pytest.raises(UVWorkspaceError, match=r"No 'pyproject\.toml' file found"),
+        ):
+            get_workspace_members()
+
+    def test_invalid_members(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[tool.uv.workspace]
+members = "packages/*"
+"""
+        )
+
+        # Act, Assert
+        with (
+            change_cwd(tmp_path),
+            files_manager(),
+            pytest.raises(
+                UVWorkspaceError, match=r"Invalid 'tool\.uv\.workspace\.members'"
+            ),
+        ):
+            get_workspace_members()
@@ -7,6 +7,7 @@ from usethis._config_file import files_manager
 from usethis._core.badge import (
     Badge,
     add_badge,
+    add_badges,
     get_bitbucket_badge,
     get_pre_commit_badge,
     get_pypi_badge,
@@ -17,6 +18,7 @@ from usethis._core.badge import (
     get_uv_badge,
     is_badge,
     remove_badge,
+    remove_badges,
 )
 
 
@@ -606,6 +608,119 @@ Automatically manage Python tooling and configuration: linters, formatters, and
         )
 
 
+class TestAddBadges:
+    def test_all_badges_reversed(self, bare_dir: Path):
+        # Arrange
+        (bare_dir / "pyproject.toml").write_text('[project]\nname = "my-project"\n')
+
+        # Act
+        with change_cwd(bare_dir), files_manager():
+            add_badges(
+                [
+                    get_socket_badge(),
+                    get_bitbucket_badge(),
+                    get_usethis_badge(),
+                    get_pre_commit_badge(),
+                    get_ty_badge(),
+                    get_ruff_badge(),
+                    get_uv_badge(),
+                    get_pypi_badge(),
+                ]
+            )
+
+        # Assert
+        expected = (
+            Path(__file__).parent / "assets" / "expected_all_badges.md"
+        ).read_text()
+        assert (bare_dir / "README.md").read_text() == expected
+
+    def test_written_on_exit(self, bare_dir: Path):
+        # Arrange
+        path = bare_dir / "README.md"
+        path.write_text("# Header\n")
+
+        # Act
+        with change_cwd(bare_dir), files_manager():
+            add_badges([get_ruff_badge(), get_uv_badge()])
+
+            # Assert
+            assert path.read_text() == "# Header\n"
+        assert path.read_text() == (
+            f"# Header\n\n{get_uv_badge().markdown}\n{get_ruff_badge().markdown}\n"
+        )
+
+    def test_some_already_present(
+        self, bare_dir: Path, capfd: pytest.CaptureFixture[str]
+    ):
+        # Arrange
+        path = bare_dir / "README.md"
+        path.write_text(f"# Header\n\n{get_ruff_badge().markdown}\n")
+
+        # Act
+        with change_cwd(bare_dir), files_manager():
+            add_badges([get_ruff_badge(), get_ty_badge()])
+
+        # Assert
+        assert path.read_text() == (
+            f"# Header\n\n{get_ruff_badge().markdown}\n{get_ty_badge().markdown}\n"
+        )
+        out, err = capfd.readouterr()
+        assert not err
+        assert out == "✔ Adding ty badge to 'README.md'.\n"
+
+
+class TestRemoveBadges:
+    def test_several(self, bare_dir: Path, capfd: pytest.CaptureFixture[str]):
+        # Arrange
+        path = bare_dir / "README.md"
+        path.write_text(
+            f"# Header\n\n{get_uv_badge().markdown}\n{get_ruff_badge().markdown}\n"
+            f"{get_ty_badge().markdown}\n\nText\n"
+        )
+
+        # Act
+        with change_cwd(bare_dir), files_manager():
+            remove_badges([get_uv_badge(), get_ty_badge()])
+
+        # Assert
+        assert path.read_text() == (
+            f"# Header\n\n{get_ruff_badge().markdown}\n\nText\n"
+        )
+        out, err = capfd.readouterr()
+        assert not err
+        assert out == (
+            "✔ Removing uv badge from 'README.md'.\n"
+            "✔ Removing ty badge from 'README.md'.\n"
+        )
+
+    def test_all(self, bare_dir: Path):
+        # Arrange
+        path = bare_dir / "README.md"
+        path.write_text(
+            f"# Header\n\n{get_uv_badge().markdown}\n{get_ruff_badge().markdown}\n"
+            "\nText\n"
+        )
+
+        # Act
+        with change_cwd(bare_dir), files_manager():
+            remove_badges([get_uv_badge(), get_ruff_badge()])
+
+        # Assert
+        assert path.read_text() == "# Header\n\nText\n"
+
+    def test_none_present(self, bare_dir: Path):
+        # Arrange
+        path = bare_dir / "README.md"
+        path.write_text("# Header")
+
+        # Act
+        with change_cwd(bare_dir), files_manager():
+            remove_badges([get_uv_badge(), get_ruff_badge()])
+
+        # Assert
+        assert path.read_text() == "# Header"
+
+
 class TestRemoveBadge:
     def test_empty(self, bare_dir: Path, capfd: pytest.CaptureFixture[str]):
         # Arrange
@@ -780,3 +895,22 @@ class TestAllBadgesMarkdownValid:
             Path(__file__).parent / "assets" / "expected_all_badges.md"
         ).read_text()
         assert (bare_dir / "README.md").read_text() == expected
+
+
+@pytest.mark.benchmark
+def test_add_and_remove_badges_long_readme(bare_dir: Path):
+    # Arrange
+    (bare_dir / "pyproject.toml").write_text('[project]\nname = "my-project"\n')
+    (bare_dir / "README.md").write_text(
+        "# Header\n\n" + "".join(f"Line {idx}.\n" for idx in range(1000))
+    )
+
+    # Act
+    with change_cwd(bare_dir), files_manager():
+        add_badges([get_ruff_badge(), get_uv_badge(), get_pre_commit_badge()])
+        remove_badges([get_uv_badge()])
+
+    # Assert
+    content = (bare_dir / "README.md").read_text()
+    assert get_ruff_badge().markdown in content
+    assert get_uv_badge().markdown not in content
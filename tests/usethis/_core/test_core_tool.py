@@ -11,7 +11,7 @@ import pytest
 from pydantic import TypeAdapter
 
 import usethis._backend.dispatch
-from _test import change_cwd, use_tool
+from _test import ALL_TOOLS, change_cwd, use_tool
 from usethis._backend.uv.call import call_uv_subprocess
 from usethis._backend.uv.link_mode import ensure_symlink_mode
 from usethis._backend.uv.toml import UVTOMLManager
@@ -32,7 +32,7 @@ from usethis._core.tool import (
     use_tach,
     use_ty,
 )
-from usethis._deps import add_deps_to_group, get_deps_from_group, is_dep_satisfied_in
+from usethis._deps import add_deps_to_group, get_dep_groups, get_dep_index
 from usethis._fallback import (
     FALLBACK_RUFF_VERSION,
     FALLBACK_SYNC_WITH_UV_VERSION,
@@ -42,7 +42,7 @@ from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._integrations.pre_commit.hooks import HOOK_GROUPS, get_hook_ids
 from usethis._integrations.pre_commit.yaml import PreCommitConfigYAMLManager
 from usethis._python.version import PythonVersion
-from usethis._tool.all_ import ALL_TOOLS, SupportedToolType
+from usethis._tool.all_ import SupportedToolType
 from usethis._tool.impl.base.ruff import RuffTool
 from usethis._types.backend import BackendEnum
 from usethis._types.deps import Dependency
@@ -163,7 +163,7 @@ ignore-regex = ["[A-Za-z0-9+/]{100,}"]
 
                 # Assert
                 # Check dependencies - should have installed codespell
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "codespell" for dep in dev_deps)
 
                 # Check hook names
@@ -203,7 +203,7 @@ ignore-regex = ["[A-Za-z0-9+/]{100,}"]
 
                 # Assert
                 # Check dependencies - should have installed codespell and tomli
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "codespell" for dep in dev_deps)
                 assert any(dep.name == "tomli" for dep in dev_deps)
 
@@ -413,7 +413,7 @@ class TestCoverage:
                 # Assert
                 assert Dependency(
                     name="coverage", extras=frozenset({"toml"})
-                ) in get_deps_from_group("test")
+                ) in get_dep_groups().get("test", [])
 
                 assert ["tool", "uv", "default-groups"] in PyprojectTOMLManager()
 
@@ -447,7 +447,7 @@ class TestCoverage:
                 # Assert
                 assert Dependency(
                     name="coverage", extras=frozenset({"toml"})
-                ) in get_deps_from_group("test")
+                ) in get_dep_groups().get("test", [])
                 out, err = capfd.readouterr()
                 assert not err
                 assert out == (
@@ -472,7 +472,7 @@ class TestCoverage:
                 # Assert
                 assert Dependency(
                     name="coverage", extras=frozenset({"toml"})
-                ) in get_deps_from_group("test")
+                ) in get_dep_groups().get("test", [])
                 out, err = capfd.readouterr()
                 assert not err
                 assert out == (
@@ -579,7 +579,7 @@ ignore-regex = ["[A-Za-z0-9+/]{100,}"]
                 use_coverage_py(remove=True)
 
                 # Assert
-                assert not get_deps_from_group("test")
+                assert not get_dep_groups().get("test", [])
                 out, err = capfd.readouterr()
                 assert not out  # Should not be removing anything
                 assert not err
@@ -594,7 +594,7 @@ ignore-regex = ["[A-Za-z0-9+/]{100,}"]
                 use_coverage_py(remove=True)
 
                 # Assert
-                assert not get_deps_from_group("test")
+                assert not get_dep_groups().get("test", [])
             out, err = capfd.readouterr()
             assert not err
             assert out == (
@@ -615,7 +615,7 @@ ignore-regex = ["[A-Za-z0-9+/]{100,}"]
                 use_coverage_py(remove=True)
 
                 # Assert
-                assert get_deps_from_group("test") == [Dependency(name="pytest")]
+                assert get_dep_groups().get("test", []) == [Dependency(name="pytest")]
                 out, err = capfd.readouterr()
                 assert not err
                 assert out == (
@@ -647,7 +647,7 @@ class TestDeptry:
                 use_deptry()
 
                 # Assert
-                (dev_dep,) = get_deps_from_group("dev")
+                (dev_dep,) = get_dep_groups().get("dev", [])
             assert dev_dep == Dependency(name="deptry")
 
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -804,7 +804,7 @@ repos:
                 use_deptry(remove=True)
 
                 # Assert
-                assert not get_deps_from_group("dev")
+                assert not get_dep_groups().get("dev", [])
 
         def test_use_deptry_removes_config(self, tmp_path: Path):
             """Test that use_deptry removes the tool's config when removing."""
@@ -874,7 +874,7 @@ dev = []
 
                 # Assert
                 # Check dependencies - SHOULD have installed deptry (issue #1020)
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "deptry" for dep in dev_deps)
 
                 hook_names = get_hook_ids()
@@ -981,7 +981,9 @@ class TestImportLinter:
                 use_import_linter()
 
                 # Assert
-                assert Dependency(name="import-linter") in get_deps_from_group("dev")
+                assert Dependency(name="import-linter") in get_dep_groups().get(
+                    "dev", []
+                )
 
             out, err = capfd.readouterr()
             assert not err
@@ -1745,7 +1747,7 @@ repos:
 
                 # Assert
                 # Check dependencies - should have installed import-linter (issue #1020)
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "import-linter" for dep in dev_deps)
 
             contents = (uv_init_repo_dir / ".pre-commit-config.yaml").read_text()
@@ -1832,7 +1834,7 @@ nav:
                 use_mkdocs(remove=True)
 
                 # Assert
-                assert get_deps_from_group("doc") == [Dependency(name="sphinx")]
+                assert get_dep_groups().get("doc", []) == [Dependency(name="sphinx")]
 
     class TestHow:
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -1866,7 +1868,7 @@ class TestPreCommit:
 
                 # Assert
                 # Has dev dep
-                (dev_dep,) = get_deps_from_group("dev")
+                (dev_dep,) = get_dep_groups().get("dev", [])
                 assert dev_dep == Dependency(name="pre-commit")
             # Correct stdout
             out, _ = capfd.readouterr()
@@ -2035,7 +2037,7 @@ repos:
                 assert "pyproject-fmt" in hook_names
 
                 # Issue #1020: Deps should remain even when using pre-commit
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "pyproject-fmt" for dep in dev_deps)
 
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -2052,7 +2054,7 @@ repos:
                 assert "codespell" in hook_names
 
                 # Issue #1020: Deps should remain even when using pre-commit
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "codespell" for dep in dev_deps)
 
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -2070,7 +2072,7 @@ repos:
                 assert "ruff-format" in hook_names
 
                 # Issue #1126: Deps should remain even when using pre-commit
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "ruff" for dep in dev_deps)
 
     class TestRemove:
@@ -2096,7 +2098,7 @@ repos:
                 use_pre_commit(remove=True)
 
                 # Assert
-                assert not get_deps_from_group("dev")
+                assert not get_dep_groups().get("dev", [])
 
         @pytest.mark.usefixtures("_vary_network_conn")
         def test_stdout(self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]):
@@ -2242,14 +2244,14 @@ repos:
                 use_codespell()
 
                 # Verify dep is present before migration
-                dev_deps_before = get_deps_from_group("dev")
+                dev_deps_before = get_dep_groups().get("dev", [])
                 assert any(dep.name == "codespell" for dep in dev_deps_before)
 
                 # Act - Add pre-commit (which triggers migration)
                 use_pre_commit()
 
                 # Assert - Dep should STILL be present after migration (issue #1020)
-                dev_deps_after = get_deps_from_group("dev")
+                dev_deps_after = get_dep_groups().get("dev", [])
                 assert any(dep.name == "codespell" for dep in dev_deps_after)
 
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -2261,7 +2263,7 @@ repos:
                 use_codespell()
 
                 # Verify dep is present before removal
-                dev_deps_before = get_deps_from_group("dev")
+                dev_deps_before = get_dep_groups().get("dev", [])
                 codespell_deps_before = [
                     dep for dep in dev_deps_before if dep.name == "codespell"
                 ]
@@ -2271,7 +2273,7 @@ repos:
                 use_pre_commit(remove=True)
 
                 # Assert - Dep should still be present exactly once (not duplicated)
-                dev_deps_after = get_deps_from_group("dev")
+                dev_deps_after = get_dep_groups().get("dev", [])
                 codespell_deps_after = [
                     dep for dep in dev_deps_after if dep.name == "codespell"
                 ]
@@ -2288,14 +2290,14 @@ repos:
                 use_ruff()
 
                 # Verify dep is present before migration
-                dev_deps_before = get_deps_from_group("dev")
+                dev_deps_before = get_dep_groups().get("dev", [])
                 assert any(dep.name == "ruff" for dep in dev_deps_before)
 
                 # Act - Add pre-commit (which triggers migration)
                 use_pre_commit()
 
                 # Assert - Dep should STILL be present after migration (issue #1126)
-                dev_deps_after = get_deps_from_group("dev")
+                dev_deps_after = get_dep_groups().get("dev", [])
                 assert any(dep.name == "ruff" for dep in dev_deps_after)
 
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -2309,7 +2311,7 @@ repos:
                 use_ruff()
 
                 # Verify dep is present before removal
-                dev_deps_before = get_deps_from_group("dev")
+                dev_deps_before = get_dep_groups().get("dev", [])
                 ruff_deps_before = [
                     dep for dep in dev_deps_before if dep.name == "ruff"
                 ]
@@ -2319,7 +2321,7 @@ repos:
                 use_pre_commit(remove=True)
 
                 # Assert - Dep should still be present exactly once (not duplicated)
-                dev_deps_after = get_deps_from_group("dev")
+                dev_deps_after = get_dep_groups().get("dev", [])
                 ruff_deps_after = [dep for dep in dev_deps_after if dep.name == "ruff"]
                 assert len(ruff_deps_after) == 1
                 assert ruff_deps_after == ruff_deps_before
@@ -2368,7 +2370,7 @@ keep_full_version = true
                     use_pyproject_fmt()
 
                     # Assert
-                    assert get_deps_from_group("dev") == [
+                    assert get_dep_groups().get("dev", []) == [
                         Dependency(name="pyproject-fmt")
                     ]
                 out, _ = capfd.readouterr()
@@ -2408,7 +2410,7 @@ keep_full_version = true
 
                 # Assert
                 # Check dependencies - should have installed pyproject-fmt (issue #1020)
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "pyproject-fmt" for dep in dev_deps)
 
                 # Check hook names
@@ -2570,13 +2572,13 @@ class TestPytest:
                 use_pytest()
 
                 # Assert
-                deps_from_test = get_deps_from_group("test")
-                assert is_dep_satisfied_in(
-                    Dependency(name="pytest"), in_=list(deps_from_test)
+                index = get_dep_index()
+                assert index.is_dep_satisfied_in_group(
+                    Dependency(name="pytest"), group="test"
                 )
                 # pytest-cov should only be added when we are using coverage
-                assert not is_dep_satisfied_in(
-                    Dependency(name="pytest-cov"), in_=list(deps_from_test)
+                assert not index.is_dep_satisfied_in_group(
+                    Dependency(name="pytest-cov"), group="test"
                 )
                 out, _ = capfd.readouterr()
                 assert out == (
@@ -2946,7 +2948,7 @@ select = ["PT"]
                     use_pytest(remove=True)
 
                     # Assert
-                    assert not get_deps_from_group("test")
+                    assert not get_dep_groups().get("test", [])
 
         def test_coverage_integration(
             self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]
@@ -3302,6 +3304,140 @@ repos:
             out, _ = capfd.readouterr()
             assert out == "✔ Writing 'requirements.txt'.\n"
 
+    class TestFingerprint:
+        def test_unchanged_deps_not_regenerated(
+            self, tmp_path: Path, capfd: pytest.CaptureFixture[str]
+        ):
+            # Arrange
+            (tmp_path / "pyproject.toml").write_text(
+                '[project]\nname = "test"\nversion = "0.1.0"\ndependencies = []\n'
+            )
+            with (
+                change_cwd(tmp_path),
+                files_manager(),
+                usethis_config.set(backend=BackendEnum.none),
+            ):
+                use_requirements_txt()
+            (tmp_path / "requirements.txt").write_text("-e .\n# edited\n")
+            capfd.readouterr()
+
+            # Act
+            with (
+                change_cwd(tmp_path),
+                files_manager(),
+                usethis_config.set(backend=BackendEnum.none),
+            ):
+                use_requirements_txt()
+
+            # Assert
+            assert (tmp_path / "requirements.txt").read_text() == "-e .\n# edited\n"
+            out, err = capfd.readouterr()
+            assert not err
+            assert not out
+
+        def test_changed_deps_regenerated(
+            self, tmp_path: Path, capfd: pytest.CaptureFixture[str]
+        ):
+            # Arrange
+            (tmp_path / "pyproject.toml").write_text(
+                '[project]\nname = "test"\nversion = "0.1.0"\ndependencies = []\n'
+            )
+            with (
+                change_cwd(tmp_path),
+                files_manager(),
+                usethis_config.set(backend=BackendEnum.none),
+            ):
+                use_requirements_txt()
+            (tmp_path / "pyproject.toml").write_text(
+                '[project]\nname = "test"\nversion = "0.1.0"\n'
+                'dependencies = ["requests"]\n'
+            )
+            capfd.readouterr()
+
+            # Act
+            with (
+                change_cwd(tmp_path),
+                files_manager(),
+                usethis_config.set(backend=BackendEnum.none),
+            ):
+                use_requirements_txt()
+
+            # Assert
+            assert (tmp_path / "requirements.txt").read_text() == "-e .\nrequests\n"
+            out, err = capfd.readouterr()
+            assert not err
+            assert out == "✔ Writing 'requirements.txt'.\n"
+
+        def test_unrelated_change_not_regenerated(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "pyproject.toml").write_text(
+                '[project]\nname = "test"\nversion = "0.1.0"\ndependencies = []\n'
+            )
+            with (
+                change_cwd(tmp_path),
+                files_manager(),
+                usethis_config.set(backend=BackendEnum.none),
+            ):
+                use_requirements_txt()
+            (tmp_path / "requirements.txt").write_text("-e .\n# edited\n")
+            (tmp_path / "pyproject.toml").write_text(
+                '[project]\nname = "test"\nversion = "0.2.0"\ndependencies = []\n'
+            )
+
+            # Act
+            with (
+                change_cwd(tmp_path),
+                files_manager(),
+                usethis_config.set(backend=BackendEnum.none),
+            ):
+                use_requirements_txt()
+
+            # Assert
+            assert (tmp_path / "requirements.txt").read_text() == "-e .\n# edited\n"
+
+        def test_unrecorded_file_not_regenerated(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "pyproject.toml").write_text(
+                '[project]\nname = "test"\nversion = "0.1.0"\n'
+                'dependencies = ["requests"]\n'
+            )
+            (tmp_path / "requirements.txt").write_text("-e .\n# handwritten\n")
+
+            # Act
+            with (
+                change_cwd(tmp_path),
+                files_manager(),
+                usethis_config.set(backend=BackendEnum.none),
+            ):
+                use_requirements_txt()
+
+            # Assert
+            assert (
+                tmp_path / "requirements.txt"
+            ).read_text() == "-e .\n# handwritten\n"
+
+        def test_force(self, tmp_path: Path, capfd: pytest.CaptureFixture[str]):
+            # Arrange
+            (tmp_path / "pyproject.toml").write_text(
+                '[project]\nname = "test"\nversion = "0.1.0"\n'
+                'dependencies = ["requests"]\n'
+            )
+            (tmp_path / "requirements.txt").write_text("-e .\n# handwritten\n")
+
+            # Act
+            with (
+                change_cwd(tmp_path),
+                files_manager(),
+                usethis_config.set(backend=BackendEnum.none),
+            ):
+                use_requirements_txt(force=True)
+
+            # Assert
+            assert (tmp_path / "requirements.txt").read_text() == "-e .\nrequests\n"
+            out, err = capfd.readouterr()
+            assert not err
+            assert out == "✔ Writing 'requirements.txt'.\n"
+
 
 class TestRuff:
     class TestAdd:
@@ -3312,7 +3448,7 @@ class TestRuff:
                 use_ruff()
 
                 # Assert
-                (dev_dep,) = get_deps_from_group("dev")
+                (dev_dep,) = get_dep_groups().get("dev", [])
             assert dev_dep == Dependency(name="ruff")
 
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -3663,7 +3799,7 @@ select = ["F"]
                 assert "ruff-check" in hook_names
 
                 # Issue #1126: Deps should remain even when using pre-commit
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "ruff" for dep in dev_deps)
 
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -3681,7 +3817,7 @@ select = ["F"]
                 assert "ruff-check" in hook_names
 
                 # Issue #1126: Deps should be added even when pre-commit is used
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "ruff" for dep in dev_deps)
 
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -4052,7 +4188,9 @@ class TestTy:
                 use_ty()
 
                 # Assert
-                (dev_dep,) = [d for d in get_deps_from_group("dev") if d.name == "ty"]
+                (dev_dep,) = [
+                    d for d in get_dep_groups().get("dev", []) if d.name == "ty"
+                ]
             assert dev_dep == Dependency(name="ty")
 
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -4088,7 +4226,7 @@ class TestTy:
                 use_ty()
 
                 # Assert
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "ty" for dep in dev_deps)
 
                 hook_names = get_hook_ids()
@@ -4117,7 +4255,7 @@ class TestTy:
                 use_ty(remove=True)
 
                 # Assert
-                deps = get_deps_from_group("dev")
+                deps = get_dep_groups().get("dev", [])
             assert not any(dep.name == "ty" for dep in deps)
 
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -4171,7 +4309,9 @@ class TestTach:
                 use_tach()
 
                 # Assert
-                (dev_dep,) = [d for d in get_deps_from_group("dev") if d.name == "tach"]
+                (dev_dep,) = [
+                    d for d in get_dep_groups().get("dev", []) if d.name == "tach"
+                ]
             assert dev_dep == Dependency(name="tach")
 
         def test_config_created(
@@ -4205,7 +4345,7 @@ class TestTach:
                 use_tach()
 
                 # Assert
-                dev_deps = get_deps_from_group("dev")
+                dev_deps = get_dep_groups().get("dev", [])
                 assert any(dep.name == "tach" for dep in dev_deps)
 
                 hook_names = get_hook_ids()
@@ -4232,7 +4372,7 @@ class TestTach:
                 use_tach(remove=True)
 
                 # Assert
-                deps = get_deps_from_group("dev")
+                deps = get_dep_groups().get("dev", [])
             assert not any(dep.name == "tach" for dep in deps)
 
     class TestHow:
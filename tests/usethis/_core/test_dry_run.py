@@ -0,0 +1,129 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from _test import change_cwd
+from usethis._config import usethis_config
+from usethis._config_file import files_manager
+from usethis._core.dry_run import dry_run
+from usethis._file import fs
+from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+from usethis._subprocess import call_subprocess
+
+
+class TestDryRun:
+    def test_project_unchanged(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "example"\n')
+
+        # Act
+        with change_cwd(tmp_path), dry_run() as plan, files_manager():
+            PyprojectTOMLManager().set_value(keys=["project", "version"], value="0.1.0")
+            fs.touch(usethis_config.cpd() / "README.md")
+
+        # Assert
+        assert (tmp_path / "pyproject.toml").read_text() == (
+            '[project]\nname = "example"\n'
+        )
+        assert not (tmp_path / "README.md").exists()
+        assert [(c.path, c.change) for c in plan.file_changes] == [
+            ("README.md", "create"),
+            ("pyproject.toml", "modify"),
+        ]
+
+    def test_subprocess_skipped(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), dry_run() as plan:
+            call_subprocess(["false"])
+
+        # Assert
+        assert [subprocess.args for subprocess in plan.subprocesses] == [("false",)]
+
+    def test_config_restored(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), dry_run():
+            project_dir = usethis_config.cpd()
+            is_dry_run = usethis_config.dry_run
+
+        # Assert
+        assert project_dir == tmp_path
+        assert is_dry_run
+        assert not usethis_config.dry_run
+        assert usethis_config.project_dir is None
+
+    def test_output(self, tmp_path: Path, capfd: pytest.CaptureFixture[str]):
+        # Act
+        with change_cwd(tmp_path), dry_run():
+            fs.write_text(usethis_config.cpd() / "ruff.toml", "[lint]\n")
+            call_subprocess(["uv", "add", "coverage[toml]"])
+
+        # Assert
+        out, err = capfd.readouterr()
+        assert not err
+        assert out == (
+            "--- /dev/null\n"
+            "+++ b/ruff.toml\n"
+            "@@ -0,0 +1 @@\n"
+            "+[lint]\n"
+            "ℹ Dry run: would run 'uv add 'coverage[toml]''.\n"  # noqa: RUF001
+        )
+
+    def test_no_changes(self, tmp_path: Path, capfd: pytest.CaptureFixture[str]):
+        # Act
+        with change_cwd(tmp_path), dry_run():
+            pass
+
+        # Assert
+        out, err = capfd.readouterr()
+        assert not err
+        assert out == "ℹ Dry run: no changes would be made.\n"  # noqa: RUF001
+
+    def test_plan_file(self, tmp_path: Path):
+        # Arrange
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        plan_file = tmp_path / "plan.json"
+
+        # Act
+        with change_cwd(project_dir), dry_run(plan_file=plan_file):
+            fs.write_text(usethis_config.cpd() / "README.md", "# Example\n")
+
+        # Assert
+        assert json.loads(plan_file.read_text()) == {
+            "files": [{"path": "README.md", "change": "create"}],
+            "subprocesses": [],
+        }
+
+    def test_removed_dir(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "conftest.py").write_text("pytest_plugins = []\n")
+
+        # Act
+        with change_cwd(tmp_path), dry_run() as plan:
+            fs.rmtree(usethis_config.cpd() / "tests")
+
+        # Assert
+        assert (tmp_path / "tests" / "conftest.py").exists()
+        assert [(c.path, c.change) for c in plan.file_changes] == [
+            ("tests/conftest.py", "delete")
+        ]
+
+    def test_outside_project(self, tmp_path: Path):
+        # e.g. the root of a uv workspace
+
+        # Arrange
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (tmp_path / "uv.toml").write_text("")
+
+        # Act
+        with change_cwd(project_dir), dry_run() as plan:
+            fs.write_text(tmp_path / "uv.toml", 'link-mode = "symlink"\n')
+
+        # Assert
+        assert (tmp_path / "uv.toml").read_text() == ""
+        assert [(c.path, c.change) for c in plan.file_changes] == [
+            ("../uv.toml", "modify")
+        ]
@@ -10,7 +10,7 @@ from usethis._core.rule import (
     select_rules,
     unignore_rules,
 )
-from usethis._deps import get_deps_from_group
+from usethis._deps import get_dep_groups
 from usethis._tool.impl.base.deptry import DeptryTool
 from usethis._tool.impl.base.ruff import RuffTool
 from usethis._types.deps import Dependency
@@ -23,7 +23,7 @@ class TestSelectRules:
             select_rules(rules=["A"])
 
             # Assert
-            assert Dependency(name="ruff") in get_deps_from_group(group="dev")
+            assert Dependency(name="ruff") in get_dep_groups().get("dev", [])
 
     def test_deptry_rule_selected(
         self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]
@@ -33,7 +33,7 @@ class TestSelectRules:
             select_rules(rules=["DEP001"])
 
             # Assert
-            assert Dependency(name="deptry") in get_deps_from_group(group="dev")
+            assert Dependency(name="deptry") in get_dep_groups().get("dev", [])
 
         out, err = capfd.readouterr()
         assert not err
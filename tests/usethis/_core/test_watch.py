@@ -0,0 +1,245 @@
+import threading
+import time
+from pathlib import Path, PurePath
+
+import pytest
+
+import usethis._core.watch
+from _test import change_cwd
+from usethis._config_file import files_manager
+from usethis._core.watch import (
+    _get_changed_paths,
+    _scan_project,
+    sync_derived_artifacts,
+    watch,
+)
+from usethis._tool.impl.base.import_linter import ImportLinterTool
+
+
+def _init_import_linter(path: Path) -> None:
+    (path / "pyproject.toml").write_text('[project]\nname = "a"\nversion = "0.1.0"\n')
+    (path / "a").mkdir()
+    (path / "a" / "__init__.py").touch()
+    with change_cwd(path), files_manager():
+        ImportLinterTool().add_configs()
+
+
+class TestSyncDerivedArtifacts:
+    def test_new_module(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+    ):
+        # Arrange
+        monkeypatch.syspath_prepend(str(tmp_path))
+        _init_import_linter(tmp_path)
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "__init__.py").touch()
+        capfd.readouterr()
+
+        # Act
+        with change_cwd(tmp_path):
+            result = sync_derived_artifacts({PurePath("b"), PurePath("b/__init__.py")})
+
+        # Assert
+        assert result == ["Import Linter contracts"]
+        assert 'root_packages = ["a", "b"]' in (tmp_path / "pyproject.toml").read_text()
+        out, err = capfd.readouterr()
+        assert not err
+        assert "✔ Updating Import Linter config in 'pyproject.toml'.\n" in out
+        assert "ℹ Synced 'Import Linter contracts' after 2 changes (" in out  # noqa: RUF001
+
+    def test_unrelated_change(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+    ):
+        # Arrange
+        monkeypatch.syspath_prepend(str(tmp_path))
+        _init_import_linter(tmp_path)
+        (tmp_path / "README.md").write_text("# a\n")
+        contents = (tmp_path / "pyproject.toml").read_text()
+        capfd.readouterr()
+
+        # Act
+        with change_cwd(tmp_path):
+            result = sync_derived_artifacts({PurePath("README.md")})
+
+        # Assert
+        assert result == []
+        assert (tmp_path / "pyproject.toml").read_text() == contents
+        out, err = capfd.readouterr()
+        assert not err
+        assert out.startswith("ℹ Nothing to sync after 1 change (")  # noqa: RUF001
+
+    def test_sonar_project_properties(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("""\
+[project]
+name = "a"
+version = "0.1.0"
+
+[tool.coverage.xml]
+output = "coverage.xml"
+
+[tool.usethis.sonarqube]
+project-key = "foobar"
+""")
+        (tmp_path / ".python-version").write_text("3.12\n")
+
+        # Act
+        with change_cwd(tmp_path):
+            result = sync_derived_artifacts({PurePath(".python-version")})
+
+        # Assert
+        assert result == ["sonar-project.properties"]
+        contents = (tmp_path / "sonar-project.properties").read_text()
+        assert "sonar.projectKey=foobar\n" in contents
+        assert "sonar.python.version=3.12\n" in contents
+
+    def test_sonar_project_properties_unmanaged(self, tmp_path: Path):
+        # Without usethis configuration, the existing file is the source of truth.
+
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "a"\n')
+        (tmp_path / "sonar-project.properties").write_text("foo=bar\n")
+
+        # Act
+        with change_cwd(tmp_path):
+            result = sync_derived_artifacts({PurePath("pyproject.toml")})
+
+        # Assert
+        assert result == []
+        assert (tmp_path / "sonar-project.properties").read_text() == "foo=bar\n"
+
+    def test_error_reported(self, tmp_path: Path, capfd: pytest.CaptureFixture[str]):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("""\
+[project]
+name = "a"
+
+[tool.usethis.sonarqube]
+verbose = true
+""")
+
+        # Act
+        with change_cwd(tmp_path):
+            result = sync_derived_artifacts({PurePath("pyproject.toml")})
+
+        # Assert
+        assert result == []
+        assert not (tmp_path / "sonar-project.properties").exists()
+        out, err = capfd.readouterr()
+        assert "project-key" in err
+        assert "Nothing to sync" in out
+
+    def test_hand_written_requirements_txt(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "a"\n')
+        (tmp_path / "requirements.txt").write_text("foo\n")
+        (tmp_path / "uv.lock").touch()
+
+        # Act
+        with change_cwd(tmp_path):
+            result = sync_derived_artifacts({PurePath("uv.lock")})
+
+        # Assert
+        assert result == []
+        assert (tmp_path / "requirements.txt").read_text() == "foo\n"
+
+
+class TestWatch:
+    def test_new_module(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+    ):
+        # Arrange
+        monkeypatch.syspath_prepend(str(tmp_path))
+        _init_import_linter(tmp_path)
+        capfd.readouterr()
+
+        def add_package() -> None:
+            time.sleep(0.2)
+            (tmp_path / "b").mkdir()
+            (tmp_path / "b" / "__init__.py").touch()
+
+        thread = threading.Thread(target=add_package)
+
+        # Act
+        with change_cwd(tmp_path):
+            thread.start()
+            watch(interval=0.05, debounce=0.05, max_cycles=1)
+        thread.join()
+
+        # Assert
+        assert 'root_packages = ["a", "b"]' in (tmp_path / "pyproject.toml").read_text()
+        out, err = capfd.readouterr()
+        assert not err
+        assert out.startswith("ℹ Watching for changes. Press Ctrl+C to stop.\n")  # noqa: RUF001
+        assert "Synced 'Import Linter contracts'" in out
+
+    def test_changes_during_sync(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        calls: list[set[PurePath]] = []
+
+        def mock_sync_derived_artifacts(changed: set[PurePath]) -> list[str]:
+            calls.append(set(changed))
+            if len(calls) == 1:
+                # An output written by the sync, and an edit made while it ran.
+                (tmp_path / "tach.toml").write_text("modules = []\n")
+                (tmp_path / "a.py").write_text("x = 1\n")
+                return ["Tach modules"]
+            return []
+
+        monkeypatch.setattr(
+            usethis._core.watch, "sync_derived_artifacts", mock_sync_derived_artifacts
+        )
+        # Otherwise, a missed edit would leave the watch waiting for changes forever.
+        timer = threading.Timer(5, (tmp_path / "z.txt").touch)
+
+        # Act
+        with change_cwd(tmp_path):
+            timer.start()
+            threading.Timer(0.1, (tmp_path / "b.py").touch).start()
+            watch(interval=0.05, debounce=0.05, max_cycles=2)
+        timer.cancel()
+
+        # Assert
+        assert calls == [{PurePath("b.py")}, {PurePath("a.py")}]
+
+
+class TestScanProject:
+    def test_hidden_and_ignored_dirs_skipped(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "a.py").touch()
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "b.py").touch()
+        (tmp_path / ".venv").mkdir()
+        (tmp_path / ".venv" / "c.py").touch()
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "__pycache__" / "d.pyc").touch()
+
+        # Act
+        with change_cwd(tmp_path):
+            stamps = _scan_project()
+
+        # Assert
+        assert set(stamps) == {PurePath("a.py"), PurePath("src"), PurePath("src/b.py")}
+        assert stamps[PurePath("src")] is None
+
+
+class TestGetChangedPaths:
+    def test_created_removed_modified(self):
+        # Arrange
+        old = {PurePath("a.py"): (1, 1), PurePath("b.py"): (1, 1), PurePath("c"): None}
+        new = {PurePath("a.py"): (1, 1), PurePath("b.py"): (2, 1), PurePath("d"): None}
+
+        # Act
+        changed = _get_changed_paths(old, new)
+
+        # Assert
+        assert changed == {PurePath("b.py"), PurePath("c"), PurePath("d")}
@@ -0,0 +1,154 @@
+from pathlib import Path
+
+import pytest
+
+import usethis._core.workspace
+from _test import change_cwd
+from usethis._backend.dispatch import get_backend
+from usethis._config import usethis_config
+from usethis._config_file import files_manager
+from usethis._core.workspace import use_in_workspace
+from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
+from usethis._types.backend import BackendEnum
+
+
+@pytest.fixture
+def workspace_dir(tmp_path: Path) -> Path:
+    (tmp_path / "pyproject.toml").write_text(
+        """\
+[project]
+name = "root"
+
+[tool.uv.workspace]
+members = ["packages/*"]
+"""
+    )
+    (tmp_path / "uv.lock").touch()
+    for name in ["a", "b"]:
+        (tmp_path / "packages" / name).mkdir(parents=True)
+        (tmp_path / "packages" / name / "pyproject.toml").write_text(
+            f'[project]\nname = "{name}"\n'
+        )
+    return tmp_path
+
+
+class TestUseInWorkspace:
+    def test_runs_for_each_member(
+        self,
+        workspace_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+    ):
+        # Arrange
+        forces: list[bool] = []
+        monkeypatch.setattr(
+            usethis._core.workspace,
+            "ensure_uv_lock",
+            lambda *, force: forces.append(force),
+        )
+        calls: list[tuple[Path, bool, BackendEnum]] = []
+
+        def func() -> None:
+            calls.append((usethis_config.cpd(), usethis_config.frozen, get_backend()))
+
+        # Act
+        with change_cwd(workspace_dir), files_manager():
+            use_in_workspace(func)
+
+        # Assert
+        assert calls == [
+            (workspace_dir, True, BackendEnum.uv),
+            (workspace_dir / "packages" / "a", True, BackendEnum.uv),
+            (workspace_dir / "packages" / "b", True, BackendEnum.uv),
+        ]
+        out, err = capfd.readouterr()
+        assert not err
+        assert out == (
+            "ℹ Configuring workspace member '.'.\n"  # noqa: RUF001
+            "ℹ Configuring workspace member 'packages/a'.\n"  # noqa: RUF001
+            "ℹ Configuring workspace member 'packages/b'.\n"  # noqa: RUF001
+        )
+
+    def test_member_changes_written(self, workspace_dir: Path):
+        # Arrange
+        def func() -> None:
+            if usethis_config.cpd() != workspace_dir:
+                PyprojectTOMLManager()[["tool", "ruff", "line-length"]] = 100
+
+        # Act
+        with (
+            change_cwd(workspace_dir),
+            files_manager(),
+            usethis_config.set(frozen=True),
+        ):
+            use_in_workspace(func)
+
+        # Assert
+        for name in ["a", "b"]:
+            content = (workspace_dir / "packages" / name / "pyproject.toml").read_text()
+            assert "line-length = 100" in content
+        assert "line-length" not in (workspace_dir / "pyproject.toml").read_text()
+
+    def test_single_lock_when_deps_change(
+        self, workspace_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        forces: list[bool] = []
+        monkeypatch.setattr(
+            usethis._core.workspace,
+            "ensure_uv_lock",
+            lambda *, force: forces.append(force),
+        )
+
+        def func() -> None:
+            PyprojectTOMLManager()[["dependency-groups", "dev"]] = ["ruff"]
+
+        # Act
+        with change_cwd(workspace_dir), files_manager():
+            use_in_workspace(func)
+
+        # Assert
+        assert forces == [True]
+
+    def test_lock_not_forced_when_deps_unchanged(
+        self, workspace_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        forces: list[bool] = []
+        monkeypatch.setattr(
+            usethis._core.workspace,
+            "ensure_uv_lock",
+            lambda *, force: forces.append(force),
+        )
+
+        # Act
+        with change_cwd(workspace_dir), files_manager():
+            use_in_workspace(lambda: None)
+
+        # Assert
+        assert forces == [False]
+
+    def test_frozen_skips_lock(
+        self, workspace_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        forces: list[bool] = []
+        monkeypatch.setattr(
+            usethis._core.workspace,
+            "ensure_uv_lock",
+            lambda *, force: forces.append(force),
+        )
+
+        def func() -> None:
+            PyprojectTOMLManager()[["dependency-groups", "dev"]] = ["ruff"]
+
+        # Act
+        with (
+            change_cwd(workspace_dir),
+            files_manager(),
+            usethis_config.set(frozen=True),
+        ):
+            use_in_workspace(func)
+
+        # Assert
+        assert forces == []
@@ -17,6 +17,7 @@ from usethis._file.ini.errors import (
     UnexpectedINIOpenError,
 )
 from usethis._file.ini.io_ import INIFileManager
+from usethis._file.patch import DeleteValue, ExtendList, RemoveFromList, SetValue
 
 
 class TestINIFileManager:
@@ -1819,3 +1820,211 @@ key2 = value2
 key2 = value2
 """
             )
+
+    class TestPatch:
+        def test_applies_all_ops(self, tmp_path: Path):
+            # Arrange
+            class MyINIFileManager(INIFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("valid.ini")
+
+            valid_file = tmp_path / "valid.ini"
+            valid_file.write_text("""\
+[section]
+key1 =
+    value1
+    value2
+key2 = value2
+""")
+
+            # Act
+            with change_cwd(tmp_path), MyINIFileManager() as manager:
+                manager.patch(
+                    [
+                        SetValue(keys=["section", "key3"], value="value3"),
+                        ExtendList(keys=["section", "key1"], values=["value4"]),
+                        RemoveFromList(keys=["section", "key1"], values=["value1"]),
+                        DeleteValue(keys=["section", "key2"]),
+                    ]
+                )
+
+            # Assert
+            assert valid_file.read_text() == (
+                """\
+[section]
+key1 =
+    value2
+    value4
+key3 = value3
+"""
+            )
+
+        def test_single_commit(self, tmp_path: Path):
+            # Arrange
+            commits: list[ConfigUpdater] = []
+
+            class MyINIFileManager(INIFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("valid.ini")
+
+                @override
+                def commit(self, document: ConfigUpdater) -> None:
+                    commits.append(document)
+                    super().commit(document)
+
+            (tmp_path / "valid.ini").write_text("[section]\nkey1 = value1\n")
+
+            with change_cwd(tmp_path), MyINIFileManager() as manager:
+                # Act
+                manager.patch(
+                    [
+                        SetValue(keys=["section", "key2"], value="value2"),
+                        DeleteValue(keys=["section", "key1"]),
+                        SetValue(keys=["other"], value={"key3": "value3"}),
+                    ]
+                )
+
+                # Assert
+                assert len(commits) == 1
+                assert manager[[]] == {
+                    "section": {"key2": "value2"},
+                    "other": {"key3": "value3"},
+                }
+
+        def test_delete_missing_ok(self, tmp_path: Path):
+            # Arrange
+            class MyINIFileManager(INIFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("valid.ini")
+
+            (tmp_path / "valid.ini").write_text("[section]\nkey1 = value1\n")
+
+            with change_cwd(tmp_path), MyINIFileManager() as manager:
+                # Act
+                manager.patch(
+                    [
+                        DeleteValue(keys=["section", "key2"], missing_ok=True),
+                        DeleteValue(keys=["section", "key1"], missing_ok=True),
+                    ]
+                )
+
+                # Assert
+                assert manager[[]] == {}
+
+        def test_delete_missing(self, tmp_path: Path):
+            # Arrange
+            class MyINIFileManager(INIFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("valid.ini")
+
+            (tmp_path / "valid.ini").write_text("[section]\nkey1 = value1\n")
+
+            # Act, Assert
+            with (
+                change_cwd(tmp_path),
+                MyINIFileManager() as manager,
+                pytest.raises(INIValueMissingError),
+            ):
+                manager.patch([DeleteValue(keys=["section", "key2"])])
+
+    class TestGetReadonly:
+        def test_lookup_does_not_parse_document(self, tmp_path: Path):
+            # Arrange
+            class MyINIFileManager(INIFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("valid.ini")
+
+            (tmp_path / "valid.ini").write_text("""\
+[section]
+Key1 =
+    value1
+    value2
+key2 = value2
+""")
+
+            with change_cwd(tmp_path), MyINIFileManager() as manager:
+                # Act
+                contained = ["section", "key1"] in manager
+                value = manager[["section", "key1"]]
+                root = manager[[]]
+
+                # Assert
+                assert contained
+                assert value == "\nvalue1\nvalue2"
+                assert root == {
+                    "section": {"key1": "\nvalue1\nvalue2", "key2": "value2"}
+                }
+                assert manager._content is None
+
+        def test_indented_comment(self, tmp_path: Path):
+            # Arrange
+            class MyINIFileManager(INIFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("valid.ini")
+
+            (tmp_path / "valid.ini").write_text("""\
+[section]
+key1 =
+    value1
+    # comment
+""")
+
+            with change_cwd(tmp_path), MyINIFileManager() as manager:
+                # Act
+                value = manager[["section", "key1"]]
+
+                # Assert
+                assert value == "\nvalue1\n# comment"
+                assert isinstance(manager._content, ConfigUpdater)
+
+        def test_upgraded_on_write(self, tmp_path: Path):
+            # Arrange
+            class MyINIFileManager(INIFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("valid.ini")
+
+            (tmp_path / "valid.ini").write_text("[section]\nkey1 = value1\n")
+
+            with change_cwd(tmp_path), MyINIFileManager() as manager:
+                assert [re.compile("sec.*")] in manager
+                assert [re.compile("other.*")] not in manager
+
+                # Act
+                manager.set_value(keys=["other"], value={"key2": "value2"})
+
+                # Assert
+                assert isinstance(manager._content, ConfigUpdater)
+                assert [re.compile("other.*")] in manager
+                assert manager[["other", "key2"]] == "value2"
+
+        def test_invalid_file(self, tmp_path: Path):
+            # Arrange
+            class MyINIFileManager(INIFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("valid.ini")
+
+            (tmp_path / "valid.ini").write_text("key = value\n")
+
+            # Act, Assert
+            with (
+                change_cwd(tmp_path),
+                MyINIFileManager() as manager,
+                pytest.raises(INIDecodeError),
+            ):
+                manager[["section"]]
@@ -0,0 +1,333 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from _test import change_cwd
+from usethis._config import usethis_config
+from usethis._config_file import files_manager
+from usethis._file.pyproject_toml.fingerprint import (
+    _get_fingerprints_path,
+    _get_user_cache_dir,
+    get_deps_fingerprint,
+    has_fingerprint,
+    is_fingerprint_stale,
+    record_fingerprint,
+)
+
+
+class TestGetDepsFingerprint:
+    def test_deterministic(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+dependencies = ["requests"]
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            first = get_deps_fingerprint()
+            second = get_deps_fingerprint()
+
+        # Assert
+        assert first == second
+
+    def test_dependency_change(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+dependencies = ["requests"]
+"""
+        )
+        with change_cwd(tmp_path), files_manager():
+            before = get_deps_fingerprint()
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+dependencies = ["requests>=2"]
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            after = get_deps_fingerprint()
+
+        # Assert
+        assert before != after
+
+    def test_dependency_group_change(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+"""
+        )
+        with change_cwd(tmp_path), files_manager():
+            before = get_deps_fingerprint()
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+
+[dependency-groups]
+dev = ["pytest"]
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            after = get_deps_fingerprint()
+
+        # Assert
+        assert before != after
+
+    def test_uv_sources_change(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+"""
+        )
+        with change_cwd(tmp_path), files_manager():
+            before = get_deps_fingerprint()
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+
+[tool.uv.sources]
+requests = { git = "https://github.com/psf/requests" }
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            after = get_deps_fingerprint()
+
+        # Assert
+        assert before != after
+
+    def test_unrelated_change(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+version = "0.1.0"
+dependencies = ["requests"]
+"""
+        )
+        with change_cwd(tmp_path), files_manager():
+            before = get_deps_fingerprint()
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+version = "0.2.0"
+dependencies = ["requests"]
+
+[tool.ruff]
+line-length = 100
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            after = get_deps_fingerprint()
+
+        # Assert
+        assert before == after
+
+    def test_no_pyproject_toml(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            fingerprint = get_deps_fingerprint()
+
+        # Assert
+        assert fingerprint
+
+    def test_outside_files_manager(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+dependencies = ["requests"]
+"""
+        )
+        with change_cwd(tmp_path), files_manager():
+            expected = get_deps_fingerprint()
+
+        # Act
+        with change_cwd(tmp_path):
+            fingerprint = get_deps_fingerprint()
+
+        # Assert
+        assert fingerprint == expected
+
+
+class TestIsFingerprintStale:
+    def test_unrecorded(self, tmp_path: Path):
+        # Act, Assert
+        with change_cwd(tmp_path), files_manager():
+            assert not is_fingerprint_stale("requirements.txt")
+
+    def test_recorded_unchanged(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+"""
+        )
+
+        # Act, Assert
+        with change_cwd(tmp_path), files_manager():
+            record_fingerprint("requirements.txt")
+            assert not is_fingerprint_stale("requirements.txt")
+
+    def test_recorded_changed(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+"""
+        )
+        with change_cwd(tmp_path), files_manager():
+            record_fingerprint("requirements.txt")
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+requires-python = ">=3.10"
+"""
+        )
+
+        # Act, Assert
+        with change_cwd(tmp_path), files_manager():
+            assert is_fingerprint_stale("requirements.txt")
+            assert not is_fingerprint_stale("uv.lock")
+
+    def test_corrupt_cache(self, tmp_path: Path):
+        # Arrange
+        with change_cwd(tmp_path):
+            path = _get_fingerprints_path()
+        path.parent.mkdir(parents=True)
+        path.write_text("not json")
+
+        # Act, Assert
+        with change_cwd(tmp_path), files_manager():
+            assert not is_fingerprint_stale("requirements.txt")
+
+
+class TestHasFingerprint:
+    def test_unrecorded(self, tmp_path: Path):
+        # Act, Assert
+        with change_cwd(tmp_path), files_manager():
+            assert not has_fingerprint("requirements.txt")
+
+    def test_recorded(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+"""
+        )
+
+        # Act, Assert
+        with change_cwd(tmp_path), files_manager():
+            record_fingerprint("requirements.txt")
+            assert has_fingerprint("requirements.txt")
+            assert not has_fingerprint("uv.lock")
+
+
+class TestRecordFingerprint:
+    def test_project_unchanged(self, tmp_path: Path, user_cache_dir: Path):
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            record_fingerprint("requirements.txt")
+
+        # Assert
+        assert list(tmp_path.iterdir()) == []
+        assert list(user_cache_dir.rglob("*.json"))
+
+    def test_separate_projects(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+
+        # Act
+        with change_cwd(tmp_path / "a"), files_manager():
+            record_fingerprint("requirements.txt")
+
+        # Assert
+        with change_cwd(tmp_path / "b"), files_manager():
+            assert not has_fingerprint("requirements.txt")
+
+    def test_dry_run(self, tmp_path: Path):
+        # Act
+        with (
+            change_cwd(tmp_path),
+            usethis_config.set(dry_run=True),
+            files_manager(),
+        ):
+            record_fingerprint("requirements.txt")
+
+            # Assert
+            assert not has_fingerprint("requirements.txt")
+
+    def test_other_artifacts_kept(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+"""
+        )
+        with change_cwd(tmp_path), files_manager():
+            record_fingerprint("uv.lock")
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[project]
+name = "test"
+dependencies = ["requests"]
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            record_fingerprint("requirements.txt")
+
+            # Assert
+            assert is_fingerprint_stale("uv.lock")
+            assert not is_fingerprint_stale("requirements.txt")
+
+
+class TestGetUserCacheDir:
+    def test_env_var(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        monkeypatch.setenv("USETHIS_CACHE_DIR", tmp_path.as_posix())
+
+        # Act, Assert
+        assert _get_user_cache_dir() == tmp_path
+
+    @pytest.mark.skipif(
+        sys.platform in ("win32", "darwin"), reason="XDG is only used elsewhere"
+    )
+    def test_xdg_cache_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        monkeypatch.delenv("USETHIS_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", tmp_path.as_posix())
+
+        # Act, Assert
+        assert _get_user_cache_dir() == tmp_path / "usethis"
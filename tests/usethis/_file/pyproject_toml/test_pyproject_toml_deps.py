@@ -0,0 +1,27 @@
+import pytest
+from packaging.requirements import InvalidRequirement
+
+from usethis._file.pyproject_toml.deps import parse_requirement
+
+
+class TestParseRequirement:
+    def test_extras(self):
+        # Act
+        req = parse_requirement("coverage[toml]>=7")
+
+        # Assert
+        assert req.name == "coverage"
+        assert req.extras == {"toml"}
+
+    def test_reused(self):
+        # Act
+        first = parse_requirement("pytest>=8")
+        second = parse_requirement("pytest>=8")
+
+        # Assert
+        assert first is second
+
+    def test_invalid(self):
+        # Act, Assert
+        with pytest.raises(InvalidRequirement):
+            parse_requirement("not a requirement!")
@@ -0,0 +1,192 @@
+from pathlib import Path
+
+import pytest
+
+from usethis._file import fs
+from usethis._file.fs import HeldFileChange, hold_changes, is_holding_changes
+
+
+class TestHoldChanges:
+    def test_not_written_to_disk(self, tmp_path: Path):
+        # Act
+        with hold_changes():
+            fs.write_text(tmp_path / "README.md", "# Example\n")
+            content = fs.read_text(tmp_path / "README.md")
+
+        # Assert
+        assert content == "# Example\n"
+        assert not (tmp_path / "README.md").exists()
+
+    def test_nested(self):
+        # Act, Assert
+        with hold_changes(), pytest.raises(RuntimeError), hold_changes():
+            pass
+
+    def test_is_holding_changes(self):
+        # Act
+        with hold_changes():
+            is_holding = is_holding_changes()
+
+        # Assert
+        assert is_holding
+        assert not is_holding_changes()
+
+
+class TestHeldChanges:
+    class TestGetFileChanges:
+        def test_created_and_modified(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "README.md").write_text("# Hello\n")
+
+            # Act
+            with hold_changes() as held:
+                fs.write_text(tmp_path / "README.md", "# Goodbye\n")
+                fs.mkdir(tmp_path / "src" / "pkg", parents=True)
+                fs.touch(tmp_path / "src" / "pkg" / "py.typed")
+
+            # Assert
+            assert held.get_file_changes() == [
+                HeldFileChange(
+                    path=tmp_path / "README.md",
+                    before=b"# Hello\n",
+                    after=b"# Goodbye\n",
+                ),
+                HeldFileChange(
+                    path=tmp_path / "src" / "pkg" / "py.typed", before=None, after=b""
+                ),
+            ]
+
+        def test_unchanged_content(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "README.md").write_text("# Hello\n")
+
+            # Act
+            with hold_changes() as held:
+                fs.write_text(tmp_path / "README.md", "# Hello\n")
+
+            # Assert
+            assert held.get_file_changes() == []
+
+        def test_removed_dir(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "tests").mkdir()
+            (tmp_path / "tests" / "conftest.py").write_text("")
+            (tmp_path / "tests" / "test_a.py").write_text("")
+
+            # Act
+            with hold_changes() as held:
+                fs.rmtree(tmp_path / "tests")
+                fs.mkdir(tmp_path / "tests")
+                fs.write_text(tmp_path / "tests" / "conftest.py", "")
+
+            # Assert
+            assert held.get_file_changes() == [
+                HeldFileChange(
+                    path=tmp_path / "tests" / "test_a.py", before=b"", after=None
+                ),
+            ]
+
+
+class TestExists:
+    def test_on_disk(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "README.md").touch()
+
+        # Act, Assert
+        with hold_changes():
+            assert fs.exists(tmp_path / "README.md")
+            assert fs.is_file(tmp_path / "README.md")
+            assert fs.is_dir(tmp_path)
+            assert not fs.exists(tmp_path / "uv.lock")
+
+    def test_unlinked(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").touch()
+
+        # Act
+        with hold_changes():
+            fs.unlink(tmp_path / ".pre-commit-config.yaml")
+            exists = fs.exists(tmp_path / ".pre-commit-config.yaml")
+
+        # Assert
+        assert not exists
+        assert (tmp_path / ".pre-commit-config.yaml").exists()
+
+    def test_beneath_removed_dir(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "conftest.py").touch()
+
+        # Act
+        with hold_changes():
+            fs.rmtree(tmp_path / "tests")
+            fs.mkdir(tmp_path / "tests")
+            exists = fs.exists(tmp_path / "tests" / "conftest.py")
+
+        # Assert
+        assert not exists
+
+
+class TestIterdir:
+    def test_merged(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "a.txt").touch()
+        (tmp_path / "b.txt").touch()
+
+        # Act
+        with hold_changes():
+            fs.unlink(tmp_path / "b.txt")
+            fs.touch(tmp_path / "c.txt")
+            names = {path.name for path in fs.iterdir(tmp_path)}
+
+        # Assert
+        assert names == {"a.txt", "c.txt"}
+
+    def test_not_a_dir(self, tmp_path: Path):
+        # Act, Assert
+        with hold_changes():
+            fs.touch(tmp_path / "a.txt")
+            with pytest.raises(NotADirectoryError):
+                fs.iterdir(tmp_path / "a.txt")
+
+
+class TestReadText:
+    def test_missing(self, tmp_path: Path):
+        # Act, Assert
+        with hold_changes(), pytest.raises(FileNotFoundError):
+            fs.read_text(tmp_path / "README.md")
+
+    def test_newlines(self, tmp_path: Path):
+        # Act
+        with hold_changes():
+            fs.write_text(tmp_path / "README.md", "a\r\nb\n")
+            content = fs.read_text(tmp_path / "README.md")
+
+        # Assert
+        assert content == "a\nb\n"
+
+
+class TestWriteText:
+    def test_without_holding(self, tmp_path: Path):
+        # Act
+        fs.write_text(tmp_path / "README.md", "# Example\n")
+
+        # Assert
+        assert (tmp_path / "README.md").read_text() == "# Example\n"
+
+    def test_missing_parent(self, tmp_path: Path):
+        # Act, Assert
+        with hold_changes(), pytest.raises(FileNotFoundError):
+            fs.write_text(tmp_path / "docs" / "index.md", "")
+
+
+class TestMkdir:
+    def test_exists(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "docs").mkdir()
+
+        # Act, Assert
+        with hold_changes():
+            fs.mkdir(tmp_path / "docs", exist_ok=True)
+            with pytest.raises(FileExistsError):
+                fs.mkdir(tmp_path / "docs")
@@ -0,0 +1,123 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from _test import change_cwd
+from usethis._config import usethis_config
+from usethis._config_file import files_manager
+from usethis._file.lock import ProjectLockTimeoutError, project_lock
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Locking is not supported on Windows"
+)
+
+_HOLD_LOCK_CODE = """\
+import fcntl, os, sys, time
+fd = os.open(sys.argv[1], os.O_RDONLY)
+fcntl.flock(fd, fcntl.LOCK_EX)
+print("locked", flush=True)
+time.sleep(float(sys.argv[2]))
+"""
+
+_TRY_LOCK_CODE = """\
+import fcntl, os, sys
+fd = os.open(sys.argv[1], os.O_RDONLY)
+try:
+    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+except BlockingIOError:
+    print("blocked")
+else:
+    print("acquired")
+"""
+
+
+def _hold_lock(path: Path, *, seconds: float) -> subprocess.Popen[str]:
+    process = subprocess.Popen(
+        [sys.executable, "-c", _HOLD_LOCK_CODE, str(path), str(seconds)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stdout is not None
+    assert process.stdout.readline().strip() == "locked"
+    return process
+
+
+def _try_lock(path: Path) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", _TRY_LOCK_CODE, str(path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+class TestProjectLock:
+    def test_blocks_other_processes(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), project_lock():
+            during = _try_lock(tmp_path)
+        after = _try_lock(tmp_path)
+
+        # Assert
+        assert during == "blocked"
+        assert after == "acquired"
+
+    def test_reentrant(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), project_lock():
+            with project_lock():
+                pass
+            during = _try_lock(tmp_path)
+
+        # Assert
+        assert during == "blocked"
+
+    def test_waits_for_other_process(
+        self, tmp_path: Path, capfd: pytest.CaptureFixture[str]
+    ):
+        # Arrange
+        process = _hold_lock(tmp_path, seconds=0.5)
+
+        # Act
+        try:
+            with change_cwd(tmp_path), project_lock():
+                pass
+        finally:
+            process.communicate()
+
+        # Assert
+        out, _ = capfd.readouterr()
+        assert "Waiting for another usethis process to finish" in out
+        assert "Continuing after waiting" in out
+
+    def test_timeout(self, tmp_path: Path):
+        # Arrange
+        process = _hold_lock(tmp_path, seconds=30)
+
+        # Act, Assert
+        try:
+            with (
+                change_cwd(tmp_path),
+                usethis_config.set(lock_timeout=0.2),
+                pytest.raises(ProjectLockTimeoutError, match=r"Timed out after 0\.2"),
+                project_lock(),
+            ):
+                pass
+        finally:
+            process.kill()
+            process.communicate()
+
+    def test_missing_dir(self, tmp_path: Path):
+        # Act, Assert
+        with usethis_config.set(project_dir=tmp_path / "missing"), project_lock():
+            pass
+
+    def test_held_by_files_manager(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            during = _try_lock(tmp_path)
+
+        # Assert
+        assert during == "blocked"
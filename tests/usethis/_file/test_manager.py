@@ -1,9 +1,12 @@
+import os
 from pathlib import Path
 
+from tomlkit.items import Table
 from typing_extensions import override
 
 from _test import change_cwd
-from usethis._file.manager import Document, FileManager
+from usethis._file.manager import Document, FileManager, document_cache
+from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 
 
 class TestUsethisFileManager:
@@ -109,3 +112,117 @@ class TestUsethisFileManager:
 
             # Assert
             assert repr_str == "MyUsethisFileManager('pyproject.toml')"
+
+    class TestRevision:
+        def test_changes(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyUsethisFileManager(FileManager[Document]):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+                @override
+                def _dump_content(self) -> str:
+                    return ""
+
+                @override
+                def _parse_content(self, content: str) -> None:
+                    raise NotImplementedError
+
+            # Act
+            with change_cwd(tmp_path), MyUsethisFileManager() as manager:
+                opened = manager.revision
+                unchanged = manager.revision
+                manager.commit(42)
+                committed = manager.revision
+                manager.revert()
+                reverted = manager.revision
+            with change_cwd(tmp_path), MyUsethisFileManager() as manager:
+                reopened = manager.revision
+
+            # Assert
+            assert opened == unchanged
+            assert len({opened, committed, reverted, reopened}) == 4
+
+
+class TestDocumentCache:
+    def test_reused(self, tmp_path: Path) -> None:
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\n')
+
+        # Act
+        with change_cwd(tmp_path), document_cache():
+            with PyprojectTOMLManager() as manager:
+                first = manager.get()
+            with PyprojectTOMLManager() as manager:
+                second = manager.get()
+
+        # Assert
+        assert first is second
+
+    def test_not_reused_outside_context(self, tmp_path: Path) -> None:
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\n')
+
+        # Act
+        with change_cwd(tmp_path):
+            with document_cache(), PyprojectTOMLManager() as manager:
+                first = manager.get()
+            with PyprojectTOMLManager() as manager:
+                second = manager.get()
+
+        # Assert
+        assert first is not second
+
+    def test_modified_on_disk(self, tmp_path: Path) -> None:
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\n')
+
+        # Act
+        with change_cwd(tmp_path), document_cache():
+            with PyprojectTOMLManager() as manager:
+                manager.get()
+            (tmp_path / "pyproject.toml").write_text('[project]\nname = "other"\n')
+            with PyprojectTOMLManager() as manager:
+                name = manager[["project", "name"]]
+
+        # Assert
+        assert name == "other"
+
+    def test_modified_on_disk_same_size_and_mtime(self, tmp_path: Path) -> None:
+        # e.g. on a filesystem with coarse timestamps
+
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[project]\nname = "test"\n')
+        stat = path.stat()
+
+        # Act
+        with change_cwd(tmp_path), document_cache():
+            with PyprojectTOMLManager() as manager:
+                manager.get()
+            path.write_text('[project]\nname = "tost"\n')
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            with PyprojectTOMLManager() as manager:
+                project_section = manager.get()["project"]
+                assert isinstance(project_section, Table)
+                name = project_section["name"]
+
+        # Assert
+        assert name == "tost"
+
+    def test_written_document_reused(self, tmp_path: Path) -> None:
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\n')
+
+        # Act
+        with change_cwd(tmp_path), document_cache():
+            with PyprojectTOMLManager() as manager:
+                manager.set_value(keys=["project", "version"], value="0.1.0")
+            with PyprojectTOMLManager() as manager:
+                version = manager[["project", "version"]]
+
+        # Assert
+        assert version == "0.1.0"
+        assert 'version = "0.1.0"' in (tmp_path / "pyproject.toml").read_text()
@@ -0,0 +1,43 @@
+import pytest
+
+from usethis._file.patch import (
+    DeleteValue,
+    ExtendList,
+    RemoveFromList,
+    SetValue,
+    validate_patch_ops,
+)
+
+
+class TestValidatePatchOps:
+    def test_empty(self):
+        # Act, Assert
+        validate_patch_ops([])
+
+    def test_valid(self):
+        # Arrange
+        ops = [
+            SetValue(keys=[], value={"a": 1}),
+            ExtendList(keys=["b"], values=["c"]),
+            RemoveFromList(keys=["b"], values=["d"]),
+            DeleteValue(keys=["e"], missing_ok=True),
+        ]
+
+        # Act, Assert
+        validate_patch_ops(ops)
+
+    def test_unrecognized_op(self):
+        # Arrange
+        ops = [SetValue(keys=["a"], value=1), ("b", 2)]
+
+        # Act, Assert
+        with pytest.raises(TypeError, match=r"Unrecognized operation of type 'tuple'"):
+            validate_patch_ops(ops)  # pyright: ignore[reportArgumentType]
+
+    @pytest.mark.parametrize(
+        "op", [ExtendList(keys=[], values=["a"]), RemoveFromList(keys=[], values=["a"])]
+    )
+    def test_list_op_without_keys(self, op: ExtendList | RemoveFromList):
+        # Act, Assert
+        with pytest.raises(ValueError, match=r"At least one ID key must be provided."):
+            validate_patch_ops([op])
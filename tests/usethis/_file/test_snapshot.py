@@ -0,0 +1,313 @@
+import os
+from pathlib import Path
+
+import pytest
+
+import usethis._file.snapshot
+from _test import change_cwd
+from usethis._config import usethis_config
+from usethis._file import fs
+from usethis._file.snapshot import (
+    ProjectSnapshot,
+    get_project_snapshot,
+    project_snapshot,
+)
+
+
+class TestProjectSnapshot:
+    class TestExists:
+        def test_file(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "pyproject.toml").touch()
+
+            # Act
+            snapshot = ProjectSnapshot(tmp_path)
+
+            # Assert
+            assert snapshot.exists("pyproject.toml")
+            assert snapshot.exists(Path("pyproject.toml"))
+            assert not snapshot.exists("uv.lock")
+
+        def test_nested(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "src" / "pkg").mkdir(parents=True)
+            (tmp_path / "src" / "pkg" / "__init__.py").touch()
+
+            # Act
+            snapshot = ProjectSnapshot(tmp_path)
+
+            # Assert
+            assert snapshot.exists("src/pkg/__init__.py")
+            assert not snapshot.exists("src/other/__init__.py")
+            assert not snapshot.exists("missing/__init__.py")
+
+        def test_absolute(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "README.md").touch()
+
+            # Act
+            snapshot = ProjectSnapshot(tmp_path)
+
+            # Assert
+            assert snapshot.exists(tmp_path / "README.md")
+
+        def test_outside_project(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "project").mkdir()
+            (tmp_path / "other.txt").touch()
+
+            # Act
+            snapshot = ProjectSnapshot(tmp_path / "project")
+
+            # Assert
+            assert snapshot.exists("../other.txt")
+            assert snapshot.exists(tmp_path / "other.txt")
+
+        def test_broken_symlink(self, tmp_path: Path):
+            # Arrange
+            try:
+                (tmp_path / "link").symlink_to(tmp_path / "missing")
+            except OSError:
+                pytest.skip("Symlinks are not supported")
+
+            # Act
+            snapshot = ProjectSnapshot(tmp_path)
+
+            # Assert
+            assert not snapshot.exists("link")
+
+    class TestIsFile:
+        def test_file(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "README.md").touch()
+
+            # Act, Assert
+            assert ProjectSnapshot(tmp_path).is_file("README.md")
+
+        def test_dir(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "README.md").mkdir()
+
+            # Act, Assert
+            assert not ProjectSnapshot(tmp_path).is_file("README.md")
+
+    class TestIsDir:
+        def test_dir(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "tests").mkdir()
+
+            # Act, Assert
+            assert ProjectSnapshot(tmp_path).is_dir("tests")
+
+        def test_file(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "tests").touch()
+
+            # Act, Assert
+            assert not ProjectSnapshot(tmp_path).is_dir("tests")
+
+        def test_root(self, tmp_path: Path):
+            # Act, Assert
+            assert ProjectSnapshot(tmp_path).is_dir(".")
+
+    class TestIterdir:
+        def test_sorted(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "b").touch()
+            (tmp_path / "a").mkdir()
+
+            # Act
+            paths = ProjectSnapshot(tmp_path).iterdir()
+
+            # Assert
+            assert paths == [tmp_path / "a", tmp_path / "b"]
+
+        def test_missing(self, tmp_path: Path):
+            # Act, Assert
+            assert ProjectSnapshot(tmp_path).iterdir("src") == []
+
+    class TestGlob:
+        def test_pattern(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "README.rst").touch()
+            (tmp_path / "readme.txt").touch()
+            (tmp_path / "CONTRIBUTING.md").touch()
+
+            # Act
+            paths = ProjectSnapshot(tmp_path).glob("README*")
+
+            # Assert
+            assert paths == [tmp_path / "README.rst"]
+
+    def test_lists_each_dir_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / "src").mkdir()
+        # Listings of recently-modified directories aren't trusted, so backdate them.
+        for path in [tmp_path, tmp_path / "src"]:
+            os.utime(path, ns=(1_000_000_001, 1_000_000_001))
+        scanned: list[Path] = []
+        scan_dir = usethis._file.snapshot._scan_dir
+
+        def _scan_dir(path: Path):
+            scanned.append(path)
+            return scan_dir(path)
+
+        monkeypatch.setattr(usethis._file.snapshot, "_scan_dir", _scan_dir)
+
+        # Act
+        snapshot = ProjectSnapshot(tmp_path)
+        snapshot.exists("pyproject.toml")
+        snapshot.exists("uv.lock")
+        snapshot.is_dir("src")
+        snapshot.exists("src/a.py")
+        snapshot.exists("src/b.py")
+        snapshot.exists("tests/conftest.py")
+
+        # Assert
+        assert scanned == [tmp_path, tmp_path / "src"]
+
+
+class TestGetProjectSnapshot:
+    def test_fresh_outside_context(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path):
+            first = get_project_snapshot()
+            second = get_project_snapshot()
+
+        # Assert
+        assert first is not second
+
+    def test_shared_in_context(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), project_snapshot():
+            first = get_project_snapshot()
+            second = get_project_snapshot()
+
+        # Assert
+        assert first is second
+
+    def test_per_project_dir(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+
+        # Act
+        with project_snapshot():
+            with usethis_config.set(project_dir=tmp_path / "a"):
+                a = get_project_snapshot()
+            with usethis_config.set(project_dir=tmp_path / "b"):
+                b = get_project_snapshot()
+
+        # Assert
+        assert a.root == tmp_path / "a"
+        assert b.root == tmp_path / "b"
+
+    def test_nested_context(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), project_snapshot():
+            first = get_project_snapshot()
+            with project_snapshot():
+                pass
+            second = get_project_snapshot()
+
+        # Assert
+        assert first is second
+
+
+class TestModifiedDir:
+    def test_created(self, tmp_path: Path):
+        # Arrange
+        snapshot = ProjectSnapshot(tmp_path)
+
+        # Act
+        before = snapshot.exists("uv.lock")
+        (tmp_path / "uv.lock").touch()
+        after = snapshot.exists("uv.lock")
+
+        # Assert
+        assert not before
+        assert after
+
+    def test_removed(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").touch()
+        snapshot = ProjectSnapshot(tmp_path)
+
+        # Act
+        before = snapshot.exists("src/a.py")
+        (tmp_path / "src" / "a.py").unlink()
+        (tmp_path / "src").rmdir()
+        after = snapshot.exists("src/a.py")
+
+        # Assert
+        assert before
+        assert not after
+        assert not snapshot.is_dir("src")
+
+    def test_shared_in_context(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), project_snapshot():
+            before = get_project_snapshot().exists("uv.lock")
+            (tmp_path / "uv.lock").touch()
+            after = get_project_snapshot().exists("uv.lock")
+
+        # Assert
+        assert not before
+        assert after
+
+    def test_same_mtime_recent(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # On filesystems with coarse timestamps, creating an entry soon after listing
+        # the directory might not change its modification time.
+
+        # Arrange
+        os.utime(tmp_path, ns=(5_000_000_000, 5_000_000_000))
+        monkeypatch.setattr(
+            usethis._file.snapshot.time, "time_ns", lambda: 5_500_000_000
+        )
+        snapshot = ProjectSnapshot(tmp_path)
+
+        # Act
+        (tmp_path / "uv.lock").touch()
+        os.utime(tmp_path, ns=(5_000_000_000, 5_000_000_000))
+        after = snapshot.exists("uv.lock")
+
+        # Assert
+        assert after
+
+    def test_same_mtime_old(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Once a listing is old enough to be trusted, it is reused.
+
+        # Arrange
+        os.utime(tmp_path, ns=(5_000_000_000, 5_000_000_000))
+        monkeypatch.setattr(
+            usethis._file.snapshot.time, "time_ns", lambda: 10_000_000_000
+        )
+        snapshot = ProjectSnapshot(tmp_path)
+
+        # Act
+        (tmp_path / "uv.lock").touch()
+        os.utime(tmp_path, ns=(5_000_000_000, 5_000_000_000))
+        after = snapshot.exists("uv.lock")
+
+        # Assert
+        assert not after
+
+
+class TestHeldChanges:
+    def test_created_and_removed(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "setup.cfg").touch()
+
+        # Act
+        with change_cwd(tmp_path), project_snapshot(), fs.hold_changes():
+            snapshot = get_project_snapshot()
+            assert snapshot.is_file("setup.cfg")
+            fs.unlink(tmp_path / "setup.cfg")
+            fs.mkdir(tmp_path / "docs")
+            fs.touch(tmp_path / "docs" / "index.md")
+
+            # Assert
+            assert not snapshot.exists("setup.cfg")
+            assert snapshot.is_dir("docs")
+            assert snapshot.iterdir("docs") == [tmp_path / "docs" / "index.md"]
@@ -0,0 +1,208 @@
+import pytest
+import tomlkit.api
+from tomlkit.items import Table
+
+import usethis._file.toml.incremental
+from usethis._file.toml.incremental import dumps_incremental, parse_with_source
+
+_CONTENT = """\
+# A comment
+name = "a"
+
+[project]
+name = "b"
+
+  [tool.a]
+  b = 1
+
+[[tool.c]]
+d = 1
+
+[[tool.c]]
+d = 2
+
+[e]   # trailing
+f = [
+    1,
+]
+"""
+
+
+class TestParseWithSource:
+    def test_spans_cover_tables(self) -> None:
+        # Act
+        _, source = parse_with_source(_CONTENT)
+
+        # Assert
+        assert source is not None
+        assert [source.text[start:end] for start, end in source.spans] == [
+            '[project]\nname = "b"\n\n',
+            "  [tool.a]\n  b = 1\n\n[[tool.c]]\nd = 1\n\n[[tool.c]]\nd = 2\n\n",
+            "[e]   # trailing\nf = [\n    1,\n]\n",
+        ]
+
+    def test_no_tables(self) -> None:
+        # Act
+        _, source = parse_with_source('a = "b"\n')
+
+        # Assert
+        assert source is not None
+        assert source.spans == ()
+
+    def test_dotted_top_level_keys(self) -> None:
+        # Act
+        _, source = parse_with_source("a.b = 1\n\n[c]\nd = 1\n")
+
+        # Assert
+        assert source is None
+
+    def test_unsupported_tomlkit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # e.g. a version of tomlkit without the private APIs this relies on
+
+        # Arrange
+        monkeypatch.setattr(usethis._file.toml.incremental, "_IS_SUPPORTED", False)
+
+        # Act
+        document, source = parse_with_source(_CONTENT)
+
+        # Assert
+        assert source is None
+        assert tomlkit.api.dumps(document) == _CONTENT
+
+
+class TestDumpsIncremental:
+    def test_unmodified(self) -> None:
+        # Arrange
+        document, source = parse_with_source(_CONTENT)
+        assert source is not None
+
+        # Act
+        result = dumps_incremental(document, source=source, modified_keys=set())
+
+        # Assert
+        assert result == _CONTENT
+
+    def test_modified_table(self) -> None:
+        # Arrange
+        document, source = parse_with_source(_CONTENT)
+        assert source is not None
+        tool_section = document["tool"]
+        assert isinstance(tool_section, Table)
+        a_section = tool_section["a"]
+        assert isinstance(a_section, Table)
+        a_section["b"] = 3
+
+        # Act
+        result = dumps_incremental(document, source=source, modified_keys={"tool"})
+
+        # Assert
+        assert result == tomlkit.api.dumps(document)
+        assert "  b = 3\n" in result
+
+    def test_added_and_removed_tables(self) -> None:
+        # Arrange
+        document, source = parse_with_source(_CONTENT)
+        assert source is not None
+        del document["e"]
+        document["g"] = {"h": 1}
+
+        # Act
+        result = dumps_incremental(document, source=source, modified_keys={"e", "g"})
+
+        # Assert
+        assert result == tomlkit.api.dumps(document)
+
+    def test_inserted_before_table(self) -> None:
+        # Arrange
+        document, source = parse_with_source("[project]\nname = 'a'\n")
+        assert source is not None
+        document["a"] = 1
+
+        # Act
+        result = dumps_incremental(document, source=source, modified_keys={"a"})
+
+        # Assert
+        assert result == tomlkit.api.dumps(document)
+        assert result == "a = 1\n\n[project]\nname = 'a'\n"
+
+    def test_neighbour_modified_in_place(self) -> None:
+        # Arrange
+        document, source = parse_with_source(
+            "[project]\nname = 'a'\n\n[tool.b]\nc = 1\n"
+        )
+        assert source is not None
+        project_section = document["project"]
+        assert isinstance(project_section, Table)
+        project_section["version"] = "0.1.0"
+        # Modify the neighbouring table without recording it, to check its text is
+        # reused.
+        tool_section = document["tool"]
+        assert isinstance(tool_section, Table)
+        b_section = tool_section["b"]
+        assert isinstance(b_section, Table)
+        b_section["c"] = 2
+
+        # Act
+        result = dumps_incremental(document, source=source, modified_keys={"project"})
+
+        # Assert
+        assert result == (
+            "[project]\nname = 'a'\nversion = \"0.1.0\"\n\n[tool.b]\nc = 1\n"
+        )
+
+    def test_unrecorded_modification_reuses_source(self) -> None:
+        # Arrange
+        document, source = parse_with_source("[a]\nb = 1\n")
+        assert source is not None
+        a_section = document["a"]
+        assert isinstance(a_section, Table)
+        a_section["b"] = 2
+
+        # Act
+        result = dumps_incremental(document, source=source, modified_keys=set())
+
+        # Assert
+        assert result == "[a]\nb = 1\n"
+
+
+def _get_large_content() -> str:
+    # e.g. a pyproject.toml with many per-file ignores and tool sections
+    content = '[project]\nname = "a"\nversion = "0.1.0"\n\n'
+    content += "[tool.ruff.lint.per-file-ignores]\n"
+    content += "".join(f'"src/a/m{idx}.py" = ["E501", "F401"]\n' for idx in range(3000))
+    for idx in range(200):
+        content += f"\n[tool.t{idx}]\nkey = {idx}\nvalues = [1, 2, 3]\n"
+    return content
+
+
+@pytest.mark.benchmark
+def test_dumps_incremental_large_document():
+    # Arrange
+    document, source = parse_with_source(_get_large_content())
+    assert source is not None
+    project_section = document["project"]
+    assert isinstance(project_section, Table)
+    project_section["version"] = "0.2.0"
+
+    # Act
+    result = dumps_incremental(document, source=source, modified_keys={"project"})
+
+    # Assert
+    assert 'version = "0.2.0"' in result
+
+
+@pytest.mark.benchmark
+def test_dumps_full_large_document():
+    # For comparison with `test_dumps_incremental_large_document`.
+
+    # Arrange
+    document, _ = parse_with_source(_get_large_content())
+    project_section = document["project"]
+    assert isinstance(project_section, Table)
+    project_section["version"] = "0.2.0"
+
+    # Act
+    result = tomlkit.api.dumps(document)
+
+    # Assert
+    assert 'version = "0.2.0"' in result
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 import pytest
@@ -7,7 +8,10 @@ import tomlkit.items
 from typing_extensions import override
 
 from _test import change_cwd
+from usethis._file.patch import DeleteValue, ExtendList, RemoveFromList, SetValue
 from usethis._file.toml.errors import (
+    TOMLDecodeError,
+    TOMLIncrementalDumpError,
     TOMLValueAlreadySetError,
     TOMLValueInvalidError,
     TOMLValueMissingError,
@@ -1022,3 +1026,336 @@ key = [
             contents = (tmp_path / "myfile.toml").read_text()
             assert "# Comment for A." in contents
             assert "# Comment for C." in contents
+
+    class TestPatch:
+        def test_applies_all_ops(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").write_text("""\
+[tool.a]
+b = 1
+c = ["x", "y"]
+d = "e"
+""")
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                # Act
+                manager.patch(
+                    [
+                        SetValue(keys=["tool", "a", "b"], value=2, exists_ok=True),
+                        SetValue(keys=["tool", "f"], value={"g": "h"}),
+                        ExtendList(keys=["tool", "a", "c"], values=["z"]),
+                        RemoveFromList(keys=["tool", "a", "c"], values=["x"]),
+                        DeleteValue(keys=["tool", "a", "d"]),
+                    ]
+                )
+
+            # Assert
+            assert (
+                (tmp_path / "pyproject.toml").read_text()
+                == """\
+[tool.a]
+b = 2
+c = ["y", "z"]
+
+[tool.f]
+g = "h"
+"""
+            )
+
+        def test_single_commit(self, tmp_path: Path) -> None:
+            # Arrange
+            commits: list[tomlkit.TOMLDocument] = []
+
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+                @override
+                def commit(self, document: tomlkit.TOMLDocument) -> None:
+                    commits.append(document)
+                    super().commit(document)
+
+            (tmp_path / "pyproject.toml").touch()
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                # Act
+                manager.patch(
+                    [
+                        SetValue(keys=["a"], value=1),
+                        SetValue(keys=["b"], value=2),
+                        ExtendList(keys=["c"], values=["d"]),
+                    ]
+                )
+
+                # Assert
+                assert len(commits) == 1
+                assert manager[[]] == {"a": 1, "b": 2, "c": ["d"]}
+
+        def test_no_ops(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                # Act
+                manager.patch([])
+
+            # Assert
+            assert not (tmp_path / "pyproject.toml").exists()
+
+        def test_delete_missing(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").touch()
+
+            # Act, Assert
+            with (
+                change_cwd(tmp_path),
+                MyTOMLFileManager() as manager,
+                pytest.raises(TOMLValueMissingError),
+            ):
+                manager.patch([DeleteValue(keys=["a"])])
+
+        def test_delete_missing_ok(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").write_text('a = "b"\n')
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                # Act
+                manager.patch(
+                    [
+                        DeleteValue(keys=["c"], missing_ok=True),
+                        DeleteValue(keys=["a"], missing_ok=True),
+                    ]
+                )
+
+                # Assert
+                assert manager[[]] == {}
+
+        def test_invalid_op_applies_nothing(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").touch()
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                # Act
+                with pytest.raises(
+                    ValueError, match=r"At least one ID key must be provided."
+                ):
+                    manager.patch(
+                        [
+                            SetValue(keys=["a"], value=1),
+                            ExtendList(keys=[], values=["b"]),
+                        ]
+                    )
+
+                # Assert
+                assert manager[[]] == {}
+
+    class TestGetReadonly:
+        @pytest.mark.skipif(
+            sys.version_info < (3, 11), reason="tomllib is not available"
+        )
+        def test_lookup_does_not_parse_document(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").write_text('[tool.a]\nb = ["c"]\n')
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                # Act
+                contained = ["tool", "a"] in manager
+                value = manager[["tool", "a", "b"]]
+
+                # Assert
+                assert contained
+                assert value == ["c"]
+                assert type(value) is list
+                assert manager._content is None
+
+        def test_upgraded_on_write(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").write_text('[tool.a]\nb = ["c"]\n')
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                assert manager[["tool", "a", "b"]] == ["c"]
+
+                # Act
+                manager.extend_list(keys=["tool", "a", "b"], values=["d"])
+
+                # Assert
+                assert isinstance(manager._content, tomlkit.TOMLDocument)
+                assert manager[["tool", "a", "b"]] == ["c", "d"]
+
+            assert (tmp_path / "pyproject.toml").read_text() == (
+                '[tool.a]\nb = ["c", "d"]\n'
+            )
+
+        def test_reverted(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").write_text('a = "b"\n')
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                assert manager[["a"]] == "b"
+                (tmp_path / "pyproject.toml").write_text('a = "c"\n')
+
+                # Act
+                manager.revert()
+
+                # Assert
+                assert manager[["a"]] == "c"
+
+        def test_missing_file(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                # Act, Assert
+                assert ["a"] not in manager
+                with pytest.raises(FileNotFoundError):
+                    manager[["a"]]
+
+        def test_invalid_file(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").write_text("[a\n")
+
+            # Act, Assert
+            with (
+                change_cwd(tmp_path),
+                MyTOMLFileManager() as manager,
+                pytest.raises(TOMLDecodeError),
+            ):
+                manager[["a"]]
+
+    class TestIncrementalDump:
+        def test_unmodified_tables_kept_verbatim(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").write_text(
+                '[project]\nname = "a"\n\n[tool.a]\nb = 1\n'
+            )
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                # Act
+                manager[["tool", "a", "c"]] = 2
+
+                # Assert
+                assert manager._modified_keys_by_path[manager.path] == {"tool"}
+
+            assert (tmp_path / "pyproject.toml").read_text() == (
+                '[project]\nname = "a"\n\n[tool.a]\nb = 1\nc = 2\n'
+            )
+
+        def test_commit_dumps_in_full(self, tmp_path: Path) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").write_text("[tool.a]\nb = 1\n")
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                document = manager.get()
+                tool_section = document["tool"]
+                assert isinstance(tool_section, tomlkit.items.Table)
+                a_section = tool_section["a"]
+                assert isinstance(a_section, tomlkit.items.Table)
+                a_section["b"] = 2
+
+                # Act
+                manager.commit(document)
+
+                # Assert
+                assert manager._modified_keys_by_path[manager.path] is None
+
+            assert (tmp_path / "pyproject.toml").read_text() == "[tool.a]\nb = 2\n"
+
+        def test_verify_mismatch(
+            self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        ) -> None:
+            # Arrange
+            class MyTOMLFileManager(TOMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("pyproject.toml")
+
+            (tmp_path / "pyproject.toml").write_text(
+                "[tool.a]\nb = 1\n\n[c]\nd = 1\n\n[e]\nf = 1\n"
+            )
+            monkeypatch.setattr(MyTOMLFileManager, "verify_incremental_dumps", True)
+
+            with change_cwd(tmp_path), MyTOMLFileManager() as manager:
+                manager[["tool", "a", "b"]] = 2
+                # Modify a table without recording it, so its stale text is reused.
+                e_section = manager.get()["e"]
+                assert isinstance(e_section, tomlkit.items.Table)
+                e_section["f"] = 2
+
+                # Act, Assert
+                with pytest.raises(
+                    TOMLIncrementalDumpError, match=r"differs from the full render"
+                ):
+                    manager._dump_content()
+
+                manager.revert()
@@ -18,6 +18,7 @@ from ruamel.yaml.timestamp import TimeStamp
 from typing_extensions import override
 
 from _test import change_cwd, edit_yaml
+from usethis._file.patch import DeleteValue, ExtendList, RemoveFromList, SetValue
 from usethis._file.yaml.errors import (
     UnexpectedYAMLIOError,
     UnexpectedYAMLOpenError,
@@ -1136,6 +1137,121 @@ outer:
                     "outer": {"inner": {"items": "item1"}}
                 }
 
+    class TestPatch:
+        def test_applies_all_ops(self, tmp_path: Path):
+            # Arrange
+            class MyYAMLFileManager(YAMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("my_yaml_file.yaml")
+
+            (tmp_path / "my_yaml_file.yaml").write_text(
+                """\
+# A comment
+a: 1
+items:
+    - item1
+    - item2
+c: d
+"""
+            )
+
+            with change_cwd(tmp_path), MyYAMLFileManager() as manager:
+                # Act
+                manager.patch(
+                    [
+                        SetValue(keys=["a"], value=2, exists_ok=True),
+                        ExtendList(keys=["items"], values=["item3"]),
+                        RemoveFromList(keys=["items"], values=["item1"]),
+                        DeleteValue(keys=["c"]),
+                        SetValue(keys=["e"], value="f"),
+                    ]
+                )
+
+            # Assert
+            assert (tmp_path / "my_yaml_file.yaml").read_text() == (
+                """\
+# A comment
+a: 2
+items:
+    - item2
+    - item3
+e: f
+"""
+            )
+
+        def test_single_commit(self, tmp_path: Path):
+            # Arrange
+            commits: list[YAMLDocument] = []
+
+            class MyYAMLFileManager(YAMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("my_yaml_file.yaml")
+
+                @override
+                def commit(self, document: YAMLDocument) -> None:
+                    commits.append(document)
+                    super().commit(document)
+
+            (tmp_path / "my_yaml_file.yaml").touch()
+
+            with change_cwd(tmp_path), MyYAMLFileManager() as manager:
+                # Act
+                manager.patch(
+                    [
+                        SetValue(keys=["a"], value=1),
+                        SetValue(keys=["b"], value=2),
+                        ExtendList(keys=["c"], values=["d"]),
+                    ]
+                )
+
+                # Assert
+                assert len(commits) == 1
+                assert manager[[]] == {"a": 1, "b": 2, "c": ["d"]}
+
+        def test_delete_missing_ok(self, tmp_path: Path):
+            # Arrange
+            class MyYAMLFileManager(YAMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("my_yaml_file.yaml")
+
+            (tmp_path / "my_yaml_file.yaml").write_text("a: b\n")
+
+            with change_cwd(tmp_path), MyYAMLFileManager() as manager:
+                # Act
+                manager.patch(
+                    [
+                        DeleteValue(keys=["c"], missing_ok=True),
+                        DeleteValue(keys=["a"], missing_ok=True),
+                    ]
+                )
+
+                # Assert
+                assert manager[[]] == {}
+
+        def test_delete_missing(self, tmp_path: Path):
+            # Arrange
+            class MyYAMLFileManager(YAMLFileManager):
+                @property
+                @override
+                def relative_path(self) -> Path:
+                    return Path("my_yaml_file.yaml")
+
+            (tmp_path / "my_yaml_file.yaml").write_text("a: b\n")
+
+            # Act, Assert
+            with (
+                change_cwd(tmp_path),
+                MyYAMLFileManager() as manager,
+                pytest.raises(YAMLValueMissingError),
+            ):
+                manager.patch([DeleteValue(keys=["c"])])
+
 
 class TestEditYaml:
     class TestLiterals:
@@ -0,0 +1,157 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from _test import change_cwd
+from usethis._config_file import files_manager
+from usethis._integrations.pre_commit.errors import PreCommitConfigYAMLConfigError
+from usethis._integrations.pre_commit.projection import (
+    PreCommitConfigProjection,
+    RepoProjection,
+    get_pre_commit_config_projection,
+)
+from usethis._integrations.pre_commit.yaml import PreCommitConfigYAMLManager
+
+
+class TestPreCommitConfigProjection:
+    class TestHookIds:
+        def test_across_repos(self):
+            # Arrange
+            projection = PreCommitConfigProjection(
+                repos=(
+                    RepoProjection(repo="local", hook_ids=("a", "b")),
+                    RepoProjection(repo="meta", hook_ids=()),
+                    RepoProjection(repo="https://example.com", hook_ids=("c",)),
+                ),
+                minimum_pre_commit_version=None,
+            )
+
+            # Act
+            result = projection.hook_ids
+
+            # Assert
+            assert result == ["a", "b", "c"]
+
+
+class TestGetPreCommitConfigProjection:
+    def test_happy_path(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+minimum_pre_commit_version: '4.4.0'
+repos:
+  - repo: https://github.com/abravalheri/validate-pyproject
+    rev: v0.23
+    hooks:
+      - id: validate-pyproject
+  - repo: local
+    hooks:
+      - id: deptry
+        name: deptry
+        entry: uv run --frozen --offline deptry src
+        language: system
+      - name: no id
+  - repo: meta
+""")
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            result = get_pre_commit_config_projection()
+
+        # Assert
+        assert result == PreCommitConfigProjection(
+            repos=(
+                RepoProjection(
+                    repo="https://github.com/abravalheri/validate-pyproject",
+                    hook_ids=("validate-pyproject",),
+                ),
+                RepoProjection(repo="local", hook_ids=("deptry",)),
+                RepoProjection(repo="meta", hook_ids=()),
+            ),
+            minimum_pre_commit_version="4.4.0",
+        )
+
+    def test_empty_file(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("")
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            result = get_pre_commit_config_projection()
+
+        # Assert
+        assert result == PreCommitConfigProjection(
+            repos=(), minimum_pre_commit_version=None
+        )
+
+    def test_invalid_structure(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+repos:
+  - repo: local
+    hooks: 42
+""")
+
+        # Act, Assert
+        with (
+            change_cwd(tmp_path),
+            files_manager(),
+            pytest.raises(
+                PreCommitConfigYAMLConfigError,
+                match=r"Invalid '.pre-commit-config.yaml' file:",
+            ),
+        ):
+            get_pre_commit_config_projection()
+
+    def test_missing_repos(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+minimum_pre_commit_version: '4.4.0'
+""")
+
+        # Act, Assert
+        with (
+            change_cwd(tmp_path),
+            files_manager(),
+            pytest.raises(PreCommitConfigYAMLConfigError),
+        ):
+            get_pre_commit_config_projection()
+
+    def test_reflects_uncommitted_changes(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+repos:
+  - repo: local
+    hooks:
+      - id: a
+""")
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            mgr = PreCommitConfigYAMLManager()
+            doc = mgr.get()
+            doc.content["repos"][0]["hooks"].append({"id": "b"})
+            mgr.commit(doc)
+            result = get_pre_commit_config_projection()
+
+        # Assert
+        assert result.hook_ids == ["a", "b"]
+
+    def test_schema_not_imported(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+repos:
+  - repo: local
+    hooks:
+      - id: a
+""")
+        monkeypatch.delitem(
+            sys.modules, "usethis._integrations.pre_commit.schema", raising=False
+        )
+
+        # Act
+        with change_cwd(tmp_path), files_manager():
+            get_pre_commit_config_projection()
+
+        # Assert
+        assert "usethis._integrations.pre_commit.schema" not in sys.modules
@@ -3,6 +3,7 @@ from pathlib import Path
 import grimp
 import pytest
 
+import usethis._integrations.project.imports
 from _test import change_cwd
 from usethis._integrations.project.errors import ImportGraphBuildFailedError
 from usethis._integrations.project.imports import (
@@ -12,6 +13,9 @@ from usethis._integrations.project.imports import (
     _get_graph,
     _get_module_layered_architecture,
     get_layered_architectures,
+    get_layered_architectures_by_root_package,
+    import_graph_cache,
+    invalidate_import_graph_cache,
 )
 
 
@@ -84,6 +88,119 @@ import salut.d.f
         assert arch_by_module["salut.d"].excluded == set()
 
 
+class TestGetLayeredArchitecturesByRootPackage:
+    def test_namespace_portions(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / "coucou" / "a").mkdir(parents=True)
+        (tmp_path / "coucou" / "a" / "__init__.py").touch()
+        (tmp_path / "coucou" / "a" / "x.py").touch()
+        (tmp_path / "coucou" / "a" / "y.py").write_text("""\
+import coucou.a.x
+import coucou.b
+""")
+        (tmp_path / "coucou" / "b").mkdir()
+        (tmp_path / "coucou" / "b" / "__init__.py").touch()
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # Act
+        with change_cwd(tmp_path):
+            arch_by_module_by_root_package = get_layered_architectures_by_root_package(
+                ["coucou.a", "coucou.b"]
+            )
+
+        # Assert
+        assert set(arch_by_module_by_root_package) == {"coucou.a", "coucou.b"}
+        assert set(arch_by_module_by_root_package["coucou.a"]) == {
+            "coucou.a",
+            "coucou.a.x",
+            "coucou.a.y",
+        }
+        assert arch_by_module_by_root_package["coucou.a"]["coucou.a"].layers == [
+            {"y"},
+            {"x"},
+        ]
+        assert set(arch_by_module_by_root_package["coucou.b"]) == {"coucou.b"}
+
+    def test_imports_via_other_package(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # a.x imports a.z only indirectly, via b.y, so they are still independent
+        # within a.
+
+        # Arrange
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "__init__.py").touch()
+        (tmp_path / "a" / "x.py").write_text("import b.y\n")
+        (tmp_path / "a" / "z.py").touch()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "__init__.py").touch()
+        (tmp_path / "b" / "y.py").write_text("import a.z\n")
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # Act
+        with change_cwd(tmp_path):
+            arch_by_module_by_root_package = get_layered_architectures_by_root_package(
+                ["a", "b"]
+            )
+            arch_by_module = get_layered_architectures("a")
+
+        # Assert
+        assert arch_by_module_by_root_package["a"] == arch_by_module
+        assert arch_by_module["a"].layers == [{"x", "z"}]
+
+    def test_single_build(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / "hola").mkdir()
+        (tmp_path / "hola" / "__init__.py").touch()
+        (tmp_path / "hej").mkdir()
+        (tmp_path / "hej" / "__init__.py").touch()
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        builds: list[tuple[str, ...]] = []
+        build_graph = usethis._integrations.project.imports._build_graph
+
+        def _build_graph(*pkg_names: str) -> grimp.ImportGraph:
+            builds.append(pkg_names)
+            return build_graph(*pkg_names)
+
+        monkeypatch.setattr(
+            usethis._integrations.project.imports, "_build_graph", _build_graph
+        )
+
+        # Act
+        with change_cwd(tmp_path), import_graph_cache():
+            get_layered_architectures_by_root_package(["hej", "hola"])
+            get_layered_architectures_by_root_package(["hej", "hola"])
+
+        # Assert
+        assert builds == [("hej", "hola")]
+
+    def test_one_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / "ciao").mkdir()
+        (tmp_path / "ciao" / "__init__.py").touch()
+        (tmp_path / "ciao" / "a.py").touch()
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # Act
+        with change_cwd(tmp_path):
+            arch_by_module_by_root_package = get_layered_architectures_by_root_package(
+                ["ciao", "does_not_exist"]
+            )
+
+        # Assert
+        assert set(arch_by_module_by_root_package["ciao"]) == {"ciao", "ciao.a"}
+        assert arch_by_module_by_root_package["does_not_exist"] == {}
+
+    def test_empty(self):
+        # Act, Assert
+        assert get_layered_architectures_by_root_package([]) == {}
+
+
 class TestGetModuleLayeredArchitecture:
     def test_three(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         # Arrange
@@ -568,3 +685,83 @@ class TestGetGraph:
 
         # Assert
         assert isinstance(graph, grimp.ImportGraph)
+
+
+class TestImportGraphCache:
+    def test_reused_within_context(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        (tmp_path / "bonsoir").mkdir()
+        (tmp_path / "bonsoir" / "__init__.py").touch()
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # Act
+        with change_cwd(tmp_path), import_graph_cache():
+            first = _get_graph("bonsoir")
+            second = _get_graph("bonsoir")
+
+        # Assert
+        assert first is second
+
+    def test_not_reused_outside_context(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        (tmp_path / "bonsoir").mkdir()
+        (tmp_path / "bonsoir" / "__init__.py").touch()
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # Act
+        with change_cwd(tmp_path):
+            with import_graph_cache():
+                first = _get_graph("bonsoir")
+            second = _get_graph("bonsoir")
+
+        # Assert
+        assert first is not second
+
+    def test_nested(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / "bonsoir").mkdir()
+        (tmp_path / "bonsoir" / "__init__.py").touch()
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # Act
+        with change_cwd(tmp_path), import_graph_cache():
+            with import_graph_cache():
+                first = _get_graph("bonsoir")
+            second = _get_graph("bonsoir")
+
+        # Assert
+        assert first is second
+
+    def test_failure_reused(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), import_graph_cache():
+            with pytest.raises(ImportGraphBuildFailedError) as first:
+                _get_graph("does_not_exist")
+            with pytest.raises(ImportGraphBuildFailedError) as second:
+                _get_graph("does_not_exist")
+
+        # Assert
+        assert first.value is second.value
+
+    def test_invalidate(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / "bonsoir").mkdir()
+        (tmp_path / "bonsoir" / "__init__.py").touch()
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # Act
+        with change_cwd(tmp_path), import_graph_cache():
+            first = _get_graph("bonsoir")
+            invalidate_import_graph_cache()
+            second = _get_graph("bonsoir")
+
+        # Assert
+        assert first is not second
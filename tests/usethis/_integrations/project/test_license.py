@@ -2,13 +2,16 @@ from pathlib import Path
 
 import pytest
 
+import usethis._integrations.project.license
 from _test import change_cwd
+from usethis._config import usethis_config
 from usethis._config_file import files_manager
 from usethis._integrations.project.errors import LicenseDetectionError
 from usethis._integrations.project.license import (
     _get_license_from_classifiers,
     _get_license_from_file,
     _get_license_from_pyproject_field,
+    _get_license_id_from_path,
     get_license_id,
 )
 
@@ -148,6 +151,103 @@ class TestGetLicenseFromFile:
         # Assert
         assert result is None
 
+    def test_relative_to_project_dir(self, tmp_path: Path, usethis_dev_dir: Path):
+        # Arrange
+        (tmp_path / "LICENSE").write_text(_MIT_LICENSE_TEXT)
+
+        # Act
+        with change_cwd(usethis_dev_dir), usethis_config.set(project_dir=tmp_path):
+            result = _get_license_from_file()
+
+        # Assert
+        assert result == "MIT"
+
+
+class TestGetLicenseIdFromPath:
+    def test_exact_match_skips_fuzzy_matching(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        path = tmp_path / "LICENSE"
+        path.write_text(_MIT_LICENSE_TEXT.replace("2024", "2025 Someone Else"))
+        monkeypatch.setattr(
+            usethis._integrations.project.license,
+            "license_id",
+            lambda _: pytest.fail("Fuzzy matching should not be needed"),
+        )
+
+        # Act
+        result = _get_license_id_from_path(path)
+
+        # Assert
+        assert result == "MIT"
+
+    def test_near_exact_match(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange - reflowed, with different case and quoting
+        path = tmp_path / "LICENSE"
+        path.write_text(
+            _MIT_LICENSE_TEXT.upper().replace('"', "'").replace(",\n", ",\n\n")
+        )
+        monkeypatch.setattr(
+            usethis._integrations.project.license,
+            "license_id",
+            lambda _: pytest.fail("Fuzzy matching should not be needed"),
+        )
+
+        # Act
+        result = _get_license_id_from_path(path)
+
+        # Assert
+        assert result == "MIT"
+
+    def test_fuzzy_match(self, tmp_path: Path):
+        # Arrange - a small typo
+        path = tmp_path / "LICENSE"
+        path.write_text(_MIT_LICENSE_TEXT.replace("hereby", "herby"))
+
+        # Act
+        result = _get_license_id_from_path(path)
+
+        # Assert
+        assert result == "MIT"
+
+    def test_cached_by_content(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        text = _MIT_LICENSE_TEXT.replace("hereby", "hereby hereby")
+        (tmp_path / "a" / "LICENSE").write_text(text)
+        (tmp_path / "b" / "LICENSE").write_text(text)
+        calls: list[str] = []
+        license_id = usethis._integrations.project.license.license_id
+
+        def _license_id(filename: str) -> str | None:
+            calls.append(filename)
+            return license_id(filename)
+
+        monkeypatch.setattr(
+            usethis._integrations.project.license, "license_id", _license_id
+        )
+
+        # Act
+        first = _get_license_id_from_path(tmp_path / "a" / "LICENSE")
+        second = _get_license_id_from_path(tmp_path / "b" / "LICENSE")
+
+        # Assert
+        assert first == second == "MIT"
+        assert len(calls) == 1
+
+    def test_unrecognized(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "LICENSE"
+        path.write_text("This is not a recognized license.\n")
+
+        # Act
+        result = _get_license_id_from_path(path)
+
+        # Assert
+        assert result is None
+
 
 class TestGetLicenseFromPyprojectField:
     def test_spdx_string(self, tmp_path: Path):
@@ -2,7 +2,7 @@ from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, RootModel
 
-from usethis._integrations.pydantic.dump import fancy_model_dump
+from usethis._integrations.pydantic.dump import _get_dump_plan, fancy_model_dump
 from usethis._integrations.pydantic.typing_ import ModelRepresentation
 
 
@@ -362,3 +362,59 @@ class TestFancyModelDump:
                 "items": [{"id": "test", "priority": 0}],
                 "minimum_prek_version": "0.2.23",
             }
+
+    class TestRepeatedDump:
+        def test_same_output(self):
+            # Arrange
+            class MyModel(BaseModel):
+                x: int = 0
+                y: float = Field(default=1.0, alias="z")
+
+            models = [MyModel(x=1), MyModel(x=0, z=2.0), MyModel()]
+
+            # Act
+            outputs = [
+                fancy_model_dump(mm, order_by_cls={MyModel: ["z", "x"]})
+                for mm in models
+            ]
+
+            # Assert
+            assert outputs == [{"x": 1}, {"z": 2.0}, {}]
+
+
+class TestGetDumpPlan:
+    def test_cached(self):
+        # Arrange
+        class MyModel(BaseModel):
+            x: int
+
+        # Act
+        plan = _get_dump_plan(MyModel, order=None)
+
+        # Assert
+        assert _get_dump_plan(MyModel, order=None) is plan
+
+    def test_alias(self):
+        # Arrange
+        class MyModel(BaseModel):
+            x: int
+            y: float = Field(default=2.0, alias="z")
+
+        # Act
+        plan = _get_dump_plan(MyModel, order=None)
+
+        # Assert
+        assert plan.field_plan_by_name["x"].display_key == "x"
+        assert plan.field_plan_by_name["y"].display_key == "z"
+        assert plan.field_plan_by_name["y"].default == 2.0
+
+    def test_order(self):
+        # Arrange
+        class MyModel(BaseModel):
+            x: int
+
+        # Act
+        plan = _get_dump_plan(MyModel, order=("x",))
+
+        # Assert
+        assert plan.order == ("x",)
@@ -0,0 +1,110 @@
+from pathlib import Path
+
+from _test import change_cwd
+from usethis._config_file import files_manager
+from usethis._integrations.readme.markdown import (
+    READMELine,
+    READMEMarkdownManager,
+    get_badge_name,
+    is_badge_line,
+)
+
+
+class TestGetBadgeName:
+    def test_linked(self):
+        assert (
+            get_badge_name("[![Ruff](https://example.com/a.svg)](https://example.com)")
+            == "Ruff"
+        )
+
+    def test_unlinked_with_whitespace(self):
+        assert get_badge_name("  ![Licence](https://example.com/a.svg) ") == "Licence"
+
+    def test_not_badge(self):
+        assert get_badge_name("# Header") is None
+
+
+class TestIsBadgeLine:
+    def test_badge(self):
+        assert is_badge_line("![Licence](https://example.com/a.svg)")
+
+    def test_surrounding_whitespace(self):
+        assert not is_badge_line(" ![Licence](https://example.com/a.svg)")
+
+
+class TestREADMEMarkdownManager:
+    class TestRelativePath:
+        def test_default(self, tmp_path: Path):
+            with change_cwd(tmp_path):
+                assert READMEMarkdownManager().relative_path == Path("README.md")
+
+        def test_no_extension(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "README").touch()
+
+            # Act, Assert
+            with change_cwd(tmp_path):
+                assert READMEMarkdownManager().relative_path == Path("README")
+
+    class TestGetLines:
+        def test_badges_located(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "README.md").write_text(
+                "# Header\n\n![Licence](https://example.com/a.svg)\n"
+            )
+
+            # Act
+            with change_cwd(tmp_path), files_manager():
+                lines = READMEMarkdownManager().get_lines()
+
+            # Assert
+            assert lines == [
+                READMELine(text="# Header", badge_name=None, is_badge=False),
+                READMELine(text="", badge_name=None, is_badge=False),
+                READMELine(
+                    text="![Licence](https://example.com/a.svg)",
+                    badge_name="Licence",
+                    is_badge=True,
+                ),
+            ]
+
+        def test_copy_returned(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "README.md").write_text("# Header\n")
+
+            # Act
+            with change_cwd(tmp_path), files_manager():
+                READMEMarkdownManager().get_lines().clear()
+                lines = READMEMarkdownManager().get_lines()
+
+            # Assert
+            assert [line.text for line in lines] == ["# Header"]
+
+        def test_reflects_commit(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "README.md").write_text("# Header\n")
+
+            # Act
+            with change_cwd(tmp_path), files_manager():
+                READMEMarkdownManager().commit("# Other\n")
+                lines = READMEMarkdownManager().get_lines()
+
+            # Assert
+            assert [line.text for line in lines] == ["# Other"]
+
+    class TestCommitLines:
+        def test_final_newline(self, tmp_path: Path):
+            # Arrange
+            path = tmp_path / "README.md"
+            path.write_text("# Header")
+
+            # Act
+            with change_cwd(tmp_path), files_manager():
+                manager = READMEMarkdownManager()
+                manager.commit_lines(
+                    [*manager.get_lines(), READMELine.from_text("Text")]
+                )
+
+                # Assert
+                assert path.read_text() == "# Header"
+            assert path.read_text() == "# Header\nText\n"
@@ -9,6 +9,7 @@ from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._init import ensure_pyproject_toml
 from usethis._integrations.sonarqube.config import (
     _validate_project_key,
+    build_sonar_project_properties,
     get_sonar_project_properties,
 )
 from usethis._integrations.sonarqube.errors import (
@@ -658,6 +659,38 @@ sonar.exclusions=tests/*, **/Dockerfile
             get_sonar_project_properties()
 
 
+class TestBuildSonarProjectProperties:
+    def test_existing_file_ignored(self, tmp_path: Path):
+        # Unlike get_sonar_project_properties, the contents are always constructed.
+
+        with change_cwd(tmp_path), files_manager():
+            # Arrange
+            (tmp_path / "sonar-project.properties").write_text("foo=bar\n")
+            uv_python_pin("3.12")
+            ensure_pyproject_toml()
+            PyprojectTOMLManager().set_value(
+                keys=["tool", "coverage", "xml", "output"], value="coverage.xml"
+            )
+
+            # Act
+            result = build_sonar_project_properties(project_key="cli-key")
+
+        # Assert
+        assert (
+            result
+            == """\
+sonar.projectKey=cli-key
+sonar.language=py
+sonar.python.version=3.12
+sonar.sources=./
+sonar.tests=./tests
+sonar.python.coverage.reportPaths=coverage.xml
+sonar.verbose=false
+sonar.exclusions=tests/*
+"""
+        )
+
+
 class TestValidateProjectKey:
     def test_valid(self):
         # Arrange
@@ -69,6 +69,12 @@ class TestParallel:
         assert Parallel(frozenset({"a", "b"})) != {"a", "b"}
         assert Parallel(frozenset({"a", "b"})) != frozenset({"a", "b"})
 
+    def test_eq_after_nested_mutation(self):
+        component = parallel(series("a"), "b")
+        (inner,) = [c for c in component.root if isinstance(c, Series)]
+        inner[0] = "c"
+        assert component == parallel(series("c"), "b")
+
     def test_len(self):
         assert len(Parallel(frozenset({"a", "b"}))) == 2
 
@@ -11,6 +11,7 @@ from usethis._pipeweld.func import (
     _parallel_merge_partitions,
     get_predecessor,
 )
+from usethis._pipeweld.nodes import depgroup_node, parallel_node, series_node
 from usethis._pipeweld.ops import InsertParallel, InsertSuccessor
 from usethis._pipeweld.result import WeldResult
 
@@ -331,6 +332,23 @@ class TestAdder:
                 parallel(depgroup("C", config_group="x"), "E"),
             )
 
+        def test_pipeline_unchanged(self):
+            # Arrange
+            pipeline = series("A", parallel(series("B", "D"), series("C", "E")))
+            adder = Adder(
+                step="F",
+                pipeline=pipeline,
+                prerequisites={"B"},
+            )
+
+            # Act
+            adder.add()
+
+            # Assert
+            assert adder.pipeline == series(
+                "A", parallel(series("B", "D"), series("C", "E"))
+            )
+
         def test_insert_at_end(self):
             # Arrange
             adder = Adder(
@@ -396,7 +414,7 @@ class TestFlattenPartition:
         result = _flatten_partition(partition)
 
         # Assert
-        assert result == series("A", "B", "C")
+        assert result == series_node("A", "B", "C")
 
     def test_no_components(self):
         # Arrange
@@ -433,7 +451,7 @@ class TestOpSeriesMergePartitions:
 
         # Assert
         assert partition == Partition(
-            prerequisite_component=series("C", "A"),
+            prerequisite_component=series_node("C", "A"),
             nondependent_component=None,
             postrequisite_component="B",
             top_ranked_endpoint="B",
@@ -459,7 +477,7 @@ class TestOpSeriesMergePartitions:
 
         # Assert
         assert partition == Partition(
-            prerequisite_component=series("A", "B"),
+            prerequisite_component=series_node("A", "B"),
             nondependent_component=None,
             postrequisite_component=None,
             top_ranked_endpoint="B",
@@ -487,7 +505,7 @@ class TestOpSeriesMergePartitions:
         assert partition == Partition(
             prerequisite_component="A",
             nondependent_component=None,
-            postrequisite_component=series("B", "C"),
+            postrequisite_component=series_node("B", "C"),
             top_ranked_endpoint="C",
         )
 
@@ -511,7 +529,7 @@ class TestOpSeriesMergePartitions:
 
         # Assert
         assert partition == Partition(
-            prerequisite_component=series("A", "B", "D"),
+            prerequisite_component=series_node("A", "B", "D"),
             nondependent_component="C",
             postrequisite_component=None,
             top_ranked_endpoint="C",
@@ -539,7 +557,7 @@ class TestOpSeriesMergePartitions:
         assert partition == Partition(
             prerequisite_component=None,
             nondependent_component=None,
-            postrequisite_component=series("B", "A"),
+            postrequisite_component=series_node("B", "A"),
             top_ranked_endpoint="A",
         )
 
@@ -565,7 +583,7 @@ class TestOpSeriesMergePartitions:
         assert partition == Partition(
             prerequisite_component=None,
             nondependent_component=None,
-            postrequisite_component=series("B", "A"),
+            postrequisite_component=series_node("B", "A"),
             top_ranked_endpoint="A",
         )
 
@@ -618,7 +636,7 @@ class TestOpSeriesMergePartitions:
         # Assert
         assert partition == Partition(
             prerequisite_component="A",
-            nondependent_component=series("C", "B"),
+            nondependent_component=series_node("C", "B"),
             postrequisite_component=None,
             top_ranked_endpoint="B",
         )
@@ -657,17 +675,21 @@ class TestExtractOrderedSteps:
         assert _extract_ordered_steps("A") == ["A"]
 
     def test_flat_series(self):
-        assert _extract_ordered_steps(series("A", "B", "C")) == ["A", "B", "C"]
+        assert _extract_ordered_steps(series_node("A", "B", "C")) == ["A", "B", "C"]
 
     def test_parallel(self):
-        result = _extract_ordered_steps(parallel("A", "B"))
+        result = _extract_ordered_steps(parallel_node("A", "B"))
         assert sorted(result) == ["A", "B"]
 
     def test_nested_series(self):
-        assert _extract_ordered_steps(series("A", series("B", "C"))) == ["A", "B", "C"]
+        assert _extract_ordered_steps(series_node("A", series_node("B", "C"))) == [
+            "A",
+            "B",
+            "C",
+        ]
 
     def test_depgroup(self):
-        assert _extract_ordered_steps(depgroup("A", "B", config_group="x")) == [
+        assert _extract_ordered_steps(depgroup_node("A", "B", config_group="x")) == [
             "A",
             "B",
         ]
@@ -679,24 +701,24 @@ class TestLinearizeComponent:
 
     def test_series_of_strings(self):
         assert _linearize_component(
-            series("A", "B", "C"), new_step="D", original_order=["A", "B", "C"]
+            series_node("A", "B", "C"), new_step="D", original_order=["A", "B", "C"]
         ) == ["A", "B", "C"]
 
     def test_parallel_new_step_last(self):
         result = _linearize_component(
-            parallel("A", "B"), new_step="B", original_order=["A"]
+            parallel_node("A", "B"), new_step="B", original_order=["A"]
         )
         assert result == ["A", "B"]
 
     def test_parallel_preserves_existing_order(self):
         result = _linearize_component(
-            parallel("B", "A"), new_step="C", original_order=["A", "B"]
+            parallel_node("B", "A"), new_step="C", original_order=["A", "B"]
         )
         assert result == ["A", "B"]
 
     def test_series_with_parallel(self):
         result = _linearize_component(
-            series(parallel("foo", "new"), "codespell"),
+            series_node(parallel_node("foo", "new"), "codespell"),
             new_step="new",
             original_order=["foo", "codespell"],
         )
@@ -704,7 +726,7 @@ class TestLinearizeComponent:
 
     def test_depgroup(self):
         result = _linearize_component(
-            depgroup("A", "B", config_group="x"),
+            depgroup_node("A", "B", config_group="x"),
             new_step="C",
             original_order=["A", "B"],
         )
@@ -825,3 +847,23 @@ class TestGetPredecessor:
         assert get_predecessor(component, "C") == "B"
         assert get_predecessor(component, "B") == "A"
         assert get_predecessor(component, "A") is None
+
+
+@pytest.mark.benchmark
+def test_add_many_steps():
+    # Arrange
+    steps = [f"step-{idx}" for idx in range(20)]
+    pipeline = series()
+
+    # Act
+    for idx, step in enumerate(steps):
+        result = Adder(
+            pipeline=pipeline,
+            step=step,
+            prerequisites=set(steps[:idx]),
+            postrequisites=set(steps[idx + 1 :]),
+        ).add()
+        pipeline = result.solution
+
+    # Assert
+    assert pipeline == series(*steps)
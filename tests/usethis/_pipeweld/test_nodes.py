@@ -0,0 +1,140 @@
+from usethis._pipeweld.containers import depgroup, parallel, series
+from usethis._pipeweld.nodes import (
+    DepGroupNode,
+    ParallelNode,
+    SeriesNode,
+    depgroup_node,
+    from_node,
+    parallel_node,
+    series_node,
+    to_node,
+)
+
+
+class TestSeriesNode:
+    def test_func(self):
+        assert series_node("a", "b") == SeriesNode(("a", "b"))
+
+    def test_hash_same(self):
+        assert hash(series_node("a", "b")) == hash(series_node("a", "b"))
+
+    def test_hash_different(self):
+        assert hash(series_node("a", "b")) != hash(series_node("b", "a"))
+
+    def test_eq_different(self):
+        assert series_node("a", "b") != series_node("b", "a")
+
+    def test_eq_wrong_type(self):
+        assert series_node("a", "b") != ("a", "b")
+        assert series_node("a", "b") != series("a", "b")
+
+    def test_getitem(self):
+        assert series_node("a", "b")[0] == "a"
+
+    def test_len(self):
+        assert len(series_node("a", "b")) == 2
+
+    def test_replace(self):
+        # Arrange
+        node = series_node("a", "b")
+
+        # Act
+        result = node.replace(0, "c")
+
+        # Assert
+        assert result == series_node("c", "b")
+        assert node == series_node("a", "b")
+
+    def test_insert(self):
+        # Arrange
+        node = series_node("a", "b")
+
+        # Act
+        result = node.insert(1, "c")
+
+        # Assert
+        assert result == series_node("a", "c", "b")
+        assert node == series_node("a", "b")
+
+    def test_append(self):
+        # Arrange
+        node = series_node("a", "b")
+
+        # Act
+        result = node.append("c")
+
+        # Assert
+        assert result == series_node("a", "b", "c")
+        assert node == series_node("a", "b")
+
+
+class TestParallelNode:
+    def test_func(self):
+        assert parallel_node("a", "b") == ParallelNode(frozenset({"a", "b"}))
+
+    def test_hash_same(self):
+        assert hash(parallel_node("a", "b")) == hash(parallel_node("b", "a"))
+
+    def test_eq_subset(self):
+        assert parallel_node("a", "b") != parallel_node("a")
+
+    def test_eq_wrong_type(self):
+        assert parallel_node("a", "b") != frozenset({"a", "b"})
+
+    def test_len(self):
+        assert len(parallel_node("a", "b")) == 2
+
+
+class TestDepGroupNode:
+    def test_func(self):
+        assert depgroup_node("a", "b", config_group="group") == DepGroupNode(
+            series=series_node("a", "b"), config_group="group"
+        )
+
+    def test_hash_same(self):
+        assert hash(depgroup_node("a", config_group="group")) == hash(
+            depgroup_node("a", config_group="group")
+        )
+
+    def test_eq_different_group(self):
+        assert depgroup_node("a", config_group="x") != depgroup_node(
+            "a", config_group="y"
+        )
+
+
+class TestToNode:
+    def test_str(self):
+        assert to_node("a") == "a"
+
+    def test_nested(self):
+        # Arrange
+        component = series(
+            "a", parallel("b", series("c", "d")), depgroup("e", config_group="x")
+        )
+
+        # Act
+        result = to_node(component)
+
+        # Assert
+        assert result == series_node(
+            "a",
+            parallel_node("b", series_node("c", "d")),
+            depgroup_node("e", config_group="x"),
+        )
+
+
+class TestFromNode:
+    def test_str(self):
+        assert from_node("a") == "a"
+
+    def test_round_trip(self):
+        # Arrange
+        component = series(
+            "a", parallel("b", series("c", "d")), depgroup("e", config_group="x")
+        )
+
+        # Act
+        result = from_node(to_node(component))
+
+        # Assert
+        assert result == component
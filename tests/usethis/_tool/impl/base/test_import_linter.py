@@ -203,6 +203,59 @@ repos:
             assert "setup" not in contract_names
             assert "myflatpkg" in contract_names
 
+    class TestSyncDerivedConfigs:
+        def test_unchanged(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+            # Arrange
+            (tmp_path / "pyproject.toml").write_text(
+                '[project]\nname = "a"\nversion = "0.1.0"\n'
+            )
+            (tmp_path / "a").mkdir()
+            (tmp_path / "a" / "__init__.py").touch()
+            monkeypatch.syspath_prepend(str(tmp_path))
+            with change_cwd(tmp_path), files_manager():
+                ImportLinterTool().add_configs()
+            contents = (tmp_path / "pyproject.toml").read_text()
+
+            # Act
+            with change_cwd(tmp_path), files_manager():
+                result = ImportLinterTool().sync_derived_configs()
+
+            # Assert
+            assert not result
+            assert (tmp_path / "pyproject.toml").read_text() == contents
+
+        def test_new_package(
+            self,
+            tmp_path: Path,
+            monkeypatch: pytest.MonkeyPatch,
+            capfd: pytest.CaptureFixture[str],
+        ):
+            # Arrange
+            (tmp_path / "pyproject.toml").write_text(
+                '[project]\nname = "a"\nversion = "0.1.0"\n'
+            )
+            (tmp_path / "a").mkdir()
+            (tmp_path / "a" / "__init__.py").touch()
+            monkeypatch.syspath_prepend(str(tmp_path))
+            with change_cwd(tmp_path), files_manager():
+                ImportLinterTool().add_configs()
+            (tmp_path / "b").mkdir()
+            (tmp_path / "b" / "__init__.py").touch()
+            capfd.readouterr()
+
+            # Act
+            with change_cwd(tmp_path), files_manager():
+                result = ImportLinterTool().sync_derived_configs()
+
+            # Assert
+            assert result
+            contents = (tmp_path / "pyproject.toml").read_text()
+            assert 'root_packages = ["a", "b"]' in contents
+            assert 'containers = ["b"]' in contents
+            out, err = capfd.readouterr()
+            assert not err
+            assert out == "✔ Updating Import Linter config in 'pyproject.toml'.\n"
+
 
 class TestIsINPRule:
     def test_inp_rule(self):
@@ -1,4 +1,4 @@
-from usethis._tool.all_ import ALL_TOOLS
+from _test import ALL_TOOLS
 
 
 class TestAllTools:
@@ -1301,6 +1301,69 @@ root_packages = ["example"]
             # Assert
             assert not (tmp_path / "setup.cfg").read_text()
 
+        def test_pending_config_not_overwritten(self, tmp_path: Path):
+            # Arrange
+            class ThisTool(Tool):
+                @property
+                @override
+                def meta(self) -> ToolMeta:
+                    return ToolMeta(name="mytool")
+
+                @override
+                def print_how_to_use(self) -> None:
+                    how_print("How to use mytool")
+
+                @override
+                def config_spec(self) -> ConfigSpec:
+                    return ConfigSpec(
+                        file_manager_by_relative_path={
+                            Path("pyproject.toml"): PyprojectTOMLManager(),
+                        },
+                        resolution="first",
+                        config_items=[
+                            ConfigItem(
+                                root={
+                                    Path("pyproject.toml"): ConfigEntry(
+                                        keys=["tool", self.name],
+                                        get_value=lambda: {"key": "a"},
+                                    )
+                                }
+                            ),
+                            ConfigItem(
+                                root={
+                                    Path("pyproject.toml"): ConfigEntry(
+                                        keys=["tool", self.name, "key"],
+                                        get_value=lambda: "b",
+                                    )
+                                }
+                            ),
+                            ConfigItem(
+                                root={
+                                    Path("pyproject.toml"): ConfigEntry(
+                                        keys=["tool", self.name, "other"],
+                                        get_value=lambda: "c",
+                                    )
+                                }
+                            ),
+                        ],
+                    )
+
+            (tmp_path / "pyproject.toml").write_text("")
+
+            # Act
+            with change_cwd(tmp_path), files_manager():
+                ThisTool().add_configs()
+
+            # Assert
+            assert (
+                (tmp_path / "pyproject.toml").read_text()
+                == """\
+[tool.mytool]
+key = "a"
+other = "c"
+"""
+            )
+
     class TestRemoveConfigs:
         def test_regex_config(self, tmp_path: Path):
             # Arrange
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+
+from _test import ALL_TOOLS, change_cwd
+from usethis._config_file import files_manager
+from usethis._tool.all_ import SupportedToolType
+from usethis._tool.impl.base.ruff import RuffTool
+from usethis._tool.registry import TOOL_REGISTRY
+
+
+class TestToolRegistry:
+    def test_matches_all_tools(self):
+        # TOOL_REGISTRY must have the same names in the same order as ALL_TOOLS.
+        assert list(TOOL_REGISTRY) == [tool.name for tool in ALL_TOOLS]
+
+    @pytest.mark.parametrize("tool", ALL_TOOLS, ids=lambda t: t.name)
+    def test_matches_tool(self, tool: SupportedToolType, uv_init_dir: Path):
+        # Arrange
+        registration = TOOL_REGISTRY[tool.name]
+
+        # Act
+        with change_cwd(uv_init_dir), files_manager():
+            hook_ids = {
+                hook.id
+                for repo in tool.get_pre_commit_repos()
+                for hook in repo.hooks or []
+            }
+
+        # Assert
+        assert type(registration.load()) is type(tool)
+        assert registration.url == tool.meta.url
+        assert list(registration.managed_files) == tool.managed_files
+        assert registration.rule_config == tool.rule_config
+        assert hook_ids <= set(registration.hook_ids)
+
+    def test_ruff_hook_ids(self, uv_init_dir: Path):
+        # Ruff's hooks depend on whether the linter and formatter are used.
+        tool = RuffTool(linter_detection="always", formatter_detection="always")
+
+        with change_cwd(uv_init_dir), files_manager():
+            hook_ids = [
+                hook.id
+                for repo in tool.get_pre_commit_repos()
+                for hook in repo.hooks or []
+            ]
+
+        assert hook_ids == list(TOOL_REGISTRY["Ruff"].hook_ids)
+
+    def test_commands(self):
+        assert [registration.command for registration in TOOL_REGISTRY.values()] == [
+            tool.name.lower().replace(" ", "-") for tool in ALL_TOOLS
+        ]
+
+    def test_load(self):
+        # Act
+        tool = TOOL_REGISTRY["Ruff"].load()
+
+        # Assert
+        assert isinstance(tool, RuffTool)
@@ -1,3 +1,7 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from usethis._types.deps import Dependency
 
 
@@ -14,3 +18,49 @@ class TestDependency:
         def test_multiple_extras(self):
             dep = Dependency(name="requests", extras=frozenset({"security", "socks"}))
             assert dep.to_requirement_string() == "requests[security,socks]"
+
+    class TestHash:
+        def test_equal_dependencies(self):
+            # Arrange
+            dep = Dependency(name="requests", extras=frozenset({"security"}))
+            other = Dependency(name="requests", extras=frozenset({"security"}))
+
+            # Act, Assert
+            assert dep == other
+            assert hash(dep) == hash(other)
+            assert len({dep, other}) == 1
+
+        def test_different_extras(self):
+            # Arrange
+            dep = Dependency(name="requests")
+            other = Dependency(name="requests", extras=frozenset({"security"}))
+
+            # Act, Assert
+            assert dep != other
+            assert other not in {dep}
+
+    class TestFrozen:
+        def test_cannot_set_name(self):
+            # Arrange
+            dep = Dependency(name="requests")
+
+            # Act, Assert
+            with pytest.raises(FrozenInstanceError):
+                setattr(dep, "name", "httpx")  # noqa: B010
+
+
+@pytest.mark.benchmark
+def test_dependency_set_operations():
+    # Arrange
+    names = [f"package-{idx}" for idx in range(200)]
+
+    # Act
+    declared = {Dependency(name=name) for name in names}
+    found = [
+        Dependency(name=name, extras=frozenset({"extra"})) in declared
+        or Dependency(name=name) in declared
+        for name in names
+    ]
+
+    # Assert
+    assert all(found)
@@ -5,7 +5,7 @@ import pytest
 from _test import CliRunner, change_cwd
 from usethis._config import usethis_config
 from usethis._config_file import files_manager
-from usethis._deps import get_deps_from_group
+from usethis._deps import get_dep_groups
 from usethis._types.deps import Dependency
 from usethis._ui.app import app
 
@@ -24,4 +24,4 @@ class TestDoc:
         # Assert
         assert result.exit_code == 0, result.output
         with change_cwd(tmp_path), files_manager():
-            assert Dependency(name="mkdocs") in get_deps_from_group("doc")
+            assert Dependency(name="mkdocs") in get_dep_groups().get("doc", [])
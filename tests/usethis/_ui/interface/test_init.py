@@ -73,6 +73,27 @@ class TestInit:
             "☐ Change the current working directory to the project directory.\n"
         )
 
+    def test_specify_path_dry_run(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(app, ["--dry-run", "init", "myproject"])
+
+        # Assert
+        assert result.exit_code == 1, result.output
+        assert not (tmp_path / "myproject").exists()
+
+    def test_dry_run(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(app, ["--dry-run", "init", "--backend", "uv"])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "+++ b/pyproject.toml" in result.output
+        assert list(tmp_path.iterdir()) == []
+
     def test_no_err_when_pyproject_toml_exists(self, tmp_path: Path):
         # Arrange
         (tmp_path / "pyproject.toml").touch()
@@ -178,6 +199,24 @@ class TestInit:
         content = (tmp_path / "pyproject.toml").read_text()
         assert 'build-backend = "uv_build"' in content
 
+    def test_template_cache(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "proj"
+        path.mkdir()
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(path):
+            result = runner.invoke_safe(
+                app,
+                ["init", "--template-cache", (tmp_path / "cache").as_posix()],
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert (path / "src" / "proj" / "__init__.py").exists()
+        assert list((tmp_path / "cache").iterdir())
+
     def test_build_backend_default_is_hatch(self, tmp_path: Path):
         # Act
         runner = CliRunner()
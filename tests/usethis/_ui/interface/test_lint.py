@@ -2,7 +2,7 @@ from pathlib import Path
 
 from _test import CliRunner, change_cwd
 from usethis._config_file import files_manager
-from usethis._deps import get_deps_from_group
+from usethis._deps import get_dep_groups
 from usethis._types.deps import Dependency
 from usethis._ui.app import app
 
@@ -17,8 +17,8 @@ class TestLint:
         # Assert
         assert result.exit_code == 0, result.output
         with change_cwd(tmp_path), files_manager():
-            assert Dependency(name="ruff") in get_deps_from_group("dev")
-            assert Dependency(name="deptry") in get_deps_from_group("dev")
+            assert Dependency(name="ruff") in get_dep_groups().get("dev", [])
+            assert Dependency(name="deptry") in get_dep_groups().get("dev", [])
 
         # Check Ruff formatter is not added
         txt = (tmp_path / "pyproject.toml").read_text()
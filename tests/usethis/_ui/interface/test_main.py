@@ -0,0 +1,176 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import usethis._core.tool
+from _test import CliRunner, change_cwd
+from usethis._config import usethis_config
+from usethis._ui.app import app
+
+
+class TestMain:
+    def test_dry_run(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(
+                app, ["--dry-run", "tool", "codespell", "--backend", "none"]
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "+++ b/.codespellrc" in result.output
+        assert list(tmp_path.iterdir()) == []
+
+    def test_plan_file(self, tmp_path: Path):
+        # Arrange
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        plan_file = tmp_path / "plan.json"
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(project_dir):
+            result = runner.invoke_safe(
+                app,
+                [
+                    "--dry-run",
+                    "--plan-file",
+                    plan_file.as_posix(),
+                    "tool",
+                    "codespell",
+                    "--backend",
+                    "none",
+                ],
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert {"path": ".codespellrc", "change": "create"} in json.loads(
+            plan_file.read_text()
+        )["files"]
+
+    def test_plan_file_without_dry_run(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(
+                app, ["--plan-file", "plan.json", "tool", "codespell"]
+            )
+
+        # Assert
+        assert result.exit_code == 1, result.output
+        assert list(tmp_path.iterdir()) == []
+
+    def test_output_ndjson(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(
+                app, ["--output", "ndjson", "tool", "codespell", "--backend", "none"]
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        events = [json.loads(line) for line in result.stdout.splitlines()]
+        assert {
+            "type": "tick",
+            "message": "Writing '.codespellrc'.",
+            "file": ".codespellrc",
+            "tool": "Codespell",
+        } in events
+
+    def test_output_plain(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(
+                app, ["--output", "plain", "tool", "codespell", "--backend", "none"]
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "✔ Writing '.codespellrc'.\n" in result.stdout
+
+    def test_subprocess_timeout(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        timeouts: list[float | None] = []
+
+        def mock_use_codespell(**__: object) -> None:
+            timeouts.append(usethis_config.subprocess_timeout)
+
+        monkeypatch.setattr(usethis._core.tool, "use_codespell", mock_use_codespell)
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(
+                app, ["--subprocess-timeout", "30", "tool", "codespell"]
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert timeouts == [30.0]
+        assert usethis_config.subprocess_timeout is None
+
+    def test_subprocess_timeout_envvar(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        timeouts: list[float | None] = []
+
+        def mock_use_codespell(**__: object) -> None:
+            timeouts.append(usethis_config.subprocess_timeout)
+
+        monkeypatch.setattr(usethis._core.tool, "use_codespell", mock_use_codespell)
+        monkeypatch.setenv("USETHIS_SUBPROCESS_TIMEOUT", "2.5")
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(app, ["tool", "codespell"])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert timeouts == [2.5]
+
+    def test_lock_timeout(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        timeouts: list[float | None] = []
+
+        def mock_use_codespell(**__: object) -> None:
+            timeouts.append(usethis_config.lock_timeout)
+
+        monkeypatch.setattr(usethis._core.tool, "use_codespell", mock_use_codespell)
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(
+                app, ["--lock-timeout", "30", "tool", "codespell"]
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert timeouts == [30.0]
+        assert usethis_config.lock_timeout is None
+
+    def test_lock_timeout_envvar(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        timeouts: list[float | None] = []
+
+        def mock_use_codespell(**__: object) -> None:
+            timeouts.append(usethis_config.lock_timeout)
+
+        monkeypatch.setattr(usethis._core.tool, "use_codespell", mock_use_codespell)
+        monkeypatch.setenv("USETHIS_LOCK_TIMEOUT", "2.5")
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(app, ["tool", "codespell"])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert timeouts == [2.5]
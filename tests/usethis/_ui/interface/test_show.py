@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 import pytest
@@ -32,6 +33,134 @@ SOFTWARE.
 """
 
 
+class TestAll:
+    def test_single_project(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "fun"
+        path.mkdir()
+        (path / "uv.lock").touch()
+        (path / "LICENSE").write_text(_MIT_LICENSE_TEXT)
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(path):
+            result = runner.invoke_safe(app, ["all"])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        facts = json.loads(result.output)
+        assert facts["name"] == "fun"
+        assert facts["backend"] == "uv"
+        assert facts["license"] == "MIT"
+        assert {"category": "tool", "name": "Ruff", "status": "unused"} in facts[
+            "usage"
+        ]
+
+    def test_errors_reported(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("[")
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(app, ["all"])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        facts = json.loads(result.output)
+        assert facts["name"] is None
+        assert "name" in facts["errors"]
+
+    def test_sonarqube(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "sonar-project.properties").write_text("sonar.projectKey=fun\n")
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(app, ["all"])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        facts = json.loads(result.output)
+        assert facts["sonarqube"] == "sonar.projectKey=fun\n"
+        assert "sonarqube" not in facts["errors"]
+
+    def test_several_projects_json(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "uv.lock").touch()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "poetry.lock").touch()
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(
+                app,
+                [
+                    "all",
+                    "--project-dir",
+                    str(tmp_path / "a"),
+                    "--project-dir",
+                    str(tmp_path / "b"),
+                ],
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        facts = json.loads(result.output)
+        assert [project["name"] for project in facts] == ["a", "b"]
+        assert facts[0]["backend"] == "uv"
+        assert facts[1]["backend"] == "poetry"
+
+    def test_several_projects_ndjson(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(
+                app,
+                [
+                    "all",
+                    "--format",
+                    "ndjson",
+                    "--project-dir",
+                    str(tmp_path / "a"),
+                    "--project-dir",
+                    str(tmp_path / "b"),
+                ],
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["a", "b"]
+
+    def test_ndjson_output_file(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "fun"
+        path.mkdir()
+        output_file = tmp_path / "facts.ndjson"
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(path):
+            result = runner.invoke_safe(
+                app, ["all", "--format", "ndjson", "--output-file", str(output_file)]
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert not result.output
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["name"] == "fun"
+
+
 class TestBackend:
     def test_uv_backend(self, tmp_path: Path):
         # Arrange
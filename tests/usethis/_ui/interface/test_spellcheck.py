@@ -2,7 +2,7 @@ from pathlib import Path
 
 from _test import CliRunner, change_cwd
 from usethis._config_file import files_manager
-from usethis._deps import get_deps_from_group
+from usethis._deps import get_dep_groups
 from usethis._python.version import PythonVersion
 from usethis._types.deps import Dependency
 from usethis._ui.app import app
@@ -18,7 +18,7 @@ class TestSpellcheck:
         # Assert
         assert result.exit_code == 0, result.output
         with change_cwd(tmp_path), files_manager():
-            assert Dependency(name="codespell") in get_deps_from_group("dev")
+            assert Dependency(name="codespell") in get_dep_groups().get("dev", [])
 
     def test_how_option(self, tmp_path: Path):
         # Act
@@ -45,7 +45,7 @@ class TestSpellcheck:
         # Assert
         assert result.exit_code == 0, result.output
         with change_cwd(tmp_path), files_manager():
-            assert Dependency(name="codespell") not in get_deps_from_group("dev")
+            assert Dependency(name="codespell") not in get_dep_groups().get("dev", [])
 
     def test_none_backend(self, tmp_path: Path):
         # Act
@@ -2,7 +2,7 @@ from pathlib import Path
 
 from _test import CliRunner, change_cwd
 from usethis._config_file import files_manager
-from usethis._deps import get_deps_from_group
+from usethis._deps import get_dep_groups
 from usethis._types.deps import Dependency
 from usethis._ui.app import app
 
@@ -17,7 +17,7 @@ class TestTest:
         # Assert
         assert result.exit_code == 0, result.output
         with change_cwd(tmp_path), files_manager():
-            assert Dependency(name="pytest") in get_deps_from_group("test")
+            assert Dependency(name="pytest") in get_dep_groups().get("test", [])
 
     def test_none_backend_no_pyproject_toml(self, tmp_path: Path):
         # Act
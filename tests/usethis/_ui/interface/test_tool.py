@@ -3,14 +3,13 @@ from pathlib import Path
 import pytest
 from pydantic import TypeAdapter
 
-from _test import CliRunner, change_cwd
+from _test import ALL_TOOLS, CliRunner, change_cwd
 from usethis._backend.uv.call import call_uv_subprocess
 from usethis._config import usethis_config
 from usethis._config_file import files_manager
 from usethis._file.pyproject_toml.io_ import PyprojectTOMLManager
 from usethis._integrations.pre_commit.hooks import get_hook_ids
 from usethis._subprocess import SubprocessFailedError, call_subprocess
-from usethis._tool.all_ import ALL_TOOLS
 from usethis._ui.interface.tool import ALL_TOOL_COMMANDS, app
 
 
@@ -529,6 +528,36 @@ class TestRuff:
             else:
                 call_subprocess(["usethis", "tool", "ruff", "--offline"])
 
+    def test_workspace(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[tool.uv.workspace]
+members = ["packages/*"]
+"""
+        )
+        for name in ["a", "b"]:
+            (tmp_path / "packages" / name).mkdir(parents=True)
+            (tmp_path / "packages" / name / "pyproject.toml").write_text(
+                f'[project]\nname = "{name}"\nversion = "0.1.0"\n'
+            )
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(
+                app, ["ruff", "--workspace", "--frozen", "--offline", "--no-apply"]
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        for name in ["a", "b"]:
+            content = (tmp_path / "packages" / name / "pyproject.toml").read_text()
+            assert "[tool.ruff" in content
+            assert '"ruff' in content
+        assert "ruff" not in (tmp_path / "pyproject.toml").read_text()
+        assert not (tmp_path / "uv.lock").exists()
+
     def test_readme_example(self, uv_init_dir: Path):
         """This example is used the README.md file.
 
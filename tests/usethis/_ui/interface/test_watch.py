@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+import usethis._core.watch
+from _test import CliRunner, change_cwd
+from usethis._ui.app import app
+from usethis.errors import UsethisError
+
+
+class TestWatch:
+    def test_interrupted(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        def mock_watch(*, interval: float, debounce: float) -> None:
+            assert interval == 0.1
+            assert debounce == 0.2
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(usethis._core.watch, "watch", mock_watch)
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(
+                app, ["watch", "--interval", "0.1", "--debounce", "0.2"]
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+
+    def test_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        def mock_watch(**__: object) -> None:
+            msg = "Something went wrong."
+            raise UsethisError(msg)
+
+        monkeypatch.setattr(usethis._core.watch, "watch", mock_watch)
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(app, ["watch"])
+
+        # Assert
+        assert result.exit_code == 1, result.output
+        assert "Something went wrong." in result.output
+
+    def test_negative_interval(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke_safe(app, ["watch", "--interval", "-1"])
+
+        # Assert
+        assert result.exit_code == 2, result.output
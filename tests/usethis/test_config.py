@@ -41,6 +41,7 @@ class TestUsethisConfig:
             config.offline = True
             config.quiet = True
             config.frozen = True
+            config.dry_run = True
             config.alert_only = True
             config.instruct_only = True
             config.backend = BackendEnum.uv
@@ -48,6 +49,9 @@ class TestUsethisConfig:
             config.build_backend = BuildBackendEnum.uv
             config.disable_pre_commit = True
             config.subprocess_verbose = True
+            config.subprocess_timeout = 60.0
+            config.lock_timeout = 30.0
+            config.template_cache_dir = Path("/some/cache")
             config.project_dir = Path("/some/project")
 
             # Act
@@ -57,6 +61,7 @@ class TestUsethisConfig:
             assert copied.offline is True
             assert copied.quiet is True
             assert copied.frozen is True
+            assert copied.dry_run is True
             assert copied.alert_only is True
             assert copied.instruct_only is True
             assert copied.backend is BackendEnum.uv
@@ -64,6 +69,9 @@ class TestUsethisConfig:
             assert copied.build_backend is BuildBackendEnum.uv
             assert copied.disable_pre_commit is True
             assert copied.subprocess_verbose is True
+            assert copied.subprocess_timeout == 60.0
+            assert copied.lock_timeout == 30.0
+            assert copied.template_cache_dir == Path("/some/cache")
             assert copied.project_dir == Path("/some/project")
 
         def test_independent_of_original(self):
@@ -103,6 +111,32 @@ class TestUsethisConfig:
             # Assert
             assert project_dir == Path("42 Wallaby Way, Sydney")
 
+    class TestSetInferredBackend:
+        def test_reset_for_other_project(self, tmp_path: Path):
+            # Arrange
+            config = UsethisConfig()
+            config.inferred_backend = BackendEnum.uv
+
+            # Act
+            with config.set(project_dir=tmp_path):
+                inferred_backend = config.inferred_backend
+
+            # Assert
+            assert inferred_backend is None
+            assert config.inferred_backend is BackendEnum.uv
+
+        def test_kept_for_same_project(self):
+            # Arrange
+            config = UsethisConfig()
+            config.inferred_backend = BackendEnum.uv
+
+            # Act
+            with config.set(quiet=True):
+                inferred_backend = config.inferred_backend
+
+            # Assert
+            assert inferred_backend is BackendEnum.uv
+
     class TestSetRestoresOnException:
         def test_restores_quiet_on_exception(self):
             # Arrange
@@ -128,12 +162,16 @@ class TestUsethisConfig:
                     offline=True,
                     quiet=True,
                     frozen=True,
+                    dry_run=True,
                     alert_only=True,
                     instruct_only=True,
                     backend=BackendEnum.none,
                     build_backend=BuildBackendEnum.uv,
                     disable_pre_commit=True,
                     subprocess_verbose=True,
+                    subprocess_timeout=60.0,
+                    lock_timeout=30.0,
+                    template_cache_dir=tmp_path / "cache",
                     project_dir=tmp_path,
                 ),
             ):
@@ -149,6 +187,9 @@ class TestUsethisConfig:
             assert config.build_backend == old.build_backend
             assert config.disable_pre_commit == old.disable_pre_commit
             assert config.subprocess_verbose == old.subprocess_verbose
+            assert config.subprocess_timeout == old.subprocess_timeout
+            assert config.lock_timeout == old.lock_timeout
+            assert config.template_cache_dir == old.template_cache_dir
             assert config.project_dir == old.project_dir
 
     class TestDisableUVSubprocess:
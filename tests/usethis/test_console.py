@@ -1,3 +1,4 @@
+import json
 import sys
 from unittest.mock import Mock
 
@@ -18,6 +19,7 @@ from usethis._console import (
     tick_print,
     warn_print,
 )
+from usethis._types.output_mode import OutputModeEnum
 
 
 class TestPlainPrint:
@@ -390,3 +392,75 @@ class TestIconFallbackIntegration:
         # Assert
         out, _ = capfd.readouterr()
         assert out == "! Warning message\n"
+
+
+class TestOutputMode:
+    def test_auto_is_plain_when_not_interactive(
+        self, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        # Act
+        tick_print("[bold]Hello[/bold]")
+
+        # Assert
+        out, _ = capfd.readouterr()
+        assert out == "✔ Hello\n"
+
+    def test_rich(self, capfd: pytest.CaptureFixture[str]) -> None:
+        # Act
+        with usethis_config.set(output_mode=OutputModeEnum.rich):
+            tick_print("[bold]Hello[/bold]")
+
+        # Assert
+        out, _ = capfd.readouterr()
+        assert out == "✔ Hello\n"
+
+    def test_plain_escaped_markup(self, capfd: pytest.CaptureFixture[str]) -> None:
+        # Act
+        with usethis_config.set(output_mode=OutputModeEnum.plain):
+            plain_print("\\[tool.ruff] :sparkles:")
+
+        # Assert
+        out, _ = capfd.readouterr()
+        assert out == "[tool.ruff] ✨\n"
+
+    def test_ndjson(self, capfd: pytest.CaptureFixture[str]) -> None:
+        # Act
+        with usethis_config.set(output_mode=OutputModeEnum.ndjson):
+            tick_print("Writing 'ruff.toml'.", file="ruff.toml", tool="Ruff")
+            info_print("Hello")
+            err_print("Oops")
+
+        # Assert
+        out, err = capfd.readouterr()
+        assert not err
+        assert [json.loads(line) for line in out.splitlines()] == [
+            {
+                "type": "tick",
+                "message": "Writing 'ruff.toml'.",
+                "file": "ruff.toml",
+                "tool": "Ruff",
+            },
+            {"type": "info", "message": "Hello", "file": None, "tool": None},
+            {"type": "error", "message": "Oops", "file": None, "tool": None},
+        ]
+
+    def test_ndjson_table(self, capfd: pytest.CaptureFixture[str]) -> None:
+        # Act
+        with usethis_config.set(output_mode=OutputModeEnum.ndjson):
+            table_print(Table("hello", box=None))
+
+        # Assert
+        out, _ = capfd.readouterr()
+        (event,) = [json.loads(line) for line in out.splitlines()]
+        assert event["type"] == "table"
+        assert "hello" in event["message"]
+
+    def test_quiet(self, capfd: pytest.CaptureFixture[str]) -> None:
+        # Act
+        with usethis_config.set(output_mode=OutputModeEnum.ndjson, quiet=True):
+            tick_print("Hello")
+
+        # Assert
+        out, err = capfd.readouterr()
+        assert not out
+        assert not err
@@ -13,14 +13,14 @@ from usethis._backend.uv.errors import (
 from usethis._config import usethis_config
 from usethis._config_file import files_manager
 from usethis._deps import (
+    DepIndex,
     add_default_groups,
     add_deps_to_group,
     get_default_groups,
     get_dep_groups,
-    get_deps_from_group,
+    get_dep_index,
     get_project_deps,
     is_dep_in_any_group,
-    is_dep_satisfied_in,
     register_default_group,
     remove_deps_from_group,
 )
@@ -620,8 +620,8 @@ class TestAddDepsToGroup:
             add_deps_to_group([Dependency(name="pytest")], "test")
 
             # Assert
-            assert is_dep_satisfied_in(
-                Dependency(name="pytest"), in_=get_deps_from_group("test")
+            assert get_dep_index().is_dep_satisfied_in_group(
+                Dependency(name="pytest"), group="test"
             )
 
     @pytest.mark.usefixtures("_vary_network_conn")
@@ -631,7 +631,7 @@ class TestAddDepsToGroup:
             add_deps_to_group([Dependency(name="pytest")], "test")
 
             # Assert
-            assert get_deps_from_group("test") == [Dependency(name="pytest")]
+            assert get_dep_groups().get("test", []) == [Dependency(name="pytest")]
             out, err = capfd.readouterr()
             assert not err
             assert (
@@ -649,7 +649,7 @@ class TestAddDepsToGroup:
             )
 
             # Assert
-            assert set(get_deps_from_group("qa")) == {
+            assert set(get_dep_groups().get("qa", [])) == {
                 Dependency(name="flake8"),
                 Dependency(name="black"),
             }
@@ -676,7 +676,7 @@ class TestAddDepsToGroup:
             )
 
             # Assert
-            assert set(get_deps_from_group("test")) == {
+            assert set(get_dep_groups().get("test", [])) == {
                 Dependency(name="pytest"),
                 Dependency(name="black"),
             }
@@ -697,9 +697,8 @@ class TestAddDepsToGroup:
             )
 
             # Assert
-            assert is_dep_satisfied_in(
-                Dependency(name="pytest", extras=frozenset({"extra"})),
-                in_=get_deps_from_group("test"),
+            assert get_dep_index().is_dep_satisfied_in_group(
+                Dependency(name="pytest", extras=frozenset({"extra"})), group="test"
             )
             content = (uv_init_dir / "pyproject.toml").read_text()
             assert "pytest[extra]" in content
@@ -718,7 +717,7 @@ class TestAddDepsToGroup:
             add_deps_to_group([], "test")
 
             # Assert
-            assert not get_deps_from_group("test")
+            assert not get_dep_groups().get("test", [])
             out, err = capfd.readouterr()
             assert not err
             assert not out
@@ -839,13 +838,33 @@ test = []
         assert not err
         assert out == "☐ Add the test dependency 'pytest'.\n"
 
+    def test_dry_run(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("""\
+[project]
+name = "example"
+version = "0.1.0"
+""")
+
+        # Act
+        with (
+            usethis_config.set(backend=BackendEnum.uv, dry_run=True),
+            change_cwd(tmp_path),
+            files_manager(),
+        ):
+            add_deps_to_group([Dependency(name="pytest")], "test")
+
+            # Assert
+            assert get_dep_groups().get("test", []) == [Dependency(name="pytest")]
+        assert not (tmp_path / "uv.lock").exists()
+
     def test_no_pyproject_toml(self, tmp_path: Path):
         # Act
         with change_cwd(tmp_path), files_manager():
             add_deps_to_group([Dependency(name="pytest")], "test")
 
             # Assert
-            assert get_deps_from_group("test") == [Dependency(name="pytest")]
+            assert get_dep_groups().get("test", []) == [Dependency(name="pytest")]
 
         content = (tmp_path / "pyproject.toml").read_text()
         assert "[dependency-groups]" in content
@@ -888,6 +907,30 @@ test = []
             )
             assert len(calls) == 1
 
+        def test_dry_run(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "pyproject.toml").write_text("""\
+[project]
+name = "example"
+version = "0.1.0"
+""")
+
+            # Act
+            with (
+                usethis_config.set(backend=BackendEnum.poetry, dry_run=True),
+                change_cwd(tmp_path),
+                files_manager(),
+            ):
+                add_deps_to_group(
+                    [Dependency(name="coverage", extras=frozenset({"toml"}))], "test"
+                )
+
+            # Assert
+            content = (tmp_path / "pyproject.toml").read_text()
+            assert "[dependency-groups]" not in content
+            assert "[tool.poetry.group.test.dependencies]" in content
+            assert 'coverage = {version = "*", extras = ["toml"]}' in content
+
         def test_no_default_group_registration(
             self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
         ):
@@ -966,7 +1009,7 @@ class TestRemoveDepsFromGroup:
             remove_deps_from_group([Dependency(name="pytest")], "test")
 
             # Assert
-            assert "pytest" not in get_deps_from_group("test")
+            assert "pytest" not in get_dep_groups().get("test", [])
 
     @pytest.mark.usefixtures("_vary_network_conn")
     def test_single_dep(self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]):
@@ -979,7 +1022,7 @@ class TestRemoveDepsFromGroup:
             remove_deps_from_group([Dependency(name="pytest")], "test")
 
             # Assert
-            assert not get_deps_from_group("test")
+            assert not get_dep_groups().get("test", [])
             out, err = capfd.readouterr()
             assert not err
             assert (
@@ -1002,7 +1045,7 @@ class TestRemoveDepsFromGroup:
             )
 
             # Assert
-            assert not get_deps_from_group("qa")
+            assert not get_dep_groups().get("qa", [])
             out, err = capfd.readouterr()
             assert not err
             assert (
@@ -1025,7 +1068,7 @@ class TestRemoveDepsFromGroup:
             )
 
             # Assert
-            assert not get_deps_from_group("test")
+            assert not get_dep_groups().get("test", [])
             out, err = capfd.readouterr()
             assert not err
             assert (
@@ -1048,7 +1091,7 @@ class TestRemoveDepsFromGroup:
             )
 
             # Assert
-            assert not get_deps_from_group("test")
+            assert not get_dep_groups().get("test", [])
             out, err = capfd.readouterr()
             assert not err
             assert (
@@ -1072,7 +1115,7 @@ class TestRemoveDepsFromGroup:
             remove_deps_from_group([Dependency(name="pytest")], "test")
 
             # Assert
-            assert not get_deps_from_group("test")
+            assert not get_dep_groups().get("test", [])
             out, err = capfd.readouterr()
             assert not err
             assert not out
@@ -1103,6 +1146,43 @@ class TestRemoveDepsFromGroup:
             ):
                 remove_deps_from_group([Dependency(name="pytest")], "test")
 
+    def test_dry_run(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("""\
+[dependency-groups]
+test = ["pytest>=8", "coverage"]
+""")
+
+        # Act
+        with (
+            usethis_config.set(backend=BackendEnum.uv, dry_run=True),
+            change_cwd(tmp_path),
+            files_manager(),
+        ):
+            remove_deps_from_group([Dependency(name="pytest")], "test")
+
+            # Assert
+            assert get_dep_groups().get("test", []) == [Dependency(name="coverage")]
+
+    def test_dry_run_poetry(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.poetry.group.test.dependencies]
+Pytest = "^8"
+coverage = "*"
+""")
+
+        # Act
+        with (
+            usethis_config.set(backend=BackendEnum.poetry, dry_run=True),
+            change_cwd(tmp_path),
+            files_manager(),
+        ):
+            remove_deps_from_group([Dependency(name="pytest")], "test")
+
+            # Assert
+            assert get_dep_groups().get("test", []) == [Dependency(name="coverage")]
+
     def test_none_backend(self, tmp_path: Path, capfd: pytest.CaptureFixture[str]):
         # Arrange
         (tmp_path / "pyproject.toml").write_text("""\
@@ -1267,61 +1347,128 @@ build-backend = "poetry.core.masonry.api"
                 assert not is_dep_in_any_group(Dependency(name="ruff"))
 
 
-class TestIsDepSatisfiedIn:
-    def test_empty(self):
-        # Arrange
-        dep = Dependency(name="pytest")
-        in_: list[Dependency] = []
+class TestDepIndex:
+    class TestIsDepSatisfiedInGroup:
+        def test_empty(self):
+            # Arrange
+            index = DepIndex.from_dep_groups({"test": []})
 
-        # Act
-        result = is_dep_satisfied_in(dep, in_=in_)
+            # Act, Assert
+            assert not index.is_dep_satisfied_in_group(
+                Dependency(name="pytest"), group="test"
+            )
 
-        # Assert
-        assert not result
+        def test_same(self):
+            # Arrange
+            index = DepIndex.from_dep_groups({"test": [Dependency(name="pytest")]})
 
-    def test_same(self):
-        # Arrange
-        dep = Dependency(name="pytest")
-        in_ = [Dependency(name="pytest")]
+            # Act, Assert
+            assert index.is_dep_satisfied_in_group(
+                Dependency(name="pytest"), group="test"
+            )
 
-        # Act
-        result = is_dep_satisfied_in(dep, in_=in_)
+        def test_subset_extras(self):
+            # Arrange
+            index = DepIndex.from_dep_groups(
+                {"test": [Dependency(name="coverage", extras=frozenset({"toml"}))]}
+            )
 
-        # Assert
-        assert result
+            # Act, Assert
+            assert index.is_dep_satisfied_in_group(
+                Dependency(name="coverage"), group="test"
+            )
+            assert not index.is_dep_satisfied_in_group(
+                Dependency(name="coverage"), group="dev"
+            )
+
+        def test_superset_extras(self):
+            # Arrange
+            index = DepIndex.from_dep_groups({"test": [Dependency(name="coverage")]})
+
+            # Act, Assert
+            assert not index.is_dep_satisfied_in_group(
+                Dependency(name="coverage", extras=frozenset({"toml"})), group="test"
+            )
+
+        def test_multiple_declarations(self):
+            # Arrange
+            index = DepIndex.from_dep_groups(
+                {
+                    "test": [
+                        Dependency(name="coverage"),
+                        Dependency(name="coverage", extras=frozenset({"toml"})),
+                    ]
+                }
+            )
+
+            # Act, Assert
+            assert index.is_dep_satisfied_in_group(
+                Dependency(name="coverage", extras=frozenset({"toml"})), group="test"
+            )
 
-    def test_same_name_superset_extra(self):
+        def test_normalized_name(self):
+            # Arrange
+            index = DepIndex.from_dep_groups({"test": [Dependency(name="Pytest_Cov")]})
+
+            # Act, Assert
+            assert index.is_dep_satisfied_in_group(
+                Dependency(name="pytest-cov"), group="test"
+            )
+
+    class TestIsDepSatisfiedInAnyGroup:
+        def test_in_second_group(self):
+            # Arrange
+            index = DepIndex.from_dep_groups(
+                {"dev": [Dependency(name="ruff")], "test": [Dependency(name="pytest")]}
+            )
+
+            # Act, Assert
+            assert index.is_dep_satisfied_in_any_group(Dependency(name="pytest"))
+            assert not index.is_dep_satisfied_in_any_group(Dependency(name="black"))
+
+
+class TestGetDepIndex:
+    def test_reused_for_same_revision(self, tmp_path: Path):
         # Arrange
-        dep = Dependency(name="pytest", extras=frozenset({"extra"}))
-        in_ = [Dependency(name="pytest")]
+        (tmp_path / "pyproject.toml").write_text("""\
+[dependency-groups]
+dev = ["ruff"]
+""")
 
         # Act
-        result = is_dep_satisfied_in(dep, in_=in_)
+        with change_cwd(tmp_path), files_manager():
+            first = get_dep_index()
+            second = get_dep_index()
 
         # Assert
-        assert not result
+        assert first is second
 
-    def test_same_name_subset_extra(self):
+    def test_rebuilt_after_change(self, tmp_path: Path):
         # Arrange
-        dep = Dependency(name="pytest")
-        in_ = [Dependency(name="pytest", extras=frozenset({"extra"}))]
+        (tmp_path / "pyproject.toml").write_text("""\
+[dependency-groups]
+dev = ["ruff"]
+""")
 
         # Act
-        result = is_dep_satisfied_in(dep, in_=in_)
+        with change_cwd(tmp_path), files_manager():
+            before = get_dep_index()
+            PyprojectTOMLManager().extend_list(
+                keys=["dependency-groups", "dev"], values=["pytest"]
+            )
+            after = get_dep_index()
 
         # Assert
-        assert result
-
-    def test_multiple(self):
-        # Arrange
-        dep = Dependency(name="pytest")
-        in_ = [Dependency(name="flake8"), Dependency(name="pytest")]
+        assert not before.is_dep_satisfied_in_any_group(Dependency(name="pytest"))
+        assert after.is_dep_satisfied_in_any_group(Dependency(name="pytest"))
 
+    def test_no_pyproject_toml(self, tmp_path: Path):
         # Act
-        result = is_dep_satisfied_in(dep, in_=in_)
+        with change_cwd(tmp_path), files_manager():
+            index = get_dep_index()
 
         # Assert
-        assert result
+        assert index.extras_by_name_by_group == {}
 
 
 class TestRegisterDefaultGroup:
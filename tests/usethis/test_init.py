@@ -51,6 +51,24 @@ class TestProjectInit:
         with change_cwd(tmp_path), pytest.raises(UVInitError), files_manager():
             project_init()
 
+    def test_dry_run(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "myproj"
+        path.mkdir()
+
+        # Act
+        with (
+            usethis_config.set(backend=BackendEnum.uv, dry_run=True),
+            change_cwd(path),
+            files_manager(),
+        ):
+            project_init()
+
+        # Assert
+        assert (path / "pyproject.toml").exists()
+        assert 'name = "myproj"' in (path / "pyproject.toml").read_text()
+        assert (path / "src" / "myproj" / "__init__.py").exists()
+
     def test_none_backend(self, tmp_path: Path, capfd: pytest.CaptureFixture[str]):
         # Arrange
         path = tmp_path / "myproj"
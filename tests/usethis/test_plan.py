@@ -0,0 +1,155 @@
+import json
+
+from usethis._plan import (
+    ChangePlan,
+    PlannedFileChange,
+    PlannedSubprocess,
+    get_planned_file_change,
+    record_plan,
+    record_subprocess,
+)
+
+
+class TestChangePlan:
+    class TestIsEmpty:
+        def test_empty(self):
+            assert ChangePlan().is_empty()
+
+        def test_subprocess(self):
+            # Arrange
+            plan = ChangePlan(subprocesses=[PlannedSubprocess(args=("uv", "lock"))])
+
+            # Act, Assert
+            assert not plan.is_empty()
+
+    class TestGetUnifiedDiff:
+        def test_concatenated(self):
+            # Arrange
+            plan = ChangePlan(
+                file_changes=[
+                    PlannedFileChange(path="a.txt", change="create", diff="A\n"),
+                    PlannedFileChange(path="b.txt", change="delete", diff="B\n"),
+                ]
+            )
+
+            # Act
+            diff = plan.get_unified_diff()
+
+            # Assert
+            assert diff == "A\nB\n"
+
+    class TestToJSON:
+        def test_structure(self):
+            # Arrange
+            plan = ChangePlan(
+                file_changes=[
+                    PlannedFileChange(path="a.txt", change="create", diff="A\n")
+                ],
+                subprocesses=[PlannedSubprocess(args=("uv", "lock"))],
+            )
+
+            # Act
+            result = json.loads(plan.to_json())
+
+            # Assert
+            assert result == {
+                "files": [{"path": "a.txt", "change": "create"}],
+                "subprocesses": [{"args": ["uv", "lock"]}],
+            }
+
+
+class TestRecordPlan:
+    def test_subprocess_recorded(self):
+        # Act
+        with record_plan() as plan:
+            record_subprocess(["uv", "lock"])
+
+        # Assert
+        assert plan.subprocesses == [PlannedSubprocess(args=("uv", "lock"))]
+
+    def test_not_recorded_outside(self):
+        # Arrange
+        with record_plan() as plan:
+            pass
+
+        # Act
+        record_subprocess(["uv", "lock"])
+
+        # Assert
+        assert plan.subprocesses == []
+
+    def test_nested(self):
+        # Act
+        with record_plan() as outer:
+            with record_plan() as inner:
+                record_subprocess(["uv", "lock"])
+            record_subprocess(["uv", "sync"])
+
+        # Assert
+        assert inner.subprocesses == [PlannedSubprocess(args=("uv", "lock"))]
+        assert outer.subprocesses == [PlannedSubprocess(args=("uv", "sync"))]
+
+
+class TestGetPlannedFileChange:
+    def test_modified(self):
+        # Act
+        file_change = get_planned_file_change(
+            "README.md", before=b"# Hello\n", after=b"# Goodbye\n"
+        )
+
+        # Assert
+        assert file_change == PlannedFileChange(
+            path="README.md",
+            change="modify",
+            diff=(
+                "--- a/README.md\n+++ b/README.md\n@@ -1 +1 @@\n-# Hello\n+# Goodbye\n"
+            ),
+        )
+
+    def test_deleted(self):
+        # Act
+        file_change = get_planned_file_change("old.txt", before=b"old", after=None)
+
+        # Assert
+        assert file_change == PlannedFileChange(
+            path="old.txt",
+            change="delete",
+            diff=(
+                "--- a/old.txt\n"
+                "+++ /dev/null\n"
+                "@@ -1 +0,0 @@\n"
+                "-old\n"
+                "\\ No newline at end of file\n"
+            ),
+        )
+
+    def test_created(self):
+        # Act
+        file_change = get_planned_file_change(
+            "src/new.txt", before=None, after=b"new\n"
+        )
+
+        # Assert
+        assert file_change == PlannedFileChange(
+            path="src/new.txt",
+            change="create",
+            diff="--- /dev/null\n+++ b/src/new.txt\n@@ -0,0 +1 @@\n+new\n",
+        )
+
+    def test_empty_file_created(self):
+        # Act
+        file_change = get_planned_file_change("py.typed", before=None, after=b"")
+
+        # Assert
+        assert file_change == PlannedFileChange(
+            path="py.typed", change="create", diff="--- /dev/null\n+++ b/py.typed\n"
+        )
+
+    def test_binary(self):
+        # Act
+        file_change = get_planned_file_change(
+            "logo.png", before=b"\x89PNG\xff", after=b"\x89PNG\xfe"
+        )
+
+        # Assert
+        assert file_change.diff == "Binary files a/logo.png and b/logo.png differ\n"
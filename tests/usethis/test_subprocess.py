@@ -0,0 +1,208 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import usethis._subprocess
+from usethis._config import usethis_config
+from usethis._plan import PlannedSubprocess, record_plan
+from usethis._subprocess import (
+    SubprocessFailedError,
+    SubprocessTimeoutError,
+    call_subprocess,
+)
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class TestCallSubprocess:
+    def test_output(self):
+        # Act
+        result = call_subprocess(
+            _python("import sys; print('out'); print('err', file=sys.stderr)")
+        )
+
+        # Assert
+        assert result.stdout.splitlines() == ["out"]
+        assert result.stderr.splitlines() == ["err"]
+
+    def test_cwd(self, tmp_path: Path):
+        # Act
+        result = call_subprocess(_python("import os; print(os.getcwd())"), cwd=tmp_path)
+
+        # Assert
+        assert Path(result.stdout.strip()).resolve() == tmp_path.resolve()
+
+    def test_failure(self):
+        # Act, Assert
+        with pytest.raises(SubprocessFailedError, match="Exit status 3") as excinfo:
+            call_subprocess(
+                _python("import sys; print('oops', file=sys.stderr); sys.exit(3)")
+            )
+        assert "oops" in str(excinfo.value)
+
+    def test_stderr_lines_streamed(self):
+        # Arrange
+        lines: list[str] = []
+
+        # Act
+        call_subprocess(
+            _python(
+                "import sys; print('first', file=sys.stderr); "
+                "print('out'); print('second', file=sys.stderr)"
+            ),
+            on_stderr_line=lines.append,
+        )
+
+        # Assert
+        assert lines == ["first", "second"]
+
+    def test_timeout(self):
+        # Act, Assert
+        with pytest.raises(SubprocessTimeoutError, match=r"No exit after 0\.5 seconds"):
+            call_subprocess(_python("import time; time.sleep(30)"), timeout=0.5)
+
+    def test_timeout_from_config(self):
+        # Act, Assert
+        with (
+            usethis_config.set(subprocess_timeout=0.5),
+            pytest.raises(SubprocessTimeoutError),
+        ):
+            call_subprocess(_python("import time; time.sleep(30)"))
+
+    def test_explicit_timeout_takes_precedence(self):
+        # Act
+        with usethis_config.set(subprocess_timeout=0.001):
+            result = call_subprocess(_python("print('done')"), timeout=30)
+
+        # Assert
+        assert result.stdout.strip() == "done"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX process groups")
+    def test_new_process_group_with_timeout(self):
+        # Act
+        result = call_subprocess(
+            _python(
+                "import os; "
+                "print(os.getpgid(0) == os.getpid()); "
+                "print(os.getsid(0) == os.getsid(os.getppid()))"
+            ),
+            timeout=30,
+        )
+
+        # Assert
+        assert result.stdout.splitlines() == ["True", "True"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX process groups")
+    def test_same_process_group_without_timeout(self):
+        # Act
+        result = call_subprocess(
+            _python("import os; print(os.getpgid(0) == os.getpgid(os.getppid()))")
+        )
+
+        # Assert
+        assert result.stdout.splitlines() == ["True"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX terminals")
+    @pytest.mark.parametrize("timeout", [None, 30])
+    def test_reads_from_terminal(self, timeout: float | None):
+        # e.g. a git credential prompt; a subprocess in a background process group
+        # would be stopped when reading from the terminal.
+
+        # Arrange
+        import pty  # noqa: PLC0415  # Not available on Windows
+
+        master, slave = pty.openpty()
+        script = (
+            "import os, sys\n"
+            # Take the pseudo-terminal as the controlling terminal of the new session.
+            "os.close(os.open(os.ttyname(0), os.O_RDWR))\n"
+            "from usethis._subprocess import call_subprocess\n"
+            "result = call_subprocess(\n"
+            "    [sys.executable, '-c', 'print(input())'],\n"
+            f"    timeout={timeout!r},\n"
+            ")\n"
+            "sys.stderr.write('got ' + result.stdout)\n"
+        )
+
+        # Act
+        process = subprocess.Popen(
+            [sys.executable, "-c", script],
+            stdin=slave,
+            stdout=slave,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+        os.close(slave)
+        try:
+            os.write(master, b"hello\n")
+            _, stderr = process.communicate(timeout=20)
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            os.close(master)
+
+        # Assert
+        assert process.returncode == 0, stderr
+        assert stderr.decode().strip() == "got hello"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX process groups")
+    def test_timeout_kills_group_after_leader_exits(self, tmp_path: Path):
+        # Arrange
+        pid_file = tmp_path / "pid"
+
+        # Act
+        with pytest.raises(SubprocessTimeoutError):
+            call_subprocess(
+                [
+                    "sh",
+                    "-c",
+                    f"sleep 30 & echo $! > '{pid_file.as_posix()}'; exit 0",
+                ],
+                timeout=0.5,
+            )
+
+        # Assert
+        pid = int(pid_file.read_text())
+        deadline = time.perf_counter() + 5
+        while _is_running(pid) and time.perf_counter() < deadline:
+            time.sleep(0.05)
+        assert not _is_running(pid)
+
+    def test_retained_output_bounded(self, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        monkeypatch.setattr(usethis._subprocess, "MAX_RETAINED_OUTPUT_CHARS", 10)
+
+        # Act
+        result = call_subprocess(
+            _python("for i in range(100): print(i)"),
+        )
+
+        # Assert
+        assert result.stdout.splitlines() == ["97", "98", "99"]
+
+    def test_dry_run(self):
+        # Act
+        with usethis_config.set(dry_run=True), record_plan() as plan:
+            result = call_subprocess(_python("raise SystemExit(1)"))
+
+        # Assert
+        assert result.stdout == ""
+        assert result.stderr == ""
+        assert plan.subprocesses == [
+            PlannedSubprocess(args=tuple(_python("raise SystemExit(1)")))
+        ]